@@ -139,6 +139,51 @@ def jsontomsb(json_path: Path):
     _LOGGER.info("Wrote %s", out)
 
 
+@app.command()
+def flverexport(
+    paths: list[Path],
+    export_format: str = typer.Option("glb", "--format", "-f", help="Export format: 'glb' (binary glTF) or 'obj'."),
+    output_dir: Path = typer.Option(
+        None, "--output-dir", "-o", help="Output directory (default: next to each FLVER)."
+    ),
+    no_skin: bool = typer.Option(False, "--no-skin", help="Do not export bones and skinning (glTF only)."),
+):
+    """Export FLVER files (and all FLVER files in given directories) to glTF or OBJ."""
+    from soulstruct.flver import FLVER
+
+    export_format = export_format.lower().lstrip(".")
+    if export_format not in {"glb", "obj"}:
+        raise typer.BadParameter(f"Export format must be 'glb' or 'obj', not '{export_format}'.")
+
+    flver_paths = []
+    for path in paths:
+        if path.is_dir():
+            flver_paths += sorted(path.glob("*.flver")) + sorted(path.glob("*.flver.dcx"))
+        else:
+            flver_paths.append(path)
+
+    failed_count = 0
+    for flver_path in flver_paths:
+        name = flver_path.name.removesuffix(".dcx").removesuffix(".flver")
+        out = (output_dir or flver_path.parent) / f"{name}.{export_format}"
+        try:
+            # Vertex fields are decompressed as needed by the exporter.
+            flver = FLVER.from_path(flver_path, lazy_vertex_arrays=True)
+            if export_format == "glb":
+                flver.write_glb(out, include_skin=not no_skin)
+            else:
+                flver.write_obj(out)
+        except Exception as ex:
+            _LOGGER.error("Could not export %s: %s", flver_path, ex)
+            failed_count += 1
+            continue
+        _LOGGER.info("Wrote %s", out)
+
+    if failed_count:
+        _LOGGER.warning("Failed to export %s of %s FLVER files.", failed_count, len(flver_paths))
+        raise typer.Exit(1)
+
+
 @app.command()
 def restorebak(
     target: Path,
@@ -121,10 +121,11 @@ class BaseBinaryFile(abc.ABC, metaclass=BaseBinaryFileMeta):
         return file_data
 
     @classmethod
-    def from_path(cls, path: str | Path) -> tp.Self:
+    def from_path(cls, path: str | Path, **kwargs) -> tp.Self:
+        """Any `kwargs` are passed to `from_reader()`."""
         path = Path(path)
         try:
-            binary_file = cls.from_bytes(BinaryReader(path))
+            binary_file = cls.from_bytes(BinaryReader(path), **kwargs)
         except Exception:
             traceback.print_exc()
             _LOGGER.error(f"Error occurred while reading `{cls.__name__}` with path '{path}'. See traceback.")
@@ -151,8 +152,11 @@ class BaseBinaryFile(abc.ABC, metaclass=BaseBinaryFileMeta):
         return files
 
     @classmethod
-    def from_bytes(cls, data: bytes | bytearray | tp.BinaryIO | BinaryReader | BinderEntry) -> tp.Self:
-        """Load instance from binary data or binary stream (or `BinderEntry.data`)."""
+    def from_bytes(cls, data: bytes | bytearray | tp.BinaryIO | BinaryReader | BinderEntry, **kwargs) -> tp.Self:
+        """Load instance from binary data or binary stream (or `BinderEntry.data`).
+
+        Any `kwargs` are passed to `from_reader()`.
+        """
         reader = BinaryReader(data) if not isinstance(data, BinaryReader) else data  # type: BinaryReader
 
         if is_dcx(reader):
@@ -165,7 +169,7 @@ class BaseBinaryFile(abc.ABC, metaclass=BaseBinaryFileMeta):
             dcx_type = DCXType.Null
 
         try:
-            binary_file = cls.from_reader(reader)
+            binary_file = cls.from_reader(reader, **kwargs)
             binary_file.dcx_type = dcx_type
         except Exception:
             traceback.print_exc()
@@ -0,0 +1,174 @@
+"""Hash-keyed cache of compiled EMEVD bytes, used for incremental `EventDirectory` builds.
+
+Each EVS script is keyed by the BLAKE2b hash of its own source plus the sources of every local module it imports
+(map enums modules, `common_func` scripts, and anything those import in turn), along with the installed Soulstruct
+version. Only scripts whose key has changed since the last build need to be recompiled; everything else is served from
+the cache directory.
+
+File hashes and direct imports are recorded alongside each file's size and modification time, so a no-op rebuild only
+has to `stat()` the sources rather than reading and parsing them again.
+"""
+from __future__ import annotations
+
+__all__ = ["EVSBuildCache"]
+
+import ast
+import importlib.metadata
+import json
+import logging
+import re
+import typing as tp
+from pathlib import Path
+
+from soulstruct.utilities.files import get_blake2b_hash_hex
+
+from .evs.utils import COMMON_FUNC_IMPORT_RE
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bump this whenever the manifest layout or the meaning of a cache key changes.
+_CACHE_VERSION = 1
+
+try:
+    # Compiled output can change between Soulstruct versions, so every build key includes it.
+    _SOULSTRUCT_VERSION = importlib.metadata.version("soulstruct")
+except importlib.metadata.PackageNotFoundError:
+    _SOULSTRUCT_VERSION = "unknown"
+
+
+class EVSBuildCache:
+    """Manages a directory of compiled EMEVD bytes and a JSON manifest of source/dependency hashes."""
+
+    MANIFEST_NAME: tp.ClassVar[str] = "manifest.json"
+
+    cache_directory: Path
+    # Maps resolved source paths to `{"mtime_ns", "size", "hash", "imports"}` records.
+    files: dict[str, dict[str, tp.Any]]
+    # Maps map stems to `{"key", "output_name"}` records for each cached EMEVD.
+    targets: dict[str, dict[str, str]]
+
+    def __init__(self, cache_directory: Path | str, salt: str = ""):
+        """Load any existing manifest from `cache_directory`.
+
+        `salt` is mixed into every build key. Pass something that identifies the compiling `EMEVD` class, so that caches
+        are never shared between games.
+        """
+        self.cache_directory = Path(cache_directory)
+        self.salt = salt
+        self.files = {}
+        self.targets = {}
+
+        manifest_path = self.cache_directory / self.MANIFEST_NAME
+        if manifest_path.is_file():
+            try:
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            except (ValueError, OSError) as ex:
+                _LOGGER.warning(f"Ignoring unreadable EVS build cache manifest '{manifest_path}': {ex}")
+                return
+            if manifest.get("version") != _CACHE_VERSION or manifest.get("salt") != salt:
+                _LOGGER.info(f"EVS build cache in '{self.cache_directory}' is stale. It will be rebuilt.")
+                return
+            self.files = manifest.get("files", {})
+            self.targets = manifest.get("targets", {})
+
+    def get_build_key(self, source_path: Path, script_directory: Path) -> str:
+        """Get the hex hash that covers `source_path`, every local module it (transitively) imports, and the installed
+        Soulstruct version."""
+        key_parts = [str(_CACHE_VERSION), _SOULSTRUCT_VERSION, self.salt]
+        for dependency_path in self.get_dependency_paths(source_path, script_directory):
+            record = self._get_file_record(dependency_path, script_directory)
+            key_parts.append(f"{dependency_path.name}:{record['hash']}")
+        return get_blake2b_hash_hex("|".join(key_parts).encode())
+
+    def get_dependency_paths(self, source_path: Path, script_directory: Path) -> list[Path]:
+        """Get `source_path` followed by all local modules it imports (depth first, no duplicates)."""
+        source_path = source_path.resolve()
+        dependency_paths = []
+        to_visit = [source_path]
+        while to_visit:
+            path = to_visit.pop()
+            if path in dependency_paths:
+                continue
+            dependency_paths.append(path)
+            record = self._get_file_record(path, script_directory)
+            to_visit.extend(reversed([Path(import_path) for import_path in record["imports"]]))
+        return dependency_paths
+
+    def get(self, map_stem: str, build_key: str) -> bytes | None:
+        """Get cached EMEVD bytes for `map_stem`, or `None` if the cache is missing or was built from other sources."""
+        target = self.targets.get(map_stem)
+        if target is None or target["key"] != build_key:
+            return None
+        cached_path = self.cache_directory / f"{map_stem}.bin"
+        if not cached_path.is_file():
+            return None
+        return cached_path.read_bytes()
+
+    def get_output_name(self, map_stem: str) -> str | None:
+        """Get the output file name recorded when `map_stem` was last built, if any."""
+        target = self.targets.get(map_stem)
+        return target["output_name"] if target else None
+
+    def put(self, map_stem: str, build_key: str, data: bytes, output_name: str):
+        """Store freshly compiled EMEVD `data` for `map_stem`."""
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        (self.cache_directory / f"{map_stem}.bin").write_bytes(data)
+        self.targets[map_stem] = {"key": build_key, "output_name": output_name}
+
+    def save(self):
+        """Write manifest to disk. Records of source files that no longer exist are dropped."""
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        self.files = {path: record for path, record in self.files.items() if Path(path).is_file()}
+        manifest = {"version": _CACHE_VERSION, "salt": self.salt, "files": self.files, "targets": self.targets}
+        manifest_path = self.cache_directory / self.MANIFEST_NAME
+        manifest_path.write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+
+    def _get_file_record(self, path: Path, script_directory: Path) -> dict[str, tp.Any]:
+        """Get hash and direct local imports of `path`, re-reading the file only if its size or mtime has changed."""
+        stat = path.stat()
+        record = self.files.get(str(path))
+        if record is not None and record["mtime_ns"] == stat.st_mtime_ns and record["size"] == stat.st_size:
+            return record
+
+        source = path.read_bytes()
+        record = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": get_blake2b_hash_hex(source),
+            "imports": [str(p) for p in _find_local_imports(source.decode("utf-8"), script_directory)],
+        }
+        self.files[str(path)] = record
+        return record
+
+
+def _find_local_imports(source: str, script_directory: Path) -> list[Path]:
+    """Find module files imported by `source` that resolve relative to `script_directory`.
+
+    Uses the same path resolution as EVS `import_from()` and `[COMMON_FUNC]` imports. Absolute imports of installed
+    packages (e.g. `soulstruct` itself) are not files in `script_directory` and are ignored.
+    """
+    module_names = []  # type: list[tuple[int, str]]
+
+    for common_func_import_match in re.finditer(COMMON_FUNC_IMPORT_RE, source):
+        module_name = common_func_import_match.group("module")
+        level = len(module_name) - len(module_name.lstrip("."))
+        module_names.append((level, module_name.lstrip(".")))
+    source = re.sub(COMMON_FUNC_IMPORT_RE, "\n", source)
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return []  # compilation will report this properly
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module:
+            module_names.append((node.level, node.module))
+
+    import_paths = []
+    for level, module_name in module_names:
+        level = 0 if level == 0 else level - 1  # single dot (level 1) is the same as no dot (level 0)
+        module_path = script_directory / ("../" * level + module_name.replace(".", "/") + ".py")
+        if module_path.is_file():
+            module_path = module_path.resolve()
+            if module_path not in import_paths:
+                import_paths.append(module_path)
+    return import_paths
@@ -3,6 +3,7 @@ from __future__ import annotations
 __all__ = ["Instruction", "EventArgRepl"]
 
 import abc
+import functools
 import logging
 import struct
 import typing as tp
@@ -12,7 +13,7 @@ from types import GenericAlias
 from soulstruct.utilities.binary import *
 
 from .event_layers import EventLayers
-from .utils import get_byte_offset_from_struct, get_instruction_args
+from .utils import get_args_struct, get_byte_offset_from_struct, get_instruction_args
 
 if tp.TYPE_CHECKING:
     from soulstruct.base.game_types.game_enums_manager import GameEnumsManager
@@ -87,6 +88,14 @@ class InstructionStruct(BinaryStruct):
     # Pad 4 (or maybe align to 8) for 32-bit classes.
 
 
+@functools.cache
+def _get_instruction_header_struct(byte_order: ByteOrder, long_varints: bool) -> struct.Struct:
+    """Precompiled `InstructionStruct` layout for fast reading, including 32-bit pad (as a fourth `uint`)."""
+    if long_varints:
+        return struct.Struct(f"{byte_order.value}IIQqq")
+    return struct.Struct(f"{byte_order.value}IIIiiI")
+
+
 @dataclass(slots=True)
 class Instruction(abc.ABC):
 
@@ -131,23 +140,27 @@ class Instruction(abc.ABC):
 
         Note that "0i" is added to end by the caller if needed for converting packed data aligned to four bytes.
         """
-        return self.display_args_fmt.replace("s", "I").replace("|", "")
+        return get_args_struct(self.display_args_fmt).format[1:-2]  # strip "@" and "0i"
 
     @classmethod
     def from_emevd_reader(cls, reader: BinaryReader, base_arg_data_offset: int, event_layers_offset: int):
 
-        header = InstructionStruct.from_bytes(reader)
-        if not reader.long_varints:
-            reader.assert_pad(4)  # TODO: alignment would be nicer?
+        # Precompiled header `Struct` used rather than `InstructionStruct.from_bytes()`, as EMEVD files from later games
+        # contain hundreds of thousands of instructions.
+        category, index, base_args_size, base_args_local_offset, event_layers_local_offset, *pad = reader.unpack_struct(
+            _get_instruction_header_struct(reader.byte_order, reader.long_varints)
+        )
+        if pad and pad[0] != 0:
+            raise ValueError(f"Instruction header pad at offset {reader.position - 4} is not zero: {pad[0]}")
 
         # Process arguments.
         try:
             args_format, args_list = get_instruction_args(
                 reader,
-                header.category,
-                header.index,
-                base_arg_data_offset + header.base_args_local_offset,
-                header.base_args_size,
+                category,
+                index,
+                base_arg_data_offset + base_args_local_offset,
+                base_args_size,
                 cls.EMEDF,
             )
         except KeyError:
@@ -158,15 +171,15 @@ class Instruction(abc.ABC):
             raise
 
         # Process event layers.
-        if header.event_layers_local_offset > 0:
-            with reader.temp_offset(event_layers_offset + header.event_layers_local_offset):
+        if event_layers_local_offset > 0:
+            with reader.temp_offset(event_layers_offset + event_layers_local_offset):
                 event_layers = EventLayers.from_emevd_reader(reader)
         else:
             event_layers = None
 
         return cls(
-            category=header.category,
-            index=header.index,
+            category=category,
+            index=index,
             display_args_fmt=args_format,
             event_arg_replacements=[],  # added later
             args_list=args_list,
@@ -176,7 +189,7 @@ class Instruction(abc.ABC):
     @property
     def base_args_size(self):
         """Calculate size of instruction arguments (aligned to 4 with '0i' suffix)."""
-        return struct.calcsize(f"@{self.struct_args_fmt}0i")
+        return get_args_struct(self.display_args_fmt).size
 
     def get_called_event(self) -> int | None:
         """Returns called event ID if instruction is `RunEvent` or `RunCommonEvent`. Returns `None` otherwise."""
@@ -346,7 +359,7 @@ class Instruction(abc.ABC):
             writer.fill("base_args_local_offset", -1, obj=self)
             return
         writer.fill("base_args_local_offset", writer.position - base_args_start_offset, obj=self)
-        packed_base_args = struct.pack(f"@{self.struct_args_fmt}0i", *self.args_list) if self.args_list else b""
+        packed_base_args = get_args_struct(self.display_args_fmt).pack(*self.args_list) if self.args_list else b""
         writer.append(packed_base_args)
 
     def pack_event_layers(
@@ -5,11 +5,15 @@ __all__ = [
     "get_coord_entity_type",
     "boolify",
     "get_write_offset",
+    "InstructionArgCodec",
+    "get_emedf_codecs",
+    "get_args_struct",
     "get_instruction_args",
     "get_byte_offset_from_struct",
     "format_event_layers",
 ]
 
+import functools
 import logging
 import struct
 import typing as tp
@@ -68,11 +72,14 @@ def get_coord_entity_type(
     raise KeyError(f"Cannot auto-detect `CoordEntityType` from argument type: {arg_or_type.__name__}")
 
 
+@functools.lru_cache(maxsize=None)
 def get_byte_offset_from_struct(format_string: str) -> dict[int, tuple[int, str]]:
     """Returns a dictionary mapping `byte_offset` to `(struct_index, struct_format)` tuples.
 
     The byte offsets indicate where the associated element in the struct format string begins. Note that native byte
     alignment "@" is critical here, as EMEVD uses byte-aligned packed binary data.
+
+    Results are cached per format string, so the returned dictionary must not be modified.
     """
     format_string = format_string.replace("|", "")
     byte_offset_array = {}
@@ -82,29 +89,70 @@ def get_byte_offset_from_struct(format_string: str) -> dict[int, tuple[int, str]
     return byte_offset_array
 
 
+@functools.lru_cache(maxsize=None)
+def get_args_struct(display_args_fmt: str) -> struct.Struct:
+    """Get precompiled native-aligned `Struct` (padded to a multiple of four bytes) for packing/unpacking instruction
+    arguments with the given display format (which may contain 's' string offsets and a '|' optional args separator).
+    """
+    return struct.Struct("@" + display_args_fmt.replace("s", "I").replace("|", "") + "0i")
+
+
+class InstructionArgCodec(tp.NamedTuple):
+    """Precompiled argument layout of one EMEDF instruction, built once per game by `get_emedf_codecs()`."""
+    args_fmt: str  # display format of required args, with 's' for packed string offsets
+    required_struct: struct.Struct  # native-aligned `Struct` for required args (NOT padded to four bytes)
+    arg_names: tuple[str, ...]
+
+
+# Maps `id(emedf)` to `(emedf, codecs)`. The EMEDF dictionary is kept alive here so its ID cannot be reused.
+_EMEDF_CODECS = {}  # type: dict[int, tuple[EMEDF_TYPING, dict[tuple[int, int], InstructionArgCodec]]]
+
+
+def get_emedf_codecs(emedf: EMEDF_TYPING) -> dict[tuple[int, int], InstructionArgCodec]:
+    """Get (or compile on first use) the `(category, index) -> InstructionArgCodec` table for this game's `emedf`.
+
+    Instructions whose arguments are missing an `internal_type` are omitted, which `get_instruction_args()` reports.
+    """
+    try:
+        return _EMEDF_CODECS[id(emedf)][1]
+    except KeyError:
+        pass
+    codecs = {}
+    for instruction_key, instruction_info in emedf.items():
+        args_info = instruction_info["args"]
+        try:
+            args_fmt = "".join(arg["internal_type"].get_fmt() for arg in args_info.values())
+        except KeyError:
+            continue
+        codecs[instruction_key] = InstructionArgCodec(
+            args_fmt=args_fmt,
+            required_struct=struct.Struct("@" + args_fmt.replace("s", "I")),
+            arg_names=tuple(args_info),
+        )
+    _EMEDF_CODECS[id(emedf)] = (emedf, codecs)
+    return codecs
+
+
 def get_instruction_args(
     reader: BinaryReader, category: int, index: int, first_arg_offset: int, event_args_size: int, emedf: EMEDF_TYPING
 ) -> tuple[str, list[tp.Any]]:
     """Process instruction arguments (required and optional) from EMEVD reader.
 
-    Uses the `EMEDF` class variable attached to the caller `Instruction`.
+    Uses the `EMEDF` class variable attached to the caller `Instruction`, compiled into argument codecs once per game.
+    The reader position is not changed.
     """
-
-    try:
-        emedf_args_info = emedf[category, index]["args"]
-    except KeyError:
-        raise KeyError(f"Could not find instruction ({category}, {index}) in `Instruction.EMEDF`.")
-    previous_offset = reader.position
+    codec = get_emedf_codecs(emedf).get((category, index))
+    if codec is None:
+        if (category, index) not in emedf:
+            raise KeyError(f"Could not find instruction ({category}, {index}) in `Instruction.EMEDF`.")
+        if event_args_size == 0:
+            return "", []
+        raise KeyError(f"Cannot find argument types for instruction {category}[{index:02d}] ({event_args_size} bytes)")
     if event_args_size == 0:
         return "", []
-    try:
-        args_format = "@" + "".join(arg["internal_type"].get_fmt() for arg in emedf_args_info.values())
-    except KeyError:
-        raise KeyError(f"Cannot find argument types for instruction {category}[{index:02d}] ({event_args_size} bytes)")
 
     # 's' arguments are actually four-byte offsets into the packed string data, though we will keep the 's' symbol.
-    struct_args_format = args_format.replace("s", "I")
-    required_args_size = struct.calcsize(struct_args_format)
+    required_args_size = codec.required_struct.size
     if required_args_size > event_args_size:
         raise ValueError(
             f"Documented size of minimum required args for instruction {category}"
@@ -112,9 +160,7 @@ def get_instruction_args(
             f"only {event_args_size}."
         )
 
-    # NOTE: Reader will be reset to initial offset below.
-    reader.seek(first_arg_offset)
-    args = reader.unpack(struct_args_format)
+    args = reader.unpack_struct(codec.required_struct, offset=first_arg_offset)
 
     # Additional arguments may appear for the instruction 2000[00], 'RunEvent', and from DS3 onward, 2000[06],
     # 'RunCommonEvent'. These instructions are tightly packed and are always aligned to 4. We read them here as
@@ -125,8 +171,7 @@ def get_instruction_args(
 
     opt_arg_count = extra_size // 4
     if opt_arg_count == 0:
-        reader.seek(previous_offset)
-        return args_format[1:], list(args)
+        return codec.args_fmt, list(args)
     elif (category, index) not in _OPTIONAL_ARGS_ALLOWED:
         raise ValueError(
             f"Extra arguments found for instruction {category}[{index}], which is not permitted. Arg types may be "
@@ -140,9 +185,8 @@ def get_instruction_args(
             f"size is not a multiple of four bytes ({extra_size})."
         )
 
-    opt_args = [reader["I"] for _ in range(opt_arg_count)]
-    reader.seek(previous_offset)
-    return args_format[1:] + "|" + "I" * (extra_size // 4), list(args) + opt_args
+    opt_args = reader.unpack(f"{opt_arg_count}I", offset=first_arg_offset + required_args_size)
+    return codec.args_fmt + "|" + "I" * opt_arg_count, list(args) + list(opt_args)
 
 
 def get_write_offset(event_format: str, arg_index: int) -> int:
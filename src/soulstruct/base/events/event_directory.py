@@ -3,7 +3,9 @@ from __future__ import annotations
 __all__ = ["EventDirectory"]
 
 import abc
+import copy
 import logging
+import multiprocessing
 import re
 import typing as tp
 from dataclasses import dataclass
@@ -11,8 +13,13 @@ from pathlib import Path
 
 from soulstruct.base.game_types.map_types import Map
 from soulstruct.base.game_file_directory import GameFileMapDirectory
+from soulstruct.utilities.files import create_bak
+from .build_cache import EVSBuildCache
 from .emevd import EMEVD
 
+if tp.TYPE_CHECKING:
+    from soulstruct.base.game_types.game_enums_manager import GameEnumsManager
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -29,8 +36,12 @@ class EventDirectory(GameFileMapDirectory[EMEVD], abc.ABC):
     COMMON_FUNC: tp.ClassVar[Map] = None
 
     @classmethod
-    def from_path(cls, directory_path: Path | str):
-        """Loads files as appropriate type (EMEVD/EVS/numeric)."""
+    def from_path(cls, directory_path: Path | str, processes: int | None = 1):
+        """Loads files as appropriate type (EMEVD/EVS/numeric).
+
+        EVS scripts are compiled in a pool of `processes` workers if `processes` is `None` (all CPUs) or greater than
+        one. Binary and numeric sources are always read in this process.
+        """
         if cls.FILE_NAME_PATTERN is None or cls.FILE_CLASS is None:
             raise TypeError(
                 f"`GameFileDirectory` subclass `{cls.__name__}` must define `FILE_NAME_PATTERN` and `FILE_CLASS` class "
@@ -44,6 +55,7 @@ class EventDirectory(GameFileMapDirectory[EMEVD], abc.ABC):
         if cls.COMMON_FUNC:
             all_map_stems.append(cls.COMMON_FUNC.emevd_file_stem)
         files = {}
+        evs_paths = {}  # type: dict[str, Path]  # deferred to worker pool
         file_name_re = re.compile(cls.FILE_NAME_PATTERN + r"(\.dcx)?$")
         for file_path in directory_path.glob("*"):
             if file_name_re.match(file_path.name):
@@ -61,7 +73,13 @@ class EventDirectory(GameFileMapDirectory[EMEVD], abc.ABC):
                         case "emevd_path":
                             files[file_stem] = cls.FILE_CLASS.from_path(file_path)
                         case "evs_path":
-                            files[file_stem] = cls.FILE_CLASS.from_evs_path(file_path, script_directory=directory_path)
+                            if processes == 1:
+                                files[file_stem] = cls.FILE_CLASS.from_evs_path(
+                                    file_path, script_directory=directory_path
+                                )
+                            else:
+                                evs_paths[file_stem] = file_path
+                                files[file_stem] = None  # placeholder to preserve order
                         case _:
                             _LOGGER.error(f"Cannot open EMEVD source type '{source_type}': {file_path.name}")
                             continue
@@ -73,17 +91,112 @@ class EventDirectory(GameFileMapDirectory[EMEVD], abc.ABC):
                         _LOGGER.warning(f"Ignoring unexpected file in `{cls.__name__}` directory: {file_path.name}")
                     continue
 
+        if evs_paths:
+            mp_args = [(cls.FILE_CLASS, evs_path, directory_path) for evs_path in evs_paths.values()]
+            with multiprocessing.Pool(processes=processes) as pool:
+                evs_emevds = pool.starmap(_from_evs_path_mp, mp_args)  # blocks here until all done
+            for file_stem, emevd in zip(evs_paths, evs_emevds):
+                if emevd is None:
+                    raise ValueError(f"Failed to compile EVS script for map '{file_stem}' (see log).")
+                files[file_stem] = emevd
+
         if all_map_stems:
             _LOGGER.warning(f"Could not find some files in `{cls.__name__}` directory: {', '.join(all_map_stems)}")
 
         return cls(directory=directory_path, files=files)
 
+    @classmethod
+    def build_incremental(
+        cls,
+        evs_directory: Path | str,
+        output_directory: Path | str = None,
+        cache_directory: Path | str = None,
+        force=False,
+    ) -> list[str]:
+        """Compile EVS (and numeric) sources in `evs_directory` to binary EMEVD files in `output_directory`, only
+        recompiling those whose source or imported modules have changed since the last build.
+
+        Compiled EMEVD bytes are stored in `cache_directory` (default: `evs_directory/__evscache__`) along with the
+        hash of each source and each local module it imports (map enums modules, `common_func`, etc.). Up-to-date
+        scripts are not parsed at all: their sources (and modules) are only re-read if their size or modification time
+        has changed. Their cached EMEVD bytes are still read and compared with the existing output file whenever the
+        sizes match, and output files are only (re)written if they are missing or differ, so their modification times
+        are stable.
+
+        If `force=True`, all sources are recompiled (and the cache refreshed) regardless of their hashes.
+
+        Returns a list of the map stems that were recompiled.
+        """
+        evs_directory = Path(evs_directory)
+        if not evs_directory.is_dir():
+            raise NotADirectoryError(f"Missing directory: {evs_directory}")
+        output_directory = Path(output_directory) if output_directory is not None else evs_directory
+        cache_directory = Path(cache_directory) if cache_directory is not None else evs_directory / "__evscache__"
+
+        all_map_stems = [getattr(game_map, cls.MAP_STEM_ATTRIBUTE) for game_map in cls.ALL_MAPS]
+        if cls.COMMON_FUNC:
+            all_map_stems.append(cls.COMMON_FUNC.emevd_file_stem)
+        source_paths = {}  # type: dict[str, Path]
+        file_name_re = re.compile(cls.FILE_NAME_PATTERN + r"(\.dcx)?$")
+        for file_path in sorted(evs_directory.glob("*")):
+            if not file_path.is_file() or not file_name_re.match(file_path.name):
+                continue
+            file_stem = file_path.name.split(".")[0]
+            if file_stem not in all_map_stems:
+                continue
+            try:
+                source_type = cls.FILE_CLASS.from_auto_detect_source_type(file_path)
+            except TypeError:
+                continue
+            if source_type not in {"evs_path", "numeric_path"}:
+                continue  # already binary EMEVD (possibly output of a previous build into this directory)
+            if file_stem in source_paths:
+                raise FileExistsError(
+                    f"Found multiple EVS/numeric sources for map '{file_stem}' in `{cls.__name__}` build directory: "
+                    f"{source_paths[file_stem].name}, {file_path.name}"
+                )
+            source_paths[file_stem] = file_path
+
+        cache = EVSBuildCache(cache_directory, salt=f"{cls.FILE_CLASS.__module__}.{cls.FILE_CLASS.__qualname__}")
+        rebuilt_stems = []
+        try:
+            for file_stem, source_path in source_paths.items():
+                build_key = cache.get_build_key(source_path, evs_directory)
+                packed = None if force else cache.get(file_stem, build_key)
+                if packed is None:
+                    if source_path.suffix == ".txt":
+                        emevd = cls.FILE_CLASS.from_numeric_path(source_path, map_name=file_stem)
+                    else:
+                        emevd = cls.FILE_CLASS.from_evs_path(source_path, script_directory=evs_directory)
+                    packed = bytes(emevd)
+                    output_name = emevd.get_file_path(output_directory / f"{file_stem}{cls.FILE_EXTENSION}").name
+                    cache.put(file_stem, build_key, packed, output_name)
+                    rebuilt_stems.append(file_stem)
+                    _LOGGER.info(f"Rebuilt EMEVD for map {file_stem}.")
+                output_path = output_directory / cache.get_output_name(file_stem)
+                if output_path.is_file() and output_path.stat().st_size == len(packed):
+                    if output_path.read_bytes() == packed:
+                        continue  # up to date
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                create_bak(output_path)
+                output_path.write_bytes(packed)
+        finally:
+            cache.save()
+
+        _LOGGER.info(
+            f"`{cls.__name__}` incremental build rebuilt {len(rebuilt_stems)} / {len(source_paths)} EMEVD files "
+            f"in '{output_directory}'."
+        )
+        return rebuilt_stems
+
     def write_evs(
         self,
         evs_directory=None,
         enums_directory: Path | str = None,
         warn_missing_enums=True,
         enums_module_prefix=".",
+        processes: int | None = 1,
+        enums_index_cache_path: Path | str = None,
     ):
         """Write EVS scripts for all EMEVD files.
 
@@ -92,6 +205,13 @@ class EventDirectory(GameFileMapDirectory[EMEVD], abc.ABC):
         with names ending in "_enums.py" present in the directory will be available for non-star import, for the rare
         case where map EMEVD references IDs from other maps (e.g. in `PlayCutscene`).
 
+        If `processes` is `None` (all CPUs) or greater than one, non-CommonFunc maps are decompiled in a worker pool.
+        Each worker imports the enums modules once into its own `GameEnumsManager`. Event ID aliases are accumulated
+        across maps in the same order as the serial path, so the written scripts are identical either way.
+
+        If `enums_index_cache_path` is given, the `GameEnumsManager` enum index is cached in that JSON file, and later
+        calls with unchanged enums modules (including pool workers) will load it instead of importing every module.
+
         See `EMEVD.write_evs()` for argument usage.
         """
         if evs_directory is None:
@@ -102,9 +222,6 @@ class EventDirectory(GameFileMapDirectory[EMEVD], abc.ABC):
 
         enums_module_paths = list(enums_directory.glob("*_enums.py")) if enums_directory else []
 
-        # Create one `GameEnumsManager` passed to all non-CommonFunc EMEVDs.
-        enums_manager = self.FILE_CLASS.ENTITY_ENUMS_MANAGER(enums_module_paths)  # `all_event_ids` set per EMEVD
-
         common_func_emevd = None  # type: EMEVD | None
         if self.COMMON_FUNC and self.COMMON_FUNC.emevd_file_stem in self.files:
             # Write `common_func` first.
@@ -121,21 +238,32 @@ class EventDirectory(GameFileMapDirectory[EMEVD], abc.ABC):
             )
             _LOGGER.info(f"Wrote EVS for COMMON_FUNC map: {common_func_emevd.map_name}")
 
-        for map_name, emevd in self.files.items():
-            if self.COMMON_FUNC and map_name == self.COMMON_FUNC.emevd_file_stem:
-                continue  # already done above
+        map_emevds = {
+            map_name: emevd for map_name, emevd in self.files.items()
+            if not (self.COMMON_FUNC and map_name == self.COMMON_FUNC.emevd_file_stem)  # already done above
+        }
+
+        if processes != 1:
+            self._write_evs_pool(
+                map_emevds, evs_directory, enums_module_paths, warn_missing_enums, enums_module_prefix,
+                common_func_emevd, processes, enums_index_cache_path,
+            )
+            _LOGGER.info(f"All EMEVD files written to decompiled EVS scripts successfully in '{evs_directory}'.")
+            return
 
+        # Create one `GameEnumsManager` passed to all non-CommonFunc EMEVDs.
+        enums_manager = self.FILE_CLASS.ENTITY_ENUMS_MANAGER(
+            enums_module_paths, index_cache_path=enums_index_cache_path
+        )  # `all_event_ids` set per EMEVD
+
+        for map_name, emevd in map_emevds.items():
             # Reset used and missing enums for each map.
             enums_manager.used_enums.clear()
             enums_manager.missing_enums.clear()
 
             emevd.write_evs(
                 evs_path=evs_directory / f"{emevd.map_name}.evs.py",
-                star_import_module_names=[f"{emevd.map_name}_enums"],
-                warn_missing_enums=warn_missing_enums,
-                enums_module_prefix=enums_module_prefix,
-                event_function_prefix="Event",
-                docstring=self.GET_MAP(map_name).verbose_name,
+                **self._get_map_evs_kwargs(map_name, emevd, warn_missing_enums, enums_module_prefix),
                 common_func_emevd=common_func_emevd,
                 enums_manager=enums_manager,
             )
@@ -143,6 +271,78 @@ class EventDirectory(GameFileMapDirectory[EMEVD], abc.ABC):
 
         _LOGGER.info(f"All EMEVD files written to decompiled EVS scripts successfully in '{evs_directory}'.")
 
+    def _get_map_evs_kwargs(
+        self, map_name: str, emevd: EMEVD, warn_missing_enums: bool, enums_module_prefix: str
+    ) -> dict[str, tp.Any]:
+        """Arguments passed to `EMEVD.to_evs()` for each non-CommonFunc map."""
+        return dict(
+            star_import_module_names=[f"{emevd.map_name}_enums"],
+            warn_missing_enums=warn_missing_enums,
+            enums_module_prefix=enums_module_prefix,
+            event_function_prefix="Event",
+            docstring=self.GET_MAP(map_name).verbose_name,
+        )
+
+    def _write_evs_pool(
+        self,
+        map_emevds: dict[str, EMEVD],
+        evs_directory: Path,
+        enums_module_paths: list[Path],
+        warn_missing_enums: bool,
+        enums_module_prefix: str,
+        common_func_emevd: EMEVD | None,
+        processes: int | None,
+        enums_index_cache_path: Path | str = None,
+    ):
+        """Decompile `map_emevds` to EVS in a worker pool, writing each script from this process as it arrives.
+
+        The only `GameEnumsManager` state that the serial path carries from one map to the next is the event ID alias
+        dictionaries (`all_event_ids` and `all_common_event_ids`), which are filled by `add_event_id()` and never
+        cleared. These are cheap to compute, so they are computed here for every map in order first, and each worker
+        rebuilds the exact aliases visible to each map before decompiling it.
+        """
+        enums_manager = self.FILE_CLASS.ENTITY_ENUMS_MANAGER(
+            enums_module_paths, index_cache_path=enums_index_cache_path
+        )
+        map_event_id_aliases = []  # type: list[tuple[dict[int, str], dict[int, str]]]
+        for emevd in map_emevds.values():
+            enums_manager.all_event_ids = {}
+            enums_manager.all_common_event_ids = {}
+            enums_manager.star_import_module_names = [f"{emevd.map_name}_enums"]
+            for event_id in emevd.events:
+                enums_manager.add_event_id(event_id)
+            map_common_func = common_func_emevd or emevd._common_func
+            if map_common_func:
+                for event_id in map_common_func.events:
+                    enums_manager.add_event_id(event_id, is_common=True)
+            map_event_id_aliases.append((enums_manager.all_event_ids, enums_manager.all_common_event_ids))
+
+        mp_args = []
+        for map_index, (map_name, emevd) in enumerate(map_emevds.items()):
+            if common_func_emevd:
+                # Shared `common_func` is sent once per worker (in `initargs`) rather than with each map.
+                emevd = copy.copy(emevd)
+                emevd._common_func = None
+            evs_kwargs = self._get_map_evs_kwargs(map_name, emevd, warn_missing_enums, enums_module_prefix)
+            mp_args.append((map_index, emevd, evs_kwargs))
+
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        chunk_size = max(1, len(mp_args) // (processes * 4))  # contiguous shards of maps
+        with multiprocessing.Pool(
+            processes=processes,
+            initializer=_init_evs_worker_mp,
+            initargs=(
+                self.FILE_CLASS, enums_module_paths, common_func_emevd, map_event_id_aliases, enums_index_cache_path
+            ),
+        ) as pool:
+            for map_name, evs_string, used_enum_names in pool.imap(_to_evs_mp, mp_args, chunksize=chunk_size):
+                evs_path = evs_directory / f"{map_name}.evs.py"
+                evs_path.parent.mkdir(exist_ok=True, parents=True)
+                with evs_path.open("w", encoding="utf-8") as f:
+                    f.write(evs_string)
+                _LOGGER.info(f"Wrote EVS for map {map_name} successfully ({len(used_enum_names)} enums used).")
+
     def write_numeric(self, event_directory=None):
         if event_directory is None:
             event_directory = self.directory
@@ -150,3 +350,67 @@ class EventDirectory(GameFileMapDirectory[EMEVD], abc.ABC):
         for emevd in self.files.values():
             emevd.write_numeric(event_directory / (emevd.path_minimal_stem + ".txt"))
         _LOGGER.info("All EMEVD files written to numeric TXT format successfully.")
+
+
+def _from_evs_path_mp(emevd_class: type[EMEVD], evs_path: Path, script_directory: Path) -> EMEVD | None:
+    """Function for batch operator."""
+    try:
+        return emevd_class.from_evs_path(evs_path, script_directory=script_directory)
+    except Exception as ex:
+        _LOGGER.error(f"Failed to compile EVS script '{evs_path}'. Error: {str(ex)}")
+        return None
+
+
+# Per-process state for `EventDirectory.write_evs()` worker pools, set once by `_init_evs_worker_mp()`.
+_WORKER_ENUMS_MANAGER = None  # type: GameEnumsManager | None
+_WORKER_COMMON_FUNC_EMEVD = None  # type: EMEVD | None
+_WORKER_MAP_EVENT_ID_ALIASES = []  # type: list[tuple[dict[int, str], dict[int, str]]]
+_WORKER_ALIASES_MAP_INDEX = -1  # index of last map whose aliases were merged into `_WORKER_ENUMS_MANAGER`
+
+
+def _init_evs_worker_mp(
+    emevd_class: type[EMEVD],
+    enums_module_paths: list[Path],
+    common_func_emevd: EMEVD | None,
+    map_event_id_aliases: list[tuple[dict[int, str], dict[int, str]]],
+    enums_index_cache_path: Path | str = None,
+):
+    """Pool initializer: import (or load cached index of) enums modules once for this worker process."""
+    global _WORKER_ENUMS_MANAGER, _WORKER_COMMON_FUNC_EMEVD, _WORKER_MAP_EVENT_ID_ALIASES, _WORKER_ALIASES_MAP_INDEX
+    _WORKER_ENUMS_MANAGER = emevd_class.ENTITY_ENUMS_MANAGER(
+        enums_module_paths, index_cache_path=enums_index_cache_path
+    )
+    _WORKER_COMMON_FUNC_EMEVD = common_func_emevd
+    _WORKER_MAP_EVENT_ID_ALIASES = map_event_id_aliases
+    _WORKER_ALIASES_MAP_INDEX = -1
+
+
+def _to_evs_mp(mp_args: tuple[int, EMEVD, dict[str, tp.Any]]) -> tuple[str, str, list[str]]:
+    """Function for batch operator. Returns map name, EVS string, and names of the enums checked out for it.
+
+    Maps in each worker's shard arrive in increasing order, so event ID aliases accumulated by all preceding maps are
+    merged incrementally rather than rebuilt for every map.
+    """
+    global _WORKER_ALIASES_MAP_INDEX
+    map_index, emevd, evs_kwargs = mp_args
+    enums_manager = _WORKER_ENUMS_MANAGER
+    if map_index <= _WORKER_ALIASES_MAP_INDEX:
+        enums_manager.all_event_ids = {}
+        enums_manager.all_common_event_ids = {}
+        _WORKER_ALIASES_MAP_INDEX = -1
+    for event_ids, common_event_ids in _WORKER_MAP_EVENT_ID_ALIASES[_WORKER_ALIASES_MAP_INDEX + 1:map_index]:
+        enums_manager.all_event_ids.update(event_ids)
+        enums_manager.all_common_event_ids.update(common_event_ids)
+    _WORKER_ALIASES_MAP_INDEX = map_index - 1  # this map's own aliases are added by `to_evs()` below
+
+    # Reset used and missing enums for each map.
+    enums_manager.used_enums.clear()
+    enums_manager.missing_enums.clear()
+
+    evs_string = emevd.to_evs(
+        **evs_kwargs,
+        common_func_emevd=_WORKER_COMMON_FUNC_EMEVD,
+        enums_manager=enums_manager,
+    )
+    used_enum_names = [f"{info.module_name}.{info.class_name}.{info.enum.name}" for info in enums_manager.used_enums]
+    return emevd.map_name, evs_string, used_enum_names
@@ -14,7 +14,7 @@ from enum import Enum, IntEnum
 from pathlib import Path
 from types import ModuleType
 
-from soulstruct.utilities.files import import_arbitrary_module
+from soulstruct.utilities.files import import_arbitrary_module, get_blake2b_hash_hex, read_json, write_json
 from soulstruct.base.game_types import *
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,13 +22,22 @@ _LOGGER = logging.getLogger(__name__)
 MAP_NAME_RE = re.compile(r"(m\d\d_\d\d_\d\d_)(\d\d)(.*)")
 
 
+class CachedEnumMember(tp.NamedTuple):
+    """Stand-in for an enum member loaded from a `GameEnumsManager` index cache, without importing its module."""
+    name: str
+    value: int
+
+
 class GameEnumInfo:
-    """Holds the enum and its origin information."""
+    """Holds the enum and its origin information.
+
+    If loaded from an index cache, `enum` is a `CachedEnumMember` and `enum_class` is `None`.
+    """
 
-    def __init__(self, enum: Enum, module_name: str):
+    def __init__(self, enum: Enum | CachedEnumMember, module_name: str, class_name: str = None):
         self.enum = enum
-        self.enum_class = enum.__class__
-        self.class_name = enum.__class__.__name__
+        self.enum_class = enum.__class__ if class_name is None else None
+        self.class_name = enum.__class__.__name__ if class_name is None else class_name
         self.module_name = module_name
 
     def get_variable_string(self, star_import_module_names: list[str], use_aa_bb_abbreviation: bool) -> str:
@@ -103,6 +112,10 @@ class GameEnumsManager(abc.ABC):
     # imported into EVS from that non-star module.
     enums: dict[str, dict[GAME_INT_TYPE, dict[int, GameEnumInfo]]]
 
+    # Maps `(game_type, value)` pairs to all `GameEnumInfo`s with that value across all modules (in module order), so
+    # that enum checkout is a single hash lookup per game type. Mirrors the contents of `enums`.
+    enum_index: dict[tuple[GAME_INT_TYPE, int], list[GameEnumInfo]]
+
     # Maps event IDs defined in one event script to their alias (from `Flag` enums), which defaults to `str(event_id)`.
     # These are not related to enum checkout, but instructions do need to see them to know if `RunEvent()` can be
     # replaced with a direct function call.
@@ -114,7 +127,7 @@ class GameEnumsManager(abc.ABC):
     used_enums: list[GameEnumInfo]
     star_import_module_names: list[str]
 
-    def __init__(self, module_paths: tp.Sequence[str | Path]):
+    def __init__(self, module_paths: tp.Sequence[str | Path], index_cache_path: Path | str = None):
         """Loads modules and monitors non-star enum usage for `EMEVD.to_evs()`.
 
         Parses all given `module_paths` and builds nested dictionary mapping module stems to game types to enum values.
@@ -128,9 +141,18 @@ class GameEnumsManager(abc.ABC):
         The same enum may safely appear in multiple `enums[module]` when parent/child types are involved -- e.g. a
         `Character` enum will appear under the `Character` itself but also the parent `MapPart` key -- but otherwise,
         conflicting values will log warnings or (if under the exact same child type key) raise a `ValueError`.
+
+        If `index_cache_path` is given, the enum index is loaded from that JSON file if it was built from the same
+        module files (compared by size and modification time, then by hash), in which case no modules are imported
+        at all; `modules` values will be `None` until `refresh_enums()` is called. Otherwise, modules are imported and
+        indexed as usual and the index is written to `index_cache_path` for next time.
         """
-        self.modules = {Path(path).name.split(".")[0]: import_arbitrary_module(path) for path in module_paths}
-        self.enums = {module_stem: {} for module_stem in self.modules}
+        self.module_paths = {Path(path).name.split(".")[0]: Path(path) for path in module_paths}
+        self.modules = {}
+        self.enums = {}
+        self.enum_index = {}
+        self._loaded_game_types = set()  # type: set[GAME_INT_TYPE]
+        self._all_module_game_types = []  # type: list[GAME_INT_TYPE]  # concatenated keys of all `enums` modules
         self.all_event_ids = {}
         self.all_common_event_ids = {}  # added separately
 
@@ -150,8 +172,16 @@ class GameEnumsManager(abc.ABC):
         self.used_enums = []
         self.star_import_module_names = []
 
+        if index_cache_path is not None and self.load_index_cache(index_cache_path):
+            return
+
+        self.modules = {module_stem: import_arbitrary_module(path) for module_stem, path in self.module_paths.items()}
+        self.enums = {module_stem: {} for module_stem in self.modules}
+
         if self.modules:
             self.refresh_enums()
+        if index_cache_path is not None:
+            self.write_index_cache(index_cache_path)
 
     def add_event_id(self, event_id: int, is_common=False):
         try:
@@ -164,13 +194,104 @@ class GameEnumsManager(abc.ABC):
         self.all_event_ids[event_id] = alias
 
     def refresh_enums(self):
-        """Completely regenerate `enums` dictionary from all registered modules."""
+        """Completely regenerate `enums` dictionary and `enum_index` from all registered modules.
+
+        Any modules not yet imported (because the index was loaded from a cache) are imported now.
+        """
+        for module_name, module in self.modules.items():
+            if module is None:
+                self.modules[module_name] = import_arbitrary_module(self.module_paths[module_name])
         self.enums = {module_stem: {} for module_stem in self.modules}
+        self.enum_index = {}
+        self.all_enum_values = {}
 
         # Iterate over all module members and find those inheriting from a type in `VALID_GAME_TYPES`.
         for module_name, module in self.modules.items():
             self._load_module(module_name, module)
 
+        self._update_game_types()
+
+    def _update_game_types(self):
+        """Record which game types appear in `enums`, for fast checkout."""
+        self._all_module_game_types = []
+        for module_enums in self.enums.values():
+            self._all_module_game_types.extend(module_enums.keys())
+        self._loaded_game_types = set(self._all_module_game_types)
+
+    def _get_index_cache_key(self) -> dict[str, tp.Any]:
+        return {
+            "manager": f"{self.__class__.__module__}.{self.__class__.__qualname__}",
+            "game_types": [game_type.__name__ for game_type in self.VALID_GAME_TYPES],
+        }
+
+    def write_index_cache(self, index_cache_path: Path | str):
+        """Write `enums` (and hence `enum_index`) to a JSON file, with the size, modification time, and hash of each
+        module it was built from, so that `load_index_cache()` can skip importing them next time."""
+        modules_info = {}
+        for module_stem, path in self.module_paths.items():
+            stat = path.stat()
+            modules_info[module_stem] = {
+                "path": str(path.resolve()),
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "hash": get_blake2b_hash_hex(path),
+            }
+        entries = []
+        for module_name, module_enums in self.enums.items():
+            for game_type, enum_dict in module_enums.items():
+                for value, info in enum_dict.items():
+                    entries.append([module_name, game_type.__name__, info.class_name, info.enum.name, value])
+        cache = self._get_index_cache_key() | {"modules": modules_info, "entries": entries}
+        index_cache_path = Path(index_cache_path)
+        index_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(index_cache_path, cache, indent=None)
+
+    def load_index_cache(self, index_cache_path: Path | str) -> bool:
+        """Load `enums` and `enum_index` from JSON file written by `write_index_cache()` without importing any modules.
+
+        Returns `False` (and changes nothing) if the cache is missing or any module has changed since it was written.
+        If modules have only been touched, the cache file is rewritten with their new modification times.
+        """
+        index_cache_path = Path(index_cache_path)
+        if not index_cache_path.is_file():
+            return False
+        try:
+            cache = read_json(index_cache_path)
+        except ValueError as ex:
+            _LOGGER.warning(f"Ignoring unreadable enums index cache '{index_cache_path}': {ex}")
+            return False
+        if any(cache.get(key) != value for key, value in self._get_index_cache_key().items()):
+            return False
+        modules_info = cache["modules"]
+        if list(modules_info) != list(self.module_paths):
+            return False
+        touched = False
+        for module_stem, path in self.module_paths.items():
+            module_info = modules_info[module_stem]
+            if module_info["path"] != str(path.resolve()) or not path.is_file():
+                return False
+            stat = path.stat()
+            if module_info["mtime_ns"] == stat.st_mtime_ns and module_info["size"] == stat.st_size:
+                continue
+            if module_info["size"] != stat.st_size or module_info["hash"] != get_blake2b_hash_hex(path):
+                return False
+            touched = True
+
+        game_types = {game_type.__name__: game_type for game_type in self.VALID_GAME_TYPES}
+        self.modules = {module_stem: None for module_stem in self.module_paths}
+        self.enums = {module_stem: {} for module_stem in self.module_paths}
+        self.enum_index = {}
+        for module_name, game_type_name, class_name, member_name, value in cache["entries"]:
+            game_type = game_types[game_type_name]
+            info = GameEnumInfo(CachedEnumMember(member_name, value), module_name, class_name=class_name)
+            self.enums[module_name].setdefault(game_type, {})[value] = info
+            self.enum_index.setdefault((game_type, value), []).append(info)
+        self._update_game_types()
+
+        if touched:
+            self.write_index_cache(index_cache_path)
+        return True
+
     def get_sorted_missing_items(self) -> list[tuple[str, int]]:
         """Sort `missing_items` and remove all occurrences of each entity ID except the most strictly typed one."""
         strictest_items = {}  # type: dict[int, list[str]]
@@ -261,7 +382,13 @@ class GameEnumsManager(abc.ABC):
         self._check_existing_enum_value(module_name, game_type, enum_member)
 
         enum_dict = self.enums[module_name].setdefault(game_type, {})
-        enum_dict[enum_member.value] = GameEnumInfo(enum_member, module_name)
+        old_info = enum_dict.get(enum_member.value)
+        enum_info = enum_dict[enum_member.value] = GameEnumInfo(enum_member, module_name)
+        index_infos = self.enum_index.setdefault((game_type, enum_member.value), [])
+        if old_info is not None:
+            index_infos[index_infos.index(old_info)] = enum_info  # replaced in `enums`, so replace here too
+        else:
+            index_infos.append(enum_info)
 
     def _load_module(self, module_name: str, module: ModuleType):
         """Iterate over all `GameObjectInt`-inheriting classes in `module` and register their IDs and values.
@@ -324,33 +451,27 @@ class GameEnumsManager(abc.ABC):
         if not game_types:
             # Check ALL valid game types.
             is_any = True
-            game_types = []
-            for module_enums in self.enums.values():
-                game_types.extend(module_enums.keys())  # all enums in all modules (star modules still checked first)
+            game_types = self._all_module_game_types  # all enums in all modules (star modules still checked first)
         else:
             is_any = False
 
-        # Search all managed modules for given `enum_value`, starting with `star_import_module_names`.
+        # Search `enum_index` for given `enum_value` under each game type, sorting hits into star and non-star modules.
         # NOTE: To ensure maximum validity, we do NOT simply stop at the first hit (see docstring above for details).
 
+        star_import_module_names = set(star_import_module_names)
         type_found = False
         star_hits = []
-        if star_import_module_names:
-            for star_module_name in star_import_module_names:
-                if star_module_name not in self.enums:
-                    # raise KeyError(f"Module name '{star_module_name}' was not loaded by this `GameEnumsManager`.")
-                    continue
-                module_enums = self.enums[star_module_name]
-                for game_type in game_types:
-                    if game_type not in module_enums:
-                        continue
-                    type_found = True
-                    # Type has been found. Look for matching value within.
-                    try:
-                        enum_info = module_enums[game_type][enum_value]
-                        star_hits.append(enum_info)
-                    except KeyError:
-                        continue  # value not found; try other `game_types`
+        non_star_hits = []
+        for game_type in game_types:
+            if game_type not in self._loaded_game_types:
+                continue
+            type_found = True
+            # Type has been found. Look for matching value within.
+            for enum_info in self.enum_index.get((game_type, enum_value), ()):
+                if enum_info.module_name in star_import_module_names:
+                    star_hits.append(enum_info)
+                else:
+                    non_star_hits.append(enum_info)
 
         if len(star_hits) > 1:
             msg = "\n    ".join(repr(info) for info in star_hits)
@@ -363,22 +484,6 @@ class GameEnumsManager(abc.ABC):
             return star_hits[0]
 
         # Try other modules.
-        non_star_hits = []
-        for module_name in self.enums:
-            if module_name in star_import_module_names:
-                continue  # already checked above
-            module_enums = self.enums[module_name]
-            for game_type in game_types:
-                if game_type not in module_enums:
-                    continue
-                type_found = True
-                # Type has been found. Look for matching value within.
-                try:
-                    enum_info = module_enums[game_type][enum_value]
-                    non_star_hits.append(enum_info)
-                except KeyError:
-                    continue  # value not found; try other `game_types`
-
         if len(non_star_hits) > 1:
             # TODO: Severity of this probably mostly depends on whether any restricted `game_types` were given. If not,
             #  this was already a hail mary; but if so, we do expect to find only one valid value for this game type...
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
-__all__ = ["ParamCrypt", "ParamCryptError"]
+__all__ = ["ParamCrypt", "ParamCryptError", "decrypt_regulation", "encrypt_regulation", "REGULATION_KEYS"]
 
 import logging
+import os
 import subprocess
 from pathlib import Path
 
 from soulstruct.exceptions import SoulstructError
+from soulstruct.utilities.aes import AES_BLOCK_SIZE, aes_cbc_decrypt, aes_cbc_encrypt
 
 _LOGGER = logging.getLogger(__name__)
 
 
 PARAM_CRYPT_EXE = Path(__file__).parent / "ParamCrypt.exe"
 
+# AES-256 keys for regulation files, by game type (same names as `ParamCrypt` executable).
+REGULATION_KEYS = {
+    "ds3": b"ds3#jn/8_7(rsY9pg55GFN7VFL#+3n/)",
+    "er": bytes.fromhex("99BFFC366A6BC8C6F5827D093602D676C42892A01C207FB024D3AF4E493FEF99"),
+}
+
 
 class ParamCryptError(SoulstructError):
     pass
@@ -22,7 +30,8 @@ class ParamCryptError(SoulstructError):
 def ParamCrypt(input_file_path: Path | str, mode="", game_type="", output_file_path: Path | str = ""):
     """Run `ParamCrypt` executable to encrypt/decrypt DS3 or ER Param binder.
 
-    Does not touch DCX, open the Binder, etc.
+    Does not touch DCX, open the Binder, etc. Requires .NET, so prefer `decrypt_regulation()` and
+    `encrypt_regulation()`, which do the same thing in memory.
 
     Args:
         input_file_path: path of file to encrypt/decrypt.
@@ -48,3 +57,35 @@ def ParamCrypt(input_file_path: Path | str, mode="", game_type="", output_file_p
 
     if output.returncode != 0:
         raise ParamCryptError(f"`ParamCrypt` encountered an error: {output.stderr}")
+
+
+def _get_regulation_key(game_type: str) -> bytes:
+    try:
+        return REGULATION_KEYS[game_type.lower()]
+    except KeyError:
+        raise ValueError(f"`game_type` must be 'ds3' or 'er', not: {game_type}")
+
+
+def decrypt_regulation(encrypted_data: bytes, game_type="er") -> bytes:
+    """Decrypt DS3 or ER regulation data, which is a 16-byte IV followed by AES-256-CBC encrypted data.
+
+    Returns the decrypted data (a DCX-compressed `Binder`), which may have trailing padding (ignored by DCX).
+    """
+    key = _get_regulation_key(game_type)
+    if len(encrypted_data) < AES_BLOCK_SIZE or len(encrypted_data) % AES_BLOCK_SIZE != 0:
+        raise ParamCryptError(f"Invalid encrypted regulation size: {len(encrypted_data)}")
+    iv = encrypted_data[:AES_BLOCK_SIZE]
+    return aes_cbc_decrypt(key, iv, encrypted_data[AES_BLOCK_SIZE:])
+
+
+def encrypt_regulation(data: bytes, game_type="er", iv: bytes = None) -> bytes:
+    """Encrypt DS3 or ER regulation `data` (a DCX-compressed `Binder`) as read by `decrypt_regulation()`.
+
+    `data` is padded with zeroes to a multiple of 16 bytes. A random IV is used unless `iv` is given.
+    """
+    key = _get_regulation_key(game_type)
+    if iv is None:
+        iv = os.urandom(AES_BLOCK_SIZE)
+    if len(data) % AES_BLOCK_SIZE != 0:
+        data += b"\0" * (AES_BLOCK_SIZE - len(data) % AES_BLOCK_SIZE)
+    return iv + aes_cbc_encrypt(key, iv, data)
@@ -2,3 +2,6 @@ from .param_row import PARAM_GAME_TYPE, ParamRow, ParamFieldMetadata
 from .param import Param
 from .gameparambnd import GameParamBND
 from .paramdef import ParamDefField, ParamDef, ParamDefBND
+from .param_diff import ParamDiff, GameParamDiff, ParamMergeConflict
+from .param_view import ParamView
+from .param_query import ParamColumn, ParamCondition, ParamFieldComparisonType
@@ -4,6 +4,7 @@ __all__ = ["GameParamBND", "param_property"]
 
 import abc
 import logging
+import multiprocessing
 import typing as tp
 from dataclasses import field
 from pathlib import Path
@@ -12,11 +13,12 @@ from types import ModuleType
 from soulstruct.base.game_types import BaseGameParam
 from soulstruct.containers import Binder, BinderEntry
 from soulstruct.exceptions import SoulstructError
-from soulstruct.utilities.files import read_json, write_json
+from soulstruct.utilities.files import iter_json_lines, read_json, write_json
 from soulstruct.utilities.misc import BiDict
 
 from .param import Param, TypedParam
-from .param_dict import ParamDict
+from .param_dict import ParamDict, unpack_row_values
+from .paramdef.core import ParamDef
 from .paramdef.paramdefbnd import ParamDefBND
 
 _LOGGER = logging.getLogger(__name__)
@@ -85,18 +87,35 @@ class GameParamBND(Binder, abc.ABC):
             )
         return TypedParam(row_type)
 
-    def unpack_all_param_rows(self, paramdefbnd: ParamDefBND = None):
+    def unpack_all_param_rows(self, paramdefbnd: ParamDefBND = None, processes: int | None = 1):
         """Unpack all row data of all `ParamDict` entries using `paramdefbnd` (defaults to bundled file).
 
-        Ignores true `Param` entries that are already using the generated `ParamRow` subclasses.
+        Ignores true `Param` entries that are already using the generated `ParamRow` subclasses. If `processes` is
+        `None` (all CPUs) or greater than one, `ParamDict`s are unpacked in a worker pool.
         """
         if paramdefbnd is None:
             paramdefbnd = ParamDefBND.from_bundled(self.get_game())
-        unpacked = []
-        for param_stem, param in self.params.values():
-            if isinstance(param, ParamDict):
+        param_dicts = {
+            param_stem: param
+            for param_stem, param in self.params.items()
+            if isinstance(param, ParamDict) and param.row_bytes is not None
+        }
+        unpacked = list(param_dicts)
+        if processes == 1 or len(param_dicts) <= 1:
+            for param in param_dicts.values():
                 param.unpack_rows(paramdefbnd)
-                unpacked.append(param_stem)
+        else:
+            paramdefs = [param.get_paramdef(paramdefbnd) for param in param_dicts.values()]
+            mp_args = [
+                (paramdef, [data for _, _, data in param.row_bytes.values()])
+                for paramdef, param in zip(paramdefs, param_dicts.values())
+            ]
+            with multiprocessing.Pool(processes=processes) as pool:
+                all_row_values = pool.starmap(_unpack_row_values_mp, mp_args)  # blocks here until all done
+            for (param_stem, param), paramdef, row_values in zip(param_dicts.items(), paramdefs, all_row_values):
+                if row_values is None:
+                    raise ValueError(f"Failed to unpack rows of `ParamDict` '{param_stem}' (see log).")
+                param.set_unpacked_rows(paramdef, row_values)
         if not unpacked:
             _LOGGER.info("No `ParamDict`s in this `GameParamBND` whose row data needs unpacking.")
         else:
@@ -173,13 +192,15 @@ class GameParamBND(Binder, abc.ABC):
         return data
 
     @classmethod
-    def from_json_directory(cls, directory: Path | str) -> tp.Self:
+    def from_json_directory(cls, directory: Path | str, processes: int | None = 1) -> tp.Self:
         """Load individual Param JSON files from an unpacked Binder folder (e.g. produced by `write_json_directory()`).
 
         The stems of the Param JSON files to be loaded from the folder are recorded in the `entries` key of the
-        `GameParamBND_manifest.json` file.
+        `GameParamBND_manifest.json` file. Each Param is read from its `.json` file or, if that does not exist, its
+        newline-delimited `.ndjson` file.
 
-        Functionally very similar to `from_dict()`, but avoids the need for one gigantic JSON file for all Params.
+        Functionally very similar to `from_dict()`, but avoids the need for one gigantic JSON file for all Params. If
+        `processes` is `None` (all CPUs) or greater than one, Param files are read in a worker pool.
         """
         directory = Path(directory)
         manifest_path = directory / "GameParamBND_manifest.json"
@@ -190,28 +211,40 @@ class GameParamBND(Binder, abc.ABC):
         if "entries" not in manifest:
             raise ValueError(f"`entries` key not in `GameParamBND` JSON manifest: {manifest_path}")
 
-        manifest["params"] = {}
+        mp_args = []
         for json_stem in manifest.pop("entries"):
             param_stem = cls.PARAM_NICKNAMES[json_stem]  # JSON nickname stem -> internal stem
-            param_dict = read_json(directory / f"{json_stem}.json")
-            try:
-                row_type = getattr(cls.PARAMDEF_MODULE, param_dict["param_type"])
-            except KeyError:
-                raise KeyError(f"Param JSON `{param_stem}.json` does not have 'param_type' key.")
-            except AttributeError:
-                raise ValueError(f"Unknown 'param_type' `{param_dict['param_type']} in Param JSON: {param_stem}.json")
-            typed_param_class = TypedParam(row_type)
-            manifest["params"][param_stem] = typed_param_class.from_dict(param_dict)
+            json_path = directory / f"{json_stem}.json"
+            if not json_path.is_file() and json_path.with_suffix(".ndjson").is_file():
+                json_path = json_path.with_suffix(".ndjson")
+            mp_args.append((cls, param_stem, json_path))
+
+        if processes == 1 or len(mp_args) <= 1:
+            params = [_read_param_json(*args) for args in mp_args]
+        else:
+            with multiprocessing.Pool(processes=processes) as pool:
+                params = pool.starmap(_read_param_json_mp, mp_args)  # blocks here until all done
+
+        manifest["params"] = {}
+        for (_, param_stem, json_path), param in zip(mp_args, params):
+            if param is None:
+                raise ValueError(f"Failed to read Param JSON file '{json_path}' (see log).")
+            manifest["params"][param_stem] = param
 
         gameparambnd = cls.from_dict(manifest)
         gameparambnd.path = directory  # TODO: auto-detect better default path, e.g. for binary?
         return gameparambnd
 
-    def write_json_directory(self, directory: Path | str, ignore_pads=True, ignore_defaults=True):
+    def write_json_directory(
+        self, directory: Path | str, ignore_pads=True, ignore_defaults=True, ndjson=False, processes: int | None = 1
+    ):
         """Write a folder containing a `GameParamBND_manifest.json` file with standard `Binder` header information and
         a list of Param JSON file stems to load from the same folder.
 
         The resulting folder can be loaded with `from_json_directory(directory)`.
+
+        If `ndjson` is True, each Param is written with `Param.write_ndjson()` to a newline-delimited `.ndjson` file
+        instead. If `processes` is `None` (all CPUs) or greater than one, Param files are written in a worker pool.
         """
         directory = Path(directory)
         directory.mkdir(parents=True, exist_ok=True)
@@ -219,11 +252,21 @@ class GameParamBND(Binder, abc.ABC):
         manifest.pop("use_id_prefix")
         manifest["entries"] = []
 
+        mp_args = []
         for param_stem, param in self.params.items():
             json_stem = self.PARAM_NICKNAMES[param_stem]
-            param.write_json(directory / f"{json_stem}.json", ignore_pads=ignore_pads, ignore_defaults=ignore_defaults)
+            mp_args.append((param, directory / f"{json_stem}.json", ignore_pads, ignore_defaults, ndjson))
             manifest["entries"].append(json_stem)
 
+        if processes == 1 or len(mp_args) <= 1:
+            for args in mp_args:
+                _write_param_json(*args)
+        else:
+            with multiprocessing.Pool(processes=processes) as pool:
+                written = pool.starmap(_write_param_json_mp, mp_args)  # blocks here until all done
+            if not all(written):
+                raise ValueError("Failed to write some Param JSON files (see log).")
+
         write_json(directory / "GameParamBND_manifest.json", manifest)
 
     def get_param(self, param_name: str) -> Param:
@@ -247,3 +290,59 @@ def param_property(param_stem: str):
         `ActionButtons = param_property("ActionButtonParam")`
     """
     return property(lambda self: self.params[param_stem])
+
+
+def _unpack_row_values_mp(paramdef: ParamDef, row_datas: list[bytes]) -> list[tuple] | None:
+    """Function for `ParamDict` worker pool."""
+    try:
+        return unpack_row_values(paramdef, row_datas)
+    except Exception as ex:
+        _LOGGER.error(f"Failed to unpack rows of `ParamDict` with type {paramdef.param_type}. Error: {str(ex)}")
+        return None
+
+
+def _read_param_json(gameparambnd_class: type[GameParamBND], param_stem: str, json_path: Path) -> Param:
+    """Read `Param` from JSON or NDJSON file, using its `param_type` to get its `TypedParam` class from the
+    `PARAMDEF_MODULE` of `gameparambnd_class`."""
+    if json_path.suffix == ".ndjson":
+        param_dict = next(iter_json_lines(json_path), {})  # header line only
+    else:
+        param_dict = read_json(json_path)
+    try:
+        row_type = getattr(gameparambnd_class.PARAMDEF_MODULE, param_dict["param_type"])
+    except KeyError:
+        raise KeyError(f"Param JSON `{param_stem}.json` does not have 'param_type' key.")
+    except AttributeError:
+        raise ValueError(f"Unknown 'param_type' `{param_dict['param_type']} in Param JSON: {param_stem}.json")
+    typed_param_class = TypedParam(row_type)
+    if json_path.suffix == ".ndjson":
+        return typed_param_class.from_ndjson(json_path)
+    return typed_param_class.from_dict(param_dict)
+
+
+def _write_param_json(param: Param, json_path: Path, ignore_pads: bool, ignore_defaults: bool, ndjson: bool):
+    if ndjson:
+        param.write_ndjson(json_path.with_suffix(".ndjson"), ignore_pads=ignore_pads, ignore_defaults=ignore_defaults)
+    else:
+        param.write_json(json_path, ignore_pads=ignore_pads, ignore_defaults=ignore_defaults)
+
+
+def _read_param_json_mp(gameparambnd_class: type[GameParamBND], param_stem: str, json_path: Path) -> Param | None:
+    """Function for `GameParamBND` worker pool."""
+    try:
+        return _read_param_json(gameparambnd_class, param_stem, json_path)
+    except Exception as ex:
+        _LOGGER.error(f"Failed to read Param JSON file '{json_path}'. Error: {str(ex)}")
+        return None
+
+
+def _write_param_json_mp(
+    param: Param, json_path: Path, ignore_pads: bool, ignore_defaults: bool, ndjson: bool
+) -> bool:
+    """Function for `GameParamBND` worker pool."""
+    try:
+        _write_param_json(param, json_path, ignore_pads, ignore_defaults, ndjson)
+    except Exception as ex:
+        _LOGGER.error(f"Failed to write Param JSON file '{json_path}'. Error: {str(ex)}")
+        return False
+    return True
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-__all__ = ["Param", "TypedParam"]
+__all__ = ["Param", "ParamHeader", "TypedParam"]
 
 import abc
+import itertools
 import logging
+import struct
+import sys
 import typing as tp
 from dataclasses import field
 from pathlib import Path
@@ -13,8 +16,11 @@ from soulstruct.base.game_file import GameFile
 from soulstruct.dcx import DCXType
 from soulstruct.utilities.binary import *
 from soulstruct.utilities.text import pad_chars
-from soulstruct.utilities.files import write_json
+from soulstruct.utilities.files import iter_json_lines, write_json_lines, write_json_stream
 
+import numpy as np
+
+from .param_query import ParamCondition, get_row_column, set_row_column
 from .param_row import ParamRow
 from .flags import ParamFlags1, ParamFlags2
 
@@ -24,6 +30,19 @@ _LOGGER = logging.getLogger(__name__)
 PARAM_ROW_DATA_T = tp.TypeVar("PARAM_ROW_DATA_T", bound=ParamRow)
 
 
+class ParamHeader(tp.NamedTuple):
+    """Information from the header of a binary `.param` file. Order matches `Param` fields."""
+    byte_order: ByteOrder
+    param_type: str
+    unknown: int
+    flags1: ParamFlags1
+    flags2: ParamFlags2
+    paramdef_data_version: int
+    paramdef_format_version: int
+    name_data_offset: int  # CANNOT BE TRUSTED IN VANILLA FILES! Off by +12 bytes.
+    row_count: int
+
+
 class Param(tp.Generic[PARAM_ROW_DATA_T], GameFile, abc.ABC):
     """Table of `ParamRows` (spreadsheet entries full of numbers used all over the place).
 
@@ -53,6 +72,14 @@ class Param(tp.Generic[PARAM_ROW_DATA_T], GameFile, abc.ABC):
         data_offset: long
         name_offset: long
 
+    # Plain `Struct`s for the above, keyed by byte order and `LongDataOffset` flag, for unpacking the whole row
+    # pointer table at once.
+    ROW_POINTER_STRUCTS: tp.ClassVar[dict[tuple[ByteOrder, bool], struct.Struct]] = {
+        (byte_order, long_data_offset): struct.Struct(byte_order.value + ("iiqq" if long_data_offset else "iII"))
+        for byte_order in (ByteOrder.LittleEndian, ByteOrder.BigEndian)
+        for long_data_offset in (False, True)
+    }
+
     param_type: str = ""
     big_endian: bool = False
     unknown: int = 0
@@ -98,59 +125,63 @@ class Param(tp.Generic[PARAM_ROW_DATA_T], GameFile, abc.ABC):
     def field_names(self):
         return self.ROW_TYPE.get_binary_field_names()
 
+    def get_column(self, field_name: str, row_ids: tp.Iterable[int] = None) -> np.ndarray:
+        """Get values of one field (by name or internal name) for all rows (in `rows` order) or just `row_ids` (in that
+        order) as a NumPy array. Array fields produce a 2D array."""
+        rows = self.rows.values() if row_ids is None else [self[row_id] for row_id in row_ids]
+        return get_row_column(self.ROW_TYPE, rows, field_name)
+
+    def get_row_mask(self, condition: ParamCondition) -> np.ndarray:
+        """Evaluate `condition` (e.g. `(ParamColumn("Weight") > 2.0) & (ParamColumn("WeaponCategory") == 24)`) for all
+        rows and return the boolean mask (in `rows` order). Each field used by `condition` is only read once."""
+        columns = {field_name: self.get_column(field_name) for field_name in condition.get_field_names()}
+        return np.broadcast_to(condition.evaluate(columns), (len(self.rows),))
+
+    def find_row_ids(self, condition: ParamCondition) -> list[int]:
+        """Return IDs of all rows that match `condition` (in `rows` order)."""
+        return list(itertools.compress(self.rows.keys(), self.get_row_mask(condition)))
+
+    def find_rows(self, condition: ParamCondition) -> dict[int, PARAM_ROW_DATA_T]:
+        """Return all rows that match `condition`."""
+        return dict(itertools.compress(self.rows.items(), self.get_row_mask(condition)))
+
+    def update_rows(self, condition: ParamCondition | None, field_values: dict[str, tp.Any]) -> list[int]:
+        """Set fields of all rows that match `condition` (or all rows, if `None`), and return the IDs of those rows.
+
+        Each value in `field_values` may be one value for all rows, a sequence or array with one value per matching row
+        (in `rows` order), or a callable that takes an array of the field's current values and returns the new values
+        (e.g. `{"Weight": lambda weight: weight * 1.1}`). New values are converted to the field's type, with floats
+        rounded to the nearest integer for integer fields.
+        """
+        if condition is None:
+            row_ids, rows = list(self.rows.keys()), list(self.rows.values())
+        else:
+            mask = self.get_row_mask(condition)
+            row_ids = list(itertools.compress(self.rows.keys(), mask))
+            rows = list(itertools.compress(self.rows.values(), mask))
+        for field_name, values in field_values.items():
+            set_row_column(self.ROW_TYPE, rows, field_name, values)
+        return row_ids
+
     # TODO: __repr__ method returns basic information about Param (but not entire row list).
 
     @classmethod
     def from_reader(cls, reader: BinaryReader):
         """Reads a `Param` from a `BinaryReader` loaded from a binary `.param` file."""
+        (
+            byte_order, param_type, unknown, flags1, flags2,
+            paramdef_data_version, paramdef_format_version, name_data_offset, row_count,
+        ) = cls.unpack_header(reader)
 
-        # Peek at struct-affecting info:
-        byte_order = ByteOrder.BigEndian if reader["b", 0x2c] == -1 else ByteOrder.LittleEndian
-        reader.byte_order = byte_order
-        version_info = reader.unpack("bbb", offset=0x2d)
-        flags1 = ParamFlags1(version_info[0])
-        flags2 = ParamFlags2(version_info[1])
-        paramdef_format_version = version_info[2]
-
-        name_data_offset = reader["I"]  # CANNOT BE TRUSTED IN VANILLA FILES! Off by +12 bytes.
-        _row_data_offset = reader["H"]  # NOT USED! It's an unsigned short, but can be larger.
-        if ((flags1[0] and flags1.IntDataOffset) or flags1.LongDataOffset) and _row_data_offset != 0:
-            raise ValueError(f"Expected `_row_data_offset` of zero in this `Param`, not: {_row_data_offset}")
-        unknown = reader["H"]
-        if unknown not in {0, 1, 2}:  # TODO: Value of 2 in Elden Ring 'BaseChrSelectMenuParam'
-            raise ValueError(f"Expected `unknown` of 0 or 1 in this `Param`, not: {unknown}")
-        paramdef_data_version = reader["H"]
-        row_count = reader["H"]
-
-        if flags1.OffsetParam:
-            reader.assert_pad(4)
-            param_type_offset = reader["q"]
-            param_type = reader.unpack_string(offset=param_type_offset, encoding="ASCII")  # e.g. 'NPC_PARAM_ST'
-            reader.assert_pad(20)
-        else:
-            param_type = reader.unpack_string(length=32, encoding="ASCII")
-
-        reader.read(4)  # big endian, flags1, flags2, paramdef_format_version
-
-        if flags1[0] and flags1.IntDataOffset:
-            _row_data_offset = reader["i"]  # not needed while unpacking
-            reader.assert_pad(12)
-        elif flags1.LongDataOffset:
-            _row_data_offset = reader["q"]  # not needed while unpacking
-            reader.assert_pad(8)
-        # End of header.
-
-        # Load row pointer data.
-        row_pointer_struct_type = cls.RowPointerStruct64 if flags1.LongDataOffset else cls.RowPointerStruct32
-        row_pointer_structs = [
-            row_pointer_struct_type.from_bytes(reader) for _ in range(row_count)
-        ]  # type: list[cls.RowPointerStruct64] | list[cls.RowPointerStruct32]
+        # Load row pointer data (`(row_id, ..., data_offset, name_offset)` tuples) in one go.
+        row_pointer_struct = cls.ROW_POINTER_STRUCTS[byte_order, bool(flags1.LongDataOffset)]
+        row_pointers = list(row_pointer_struct.iter_unpack(reader.read(row_pointer_struct.size * row_count)))
 
         # Reliable row data offset (unlike header one).
         row_data_offset = reader.position
 
         # If there are no row pointer structs, return an empty `Param`.
-        if len(row_pointer_structs) == 0:
+        if len(row_pointers) == 0:
             return cls(
                 param_type=param_type,
                 big_endian=ByteOrder == ByteOrder.BigEndian,
@@ -163,7 +194,7 @@ class Param(tp.Generic[PARAM_ROW_DATA_T], GameFile, abc.ABC):
             )
 
         # Row size is lazily determined.
-        if len(row_pointer_structs) == 1:
+        if len(row_pointers) == 1:
             # NOTE: The only vanilla param in Dark Souls with one row is LEVELSYNC_PARAM_ST (Remastered only),
             # for which the row size is hard-coded here. Otherwise, we can trust the repacked offset from Soulstruct
             # (and SoulsFormats, etc.).
@@ -172,37 +203,42 @@ class Param(tp.Generic[PARAM_ROW_DATA_T], GameFile, abc.ABC):
             else:  # best guess
                 row_size = name_data_offset - row_data_offset
         else:  # most reliable: just use difference between first two row pointer data offsets
-            row_size = row_pointer_structs[1].data_offset - row_pointer_structs[0].data_offset
+            row_size = row_pointers[1][-2] - row_pointers[0][-2]
 
         # Note that we no longer need to track reader offset.
-        rows = {}
         name_encoding = cls.get_name_encoding(byte_order == ByteOrder.BigEndian, flags2)
-        # TODO: Would be more efficient to unpack row data in sequence and assign row names afterwards.
-        for row_struct in row_pointer_structs:
-            reader.seek(row_struct.data_offset)
-            row_data = reader.read(row_size)
+        row_list = cls._unpack_row_block(reader, row_pointers, row_size)
+        if row_list is None:
+            # Irregular row layout or row type. Unpack each row separately.
+            row_list = []
+            for _, *_, data_offset, _ in row_pointers:
+                reader.seek(data_offset)
+                row_data = reader.read(row_size)
+                try:
+                    row_list.append(cls.ROW_TYPE.from_bytes(row_data))
+                except Exception as ex:
+                    raise ValueError(
+                        f"Could not read `ParamRow` of data type `{cls.__name__}` from {len(row_data)} bytes: {ex}"
+                    )
+
+        # Assign names in a second pass.
+        rows = {}
+        for (row_id, *_, name_offset), row in zip(row_pointers, row_list):
+            if row_id in rows:
+                _LOGGER.warning(f"Repeated param row ID in {param_type}: {row_id}. Only first will be kept.")
+                continue
             raw_name = b""
             name = ""
-            if row_struct.name_offset != 0:
-                reader.seek(row_struct.name_offset)
-                raw_name = reader.unpack_bytes()  # null-terminated raw name
+            if name_offset != 0:
+                raw_name = reader.unpack_bytes(offset=name_offset)  # null-terminated raw name
                 try:
                     name = raw_name.decode(name_encoding)
                 except UnicodeDecodeError:
                     # For whatever reason, some vanilla row names are junk (notably in DS1 DrawParam).
                     pass
-            if row_struct.row_id in rows:
-                _LOGGER.warning(f"Repeated param row ID in {param_type}: {row_struct.row_id}. Only first will be kept.")
-            else:
-                try:
-                    row = cls.ROW_TYPE.from_bytes(row_data)
-                except Exception as ex:
-                    raise ValueError(
-                        f"Could not read `ParamRow` of data type `{cls.__name__}` from {len(row_data)} bytes: {ex}"
-                    )
-                row.RawName = raw_name
-                row.Name = name
-                rows[row_struct.row_id] = row
+            row.RawName = raw_name
+            row.Name = name
+            rows[row_id] = row
 
         return cls(
             param_type=param_type,
@@ -215,6 +251,79 @@ class Param(tp.Generic[PARAM_ROW_DATA_T], GameFile, abc.ABC):
             rows=rows,
         )
 
+    @classmethod
+    def unpack_header(cls, reader: BinaryReader) -> ParamHeader:
+        """Unpack `.param` file header from the start of `reader`, leaving it at the start of the row pointers.
+
+        Also sets the byte order of `reader`.
+        """
+        # Peek at struct-affecting info:
+        byte_order = ByteOrder.BigEndian if reader["b", 0x2c] == -1 else ByteOrder.LittleEndian
+        reader.byte_order = byte_order
+        version_info = reader.unpack("bbb", offset=0x2d)
+        flags1 = ParamFlags1(version_info[0])
+        flags2 = ParamFlags2(version_info[1])
+        paramdef_format_version = version_info[2]
+
+        name_data_offset = reader["I"]  # CANNOT BE TRUSTED IN VANILLA FILES! Off by +12 bytes.
+        _row_data_offset = reader["H"]  # NOT USED! It's an unsigned short, but can be larger.
+        if ((flags1[0] and flags1.IntDataOffset) or flags1.LongDataOffset) and _row_data_offset != 0:
+            raise ValueError(f"Expected `_row_data_offset` of zero in this `Param`, not: {_row_data_offset}")
+        unknown = reader["H"]
+        if unknown not in {0, 1, 2}:  # TODO: Value of 2 in Elden Ring 'BaseChrSelectMenuParam'
+            raise ValueError(f"Expected `unknown` of 0 or 1 in this `Param`, not: {unknown}")
+        paramdef_data_version = reader["H"]
+        row_count = reader["H"]
+
+        if flags1.OffsetParam:
+            reader.assert_pad(4)
+            param_type_offset = reader["q"]
+            param_type = reader.unpack_string(offset=param_type_offset, encoding="ASCII")  # e.g. 'NPC_PARAM_ST'
+            reader.assert_pad(20)
+        else:
+            param_type = reader.unpack_string(length=32, encoding="ASCII")
+
+        reader.read(4)  # big endian, flags1, flags2, paramdef_format_version
+
+        if flags1[0] and flags1.IntDataOffset:
+            _row_data_offset = reader["i"]  # not needed while unpacking
+            reader.assert_pad(12)
+        elif flags1.LongDataOffset:
+            _row_data_offset = reader["q"]  # not needed while unpacking
+            reader.assert_pad(8)
+        # End of header.
+
+        return ParamHeader(
+            byte_order=byte_order,
+            param_type=param_type,
+            unknown=unknown,
+            flags1=flags1,
+            flags2=flags2,
+            paramdef_data_version=paramdef_data_version,
+            paramdef_format_version=paramdef_format_version,
+            name_data_offset=name_data_offset,
+            row_count=row_count,
+        )
+
+    @classmethod
+    def _unpack_row_block(
+        cls, reader: BinaryReader, row_pointers: list[tuple[int, ...]], row_size: int
+    ) -> list[PARAM_ROW_DATA_T] | None:
+        """Unpack all rows in sequence with `ParamRow.unpack_rows()` if they are stored contiguously, in order, with
+        no padding between them (as they are in all known vanilla files). Returns `None` otherwise."""
+        first_data_offset = row_pointers[0][-2]
+        for i, row_pointer in enumerate(row_pointers):
+            if row_pointer[-2] != first_data_offset + i * row_size:
+                return None
+        row_byte_order = cls.ROW_TYPE.DEFAULT_BYTE_ORDER  # same as `from_bytes(row_data)`
+        if row_size != cls.ROW_TYPE.get_size(row_byte_order):
+            return None  # e.g. extra row padding
+        reader.seek(first_data_offset)
+        try:
+            return cls.ROW_TYPE.unpack_rows(reader.read(row_size * len(row_pointers)), row_byte_order)
+        except Exception as ex:
+            raise ValueError(f"Could not read `ParamRow`s of data type `{cls.__name__}`: {ex}")
+
     def sort(self):
         """Sort rows by ID."""
         self.rows = {row_id: self.rows[row_id] for row_id in sorted(self.rows)}
@@ -332,7 +441,13 @@ class Param(tp.Generic[PARAM_ROW_DATA_T], GameFile, abc.ABC):
 
     def to_dict(self, ignore_pads=True, ignore_defaults=True, use_internal_names=False) -> dict[str, tp.Any]:
         """Provides options to ignore pad fields and/or fields with default values."""
-        data = {
+        data = self.get_header_dict()
+        data["rows"] = dict(self.iter_row_dicts(ignore_pads, ignore_defaults, use_internal_names))
+        return data
+
+    def get_header_dict(self) -> dict[str, tp.Any]:
+        """Dictionary of all `to_dict()` values except `rows`."""
+        return {
             "param_type": self.param_type,
             # `paramdef` not added.
             "big_endian": self.big_endian,
@@ -341,13 +456,18 @@ class Param(tp.Generic[PARAM_ROW_DATA_T], GameFile, abc.ABC):
             "flags1": self.flags1.pack(),
             "flags2": self.flags2.pack(),
             "paramdef_format_version": self.paramdef_format_version,
-            "rows": {},
         }
+
+    def iter_row_dicts(
+        self, ignore_pads=True, ignore_defaults=True, use_internal_names=False
+    ) -> tp.Iterator[tuple[int, dict[str, tp.Any]]]:
+        """Generate `(row_id, row_dict)` pairs for `to_dict()` in sorted row ID order, one row at a time."""
         # Row name encoding needed to update `RawName`.
         row_name_encoding = self.get_name_encoding(self.big_endian, self.flags2)
-        for i in sorted(self.rows):
-            data["rows"][i] = self.rows[i].to_dict(ignore_pads, ignore_defaults, use_internal_names, row_name_encoding)
-        return data
+        row_ids = sorted(self.rows)
+        rows = (self.rows[row_id] for row_id in row_ids)
+        row_dicts = self.ROW_TYPE.iter_dicts(rows, ignore_pads, ignore_defaults, use_internal_names, row_name_encoding)
+        return zip(row_ids, row_dicts)
 
     @classmethod
     def from_json(cls, json_path: str | Path) -> tp.Self:
@@ -359,16 +479,62 @@ class Param(tp.Generic[PARAM_ROW_DATA_T], GameFile, abc.ABC):
     def write_json(
         self, file_path: Path | str = None, encoding="utf-8", indent=4, ignore_pads=True, ignore_defaults=True
     ):
-        """Extra arguments passed through to `Param.to_dict()`."""
-        json_dict = self.to_dict(ignore_pads=ignore_pads, ignore_defaults=ignore_defaults)
+        """Extra arguments passed through to `Param.to_dict()`.
+
+        Rows are converted and written one at a time, rather than converting the whole `Param` first, but the file is
+        identical to one written from `to_dict()`.
+        """
+        file_path = self._get_json_path(file_path, ".json")
+        data = self.get_header_dict() | {"rows": None}
+        rows = self.iter_row_dicts(ignore_pads=ignore_pads, ignore_defaults=ignore_defaults)
+        write_json_stream(file_path, data, "rows", rows, indent=indent, encoding=encoding)
+
+    @classmethod
+    def from_ndjson(cls, ndjson_path: str | Path, encoding="utf-8") -> tp.Self:
+        """Read newline-delimited JSON file written by `write_ndjson()`, one row at a time."""
+        if cls.ROW_TYPE is None:
+            raise TypeError("Cannot call `Param.from_ndjson()` on `Param` of unknown row type.")
+        lines = iter_json_lines(ndjson_path, encoding=encoding)
+        try:
+            data = next(lines)  # type: dict[str, tp.Any]
+        except StopIteration:
+            raise ValueError(f"Param NDJSON file is empty: {ndjson_path}")
+        row_name_encoding = cls.get_name_encoding(data["big_endian"], ParamFlags2(int(data.get("flags2", 0))))
+        data["rows"] = {
+            row_id: cls.ROW_TYPE.from_dict(row_dict, row_name_encoding=row_name_encoding) for row_id, row_dict in lines
+        }
+        param = cls.from_dict(data)
+        param.path = Path(ndjson_path)
+        return param
+
+    def write_ndjson(self, file_path: Path | str = None, encoding="utf-8", ignore_pads=True, ignore_defaults=True):
+        """Write `Param` as newline-delimited JSON, one row at a time: the `to_dict()` header on the first line, then a
+        `[row_id, row_dict]` list on each line. Read it with `from_ndjson()`.
+
+        The file path will have the `.ndjson` suffix added automatically if missing.
+        """
+        file_path = self._get_json_path(file_path, ".ndjson")
+        rows = self.iter_row_dicts(ignore_pads=ignore_pads, ignore_defaults=ignore_defaults)
+        write_json_lines(file_path, self.get_header_dict(), rows, encoding=encoding)
+
+    def _get_json_path(self, file_path: Path | str | None, suffix: str) -> Path:
         if file_path is None:
             if self.path is None:
                 raise ValueError("You must specify `file_path` because file default `path` has not been set.")
             file_path = self.path
         file_path = Path(file_path)
-        if file_path.suffix != ".json":
-            file_path = file_path.with_suffix(file_path.suffix + ".json")
-        write_json(file_path, json_dict, indent=indent, encoding=encoding)
+        if file_path.suffix != suffix:
+            file_path = file_path.with_suffix(file_path.suffix + suffix)
+        return file_path
+
+    def __reduce_ex__(self, protocol):
+        """Classes from `TypedParam()` cannot be found by name, so they are pickled (e.g. for worker processes) as their
+        `ROW_TYPE` and retrieved again with `TypedParam()` when unpickled."""
+        reduced = super().__reduce_ex__(protocol)
+        param_class = type(self)
+        if self.ROW_TYPE is None or hasattr(sys.modules[param_class.__module__], param_class.__name__):
+            return reduced
+        return (_new_typed_param, (self.ROW_TYPE,)) + tuple(reduced[2:])
 
     def get_range(self, start, count):
         return [(row_id, self[row_id]) for row_id in sorted(self.rows)[start:start + count]]
@@ -426,3 +592,9 @@ def TypedParam(row_type: type[ParamRow]):
     new_param_subclass = type(f"Param_{row_type.__name__}", (Param,), {"ROW_TYPE": row_type})
     new_param_subclass.__module__ = row_type.__module__
     return new_param_subclass
+
+
+def _new_typed_param(row_type: type[ParamRow]) -> Param:
+    """Create empty `TypedParam` instance when unpickling."""
+    param_class = TypedParam(row_type)
+    return param_class.__new__(param_class)
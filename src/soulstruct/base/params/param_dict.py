@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-__all__ = ["ParamDict", "ParamDictRow"]
+__all__ = ["ParamDict", "ParamDictRow", "unpack_row_values"]
 
 import copy
 import logging
@@ -9,11 +9,10 @@ import typing as tp
 from dataclasses import field, dataclass
 
 from constrata import BinaryReader, ByteOrder, BinaryWriter
-from constrata.streams import BitFieldReader, BitFieldWriter
+from constrata.streams import BitFieldReader
 
 from soulstruct.base.params import Param
-from soulstruct.base.params.flags import ParamFlags1, ParamFlags2
-from soulstruct.base.params.paramdef import ParamDef, ParamDefBND, ParamDefField, field_types as ft
+from soulstruct.base.params.paramdef import ParamDef, ParamDefBND, ParamDefField, ParamDefRowCodec, field_types as ft
 from soulstruct.utilities.text import pad_chars
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,53 +32,20 @@ class ParamDict(Param):
 
     @classmethod
     def from_reader(cls, reader: BinaryReader):
-        """Use a `ParamDefBND` to """
-
-        # Peek at struct-affecting info:
-        byte_order = ByteOrder.BigEndian if reader["b", 0x2c] == -1 else ByteOrder.LittleEndian
-        version_info = reader.unpack("bbb", offset=0x2d)
-        flags1 = ParamFlags1(version_info[0])
-        flags2 = ParamFlags2(version_info[1])
-        paramdef_format_version = version_info[2]
-
-        row_names_offset = reader["I"]  # CANNOT BE TRUSTED IN VANILLA FILES! Off by +12 bytes.
-        _row_data_offset = reader["H"]  # NOT USED! It's an unsigned short, but can be larger.
-        if ((flags1[0] and flags1.IntDataOffset) or flags1.LongDataOffset) and _row_data_offset != 0:
-            raise ValueError(f"Expected `_row_data_offset` of zero in this `Param`, not: {_row_data_offset}")
-        unknown = reader["H"]
-        if unknown not in {0, 1}:
-            raise ValueError(f"Expected `unknown` of 0 or 1 in this `Param`, not: {unknown}")
-        paramdef_data_version = reader["H"]
-        row_count = reader["H"]
-
-        if flags1.OffsetParam:
-            reader.assert_pad(4)
-            param_type_offset = reader["q"]
-            param_type = reader.unpack_string(offset=param_type_offset, encoding="ASCII")  # e.g. 'NPC_PARAM_ST'
-            reader.assert_pad(20)
-        else:
-            param_type = reader.unpack_string(length=32, encoding="ASCII")
-
-        reader.read(4)  # big endian, flags1, flags2, paramdef_format_version
-
-        if flags1[0] and flags1.IntDataOffset:
-            _row_data_offset = reader["i"]  # not needed while unpacking
-            reader.assert_pad(12)
-        elif flags1.LongDataOffset:
-            _row_data_offset = reader["q"]  # not needed while unpacking
-            reader.assert_pad(8)
-        # End of header.
+        """Read header and raw row data. Use `unpack_rows()` with a `ParamDef` or `ParamDefBND` to unpack the rows."""
+        (
+            byte_order, param_type, unknown, flags1, flags2,
+            paramdef_data_version, paramdef_format_version, name_data_offset, row_count,
+        ) = cls.unpack_header(reader)
 
-        # Load row pointer data.
-        row_pointer_struct_type = cls.RowPointerStruct64 if flags1.LongDataOffset else cls.RowPointerStruct32
-        row_pointer_structs = [
-            row_pointer_struct_type.from_bytes(reader) for _ in range(row_count)
-        ]  # type: list[cls.RowPointerStruct64] | list[cls.RowPointerStruct32]
+        # Load row pointer data (`(row_id, ..., data_offset, name_offset)` tuples) in one go.
+        row_pointer_struct = cls.ROW_POINTER_STRUCTS[byte_order, bool(flags1.LongDataOffset)]
+        row_pointers = list(row_pointer_struct.iter_unpack(reader.read(row_pointer_struct.size * row_count)))
 
         # Reliable row data offset (unlike header one).
-        row_data_offset = reader.position  # Reliable row data offset.
+        row_data_offset = reader.position
 
-        if len(row_pointer_structs) == 0:
+        if len(row_pointers) == 0:
             # Empty `ParamDict`.
             return cls(
                 param_type=param_type,
@@ -93,38 +59,36 @@ class ParamDict(Param):
             )
 
         # Row size is lazily determined.
-        if len(row_pointer_structs) == 1:
+        if len(row_pointers) == 1:
             # NOTE: The only vanilla param in Dark Souls with one row is LEVELSYNC_PARAM_ST (Remastered only),
             # for which the row size is hard-coded here. Otherwise, we can trust the repacked offset from Soulstruct
             # (and SoulsFormats, etc.).
             if param_type == "LEVELSYNC_PARAM_ST":
                 row_size = 220
             else:  # best guess
-                row_size = row_names_offset - row_data_offset
+                row_size = name_data_offset - row_data_offset
         else:  # most reliable: just use difference between first two row pointer data offsets
-            row_size = row_pointer_structs[1].data_offset - row_pointer_structs[0].data_offset
+            row_size = row_pointers[1][-2] - row_pointers[0][-2]
 
         # Note that we no longer need to track reader offset.
         row_bytes = {}
         name_encoding = cls.get_name_encoding(byte_order == ByteOrder.BigEndian, flags2)
-        # TODO: Would be more efficient to unpack row data in sequence and assign row names afterwards.
-        for row_struct in row_pointer_structs:
-            reader.seek(row_struct.data_offset)
+        for row_id, *_, data_offset, name_offset in row_pointers:
+            reader.seek(data_offset)
             row_data = reader.read(row_size)
             raw_name = b""
             name = ""
-            if row_struct.name_offset != 0:
-                reader.seek(row_struct.name_offset)
-                raw_name = reader.unpack_bytes()  # null-terminated raw name
+            if name_offset != 0:
+                raw_name = reader.unpack_bytes(offset=name_offset)  # null-terminated raw name
                 try:
                     name = raw_name.decode(name_encoding)
                 except UnicodeDecodeError:
                     # For whatever reason, some vanilla row names are junk (notably in DS1 DrawParam).
                     pass
-            if row_struct.row_id in row_bytes:
-                _LOGGER.warning(f"Repeated param row ID in {param_type}: {row_struct.row_id}. Only first will be kept.")
+            if row_id in row_bytes:
+                _LOGGER.warning(f"Repeated param row ID in {param_type}: {row_id}. Only first will be kept.")
             else:
-                row_bytes[row_struct.row_id] = (raw_name, name, row_data)
+                row_bytes[row_id] = (raw_name, name, row_data)
 
         return cls(
             param_type=param_type,
@@ -137,11 +101,8 @@ class ParamDict(Param):
             row_bytes=row_bytes,
         )
 
-    def unpack_rows(self, paramdef_or_paramdefbnd: ParamDef | ParamDefBND | None = None):
-        if self.row_bytes is None:
-            _LOGGER.warning(f"Rows in `Param` with type '{self.param_type}' have already been unpacked from bytes.")
-            return
-
+    def get_paramdef(self, paramdef_or_paramdefbnd: ParamDef | ParamDefBND | None = None) -> ParamDef:
+        """Get and validate the `ParamDef` for this `Param` type (from the bundled `ParamDefBND` by default)."""
         if paramdef_or_paramdefbnd is None:
             paramdef_or_paramdefbnd = ParamDefBND.from_bundled(self.get_game())
         if isinstance(paramdef_or_paramdefbnd, ParamDefBND):
@@ -164,12 +125,25 @@ class ParamDict(Param):
                 f"`paramdef.data_version` {paramdef.data_version}."
             )
         # NOTE: `format_version` in Param is not correct/used.
+        return paramdef
 
-        # Note that we no longer need to track reader offset.
-        self.row_dicts = {}
-        for row_id, (raw_name, name, data) in self.row_bytes.items():
-            self.row_dicts[row_id] = ParamDictRow.from_reader(BinaryReader(data), paramdef, raw_name, name)
-
+    def unpack_rows(self, paramdef_or_paramdefbnd: ParamDef | ParamDefBND | None = None):
+        """Unpack `row_bytes` into `row_dicts` with the compiled `ParamDefRowCodec` of the appropriate `ParamDef`."""
+        if self.row_bytes is None:
+            _LOGGER.warning(f"Rows in `Param` with type '{self.param_type}' have already been unpacked from bytes.")
+            return
+        paramdef = self.get_paramdef(paramdef_or_paramdefbnd)
+        self.set_unpacked_rows(paramdef, unpack_row_values(paramdef, [data for _, _, data in self.row_bytes.values()]))
+
+    def set_unpacked_rows(self, paramdef: ParamDef, row_values: list[tuple]):
+        """Replace `row_bytes` with `row_dicts` created from `row_values` (in `row_bytes` order) from
+        `unpack_row_values()`."""
+        field_names = tuple(paramdef.fields)
+        self.row_dicts = {
+            row_id: ParamDictRow(dict(zip(field_names, values)), paramdef, raw_name, name)
+            for (row_id, (raw_name, name, _)), values in zip(self.row_bytes.items(), row_values, strict=True)
+        }
+        self.paramdef = paramdef
         # Remove row bytes.
         self.row_bytes = None
 
@@ -204,7 +178,9 @@ class ParamDict(Param):
             writer.reserve("param_type_offset", "q", obj=self)
             writer.pad(20)
         else:
-            writer.append(pad_chars(self.param_type, encoding="ASCII", null_terminate=False, alignment=32))
+            writer.append(pad_chars(
+                self.param_type, encoding="ASCII", null_terminate=True, alignment=32, pad=b"\x20")
+            )
 
         writer.pack(
             "4b", -1 if self.big_endian else 0, self.flags1.pack(), self.flags2.pack(), self.paramdef_format_version
@@ -242,29 +218,34 @@ class ParamDict(Param):
                 writer.fill_with_position(f"row_data_offset{row_id}", obj=self)
                 writer.append(data)
         else:
-            # Pack row data.
+            # Pack row data. All rows should use the same `ParamDef`.
+            paramdef = codec = None  # type: ParamDef | ParamDefRowCodec | None
             for row_id, row in self.row_dicts.items():
                 writer.fill_with_position(f"row_data_offset{row_id}", obj=self)
-                row.to_param_writer(writer)
+                if row.paramdef is not paramdef:
+                    paramdef = row.paramdef
+                    codec = paramdef.get_row_codec()
+                writer.append(codec.pack_row(map(row.fields.__getitem__, codec.field_names)))
 
         if self.flags1.OffsetParam:
             writer.fill_with_position("param_type_offset", obj=self)
             writer.append(self.param_type.encode("ASCII") + b"\0")
 
-        # Pack row names.
+        # Pack row names (if not empty).
+        writer.fill_with_position("row_names_offset", obj=self)
         name_encoding = self.get_name_encoding(self.big_endian, self.flags2)
+        terminator = b"\0\0" if self.flags2.UnicodeRowNames else b"\0"
         if self.row_bytes is not None:
-            for row_id, (raw_name, name, _) in self.row_bytes.items():
-                writer.fill_with_position(f"row_name_offset{row_id}")
-                raw_name = name.encode(name_encoding) if name else raw_name
-                raw_name = raw_name.rstrip(b"\0") + (b"\0\0" if self.flags2.UnicodeRowNames else b"\0")
-                writer.append(raw_name)
+            row_names = [(row_id, raw_name, name) for row_id, (raw_name, name, _) in self.row_bytes.items()]
         else:
-            for row_id, row in self.row_dicts.items():
-                writer.fill_with_position(f"row_name_offset{row_id}")
-                raw_name = row.name.encode(name_encoding) if row.name else row.raw_name
-                raw_name = raw_name.rstrip(b"\0") + (b"\0\0" if self.flags2.UnicodeRowNames else b"\0")
-                writer.append(raw_name)
+            row_names = [(row_id, row.raw_name, row.name) for row_id, row in self.row_dicts.items()]
+        for row_id, raw_name, name in row_names:
+            raw_name = (name.encode(name_encoding) if name else raw_name).rstrip(b"\0")
+            if raw_name:
+                writer.fill_with_position(f"row_name_offset{row_id}", obj=self)
+                writer.append(raw_name + terminator)
+            else:
+                writer.fill(f"row_name_offset{row_id}", 0, obj=self)
 
         return writer
 
@@ -329,7 +310,22 @@ class ParamDictRow:
 
     @classmethod
     def from_reader(cls, reader: BinaryReader, paramdef: ParamDef, raw_name: bytes, name="") -> ParamDictRow:
-        """Unpack `ParamRow` from binary game data using `paramdef`."""
+        """Unpack `ParamRow` from binary game data using the compiled row codec of `paramdef`."""
+        codec = paramdef.get_row_codec()
+        data = reader.read(codec.size)
+        if len(data) == codec.size:
+            return cls(dict(zip(codec.field_names, codec.unpack_row(data))), paramdef, raw_name, name)
+        reader.seek(-len(data), 1)
+        return cls.from_reader_by_field(reader, paramdef, raw_name, name)
+
+    @classmethod
+    def from_reader_by_field(
+        cls, reader: BinaryReader, paramdef: ParamDef, raw_name: bytes, name=""
+    ) -> ParamDictRow:
+        """Unpack `ParamRow` one field at a time using `paramdef`.
+
+        Slow, but tolerates rows that are shorter than `paramdef` (see malformed fields below).
+        """
         bit_reader = BitFieldReader()
 
         fields = {}
@@ -386,23 +382,8 @@ class ParamDictRow:
         return parsed_fields
 
     def to_param_writer(self, writer: BinaryWriter):
-        bit_writer = BitFieldWriter()
-
-        for field_name, value in self.fields.items():  # These are ordered correctly already.
-            paramdef_field = self.paramdef[field_name]
-            paramdef_field.check_python_type(value)
-            paramdef_field.check_range(value)
-            if paramdef_field.bit_count != -1:
-                bit_writer.write(writer, value, paramdef_field.bit_count, paramdef_field.py_fmt)
-            else:
-                bit_writer.finish_field(writer)
-                if issubclass(paramdef_field.display_type, ft.basestring):
-                    writer.append(paramdef_field.display_type.write(value, paramdef_field.size))
-                elif paramdef_field.display_type is ft.dummy8:
-                    writer.append(value)  # already null bytes
-                else:
-                    writer.append(struct.pack(paramdef_field.py_fmt, value))
-        bit_writer.finish_field(writer)
+        codec = self.paramdef.get_row_codec()
+        writer.append(codec.pack_row(map(self.fields.__getitem__, codec.field_names)))
 
     # NOTE: Cannot be loaded `from_dict()`.
 
@@ -435,3 +416,21 @@ class ParamDictRow:
                     continue  # padding differences have no effect and do not count against equality
                 return False
         return True
+
+
+def unpack_row_values(paramdef: ParamDef, row_datas: list[bytes]) -> list[tuple]:
+    """Unpack field values (in `paramdef` order) of each row in `row_datas` with the compiled codec of `paramdef`.
+
+    Any rows that are too short for the codec are unpacked field by field with `ParamDictRow.from_reader_by_field()`.
+    """
+    codec = paramdef.get_row_codec()
+    if all(len(data) >= codec.size for data in row_datas):
+        return codec.unpack_rows(row_datas)
+    row_values = []
+    for data in row_datas:
+        if len(data) >= codec.size:
+            row_values.append(codec.unpack_row(data))
+        else:
+            row = ParamDictRow.from_reader_by_field(BinaryReader(data), paramdef, b"")
+            row_values.append(tuple(row.fields.values()))
+    return row_values
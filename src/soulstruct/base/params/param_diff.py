@@ -0,0 +1,342 @@
+"""Row- and field-level differences between `Param`s (or whole `GameParamBND`s), stored as compact JSON patches that can
+be applied to another copy of the base params or merged with other patches of the same base.
+
+Pad fields are ignored throughout, as are `RawName` values (which are generated from `Name` on write).
+"""
+from __future__ import annotations
+
+__all__ = ["ParamDiff", "GameParamDiff", "ParamMergeConflict"]
+
+import logging
+import operator
+import typing as tp
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from soulstruct.utilities.files import read_json, write_json
+
+from .exceptions import ParamError
+from .param import Param
+from .param_row import ParamRow
+from .param_view import ParamView
+
+if tp.TYPE_CHECKING:
+    from .gameparambnd import GameParamBND
+
+_LOGGER = logging.getLogger(__name__)
+
+# Identifies JSON patch files written by `GameParamDiff.write_json()`.
+PATCH_FORMAT = "soulstruct-param-patch"
+PATCH_VERSION = 1
+
+# Maps `ParamRow` subclasses to their compared field names and a C-level getter for all their values at once.
+_ROW_VALUE_GETTERS = {}  # type: dict[type[ParamRow], tuple[tuple[str, ...], tp.Callable[[ParamRow], tuple]]]
+
+
+class ParamMergeConflict(tp.NamedTuple):
+    """Two patches disagree about a row (`field_name` is `None`) or a field. The `ours` side is kept in the merge."""
+    param_name: str
+    row_id: int
+    field_name: str | None
+    ours: tp.Any
+    theirs: tp.Any
+
+    def __str__(self):
+        where = f"{self.param_name}[{self.row_id}]" + (f".{self.field_name}" if self.field_name else "")
+        return f"{where}: ours = {self.ours}, theirs = {self.theirs}"
+
+
+@dataclass(slots=True)
+class ParamDiff:
+    """Differences between a base `Param` and a modified version of it.
+
+    Added rows are stored as dictionaries of their non-default fields (as in `ParamRow.to_dict()`), removed rows as
+    IDs only, and changed rows as `{field_name: (old_value, new_value)}` dictionaries. Old values are kept so that
+    patches can be checked against the `Param` they are applied to and merged with each other.
+    """
+    param_type: str
+    added: dict[int, dict[str, tp.Any]] = field(default_factory=dict)
+    removed: list[int] = field(default_factory=list)
+    changed: dict[int, dict[str, tuple[tp.Any, tp.Any]]] = field(default_factory=dict)
+
+    @classmethod
+    def from_params(cls, base: Param, other: Param, identical_row_ids: tp.Container[int] = ()) -> ParamDiff:
+        """Compare `other` to `base`.
+
+        Rows are compared by value, field by field, unless they are the same object in both `Param`s or their IDs are
+        in `identical_row_ids` (e.g. from `ParamView.get_identical_row_ids()` on the data both `Param`s were loaded
+        from), in which case only their names are compared.
+        """
+        if base.ROW_TYPE is not other.ROW_TYPE:
+            raise ParamError(
+                f"Cannot diff `Param`s with different row types: {base.ROW_TYPE.__name__} and {other.ROW_TYPE.__name__}"
+            )
+        field_names, get_values = _get_row_value_getter(base.ROW_TYPE)
+        base_rows, other_rows = base.rows, other.rows
+
+        row_name_encoding = other.get_name_encoding(other.big_endian, other.flags2)
+        added = {
+            row_id: other_rows[row_id].to_dict(row_name_encoding=row_name_encoding)
+            for row_id in sorted(other_rows.keys() - base_rows.keys())
+        }
+        removed = sorted(base_rows.keys() - other_rows.keys())
+
+        changed = {}
+        for row_id, base_row in base_rows.items():
+            other_row = other_rows.get(row_id)
+            if other_row is None or other_row is base_row:
+                continue
+            if row_id in identical_row_ids and base_row.Name == other_row.Name:
+                continue
+            base_values = get_values(base_row)
+            other_values = get_values(other_row)
+            if base_values == other_values:
+                continue
+            field_changes = {
+                name: (old, new)
+                for name, old, new in zip(field_names, base_values, other_values)
+                if old != new and not (old != old and new != new)  # NaN is unchanged
+            }
+            if field_changes:
+                changed[row_id] = field_changes
+
+        return cls(param_type=base.param_type, added=added, removed=removed, changed=changed)
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def check(self, param: Param) -> list[str]:
+        """Get a description of each way in which `param` does not match the base `Param` of this diff: rows to add
+        that already exist, rows to remove or change that are missing, and changed fields without their old value."""
+        problems = [f"Row {row_id} to add already exists." for row_id in self.added if row_id in param.rows]
+        problems += [f"Row {row_id} to remove is missing." for row_id in self.removed if row_id not in param.rows]
+        for row_id, field_changes in self.changed.items():
+            row = param.rows.get(row_id)
+            if row is None:
+                problems.append(f"Row {row_id} to change is missing.")
+                continue
+            current_values = row.get_many(field_changes)
+            for (field_name, (old, _)), current in zip(field_changes.items(), current_values):
+                if current != old and not (current != current and old != old):
+                    problems.append(f"Row {row_id} field {field_name} is {current}, not {old}.")
+        return problems
+
+    def apply(self, param: Param, strict=True):
+        """Apply these changes to `param` in place.
+
+        If `strict` is True (default), a `ParamError` is raised (and `param` is left untouched) if `check()` finds any
+        problems. Otherwise, added rows overwrite existing ones and missing rows and old values are ignored.
+        """
+        if strict and (problems := self.check(param)):
+            raise ParamError(f"Cannot apply diff to `{self.param_type}` Param:\n  " + "\n  ".join(problems))
+
+        for row_id in self.removed:
+            param.rows.pop(row_id, None)
+        for row_id, field_changes in self.changed.items():
+            if row_id in param.rows:
+                param.rows[row_id].set_many({field_name: new for field_name, (_, new) in field_changes.items()})
+        row_name_encoding = param.get_name_encoding(param.big_endian, param.flags2)
+        for row_id, row_dict in self.added.items():
+            param.rows[row_id] = param.ROW_TYPE.from_dict(dict(row_dict), row_name_encoding=row_name_encoding)
+
+    def merge(self, theirs: ParamDiff, param_name="") -> tuple[ParamDiff, list[ParamMergeConflict]]:
+        """Combine this diff ('ours') with another diff of the same base `Param` ('theirs').
+
+        Returns the merged diff and a list of conflicts (rows added or fields changed differently by both, or rows
+        removed by one and changed by the other). Conflicts are resolved in favor of this diff.
+        """
+        if theirs.param_type != self.param_type:
+            raise ParamError(f"Cannot merge diffs of `{self.param_type}` and `{theirs.param_type}` Params.")
+        conflicts = []
+
+        added = dict(self.added)
+        for row_id, row_dict in theirs.added.items():
+            if row_id not in added:
+                added[row_id] = row_dict
+            elif added[row_id] != row_dict:
+                conflicts.append(ParamMergeConflict(param_name, row_id, None, added[row_id], row_dict))
+
+        removed = set(self.removed)
+        for row_id in theirs.removed:
+            if row_id in self.changed:
+                conflicts.append(ParamMergeConflict(param_name, row_id, None, "changed", "removed"))
+            else:
+                removed.add(row_id)
+
+        changed = {row_id: dict(field_changes) for row_id, field_changes in self.changed.items()}
+        for row_id, their_changes in theirs.changed.items():
+            if row_id in self.removed:
+                conflicts.append(ParamMergeConflict(param_name, row_id, None, "removed", "changed"))
+                continue
+            our_changes = changed.setdefault(row_id, {})
+            for field_name, (old, their_new) in their_changes.items():
+                if field_name not in our_changes:
+                    our_changes[field_name] = (old, their_new)
+                elif our_changes[field_name][1] != their_new:
+                    conflicts.append(
+                        ParamMergeConflict(param_name, row_id, field_name, our_changes[field_name][1], their_new)
+                    )
+
+        merged = ParamDiff(
+            param_type=self.param_type,
+            added=dict(sorted(added.items())),
+            removed=sorted(removed),
+            changed=dict(sorted(changed.items())),
+        )
+        return merged, conflicts
+
+    def to_dict(self) -> dict[str, tp.Any]:
+        """JSON-ready dictionary. Row IDs are not converted to strings here (`json` does that)."""
+        data = {"param_type": self.param_type}  # type: dict[str, tp.Any]
+        if self.added:
+            data["added"] = self.added
+        if self.removed:
+            data["removed"] = self.removed
+        if self.changed:
+            data["changed"] = {
+                row_id: {field_name: list(values) for field_name, values in field_changes.items()}
+                for row_id, field_changes in self.changed.items()
+            }
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, tp.Any]) -> ParamDiff:
+        return cls(
+            param_type=data["param_type"],
+            added={int(row_id): row_dict for row_id, row_dict in data.get("added", {}).items()},
+            removed=[int(row_id) for row_id in data.get("removed", [])],
+            changed={
+                int(row_id): {field_name: tuple(values) for field_name, values in field_changes.items()}
+                for row_id, field_changes in data.get("changed", {}).items()
+            },
+        )
+
+
+@dataclass(slots=True)
+class GameParamDiff:
+    """Differences between all `Param`s in a base `GameParamBND` and a modified version of it, keyed by the names in
+    `GameParamBND.params`. Only `Param`s with at least one change are stored."""
+    params: dict[str, ParamDiff] = field(default_factory=dict)
+
+    @classmethod
+    def from_gameparambnds(cls, base: GameParamBND, other: GameParamBND, use_entry_data=False) -> GameParamDiff:
+        """Compare all typed `Param`s present in both binders. Others (untyped `ParamDict`s or `Param`s only present
+        in one binder) are logged and skipped.
+
+        If `use_entry_data` is True, rows whose raw data is identical in the `.param` entries of both binders are not
+        compared field by field, which is much faster for large binders (e.g. Elden Ring regulation). Entry data is read
+        in place, and is only up to date when the binder was loaded or last written, so only use this if no `Param` in
+        either binder has been changed since.
+        """
+        base_entries = {entry.stem: entry for entry in base.entries} if use_entry_data else {}
+        other_entries = {entry.stem: entry for entry in other.entries} if use_entry_data else {}
+        params = {}
+        for param_name, base_param in base.params.items():
+            other_param = other.params.get(param_name)
+            if other_param is None:
+                _LOGGER.warning(f"Param '{param_name}' is missing from modified `GameParamBND` and will not be diffed.")
+                continue
+            if not isinstance(base_param, Param) or not isinstance(other_param, Param):
+                _LOGGER.warning(f"Param '{param_name}' is not a typed `Param` and will not be diffed.")
+                continue
+            identical_row_ids = ()
+            if param_name in base_entries and param_name in other_entries:
+                base_view = ParamView(base_entries[param_name].data, base_param.ROW_TYPE)
+                other_view = ParamView(other_entries[param_name].data, other_param.ROW_TYPE)
+                identical_row_ids = set(base_view.get_identical_row_ids(other_view))
+            if param_diff := ParamDiff.from_params(base_param, other_param, identical_row_ids):
+                params[param_name] = param_diff
+        for param_name in other.params.keys() - base.params.keys():
+            _LOGGER.warning(f"Param '{param_name}' is missing from base `GameParamBND` and will not be diffed.")
+        return cls(params)
+
+    @classmethod
+    def three_way_merge(
+        cls, base: GameParamBND, ours: GameParamBND, theirs: GameParamBND, use_entry_data=False
+    ) -> tuple[GameParamDiff, list[ParamMergeConflict]]:
+        """Diff `ours` and `theirs` against their common `base` and merge the two diffs.
+
+        See `from_gameparambnds()` for `use_entry_data`.
+        """
+        return cls.from_gameparambnds(base, ours, use_entry_data).merge(
+            cls.from_gameparambnds(base, theirs, use_entry_data)
+        )
+
+    def __bool__(self):
+        return bool(self.params)
+
+    def apply(self, gameparambnd: GameParamBND, strict=True):
+        """Apply all `Param` diffs to `gameparambnd` in place. See `ParamDiff.apply()` for `strict`.
+
+        With `strict=True`, every `Param` is checked before any of them are modified.
+        """
+        targets = []
+        for param_name, param_diff in self.params.items():
+            param = gameparambnd.params.get(param_name)
+            if not isinstance(param, Param):
+                raise ParamError(f"`GameParamBND` has no typed `Param` named '{param_name}' to apply diff to.")
+            if param.param_type != param_diff.param_type:
+                raise ParamError(
+                    f"Param '{param_name}' has type `{param.param_type}`, but diff is for `{param_diff.param_type}`."
+                )
+            targets.append((param, param_diff))
+        if strict:
+            problems = [
+                f"{param_name}: {problem}"
+                for param_name, (param, param_diff) in zip(self.params, targets)
+                for problem in param_diff.check(param)
+            ]
+            if problems:
+                raise ParamError("Cannot apply diff to `GameParamBND`:\n  " + "\n  ".join(problems))
+        for param, param_diff in targets:
+            param_diff.apply(param, strict=False)
+
+    def merge(self, theirs: GameParamDiff) -> tuple[GameParamDiff, list[ParamMergeConflict]]:
+        """Merge with another diff of the same base `GameParamBND`. See `ParamDiff.merge()`."""
+        params = dict(self.params)
+        conflicts = []
+        for param_name, their_diff in theirs.params.items():
+            if param_name in params:
+                params[param_name], param_conflicts = params[param_name].merge(their_diff, param_name)
+                conflicts += param_conflicts
+            else:
+                params[param_name] = their_diff
+        return GameParamDiff(params), conflicts
+
+    def to_dict(self) -> dict[str, tp.Any]:
+        return {
+            "format": PATCH_FORMAT,
+            "version": PATCH_VERSION,
+            "params": {param_name: param_diff.to_dict() for param_name, param_diff in self.params.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, tp.Any]) -> GameParamDiff:
+        if data.get("format") != PATCH_FORMAT:
+            raise ParamError(f"Not a Param patch dictionary (format = {data.get('format')}).")
+        if data["version"] > PATCH_VERSION:
+            raise ParamError(f"Param patch version {data['version']} is newer than supported version {PATCH_VERSION}.")
+        return cls({param_name: ParamDiff.from_dict(d) for param_name, d in data["params"].items()})
+
+    def write_json(self, json_path: Path | str, indent: int | None = None):
+        """Write patch to JSON. No indent by default, for compactness."""
+        write_json(json_path, self.to_dict(), indent=indent)
+
+    @classmethod
+    def from_json(cls, json_path: Path | str) -> GameParamDiff:
+        return cls.from_dict(read_json(json_path, encoding="utf-8"))
+
+
+def _get_row_value_getter(row_type: type[ParamRow]) -> tuple[tuple[str, ...], tp.Callable[[ParamRow], tuple]]:
+    """Get compared field names (`Name` and non-pad binary fields) and an `attrgetter` for all of them."""
+    try:
+        return _ROW_VALUE_GETTERS[row_type]
+    except KeyError:
+        pass
+    field_names = ("Name",) + tuple(
+        binary_field.name
+        for binary_field in row_type.get_binary_fields()
+        if not binary_field.metadata["param"].is_pad
+    )
+    _ROW_VALUE_GETTERS[row_type] = field_names, operator.attrgetter(*field_names)
+    return _ROW_VALUE_GETTERS[row_type]
@@ -0,0 +1,272 @@
+"""Vectorized search and bulk update of `Param` rows.
+
+Conditions are built by comparing `ParamColumn` field references and combined with `&`, `|`, and `~`, e.g.:
+
+    (ParamColumn("WeaponCategory") == 24) & ~(ParamColumn("Weight") > 2.0)
+
+Each field used by a condition is extracted from all rows only once, as a NumPy column, and the whole condition is then
+evaluated as a boolean mask over those columns. See `Param.find_rows()` and `Param.update_rows()`.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "ParamFieldComparisonType",
+    "ParamCondition",
+    "ParamFieldCondition",
+    "ParamColumn",
+    "get_row_column",
+    "set_row_column",
+]
+
+import abc
+import collections
+import itertools
+import logging
+import operator
+import typing as tp
+from enum import Enum
+
+import numpy as np
+
+if tp.TYPE_CHECKING:
+    from .param_row import ParamRow
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ParamFieldComparisonType(Enum):
+    """Numerical comparator condition for a Param field search."""
+    Equal = "=="
+    NotEqual = "!="
+    GreaterThan = ">"
+    LessThan = "<"
+    GreaterThanOrEqual = ">="
+    LessThanOrEqual = "<="
+
+    def compare(self, left, right) -> bool:
+        """Works element-wise if `left` is a NumPy array."""
+        match self:
+            case ParamFieldComparisonType.Equal:
+                return left == right
+            case ParamFieldComparisonType.NotEqual:
+                return left != right
+            case ParamFieldComparisonType.GreaterThan:
+                return left > right
+            case ParamFieldComparisonType.LessThan:
+                return left < right
+            case ParamFieldComparisonType.GreaterThanOrEqual:
+                return left >= right
+            case ParamFieldComparisonType.LessThanOrEqual:
+                return left <= right
+
+
+class ParamCondition(abc.ABC):
+    """Boolean expression over `ParamRow` fields that is evaluated for all rows at once."""
+
+    @abc.abstractmethod
+    def get_field_names(self) -> set[str]:
+        """Names of all fields used by this condition (as given, e.g. internal names)."""
+
+    @abc.abstractmethod
+    def evaluate(self, columns: dict[str, np.ndarray]) -> np.ndarray:
+        """Return a boolean mask over rows, given columns for all `get_field_names()`."""
+
+    def __and__(self, other: ParamCondition) -> ParamCondition:
+        return _CompoundCondition(np.logical_and, "&", (self, other))
+
+    def __or__(self, other: ParamCondition) -> ParamCondition:
+        return _CompoundCondition(np.logical_or, "|", (self, other))
+
+    def __invert__(self) -> ParamCondition:
+        return _NotCondition(self)
+
+
+class ParamFieldCondition(ParamCondition):
+    """Compares one field to a value.
+
+    Non-numeric fields (e.g. strings) only support `Equal` and `NotEqual`; other comparisons log a warning and match no
+    rows.
+    """
+
+    field_name: str
+    comparison_type: ParamFieldComparisonType
+    value: tp.Any
+
+    def __init__(self, field_name: str, comparison_type: ParamFieldComparisonType, value: tp.Any):
+        self.field_name = field_name
+        self.comparison_type = comparison_type
+        self.value = value
+
+    def get_field_names(self) -> set[str]:
+        return {self.field_name}
+
+    def evaluate(self, columns: dict[str, np.ndarray]) -> np.ndarray:
+        column = columns[self.field_name]
+        if column.ndim != 1:
+            raise ValueError(f"Array field '{self.field_name}' cannot be used in a Param condition.")
+        if column.dtype.kind not in "biuf" and self.comparison_type not in (
+            ParamFieldComparisonType.Equal, ParamFieldComparisonType.NotEqual
+        ):
+            _LOGGER.warning(f"Non-numeric Param field '{self.field_name}' can only be a condition with == or !=.")
+            return np.zeros(len(column), dtype=bool)
+        return np.broadcast_to(self.comparison_type.compare(column, self.value), column.shape)
+
+    def __repr__(self):
+        return f"({self.field_name} {self.comparison_type.value} {self.value!r})"
+
+
+class _IsInCondition(ParamCondition):
+
+    def __init__(self, field_name: str, values: tp.Iterable):
+        self.field_name = field_name
+        self.values = list(values)
+
+    def get_field_names(self) -> set[str]:
+        return {self.field_name}
+
+    def evaluate(self, columns: dict[str, np.ndarray]) -> np.ndarray:
+        return np.isin(columns[self.field_name], self.values)
+
+    def __repr__(self):
+        return f"({self.field_name} in {self.values!r})"
+
+
+class _CompoundCondition(ParamCondition):
+
+    def __init__(self, combine: np.ufunc, symbol: str, conditions: tuple[ParamCondition, ...]):
+        if not all(isinstance(condition, ParamCondition) for condition in conditions):
+            raise TypeError("Param conditions can only be combined with other conditions.")
+        self.combine = combine
+        self.symbol = symbol
+        # Flatten nested conditions with the same operator.
+        self.conditions = tuple(itertools.chain.from_iterable(
+            condition.conditions if isinstance(condition, _CompoundCondition) and condition.combine is combine
+            else (condition,)
+            for condition in conditions
+        ))
+
+    def get_field_names(self) -> set[str]:
+        return set().union(*(condition.get_field_names() for condition in self.conditions))
+
+    def evaluate(self, columns: dict[str, np.ndarray]) -> np.ndarray:
+        mask = self.conditions[0].evaluate(columns)
+        for condition in self.conditions[1:]:
+            mask = self.combine(mask, condition.evaluate(columns))
+        return mask
+
+    def __repr__(self):
+        return "(" + f" {self.symbol} ".join(repr(condition) for condition in self.conditions) + ")"
+
+
+class _NotCondition(ParamCondition):
+
+    def __init__(self, condition: ParamCondition):
+        self.condition = condition
+
+    def get_field_names(self) -> set[str]:
+        return self.condition.get_field_names()
+
+    def evaluate(self, columns: dict[str, np.ndarray]) -> np.ndarray:
+        return np.logical_not(self.condition.evaluate(columns))
+
+    def __repr__(self):
+        return f"~{self.condition!r}"
+
+
+class ParamColumn:
+    """Reference to a `ParamRow` field (by name or internal name) that creates a `ParamCondition` when compared to a
+    value, e.g. `ParamColumn("Weight") > 2.0`."""
+
+    __slots__ = ("field_name",)
+    __hash__ = None  # comparisons do not return `bool`
+
+    def __init__(self, field_name: str):
+        self.field_name = field_name
+
+    def __eq__(self, value) -> ParamCondition:
+        return ParamFieldCondition(self.field_name, ParamFieldComparisonType.Equal, value)
+
+    def __ne__(self, value) -> ParamCondition:
+        return ParamFieldCondition(self.field_name, ParamFieldComparisonType.NotEqual, value)
+
+    def __gt__(self, value) -> ParamCondition:
+        return ParamFieldCondition(self.field_name, ParamFieldComparisonType.GreaterThan, value)
+
+    def __lt__(self, value) -> ParamCondition:
+        return ParamFieldCondition(self.field_name, ParamFieldComparisonType.LessThan, value)
+
+    def __ge__(self, value) -> ParamCondition:
+        return ParamFieldCondition(self.field_name, ParamFieldComparisonType.GreaterThanOrEqual, value)
+
+    def __le__(self, value) -> ParamCondition:
+        return ParamFieldCondition(self.field_name, ParamFieldComparisonType.LessThanOrEqual, value)
+
+    def isin(self, values: tp.Iterable) -> ParamCondition:
+        return _IsInCondition(self.field_name, values)
+
+    def __repr__(self):
+        return f"ParamColumn({self.field_name!r})"
+
+
+def _resolve_field_name(row_type: type[ParamRow], field_name: str) -> str:
+    lookup, _ = row_type.get_field_lookup()
+    try:
+        return lookup[field_name]
+    except KeyError:
+        try:
+            return row_type._get_special_field_name(field_name)  # 'Name' or 'RawName'
+        except KeyError:
+            raise KeyError(f"No field named '{field_name}' in `{row_type.__name__}`.") from None
+
+
+def get_row_column(row_type: type[ParamRow], rows: tp.Collection[ParamRow], field_name: str) -> np.ndarray:
+    """Get the values of one field (by name or internal name) of all `rows` as a NumPy array.
+
+    Array fields produce a 2D array.
+    """
+    attr_name = _resolve_field_name(row_type, field_name)
+    return np.array(list(map(operator.attrgetter(attr_name), rows)))
+
+
+def set_row_column(row_type: type[ParamRow], rows: tp.Sequence[ParamRow], field_name: str, values: tp.Any):
+    """Set one field (by name or internal name) of all `rows`.
+
+    `values` may be one value for all rows, a sequence or array with one value per row, or a callable that takes an
+    array of the current values (from `get_row_column()`) and returns new values. Values are converted to the type of
+    the current values: floats are rounded to the nearest integer for integer fields, and to single precision for
+    (single-precision) float fields.
+    """
+    attr_name = _resolve_field_name(row_type, field_name)
+    old_column = get_row_column(row_type, rows, attr_name)
+    if callable(values):
+        values = values(old_column.copy())
+    new_column = np.asarray(values)
+    if new_column.ndim < old_column.ndim:
+        new_column = np.broadcast_to(new_column, old_column.shape)
+    elif new_column.shape != old_column.shape:
+        raise ValueError(
+            f"Cannot set field '{field_name}' of {len(rows)} rows to values with shape {new_column.shape}."
+        )
+
+    match old_column.dtype.kind:
+        case "b":
+            new_column = new_column.astype(bool)
+        case "i" | "u":
+            if new_column.dtype.kind == "f":
+                new_column = np.rint(new_column)
+            new_column = new_column.astype(np.int64)
+        case "f":
+            if _is_single_precision(row_type, attr_name):
+                new_column = new_column.astype(np.float32)
+            new_column = new_column.astype(np.float64)
+        case _:
+            new_column = new_column.astype(old_column.dtype.kind)
+
+    collections.deque(map(setattr, rows, itertools.repeat(attr_name), new_column.tolist()), maxlen=0)
+
+
+def _is_single_precision(row_type: type[ParamRow], attr_name: str) -> bool:
+    for binary_field, metadata, _ in row_type._get_binary_layout(row_type.DEFAULT_BYTE_ORDER)[1]:
+        if binary_field.name == attr_name:
+            return metadata.fmt == "f"
+    return False
@@ -15,15 +15,23 @@ __all__ = [
 
 import abc
 import ast
+import collections
+import dataclasses
+import itertools
 import logging
+import operator
+import struct
 import typing as tp
 from dataclasses import dataclass, field
 from types import MappingProxyType
 
+import numpy as np
+
 from soulstruct.base.game_types import GAME_INT_TYPE
 from soulstruct.base.params.paramdef.field_types import base_type
 from soulstruct.utilities.binary import *
 from constrata.field_types.type_info import PRIMITIVE_FIELD_TYPING
+from constrata.metadata import BinaryMetadata, BinaryStringMetadata
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,42 +78,93 @@ class ParamRow(BinaryStruct):
 
     # Cached on first use. Maps binary field names (i.e. not including Name/RawName) to `ParamFieldMetadata` instances.
     _FIELD_PARAM_METADATA: tp.ClassVar[MappingProxyType[str, ParamFieldMetadata]] = None
+    # Cached on first use. Maps binary field names, internal names, `Name`, and `RawName` to field (attribute) names.
+    _FIELD_LOOKUP: tp.ClassVar[dict[str, str]] = None
+    # Cached on first use. All binary field names, in order.
+    _FIELD_NAMES: tp.ClassVar[tuple[str, ...]] = None
+    # Cached on first use. Maps byte order to a row `Struct` and per-field column decoders for `unpack_rows()`, or to
+    # `None` if this row type cannot be decoded that way (in which case `from_bytes()` must be used for each row).
+    _ROW_DECODERS: tp.ClassVar[dict[ByteOrder, tuple[struct.Struct, tuple[_FieldDecoder, ...]] | None]] = None
+    # Cached on first use. Maps `(ignore_pads, ignore_defaults, use_internal_names)` options of `iter_dicts()` to a
+    # getter of `(RawName, Name, *field_values)`, the dictionary key of each field value, and each field's default.
+    _DICT_EXPORTERS: tp.ClassVar[dict[tuple[bool, bool, bool], tuple[tp.Callable, tuple[str, ...], tuple]]] = None
 
     RawName: bytes = field(default=b"", metadata={"NOT_BINARY": True})
     Name: str = field(default="", metadata={"NOT_BINARY": True})
 
     def __iter__(self) -> tp.Iterator[tuple[str, PARAM_VALUE_TYPING]]:
         """Similar to `.items()`. Returns a tuple of `(name, value)` pairs."""
-        return iter((field_name, getattr(self, field_name)) for field_name in self.get_binary_field_names())
+        field_names = self.get_field_lookup()[1]
+        return iter((field_name, getattr(self, field_name)) for field_name in field_names)
 
     def __getitem__(self, field_name_or_nickname: str) -> PARAM_VALUE_TYPING:
-        if field_name_or_nickname.lower() == "name":
-            return self.Name
-        elif field_name_or_nickname.lower() == "rawname":
-            return self.RawName
-
-        for binary_field in self.get_binary_fields():
-            if binary_field.name == field_name_or_nickname:
-                return getattr(self, binary_field.name)
-            elif binary_field.metadata["param"].internal_name == field_name_or_nickname:
-                return getattr(self, binary_field.name)
-        raise KeyError(f"No field with internal name or nickname '{field_name_or_nickname}'.")
+        lookup = self.get_field_lookup()[0]
+        try:
+            return getattr(self, lookup[field_name_or_nickname])
+        except KeyError:
+            return getattr(self, self._get_special_field_name(field_name_or_nickname))
 
     def __setitem__(self, field_name_or_nickname: str, value: PARAM_VALUE_TYPING):
+        lookup = self.get_field_lookup()[0]
+        try:
+            setattr(self, lookup[field_name_or_nickname], value)
+        except KeyError:
+            setattr(self, self._get_special_field_name(field_name_or_nickname), value)
+
+    def get_many(self, field_names_or_nicknames: tp.Iterable[str]) -> list[PARAM_VALUE_TYPING]:
+        """Get values of all given fields (by name or internal name) at once, in order."""
+        lookup = self.get_field_lookup()[0]
+        values = []
+        for key in field_names_or_nicknames:
+            try:
+                values.append(getattr(self, lookup[key]))
+            except KeyError:
+                values.append(getattr(self, self._get_special_field_name(key)))
+        return values
+
+    def set_many(self, field_values: dict[str, PARAM_VALUE_TYPING]):
+        """Set values of all given fields (by name or internal name).
+
+        All keys are checked before any values are set, so no fields are changed if any key is invalid.
+        """
+        lookup = self.get_field_lookup()[0]
+        resolved = []
+        for key, value in field_values.items():
+            try:
+                resolved.append((lookup[key], value))
+            except KeyError:
+                resolved.append((self._get_special_field_name(key), value))
+        for attr_name, value in resolved:
+            setattr(self, attr_name, value)
+
+    @classmethod
+    def get_field_lookup(cls) -> tuple[dict[str, str], tuple[str, ...]]:
+        """Returns a dictionary mapping binary field names and internal names to field (attribute) names, and a tuple
+        of all binary field names in order, both constructed once on first call (per class, so subclasses that add
+        fields do not inherit their parent's tables).
+
+        If a key is both the name of one field and the internal name of another, the earlier field is used. Keys like
+        'name' and 'rawname' (in any case) always refer to `Name` and `RawName`, so are handled separately.
+        """
+        if cls.__dict__.get("_FIELD_LOOKUP") is None:
+            lookup = {"Name": "Name", "RawName": "RawName"}
+            field_names = []
+            for binary_field in cls.get_binary_fields():
+                field_names.append(binary_field.name)
+                for key in (binary_field.name, binary_field.metadata["param"].internal_name):
+                    if key.lower() not in {"name", "rawname"}:
+                        lookup.setdefault(key, binary_field.name)
+            cls._FIELD_NAMES = tuple(field_names)
+            cls._FIELD_LOOKUP = lookup
+        return cls._FIELD_LOOKUP, cls._FIELD_NAMES
+
+    @staticmethod
+    def _get_special_field_name(field_name_or_nickname: str) -> str:
+        """Handles `Name` and `RawName` keys in any case, which are not in `_FIELD_LOOKUP`."""
         if field_name_or_nickname.lower() == "name":
-            self.Name = value
-            return
+            return "Name"
         elif field_name_or_nickname.lower() == "rawname":
-            self.RawName = value
-            return
-
-        for binary_field in self.get_binary_fields():
-            if binary_field.name == field_name_or_nickname:
-                setattr(self, binary_field.name, value)
-                return
-            elif binary_field.metadata["param"].internal_name == field_name_or_nickname:
-                setattr(self, binary_field.name, value)
-                return
+            return "RawName"
         raise KeyError(f"No field with internal name or nickname '{field_name_or_nickname}'.")
 
     @classmethod
@@ -169,9 +228,51 @@ class ParamRow(BinaryStruct):
             data[key] = value
         return data
 
+    @classmethod
+    def iter_dicts(
+        cls,
+        rows: tp.Iterable[ParamRow],
+        ignore_pads=True,
+        ignore_defaults=True,
+        use_internal_names=False,
+        row_name_encoding="shift_jis_2004",
+    ) -> tp.Iterator[dict[str, PARAM_VALUE_TYPING]]:
+        """Generate the same dictionary as `to_dict()` for each of `rows` (all of this type), one at a time.
+
+        Which fields to include, their keys, and their defaults are determined once per option set rather than for every
+        row, and all values of each row are fetched at once. As in `to_dict()`, `RawName` is updated from `Name`.
+        """
+        exporter_key = (ignore_pads, ignore_defaults, use_internal_names)
+        if cls.__dict__.get("_DICT_EXPORTERS") is None:
+            cls._DICT_EXPORTERS = {}
+        if exporter_key not in cls._DICT_EXPORTERS:
+            field_names, keys, defaults = [], [], []
+            for binary_field in cls.get_binary_fields():
+                info = binary_field.metadata["param"]  # type: ParamFieldMetadata
+                if ignore_pads and info.is_pad:
+                    continue
+                field_names.append(binary_field.name)
+                keys.append(info.internal_name if use_internal_names else binary_field.name)
+                defaults.append(binary_field.default)
+            cls._DICT_EXPORTERS[exporter_key] = (
+                operator.attrgetter("RawName", "Name", *field_names), tuple(keys), tuple(defaults)
+            )
+        get_values, keys, defaults = cls._DICT_EXPORTERS[exporter_key]
+
+        for row in rows:
+            raw_name, name, *values = get_values(row)
+            if name:
+                # Update `RawName` before exporting dictionary.
+                row.RawName = raw_name = name.encode(row_name_encoding)
+            data = {"RawName": repr(raw_name), "Name": name}
+            if ignore_defaults:
+                data.update(itertools.compress(zip(keys, values), map(operator.ne, values, defaults)))
+            else:
+                data.update(zip(keys, values))
+            yield data
+
     def update(self, **kwargs):
-        for field_name, field_value in kwargs.items():
-            self.__setitem__(field_name, field_value)
+        self.set_many(kwargs)
 
     @property
     def try_name(self) -> str:
@@ -206,6 +307,95 @@ class ParamRow(BinaryStruct):
         row.Name = name
         return row
 
+    @classmethod
+    def unpack_rows(cls, data: bytes, byte_order: ByteOrder) -> list[tp.Self] | None:
+        """Unpack a contiguous block of rows (with no names) all at once, or return `None` if this row type or the
+        size of `data` does not support it.
+
+        Equivalent to calling `from_bytes()` on each row, but the block is unpacked with one precompiled `Struct` and
+        each field is then decoded for all rows at once (bit fields with NumPy) and assigned directly to its slot.
+        """
+        decoder = cls._get_row_decoder(byte_order)
+        if decoder is None:
+            return None
+        row_struct, field_decoders = decoder
+        if len(data) % row_struct.size != 0:
+            return None
+
+        row_values = list(row_struct.iter_unpack(data))
+        if not row_values:
+            return []
+        columns = list(zip(*row_values))
+        rows = [cls.__new__(cls) for _ in range(len(row_values))]
+        for field_decoder in field_decoders:
+            if field_decoder.length > 0:
+                start, stop = field_decoder.struct_index, field_decoder.struct_index + field_decoder.length
+                column = [list(values[start:stop]) for values in row_values]
+            elif field_decoder.bit_shift_mask is not None:
+                shift, mask = field_decoder.bit_shift_mask
+                column = ((np.array(columns[field_decoder.struct_index]) >> shift) & mask).tolist()
+            else:
+                column = columns[field_decoder.struct_index]
+            if field_decoder.process_from_unpack is not None:
+                column = [field_decoder.process_from_unpack(value, byte_order) for value in column]
+            if field_decoder.asserted:
+                for value in column:
+                    if value not in field_decoder.asserted:
+                        raise ValueError(
+                            f"Field '{field_decoder.name}' unpacked value {value} is not an asserted value: "
+                            f"{field_decoder.asserted}"
+                        )
+            collections.deque(map(field_decoder.set_slot, rows, column), maxlen=0)  # consume in C
+        return rows
+
+    @classmethod
+    def _get_row_decoder(cls, byte_order: ByteOrder) -> tuple[struct.Struct, tuple[_FieldDecoder, ...]] | None:
+        if cls.__dict__.get("_ROW_DECODERS") is None:
+            cls._ROW_DECODERS = {}  # never inherited, as decoders hold slot setters of this class
+        if byte_order in cls._ROW_DECODERS:
+            return cls._ROW_DECODERS[byte_order]
+
+        cls._ROW_DECODERS[byte_order] = None
+        if any(f.name not in {"RawName", "Name"} for f in cls.get_fields() if f.metadata.get("NOT_BINARY", False)):
+            return None  # other non-binary fields would need their defaults
+        try:
+            row_struct, field_layouts = cls._get_binary_layout(byte_order)
+        except ValueError:
+            return None  # varints
+        field_decoders = []
+        for binary_field, metadata, bit_shift_mask in field_layouts:
+            slot = getattr(cls, binary_field.name, None)
+            if not hasattr(slot, "__set__"):
+                return None  # not a slotted dataclass
+            has_processing = metadata.unpack_func is not None or isinstance(metadata, BinaryStringMetadata)
+            field_decoders.append(_FieldDecoder(
+                name=binary_field.name,
+                struct_index=metadata.struct_index,
+                length=metadata.length,
+                bit_shift_mask=bit_shift_mask,
+                process_from_unpack=metadata.process_from_unpack if has_processing else None,
+                asserted=metadata.asserted,
+                set_slot=slot.__set__,
+            ))
+        cls._ROW_DECODERS[byte_order] = row_struct, tuple(field_decoders)
+        return cls._ROW_DECODERS[byte_order]
+
+    @classmethod
+    def _get_binary_layout(cls, byte_order: ByteOrder) -> tuple[struct.Struct, tuple[_BinaryFieldLayout, ...]]:
+        """Get the `Struct` that packs all binary fields in `byte_order`, and the field, Constrata metadata, and bit
+        field `(shift, mask)` (or `None`) of each binary field, in order.
+
+        Constrata does not expose this layout publicly, so this is the only place its private class attributes are read
+        (and `pyproject.toml` pins Constrata's minor version). Raises `ValueError` for varint fields.
+        """
+        cls.get_size(byte_order)  # ensures binary metadata is initialized
+        row_struct = cls._STRUCT_METADATA.get_metadata(byte_order, None)[0]
+        field_layouts = tuple(
+            _BinaryFieldLayout(binary_field, metadata, cls._BIT_OFFSET_SHIFT_MASK.get(binary_field.name))
+            for binary_field, metadata in zip(cls.get_binary_fields(), cls._BFIELD_METADATA, strict=True)
+        )
+        return row_struct, field_layouts
+
     # `to_writer()` does not need overriding, as name is packed later.
 
     def get_packed_name(self, encoding: str) -> bytes:
@@ -224,6 +414,24 @@ class ParamRow(BinaryStruct):
                 print(f"  {field_name}: this = {field_value}, other = {other_value}")
 
 
+class _BinaryFieldLayout(tp.NamedTuple):
+    """Constrata packing information for one binary field of a `ParamRow` subclass."""
+    field: dataclasses.Field
+    metadata: BinaryMetadata
+    bit_shift_mask: tuple[int, int] | None  # bit fields only
+
+
+class _FieldDecoder(tp.NamedTuple):
+    """Precompiled decoding information for one field of a `ParamRow` subclass, used by `ParamRow.unpack_rows()`."""
+    name: str
+    struct_index: int
+    length: int  # non-zero for arrays
+    bit_shift_mask: tuple[int, int] | None  # bit fields only
+    process_from_unpack: tp.Callable[[tp.Any, ByteOrder], tp.Any] | None
+    asserted: tuple
+    set_slot: tp.Callable[[ParamRow, tp.Any], None]
+
+
 @dataclass(slots=True)
 class ParamFieldMetadata:
     """Not a `NamedTuple` as it may be modified with defaults."""
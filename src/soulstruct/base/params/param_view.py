@@ -0,0 +1,338 @@
+"""Read-only view of binary `.param` data that never unpacks more than it is asked for.
+
+Useful for analyzing many (versions of) params at once, when the memory and time spent creating every `ParamRow` in
+every `Param` would be wasted. Only the raw file data (or a memory map of an unpacked `.param` file) and the row
+pointer table are kept. Row objects are created on demand, and whole fields can be extracted as NumPy columns.
+"""
+from __future__ import annotations
+
+__all__ = ["ParamView"]
+
+import logging
+import mmap
+import re
+import struct
+import typing as tp
+from pathlib import Path
+from types import ModuleType
+
+import numpy as np
+from constrata.metadata import BinaryStringMetadata
+
+from soulstruct.utilities.binary import BinaryReader, ByteOrder
+
+from .exceptions import ParamError
+from .param import Param, ParamHeader, PARAM_ROW_DATA_T
+
+if tp.TYPE_CHECKING:
+    from soulstruct.containers import Binder
+
+_LOGGER = logging.getLogger(__name__)
+
+# Maps `struct` format characters to NumPy type codes (without byte order).
+_NUMPY_TYPES = {
+    "b": "i1", "B": "u1", "?": "b1", "h": "i2", "H": "u2", "i": "i4", "I": "u4", "q": "i8", "Q": "u8",
+    "f": "f4", "d": "f8",
+}
+_STRUCT_TOKEN_RE = re.compile(r"(\d*)([xcbB?hHiIlLqQnNefdsp])")
+
+
+class ParamView(tp.Generic[PARAM_ROW_DATA_T]):
+    """Read-only view of a binary `.param` file, using the field layout of `row_type`.
+
+    Row IDs are sorted. As in `Param`, only the first row with each ID is visible. The underlying data must not change
+    while the view is in use.
+    """
+
+    row_type: type[PARAM_ROW_DATA_T]
+    header: ParamHeader
+    path: Path | None
+    # Sorted unique row IDs.
+    row_ids: np.ndarray
+
+    def __init__(self, data: bytes | mmap.mmap, row_type: type[PARAM_ROW_DATA_T], path: Path | str = None):
+        """Create view of a whole binary `.param` file in `data` (which is not copied).
+
+        If `path` is given, the header is read from that file rather than `data`, which may be a memory map of it.
+        """
+        self.row_type = row_type
+        self.path = Path(path) if path is not None else None
+        self._data = data
+
+        reader = BinaryReader(self.path if self.path is not None else data)
+        try:
+            self.header = Param.unpack_header(reader)
+            row_pointers_offset = reader.position
+        finally:
+            reader.close()
+        if self.header.param_type != row_type.__name__:
+            raise ParamError(f"Param type `{self.header.param_type}` does not match row type `{row_type.__name__}`.")
+
+        byte_order = self.header.byte_order.value
+        if self.header.flags1.LongDataOffset:
+            pointer_dtype = np.dtype([("id", "i4"), ("unknown", "i4"), ("data", "i8"), ("name", "i8")])
+        else:
+            pointer_dtype = np.dtype([("id", "i4"), ("data", "u4"), ("name", "u4")])
+        row_pointers = np.frombuffer(
+            data, dtype=pointer_dtype.newbyteorder(byte_order), count=self.header.row_count, offset=row_pointers_offset
+        )
+        # `np.unique` returns the index of the first occurrence of each ID.
+        self.row_ids, first_indices = np.unique(row_pointers["id"], return_index=True)
+        self._data_offsets = row_pointers["data"][first_indices].astype(np.int64)
+        self._name_offsets = row_pointers["name"][first_indices].astype(np.int64)
+
+        self._row_size = row_type.get_size(row_type.DEFAULT_BYTE_ORDER)
+        if len(row_pointers) >= 2 and row_pointers["data"][1] - row_pointers["data"][0] != self._row_size:
+            raise ParamError(
+                f"Row size in `{self.header.param_type}` data ({row_pointers['data'][1] - row_pointers['data'][0]}) "
+                f"does not match size of row type `{row_type.__name__}` ({self._row_size})."
+            )
+        self._name_encoding = Param.get_name_encoding(
+            self.header.byte_order == ByteOrder.BigEndian, self.header.flags2
+        )
+        self._field_layout = None  # type: dict[str, _ColumnLayout] | None
+
+    @classmethod
+    def from_path(cls, path: Path | str, row_type: type[PARAM_ROW_DATA_T], use_mmap=True) -> ParamView:
+        """View an unpacked `.param` file, memory-mapped by default (in which case `close()` should be called, or the
+        view used as a context manager)."""
+        path = Path(path)
+        if not use_mmap:
+            return cls(path.read_bytes(), row_type, path)
+        with path.open("rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(data, row_type, path)
+
+    @classmethod
+    def from_binder(cls, binder: Binder, paramdef_module: ModuleType) -> dict[str, ParamView]:
+        """View every `.param` entry in `binder` whose type is defined in `paramdef_module` (e.g. `PARAMDEF_MODULE`
+        of a game's `GameParamBND`), keyed by entry stem like `GameParamBND.params`. Others are skipped with a warning.
+
+        Views share the entry data, so no row data is copied or unpacked.
+        """
+        views = {}
+        for entry in binder.entries:
+            if not entry.name.endswith(".param"):
+                continue
+            param_type = Param.detect_param_type(entry.data)
+            row_type = getattr(paramdef_module, param_type, None)
+            if row_type is None:
+                _LOGGER.warning(f"Cannot view Param entry '{entry.name}' of unknown type `{param_type}`.")
+                continue
+            views[entry.stem] = cls(entry.data, row_type)
+        return views
+
+    def close(self):
+        """Close memory map (if used). The view cannot be used afterward."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __enter__(self) -> tp.Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def param_type(self) -> str:
+        return self.header.param_type
+
+    def __len__(self) -> int:
+        return len(self.row_ids)
+
+    def __contains__(self, row_id: int) -> bool:
+        return self._get_index(row_id) is not None
+
+    def __iter__(self) -> tp.Iterator[int]:
+        """Iterate over sorted row IDs."""
+        return iter(self.row_ids.tolist())
+
+    def __getitem__(self, row_id: int) -> PARAM_ROW_DATA_T:
+        """Create a new `ParamRow` for `row_id`. It is not cached, and modifying it does not change the view."""
+        index = self._get_index(row_id)
+        if index is None:
+            raise KeyError(f"No row with ID {row_id} in `{self.param_type}` view.")
+        row = self.row_type.from_bytes(self.get_row_data(row_id))
+        row.RawName = self._get_raw_name(index)
+        try:
+            row.Name = row.RawName.decode(self._name_encoding)
+        except UnicodeDecodeError:
+            pass  # some vanilla row names are junk
+        return row
+
+    def get(self, row_id: int, default=None) -> PARAM_ROW_DATA_T | None:
+        return self[row_id] if row_id in self else default
+
+    def get_row_data(self, row_id: int) -> bytes:
+        """Get raw (packed) data of row `row_id`."""
+        index = self._get_index(row_id)
+        if index is None:
+            raise KeyError(f"No row with ID {row_id} in `{self.param_type}` view.")
+        offset = int(self._data_offsets[index])
+        return bytes(self._data[offset:offset + self._row_size])
+
+    def get_row_name(self, row_id: int) -> str:
+        """Get decoded name of row `row_id`, or an empty string if it has no (valid) name."""
+        index = self._get_index(row_id)
+        if index is None:
+            raise KeyError(f"No row with ID {row_id} in `{self.param_type}` view.")
+        try:
+            return self._get_raw_name(index).decode(self._name_encoding)
+        except UnicodeDecodeError:
+            return ""
+
+    def get_identical_row_ids(self, other: ParamView) -> list[int]:
+        """Get sorted IDs of rows present in both this view and `other` whose raw (packed) data is identical. Row names
+        are not compared."""
+        if other.row_type is not self.row_type:
+            raise ParamError(f"Cannot compare `{self.param_type}` view to `{other.param_type}` view.")
+        row_ids, indices, other_indices = np.intersect1d(
+            self.row_ids, other.row_ids, assume_unique=True, return_indices=True
+        )
+        data, other_data, row_size = self._data, other._data, self._row_size
+        return [
+            row_id
+            for row_id, offset, other_offset in zip(
+                row_ids.tolist(), self._data_offsets[indices].tolist(), other._data_offsets[other_indices].tolist()
+            )
+            if data[offset:offset + row_size] == other_data[other_offset:other_offset + row_size]
+        ]
+
+    def get_column(self, field_name: str, row_ids: tp.Sequence[int] | np.ndarray = None) -> np.ndarray:
+        """Get values of one field (by name or internal name) for all rows, in `row_ids` order, as a NumPy array.
+
+        Values are as stored, except that bit fields are extracted, boolean fields are converted to `bool`, and string
+        fields are decoded. Array fields produce a 2D array. If `row_ids` is given, only those rows are read (and all
+        must exist).
+        """
+        lookup, _ = self.row_type.get_field_lookup()
+        try:
+            field_name = lookup[field_name]
+        except KeyError:
+            raise KeyError(f"No field named '{field_name}' in `{self.row_type.__name__}`.")
+        if field_name in {"Name", "RawName"}:
+            raise KeyError("Use `get_row_name()` for row names. Only binary fields can be extracted as columns.")
+
+        if self._field_layout is None:
+            self._field_layout = self._get_field_layout()
+        field_offset, dtype, length, bit_shift_mask, is_bool, decode_string = self._field_layout[field_name]
+
+        if row_ids is None:
+            data_offsets = self._data_offsets
+        else:
+            indices = self._get_indices(row_ids)
+            data_offsets = self._data_offsets[indices]
+
+        item_size = dtype.itemsize * max(length, 1)
+        data_bytes = np.frombuffer(self._data, dtype=np.uint8)
+        gathered = data_bytes[(data_offsets + field_offset)[:, None] + np.arange(item_size)]
+        if decode_string is not None:
+            # Decoded from raw bytes, as NumPy strips trailing nulls from `bytes` values (breaking UTF-16).
+            raw, byte_order = gathered.tobytes(), self.row_type.DEFAULT_BYTE_ORDER
+            return np.array([decode_string(raw[i:i + item_size], byte_order) for i in range(0, len(raw), item_size)])
+        column = gathered.view(dtype)
+        column = column.reshape(len(data_offsets), length) if length > 0 else column.reshape(len(data_offsets))
+        if bit_shift_mask is not None:
+            shift, mask = bit_shift_mask
+            column = (column >> shift) & mask
+        if is_bool:
+            column = column.astype(bool)
+        return column.astype(column.dtype.newbyteorder("="))  # native byte order
+
+    def get_columns(
+        self, field_names: tp.Iterable[str], row_ids: tp.Sequence[int] | np.ndarray = None
+    ) -> dict[str, np.ndarray]:
+        """Get multiple columns at once with `get_column()`."""
+        if row_ids is not None:
+            row_ids = np.asarray(row_ids)
+        return {field_name: self.get_column(field_name, row_ids) for field_name in field_names}
+
+    def to_param(self) -> Param[PARAM_ROW_DATA_T]:
+        """Fully unpack into a new, mutable `Param`."""
+        from .param import TypedParam
+        return TypedParam(self.row_type).from_bytes(bytes(self._data))
+
+    def _get_index(self, row_id: int) -> int | None:
+        index = int(np.searchsorted(self.row_ids, row_id))
+        if index < len(self.row_ids) and self.row_ids[index] == row_id:
+            return index
+        return None
+
+    def _get_indices(self, row_ids: tp.Sequence[int] | np.ndarray) -> np.ndarray:
+        row_ids = np.asarray(row_ids)
+        indices = np.searchsorted(self.row_ids, row_ids)
+        found = indices < len(self.row_ids)
+        found[found] = self.row_ids[indices[found]] == row_ids[found]
+        if not found.all():
+            raise KeyError(f"Row IDs not in `{self.param_type}` view: {row_ids[~found].tolist()}")
+        return indices
+
+    def _get_raw_name(self, index: int) -> bytes:
+        name_offset = int(self._name_offsets[index])
+        if name_offset == 0:
+            return b""
+        if self._name_encoding.startswith("utf-16"):
+            # Find aligned null terminator.
+            end = name_offset
+            while self._data[end:end + 2] not in (b"\0\0", b""):
+                end += 2
+        else:
+            end = self._data.find(b"\0", name_offset)
+            if end == -1:
+                end = len(self._data)
+        return bytes(self._data[name_offset:end])
+
+    def _get_field_layout(self) -> dict[str, _ColumnLayout]:
+        """Map binary field names to the information needed to extract them from each row."""
+        row_type = self.row_type
+        byte_order = row_type.DEFAULT_BYTE_ORDER
+        row_struct, field_layouts = row_type._get_binary_layout(byte_order)
+
+        # Offsets and format characters of each `struct` item (pad bytes and strings are single items).
+        item_offsets = []
+        item_chars = []
+        offset = 0
+        for count, char in _STRUCT_TOKEN_RE.findall(row_struct.format):
+            count = int(count) if count else 1
+            if char == "x":
+                offset += count
+            elif char in "sp":
+                item_offsets.append(offset)
+                item_chars.append(char)
+                offset += count
+            else:
+                size = struct.calcsize(byte_order.value + char)
+                for _ in range(count):
+                    item_offsets.append(offset)
+                    item_chars.append(char)
+                    offset += size
+
+        layout = {}
+        for binary_field, metadata, bit_shift_mask in field_layouts:
+            char = item_chars[metadata.struct_index]
+            if char in "sp":
+                dtype = np.dtype(f"S{metadata.fmt.rstrip('sp') or 1}")
+            else:
+                dtype = np.dtype(_NUMPY_TYPES[char]).newbyteorder(byte_order.value)
+            layout[binary_field.name] = _ColumnLayout(
+                offset=item_offsets[metadata.struct_index],
+                dtype=dtype,
+                length=metadata.length,
+                bit_shift_mask=bit_shift_mask,
+                is_bool=binary_field.type in {bool, "bool"},
+                decode_string=metadata.process_from_unpack if isinstance(metadata, BinaryStringMetadata) else None,
+            )
+        return layout
+
+    def __repr__(self) -> str:
+        return f"ParamView[{self.param_type}]({len(self)} rows)"
+
+
+class _ColumnLayout(tp.NamedTuple):
+    """Location and type of one `ParamRow` field in each row, for `ParamView.get_column()`."""
+    offset: int
+    dtype: np.dtype
+    length: int  # non-zero for arrays
+    bit_shift_mask: tuple[int, int] | None
+    is_bool: bool
+    decode_string: tp.Callable[[bytes, ByteOrder], str] | None
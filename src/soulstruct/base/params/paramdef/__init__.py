@@ -1,5 +1,6 @@
-__all__ = ["ParamDef", "ParamDefBND", "ParamDefField"]
+__all__ = ["ParamDef", "ParamDefBND", "ParamDefField", "ParamDefRowCodec"]
 
 from .core import *
 from .paramdef_field import ParamDefField
 from .paramdefbnd import ParamDefBND
+from .row_codec import ParamDefRowCodec
@@ -12,6 +12,7 @@ from soulstruct.base.game_file import GameFile
 from soulstruct.utilities.binary import *
 
 from .paramdef_field import ParamDefField
+from .row_codec import ParamDefRowCodec
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -173,6 +174,10 @@ class ParamDef(GameFile):
                 size += f.size
         return size
 
+    def get_row_codec(self) -> ParamDefRowCodec:
+        """Get compiled `ParamDefRowCodec` that unpacks and packs rows with this layout (cached by layout)."""
+        return ParamDefRowCodec.from_paramdef(self)
+
     def to_writer(self) -> BinaryWriter:
         raise TypeError("Cannot pack `ParamDef` to binary. Are you trying to make your own FromSoftware game...?")
 
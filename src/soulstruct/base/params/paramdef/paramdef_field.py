@@ -326,9 +326,9 @@ class ParamDefField:
         if self.display_type is field_types.dummy8 and self.bit_count == -1:
             if not isinstance(value, bytes):  # `dummy8` fields that are not bit fields are not unpacked
                 raise ParamError(f"Value {value} of `dummy8` field {self.name} should be `bytes`, not {type(value)}.")
-        elif not isinstance(value, self.display_type):
+        elif not isinstance(value, self.py_type) and not (self.py_type is float and isinstance(value, int)):
             raise ParamError(
-                f"Value {value} of field {self.name} should have type {self.display_type}, not {type(value)}."
+                f"Value {value} of field {self.name} should have type {self.py_type}, not {type(value)}."
             )
 
     def check_range(self, value):
@@ -0,0 +1,228 @@
+"""Compiled binary layout of the rows of a `ParamDef`, used to unpack and pack `ParamDictRow` data at once rather than
+interpreting the `ParamDef` field by field for every row."""
+from __future__ import annotations
+
+__all__ = ["ParamDefRowCodec"]
+
+import logging
+import re
+import struct
+import typing as tp
+
+from soulstruct.base.params.exceptions import ParamError
+
+from . import field_types as ft
+from .exceptions import ParamDefError
+
+if tp.TYPE_CHECKING:
+    from .core import ParamDef
+
+_LOGGER = logging.getLogger(__name__)
+
+_SLOT_FMT_RE = re.compile(r"\d*[a-zA-Z?]")
+
+# Field kinds in compiled plan.
+_VALUE = 0  # one number in its own slot
+_BITS = 1  # integer bit field in a shared slot
+_BOOL = 2  # one-bit field in a shared slot
+_STRING = 3  # fixed-size encoded string
+_BYTES = 4  # raw pad bytes (`dummy8`), not decoded
+
+
+class ParamDefRowCodec:
+    """Precomputed `struct` format and bit field extraction plan for rows of one `ParamDef` layout.
+
+    Every field is one slot of a single row `Struct` (strings and pad fields are `{size}s` slots), except bit fields,
+    which share an integer slot and are extracted with a shift and mask. Bit fields are assigned to slots exactly as
+    `BitFieldReader` reads them: a new slot starts whenever the field format changes, a non-bit field intervenes, or the
+    next bit field would not fit in the current slot.
+
+    Get codecs with `ParamDef.get_row_codec()`, which caches them by `ParamDef` layout.
+    """
+
+    _CACHE: tp.ClassVar[dict[tuple, ParamDefRowCodec]] = {}
+
+    param_type: str
+    field_names: tuple[str, ...]
+    row_struct: struct.Struct
+    # Each field's `(kind, slot_index, bit_shift, bit_mask_or_size, encoding)`. Size is only used for strings.
+    _plan: tuple[tuple[int, int, int, int, str], ...]
+    _slot_count: int
+    # Index, allowed types, and type range (as in `ParamDefField.check_range()`) of each `_VALUE` field, checked before
+    # packing (as `ParamDictRow` field values are not checked when set).
+    _value_checks: tuple[tuple[int, tuple[type, ...], int | float, int | float], ...]
+
+    def __init__(self, paramdef: ParamDef):
+        self.param_type = paramdef.param_type
+        self.field_names = tuple(paramdef.fields)
+
+        slot_fmts = []
+        plan = []
+        value_checks = []
+        bit_fmt = ""  # format of current bit field slot, if any
+        bit_offset = 0
+        for paramdef_field in paramdef.fields.values():
+            display_type = paramdef_field.display_type
+            if paramdef_field.bit_count != -1:
+                fmt = paramdef_field.py_fmt.lstrip("<")
+                max_bit_count = 8 * struct.calcsize(fmt)
+                if not bit_fmt or fmt != bit_fmt or bit_offset + paramdef_field.bit_count > max_bit_count:
+                    slot_fmts.append(fmt)
+                    bit_fmt = fmt
+                    bit_offset = 0
+                kind = _BOOL if paramdef_field.bit_count == 1 else _BITS
+                plan.append((kind, len(slot_fmts) - 1, bit_offset, (1 << paramdef_field.bit_count) - 1, ""))
+                bit_offset += paramdef_field.bit_count
+                if bit_offset == max_bit_count:
+                    bit_fmt = ""
+                continue
+
+            bit_fmt = ""
+            if issubclass(display_type, ft.basestring):
+                encoding = "utf-16-le" if display_type is ft.fixstrW else "shift_jis_2004"
+                slot_fmts.append(f"{paramdef_field.size}s")
+                plan.append((_STRING, len(slot_fmts) - 1, 0, paramdef_field.size, encoding))
+            elif display_type is ft.dummy8:
+                slot_fmts.append(f"{paramdef_field.size}s")
+                plan.append((_BYTES, len(slot_fmts) - 1, 0, 0, ""))
+            elif paramdef_field.size == display_type.size():
+                slot_fmts.append(paramdef_field.py_fmt.lstrip("<"))
+                plan.append((_VALUE, len(slot_fmts) - 1, 0, 0, ""))
+                value_types = (float, int) if paramdef_field.py_type is float else (paramdef_field.py_type,)
+                value_checks.append(
+                    (len(plan) - 1, value_types, paramdef_field.py_type_min, paramdef_field.py_type_max)
+                )
+            else:
+                raise ParamDefError(
+                    f"Cannot compile row layout of `ParamDef` {self.param_type}: numeric array field "
+                    f"'{paramdef_field.name}' (size {paramdef_field.size}) is not supported."
+                )
+
+        # NOTE: All `ParamDef` field types are little-endian.
+        self.row_struct = struct.Struct("<" + "".join(slot_fmts))
+        self._plan = tuple(plan)
+        self._slot_count = len(slot_fmts)
+        self._value_checks = tuple(value_checks)
+
+    @classmethod
+    def from_paramdef(cls, paramdef: ParamDef) -> ParamDefRowCodec:
+        """Get cached codec for the layout of `paramdef`, compiling it if needed.
+
+        The cache key contains `param_type`, `data_version`, and the name, type, size, and bit count of every field, so
+        the same codec is shared by equal `ParamDef`s (e.g. copies sent to worker processes) and a modified `ParamDef`
+        gets a new one.
+        """
+        key = (
+            paramdef.param_type,
+            paramdef.data_version,
+            tuple((f.name, f.display_type, f.size, f.bit_count) for f in paramdef.fields.values()),
+        )
+        try:
+            return cls._CACHE[key]
+        except KeyError:
+            codec = cls._CACHE[key] = cls(paramdef)
+            return codec
+
+    @property
+    def size(self) -> int:
+        """Size of one row in bytes."""
+        return self.row_struct.size
+
+    def unpack_row(self, data: bytes) -> tuple:
+        """Unpack field values of one row from the start of `data` (in `field_names` order)."""
+        return self.unpack_rows([data])[0]
+
+    def unpack_rows(self, row_datas: tp.Sequence[bytes]) -> list[tuple]:
+        """Unpack field values of each row in `row_datas` (in `field_names` order).
+
+        Slots are unpacked row by row with the row `Struct`, and then fields are decoded column by column.
+        """
+        if not self._plan:
+            return [() for _ in row_datas]
+        slot_columns = list(zip(*map(self.row_struct.unpack_from, row_datas)))
+        if not slot_columns:
+            return []
+        field_columns = []
+        for kind, slot_index, shift, mask, encoding in self._plan:
+            column = slot_columns[slot_index]
+            if kind == _VALUE or kind == _BYTES:
+                field_columns.append(column)
+            elif kind == _BITS:
+                field_columns.append([slot >> shift & mask for slot in column])
+            elif kind == _BOOL:
+                field_columns.append([slot >> shift & 1 == 1 for slot in column])
+            else:
+                field_columns.append([_decode_fixed_string(raw, encoding) for raw in column])
+        return list(zip(*field_columns))
+
+    def pack_row(self, values: tp.Iterable) -> bytes:
+        """Pack one row from its field values (in `field_names` order).
+
+        Strings are encoded and null-padded, and pad field `bytes` are written as given (padded or truncated to the
+        field size). Raises `ParamError` for values with the wrong type or outside the range of their field.
+        """
+        values = tuple(values)
+        for field_index, value_types, minimum, maximum in self._value_checks:
+            value = values[field_index]
+            if not isinstance(value, value_types):
+                raise ParamError(
+                    f"Value {value!r} of field {self.field_names[field_index]} should have type {value_types[0]}, "
+                    f"not {type(value)}."
+                )
+            if not minimum <= value <= maximum and value == value:  # NaN is allowed
+                raise ParamError(
+                    f"Value {value!r} of field {self.field_names[field_index]} is outside range of its type: "
+                    f"[{minimum}, {maximum}]"
+                )
+        slots = [0] * self._slot_count
+        for (kind, slot_index, shift, mask, encoding), value, field_name in zip(self._plan, values, self.field_names):
+            if kind == _VALUE or kind == _BYTES:
+                slots[slot_index] = value
+            elif kind == _STRING:
+                if not isinstance(value, str):
+                    raise ParamError(f"Value {value!r} of string field {field_name} should be `str`.")
+                slots[slot_index] = encoded = value.encode(encoding)
+                if len(encoded) > mask:
+                    raise ParamError(f"String {value!r} of field {field_name} is longer than {mask} bytes.")
+            else:
+                if not isinstance(value, int) or not 0 <= value <= mask:
+                    raise ParamError(
+                        f"Value {value!r} of bit field {field_name} is not an integer in range [0, {mask}]."
+                    )
+                slots[slot_index] |= value << shift
+        try:
+            return self.row_struct.pack(*slots)
+        except struct.error as ex:
+            raise ParamError(f"Could not pack `{self.param_type}` row: {self._find_invalid_value(values) or ex}")
+
+    def pack_rows(self, rows_values: tp.Iterable[tp.Iterable]) -> bytes:
+        """Pack all rows from their field values (each in `field_names` order) into contiguous row data."""
+        return b"".join(map(self.pack_row, rows_values))
+
+    def _find_invalid_value(self, values: tuple) -> str:
+        """Find first number that its field format cannot pack, for error messages."""
+        for (kind, slot_index, *_), value, field_name in zip(self._plan, values, self.field_names):
+            if kind == _VALUE:
+                try:
+                    struct.pack("<" + self._get_slot_fmt(slot_index), value)
+                except struct.error as ex:
+                    return f"Invalid value {value!r} for field {field_name}: {ex}"
+        return ""
+
+    def _get_slot_fmt(self, slot_index: int) -> str:
+        return _SLOT_FMT_RE.findall(self.row_struct.format)[slot_index]
+
+    def __repr__(self):
+        return f"ParamDefRowCodec({self.param_type}, {len(self.field_names)} fields, {self.size} bytes)"
+
+
+def _decode_fixed_string(raw: bytes, encoding: str) -> str:
+    """Decode fixed-size string like `BinaryReader.unpack_string(length)`: strip trailing spaces, then nulls."""
+    bytes_per_char = 2 if encoding == "utf-16-le" else 1
+    if bytes_per_char == 2 and len(raw) % 2:
+        raw = raw[:-1]
+    raw = raw.rstrip()
+    terminator = b"\0" * bytes_per_char
+    while raw.endswith(terminator):
+        raw = raw[:-bytes_per_char]
+    return raw.decode(encoding)
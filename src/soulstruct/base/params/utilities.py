@@ -5,38 +5,13 @@ __all__ = ["ParamFieldComparisonType", "ParamFieldSearchCondition", "find_param_
 
 import logging
 import typing as tp
-from enum import Enum
 
 from .param import Param, ParamRow
+from .param_query import ParamFieldComparisonType, ParamFieldCondition
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class ParamFieldComparisonType(Enum):
-    """Numerical comparator condition for a Param field search."""
-    Equal = "=="
-    NotEqual = "!="
-    GreaterThan = ">"
-    LessThan = "<"
-    GreaterThanOrEqual = ">="
-    LessThanOrEqual = "<="
-
-    def compare(self, left, right) -> bool:
-        match self:
-            case ParamFieldComparisonType.Equal:
-                return left == right
-            case ParamFieldComparisonType.NotEqual:
-                return left != right
-            case ParamFieldComparisonType.GreaterThan:
-                return left > right
-            case ParamFieldComparisonType.LessThan:
-                return left < right
-            case ParamFieldComparisonType.GreaterThanOrEqual:
-                return left >= right
-            case ParamFieldComparisonType.LessThanOrEqual:
-                return left <= right
-
-
 class ParamFieldSearchCondition(tp.NamedTuple):
     field_name: str
     comparison_type: ParamFieldComparisonType
@@ -47,22 +22,15 @@ class ParamFieldSearchCondition(tp.NamedTuple):
 
 
 def find_param_rows(param: Param, conditions: tp.Iterable[ParamFieldSearchCondition]) -> dict[int, ParamRow]:
-    """Return all rows in `param` that match all `conditions`."""
-    return {
-        row_id: row for row_id, row in param.items()
-        if all(_check_condition(row, condition) for condition in conditions)
-    }
-
-
-def _check_condition(row: ParamRow, condition: ParamFieldSearchCondition) -> bool:
-    """Return True if `row` matches `condition`.
+    """Return all rows in `param` that match all `conditions`. Use `Param.find_rows()` for compound conditions.
 
-    Currently always returns false, and logs a warning, for non-numeric fields.
+    Non-numeric fields can only be compared with `Equal` or `NotEqual`; other comparisons log a warning and match no
+    rows.
     """
-    value = row[condition.field_name]
-    if not isinstance(value, (int, float)):
-        # Only Equal/NotEqual supported.
-        if condition.comparison_type not in (ParamFieldComparisonType.Equal, ParamFieldComparisonType.NotEqual):
-            _LOGGER.warning(f"Non-numeric Param field '{condition.field_name}' can only be a condition with == or !=.")
-            return False
-    return condition.comparison_type.compare(value, condition.value)
+    combined = None
+    for condition in conditions:
+        field_condition = ParamFieldCondition(condition.field_name, condition.comparison_type, condition.value)
+        combined = field_condition if combined is None else combined & field_condition
+    if combined is None:
+        return dict(param.items())
+    return param.find_rows(combined)
@@ -1,4 +1,5 @@
-__all__ = ["FMG", "MSGDirectory"]
+__all__ = ["FMG", "MSGDirectory", "TextSearchHit", "TextSearchIndex"]
 
 from .fmg import FMG
 from .msg_directory import MSGDirectory
+from .text_search import TextSearchHit, TextSearchIndex
@@ -11,7 +11,7 @@ from textwrap import wrap
 
 from soulstruct.base.game_file import GameFile
 from soulstruct.utilities.binary import *
-from soulstruct.utilities.files import read_json
+from soulstruct.utilities.files import iter_json_lines, read_json, write_json_lines
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,7 +35,7 @@ class FMGHeaderV0(BinaryStruct):
     _pad2: bytes = binary_pad(1)
     file_size: int
     _one: byte = binary(asserted=1)
-    _minus_one: byte = binary(asserted=-1)
+    _minus_one: sbyte = binary(asserted=-1)
     _pad3: bytes = binary_pad(2)
     range_count: int
     string_count: int
@@ -91,10 +91,15 @@ class FMG(GameFile):
         FMGVersion.V1: FMGHeaderV1,
         FMGVersion.V2: FMGHeaderV2,
     }
+    # Default `pool_strings` argument of `to_writer()`, which is also used by `bytes(fmg)` and `fmg.write()`.
+    POOL_STRINGS: tp.ClassVar[bool] = False
 
     entries: dict[int, str] = field(default_factory=dict)
     version: int = 2  # default to newest version (Bloodborne onwards)
 
+    # Incremented by methods that modify `entries` in place, so that search indices know to update (see `revision`).
+    _revision: int = field(default=0, init=False, repr=False, compare=False)
+
     @classmethod
     def from_reader(cls, reader: BinaryReader) -> tp.Self:
 
@@ -141,6 +146,23 @@ class FMG(GameFile):
         json_dict["entries"] = {int(k): v for k, v in json_dict["entries"].items()}
         return cls.from_dict(json_dict)
 
+    @classmethod
+    def from_ndjson(cls, ndjson_path: str | Path, encoding="utf-8") -> tp.Self:
+        """Read newline-delimited JSON file written by `write_ndjson()`, one entry at a time."""
+        lines = iter_json_lines(ndjson_path, encoding=encoding)
+        try:
+            header = next(lines)  # type: dict[str, tp.Any]
+        except StopIteration:
+            raise ValueError(f"FMG NDJSON file is empty: {ndjson_path}")
+        fmg = cls(entries={string_id: text for string_id, text in lines}, version=header.get("version", 2))
+        fmg.path = Path(ndjson_path)
+        return fmg
+
+    @property
+    def revision(self) -> int:
+        """Counts in-place changes made by `FMG` methods. Changes made directly to `entries` are NOT counted."""
+        return self._revision
+
     def sort(self):
         """Sort strings by ID in-place."""
         self.entries = {string_id: self.entries[string_id] for string_id in sorted(self.entries.keys())}
@@ -191,10 +213,16 @@ class FMG(GameFile):
             new_entries[string_id] = wrapped_string
         return FMG(entries=new_entries, version=self.version)
 
-    def to_writer(self, sort=True) -> BinaryWriter:
-        """Pack text dictionary to binary FMG file."""
+    def to_writer(self, sort=True, pool_strings: bool = None) -> BinaryWriter:
+        """Pack text dictionary to binary FMG file.
+
+        If `pool_strings` is True, identical strings are only written once and share an offset, which can noticeably
+        reduce the size of large FMGs. Defaults to class variable `POOL_STRINGS` (False, as in vanilla files).
+        """
         if sort:
             self.sort()
+        if pool_strings is None:
+            pool_strings = self.POOL_STRINGS
 
         writer = BinaryWriter(
             byte_order=ByteOrder.BigEndian if self.version == 0 else ByteOrder.LittleEndian,
@@ -208,7 +236,6 @@ class FMG(GameFile):
             writer,
             big_endian=self.version == 0,
             file_size=RESERVED,
-            unknown1=-1 if self.version == 0 else 0,
             range_count=RESERVED,
             string_count=len(self.entries),
             string_offsets_offset=RESERVED,
@@ -246,16 +273,30 @@ class FMG(GameFile):
         writer.fill("range_count", range_count, obj=self)
 
         writer.fill_with_position("string_offsets_offset", obj=self)
-        packed_strings = b""  # saving ourselves an additional iteration
+        # Offsets and encoded strings are collected in lists and packed/joined once at the end, which keeps packing
+        # linear in total text size. With `pool_strings`, identical strings share one offset (and one copy of the data).
+        encoding = writer.get_utf_16_encoding()
+        string_offsets = []
+        packed_strings = []
+        pooled_offsets = {}  # type: dict[str, int]
         packed_strings_offset = writer.position + (8 if writer.long_varints else 4) * len(self.entries)
-        for string_id, string in self.entries.items():
+        for string in self.entries.values():
             if string == "":
-                writer.pack("v", 0)  # no offset
-            else:
-                writer.pack("v", packed_strings_offset + len(packed_strings))
-            packed_strings += string.encode(writer.get_utf_16_encoding()) + b"\0\0"
-
-        writer.append(packed_strings)
+                string_offsets.append(0)  # no offset
+                continue
+            if pool_strings:
+                string_offset = pooled_offsets.get(string)
+                if string_offset is not None:
+                    string_offsets.append(string_offset)
+                    continue
+                pooled_offsets[string] = packed_strings_offset
+            string_offsets.append(packed_strings_offset)
+            packed_string = string.encode(encoding) + b"\0\0"
+            packed_strings.append(packed_string)
+            packed_strings_offset += len(packed_string)
+
+        writer.pack(f"{len(string_offsets)}v", *string_offsets)
+        writer.append(b"".join(packed_strings))
 
         writer.fill_with_position("file_size", obj=self)
 
@@ -265,7 +306,27 @@ class FMG(GameFile):
         """Optionally (and by default) sorts text entries before converting to dictionary."""
         if sort:
             self.sort()
-        return super(GameFile, self).to_dict()
+        data = super(GameFile, self).to_dict()
+        data.pop("_revision", None)
+        return data
+
+    def write_ndjson(self, file_path: None | str | Path = None, encoding="utf-8", sort=True):
+        """Write FMG as newline-delimited JSON, one entry at a time: a header with `version` on the first line, then a
+        `[string_id, text]` list on each line. Read it with `from_ndjson()`.
+
+        Optionally (and by default) sorts text entries first, like `to_dict()`. The file path will have the `.ndjson`
+        suffix added automatically if missing.
+        """
+        if sort:
+            self.sort()
+        if file_path is None:
+            if self.path is None:
+                raise ValueError("You must specify `file_path` because file default `path` has not been set.")
+            file_path = self.path
+        file_path = Path(file_path)
+        if file_path.suffix != ".ndjson":
+            file_path = file_path.with_suffix(file_path.suffix + ".ndjson")
+        write_json_lines(file_path, {"version": int(self.version)}, self.entries.items(), encoding=encoding)
 
     def __getitem__(self, index: int):
         return self.entries[index]
@@ -276,9 +337,11 @@ class FMG(GameFile):
 
     def __setitem__(self, index: int, text: str):
         self.entries[index] = text
+        self._revision += 1
 
     def setdefault(self, string_id: int, default: str):
         """Return `string_id` value or set it to `default` and return that."""
+        self._revision += 1
         return self.entries.setdefault(string_id, default)
 
     def pop(self, string_id: int, default: str = None):
@@ -286,10 +349,12 @@ class FMG(GameFile):
 
         Will never raise a `KeyError`. Use `FMG.entries.pop()` if you want to assert the key exists.
         """
+        self._revision += 1
         return self.entries.pop(string_id, default)
 
     def update(self, fmg_or_entries: FMG | dict):
         """Update this FMG in place with `FMG` or `entries` dict."""
+        self._revision += 1
         if isinstance(fmg_or_entries, dict):
             return self.entries.update(fmg_or_entries)
         elif isinstance(fmg_or_entries, FMG):
@@ -312,6 +377,7 @@ class FMG(GameFile):
                 print(f"\n  [{index}]:\n{text}")
                 if replace_with is not None:
                     self.entries[index] = text.replace(search_string, replace_with)
+                    self._revision += 1
                     print(f"  -> {self.entries[index]}")
         if not found_something:
             print(f"Could not find any occurrences of string {repr(search_string)}.")
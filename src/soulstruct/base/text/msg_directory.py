@@ -5,6 +5,7 @@ __all__ = ["MSGDirectory", "fmg_property"]
 import abc
 import csv
 import logging
+import multiprocessing
 import re
 import typing as tp
 from dataclasses import field
@@ -16,6 +17,7 @@ from soulstruct.base.game_file_directory import GameFileDirectory
 from soulstruct.utilities.files import read_json, write_json
 
 from .fmg import FMG
+from .text_search import TextSearchHit, TextSearchIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,6 +57,9 @@ class MSGDirectory(GameFileDirectory, abc.ABC):
     # Maps "item/menu" string and entry IDs to FMGs (unusual for IDs to matter, but they do in MSGBNDs).
     fmgs: dict[(str, int), FMG] = field(default_factory=dict)
 
+    # Built by first call to `search()`.
+    _search_index: TextSearchIndex | None = field(default=None, init=False, repr=False, compare=False)
+
     @classmethod
     def GET_ALL_CATEGORIES(cls):
         return cls.MAIN_CATEGORIES + cls.INTERNAL_CATEGORIES
@@ -92,11 +97,14 @@ class MSGDirectory(GameFileDirectory, abc.ABC):
         return cls(directory=None, files=files, fmgs=fmgs)
 
     @classmethod
-    def from_json_directory(cls, directory: Path | str) -> tp.Self:
+    def from_json_directory(cls, directory: Path | str, processes: int | None = 1) -> tp.Self:
         """Load individual text (FMG) JSON files from an unpacked Binder folder (e.g. from `write_json_directory()`).
 
         The names of the JSON files to be loaded from the folder are recorded in the "entries" key of the
         `item_msgbnd_manifest.json` and `menu_msgbnd_manifest.json` files, along with header information for each BND.
+        Each FMG is read from its `.json` file or, if that does not exist, its newline-delimited `.ndjson` file.
+
+        If `processes` is `None` (all CPUs) or greater than one, FMG files are read in a worker pool.
 
         NOTE: This does not use the `Binder` base manifest system at all.
         """
@@ -116,20 +124,36 @@ class MSGDirectory(GameFileDirectory, abc.ABC):
         item_kwargs = cls.FILE_CLASS.process_manifest_header(item_manifest)
         menu_kwargs = cls.FILE_CLASS.process_manifest_header(menu_manifest)
 
-        missing_ids = list(cls.DEFAULT_ENTRY_STEMS)
+        # Find all FMG JSON files first, so they can be read in parallel.
+        fmg_json_paths = {}  # type: dict[tuple[str, int], Path]
         for msgbnd_name, kwargs in zip(("item", "menu"), (item_kwargs, menu_kwargs)):
-            entries = []
-            entry_json_dict = kwargs.pop("entries", {})
-            for entry_id, json_stem in entry_json_dict.items():
+            for entry_id, json_stem in kwargs.get("entries", {}).items():
                 entry_id = int(entry_id)
-                json_name = f"{json_stem}.json"
+                json_path = directory / f"{json_stem}.json"
                 if (msgbnd_name, entry_id) not in cls.DEFAULT_ENTRY_STEMS:
-                    _LOGGER.warning(f"Ignoring unrecognized MSGBND JSON file with entry ID {entry_id}: {json_name}")
+                    _LOGGER.warning(
+                        f"Ignoring unrecognized MSGBND JSON file with entry ID {entry_id}: {json_path.name}"
+                    )
+                    continue
+                if not json_path.is_file() and json_path.with_suffix(".ndjson").is_file():
+                    json_path = json_path.with_suffix(".ndjson")
+                fmg_json_paths[msgbnd_name, entry_id] = json_path
+        if processes == 1 or len(fmg_json_paths) <= 1:
+            loaded_fmgs = [_read_fmg_json(json_path) for json_path in fmg_json_paths.values()]
+        else:
+            with multiprocessing.Pool(processes=processes) as pool:
+                loaded_fmgs = pool.map(_read_fmg_json_mp, fmg_json_paths.values())  # blocks here until all done
+        loaded_fmgs = dict(zip(fmg_json_paths, loaded_fmgs))
+
+        missing_ids = list(cls.DEFAULT_ENTRY_STEMS)
+        for msgbnd_name, kwargs in zip(("item", "menu"), (item_kwargs, menu_kwargs)):
+            entries = []
+            kwargs.pop("entries", None)
+            for (fmg_msgbnd_name, entry_id), fmg in loaded_fmgs.items():
+                if fmg_msgbnd_name != msgbnd_name:
                     continue
-                try:
-                    fmg = FMG.from_json(directory / json_name)
-                except FileNotFoundError:
-                    raise FileNotFoundError(f"Could not find text (FMG) JSON file: {directory / json_name}")
+                if fmg is None:
+                    raise ValueError(f"Failed to read text (FMG) JSON file: {fmg_json_paths[msgbnd_name, entry_id]}")
                 fmg.dcx_type = cls.FMG_DCX_TYPE
                 fmg_stem = cls.DEFAULT_ENTRY_STEMS[(msgbnd_name, entry_id)]
                 entry_path = cls.FILE_CLASS.get_default_entry_path(fmg_stem + ".fmg")
@@ -165,7 +189,7 @@ class MSGDirectory(GameFileDirectory, abc.ABC):
                 raise
         return fmgs
 
-    def write_json_directory(self, directory: tp.Union[Path, str]):
+    def write_json_directory(self, directory: tp.Union[Path, str], ndjson=False, processes: int | None = 1):
         """Write a folder containing custom MSGBND manifests linking to FMG JSON entry files.
 
         The resulting folder can be loaded with `from_json_directory(directory)`.
@@ -173,6 +197,9 @@ class MSGDirectory(GameFileDirectory, abc.ABC):
         The JSON file names will always be the more readable Soulstruct 'category' names, e.g. 'WeaponDescriptions', but
         the entry names written to the Binders by `write()` will always use the game-specific internal names from
         `DEFAULT_ENTRY_NAMES`.
+
+        If `ndjson` is True, each FMG is written with `FMG.write_ndjson()` to a newline-delimited `.ndjson` file
+        instead. If `processes` is `None` (all CPUs) or greater than one, FMG files are written in a worker pool.
         """
         directory = Path(directory)
         directory.mkdir(parents=True, exist_ok=True)
@@ -187,11 +214,20 @@ class MSGDirectory(GameFileDirectory, abc.ABC):
 
         category_fmgs = self.get_matching_fmgs()
 
+        mp_args = []
         for (msgbnd_name, entry_id), fmg in self.fmgs.items():
             # TODO: Clunky way to get Soulstruct category name...
             category_name = [key for key, _fmg in category_fmgs.items() if _fmg is fmg][0]
             manifests[msgbnd_name]["entries"][entry_id] = category_name
-            fmg.write_json(directory / f"{category_name}.json", encoding="utf-8")
+            mp_args.append((fmg, directory / f"{category_name}.json", ndjson))
+        if processes == 1 or len(mp_args) <= 1:
+            for args in mp_args:
+                _write_fmg_json(*args)
+        else:
+            with multiprocessing.Pool(processes=processes) as pool:
+                written = pool.starmap(_write_fmg_json_mp, mp_args)  # blocks here until all done
+            if not all(written):
+                raise ValueError("Failed to write some text (FMG) JSON files (see log).")
 
         write_json(directory / "item_msgbnd_manifest.json", manifests["item"])
         write_json(directory / "menu_msgbnd_manifest.json", manifests["menu"])
@@ -377,19 +413,49 @@ class MSGDirectory(GameFileDirectory, abc.ABC):
             exclude_subtitles: the 'Subtitles' text category is so large that it deserves its own bool to exclude it
                 from the text search separate.
         """
-        fmgs = self.get_matching_fmgs(category_name_regex)
-        if exclude_subtitles:
-            fmgs.pop("Subtitles", None)
-
-        found_something = False
-        for fmg_name, fmg in fmgs.items():
-            for string_id, string in fmg.items():
-                if search_string in string:
-                    found_something = True
+        if not search_string:
+            # Every string (including empty strings, which are never search hits) contains the empty string.
+            fmgs = self.get_matching_fmgs(category_name_regex)
+            if exclude_subtitles:
+                fmgs.pop("Subtitles", None)
+            for fmg_name, fmg in fmgs.items():
+                for string_id, string in fmg.items():
                     print(f"\n~~~ {fmg_name}[{string_id}]:\n{string}")
-        if not found_something:
+            return
+
+        hits = self.search(search_string, "substring", case_sensitive=True, category_name_regex=category_name_regex)
+        if exclude_subtitles:
+            hits = [hit for hit in hits if hit.category != "Subtitles"]
+        for hit in hits:
+            print(f"\n~~~ {hit.category}[{hit.string_id}]:\n{hit.text}")
+        if not hits:
             print(f"Could not find any occurrences of string {repr(search_string)}.")
 
+    def search(
+        self,
+        query: str | re.Pattern,
+        mode: str = "words",
+        case_sensitive=False,
+        category_name_regex: str | re.Pattern = "",
+        limit: int = None,
+    ) -> list[TextSearchHit]:
+        """Search all FMGs for `query` and return `TextSearchHit` tuples of `(category, fmg_name, string_id, text)`.
+
+        See `TextSearchIndex.search()` for arguments. The index is built on first use and kept up to date with changes
+        made to FMGs, except for edits made directly to `FMG.entries` dictionaries; call `invalidate_search_index()`
+        after those. Use `TextSearchIndex` directly to search multiple directories (e.g. languages) at once.
+        """
+        if self._search_index is None:
+            self._search_index = TextSearchIndex(self)
+        return self._search_index.search(
+            query, mode, case_sensitive=case_sensitive, category_name_regex=category_name_regex, limit=limit
+        )
+
+    def invalidate_search_index(self):
+        """Discard search index, which will be rebuilt as needed by the next `search()`."""
+        if self._search_index is not None:
+            self._search_index.invalidate()
+
     def __iter__(self):
         return iter(self.fmgs.keys())
 
@@ -467,3 +533,36 @@ def fmg_property(msgbnd_name: str, bnd_index: int):
     No setter is available. Contents of an FMG can be replaced completely by setting its `entries` attribute.
     """
     return property(lambda self: self.fmgs[msgbnd_name, bnd_index])
+
+
+def _read_fmg_json(json_path: Path) -> FMG:
+    try:
+        return FMG.from_ndjson(json_path) if json_path.suffix == ".ndjson" else FMG.from_json(json_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Could not find text (FMG) JSON file: {json_path}")
+
+
+def _write_fmg_json(fmg: FMG, json_path: Path, ndjson: bool):
+    if ndjson:
+        fmg.write_ndjson(json_path.with_suffix(".ndjson"), encoding="utf-8")
+    else:
+        fmg.write_json(json_path, encoding="utf-8")
+
+
+def _read_fmg_json_mp(json_path: Path) -> FMG | None:
+    """Function for `MSGDirectory` worker pool."""
+    try:
+        return _read_fmg_json(json_path)
+    except Exception as ex:
+        _LOGGER.error(f"Failed to read FMG JSON file '{json_path}'. Error: {str(ex)}")
+        return None
+
+
+def _write_fmg_json_mp(fmg: FMG, json_path: Path, ndjson: bool) -> bool:
+    """Function for `MSGDirectory` worker pool."""
+    try:
+        _write_fmg_json(fmg, json_path, ndjson)
+    except Exception as ex:
+        _LOGGER.error(f"Failed to write FMG JSON file '{json_path}'. Error: {str(ex)}")
+        return False
+    return True
@@ -0,0 +1,272 @@
+"""Indexed text search over the FMGs of one or more `MSGDirectory` instances (e.g. every language of a game).
+
+Index data is built lazily, one FMG at a time, and an FMG is re-indexed automatically before the next search if it has
+been replaced, had its `entries` dictionary replaced, or been modified with `FMG` methods like `fmg[string_id] = text`
+or `fmg.update(...)`. Edits made directly to `fmg.entries` cannot be detected; call `invalidate()` after those.
+"""
+from __future__ import annotations
+
+__all__ = ["TextSearchHit", "TextSearchIndex"]
+
+import bisect
+import logging
+import re
+import typing as tp
+from pathlib import Path
+
+import numpy as np
+
+if tp.TYPE_CHECKING:
+    from .fmg import FMG
+    from .msg_directory import MSGDirectory
+
+_LOGGER = logging.getLogger(__name__)
+
+# Words are indexed in case-folded form. Note that languages without spaces (e.g. Japanese) will produce long 'words';
+# use 'substring' mode to search those.
+_WORD_RE = re.compile(r"\w+")
+
+# Joins FMG strings into one searchable corpus. Cannot appear in FMG strings, which are null-terminated.
+_CORPUS_SEPARATOR = "\0"
+
+_WORD_OR_SEPARATOR_RE = re.compile(r"\w+|\0")
+
+SEARCH_MODES = ("words", "substring", "regex")
+
+
+class TextSearchHit(tp.NamedTuple):
+    category: str  # Soulstruct text category name, e.g. 'WeaponNames'
+    fmg_name: str  # FMG entry stem in MSGBND, e.g. 'WeaponName' (same as `category` if unknown)
+    string_id: int
+    text: str
+    language: str = ""  # key of the hit's `MSGDirectory` in `TextSearchIndex.msg_directories`
+
+
+class _FMGSegment:
+    """Search data for one FMG. Word index and joined corpora are only built when first needed by a search mode."""
+
+    __slots__ = (
+        "fmg", "entries", "entry_count", "revision", "category", "fmg_name", "string_ids", "texts", "_words", "_corpora"
+    )
+
+    fmg: FMG
+    entries: dict[int, str]
+    entry_count: int
+    revision: int
+    category: str
+    fmg_name: str
+    string_ids: list[int]
+    texts: list[str]
+    _words: tuple[dict[str, int], np.ndarray, np.ndarray] | None
+    _corpora: dict[bool, tuple[str, list[int]]]
+
+    def __init__(self, fmg: FMG, category: str, fmg_name: str):
+        self.fmg = fmg
+        self.entries = fmg.entries
+        self.entry_count = len(fmg.entries)
+        self.revision = fmg.revision
+        self.category = category
+        self.fmg_name = fmg_name
+        # Empty strings are never hits.
+        self.string_ids = [string_id for string_id, text in fmg.entries.items() if text]
+        self.texts = [text for text in fmg.entries.values() if text]
+        self._words = None
+        self._corpora = {}
+
+    def is_current(self, fmg: FMG) -> bool:
+        return (
+            fmg is self.fmg
+            and fmg.entries is self.entries
+            and len(fmg.entries) == self.entry_count
+            and fmg.revision == self.revision
+        )
+
+    def find_words(self, words: list[str]) -> list[int]:
+        """Return indices of strings containing all (case-folded) `words`."""
+        if self._words is None:
+            self._words = self._build_word_index()
+        word_ids, offsets, postings = self._words
+        word_postings = []
+        for word in words:
+            if (word_id := word_ids.get(word)) is None:
+                return []
+            word_postings.append(postings[offsets[word_id]:offsets[word_id + 1]])
+        word_postings.sort(key=len)
+        indices = word_postings[0]
+        for other_indices in word_postings[1:]:
+            indices = np.intersect1d(indices, other_indices, assume_unique=True)
+        return indices.tolist()
+
+    def _build_word_index(self) -> tuple[dict[str, int], np.ndarray, np.ndarray]:
+        """Build inverted index in 'CSR' form: the sorted indices of all strings containing word ID `i` (in `word_ids`)
+        are `postings[offsets[i]:offsets[i + 1]]`.
+
+        Words are found with a single pass over the case-folded corpus, and string indices are recovered by counting
+        separators, so no Python code runs per string.
+        """
+        corpus, _ = self._get_corpus(case_sensitive=False)
+        tokens = _WORD_OR_SEPARATOR_RE.findall(corpus)
+        word_ids = {word: i for i, word in enumerate(dict.fromkeys(tokens))}  # includes separator
+        token_ids = np.fromiter(map(word_ids.__getitem__, tokens), dtype=np.int32, count=len(tokens))
+        is_separator = token_ids == word_ids.get(_CORPUS_SEPARATOR, -1)
+        string_indices = np.cumsum(is_separator, dtype=np.int32)[~is_separator]
+        token_ids = token_ids[~is_separator]
+
+        # Group by word with a stable sort (so string indices stay sorted within each word), then drop repeated words
+        # in the same string.
+        order = np.argsort(token_ids, kind="stable")
+        token_ids = token_ids[order]
+        string_indices = string_indices[order]
+        is_first = np.ones(len(token_ids), dtype=bool)
+        is_first[1:] = (token_ids[1:] != token_ids[:-1]) | (string_indices[1:] != string_indices[:-1])
+        offsets = np.searchsorted(token_ids[is_first], np.arange(len(word_ids) + 1))
+        return word_ids, offsets, string_indices[is_first]
+
+    def find_substring(self, substring: str, case_sensitive: bool) -> list[int]:
+        """Return indices of strings containing `substring`, by scanning one joined corpus with `str.find`."""
+        corpus, starts = self._get_corpus(case_sensitive)
+        if not case_sensitive:
+            substring = substring.casefold()
+
+        indices = []
+        string_count = len(starts)
+        position = corpus.find(substring)
+        while position != -1:
+            i = bisect.bisect_right(starts, position) - 1
+            indices.append(i)
+            if i + 1 == string_count:
+                break
+            position = corpus.find(substring, starts[i + 1])  # skip to next string
+        return indices
+
+    def _get_corpus(self, case_sensitive: bool) -> tuple[str, list[int]]:
+        """Get all strings (case-folded unless `case_sensitive`) joined by separators, and the offset of each string."""
+        if case_sensitive not in self._corpora:
+            texts = self.texts if case_sensitive else [text.casefold() for text in self.texts]
+            starts = []
+            offset = 0
+            for text in texts:
+                starts.append(offset)
+                offset += len(text) + 1
+            self._corpora[case_sensitive] = (_CORPUS_SEPARATOR.join(texts), starts)
+        return self._corpora[case_sensitive]
+
+    def find_pattern(self, pattern: re.Pattern) -> list[int]:
+        """Return indices of strings that `pattern` can be found in. Not indexed (anchors must apply to each string)."""
+        search = pattern.search
+        return [i for i, text in enumerate(self.texts) if search(text)]
+
+
+class TextSearchIndex:
+    """Searchable index of all FMG strings in one or more `MSGDirectory` instances, keyed by any name (e.g. language).
+
+    Use `MSGDirectory.search()` to search a single directory with its own cached index.
+    """
+
+    msg_directories: dict[str, MSGDirectory]
+
+    def __init__(self, msg_directories: MSGDirectory | dict[str, MSGDirectory]):
+        if not isinstance(msg_directories, dict):
+            msg_directories = {"": msg_directories}
+        self.msg_directories = msg_directories
+        self._segments = {}  # type: dict[str, dict[tuple[str, int], _FMGSegment]]
+
+    @classmethod
+    def from_msg_path(cls, msg_directory_class: type[MSGDirectory], msg_path: Path | str) -> tp.Self:
+        """Load every language subdirectory of game `msg` folder `msg_path` that contains an `item` MSGBND."""
+        msg_directories = {}
+        for language_path in sorted(Path(msg_path).iterdir()):
+            if language_path.is_dir() and any(language_path.glob("item.msgbnd*")):
+                msg_directories[language_path.name] = msg_directory_class.from_path(language_path)
+        if not msg_directories:
+            raise FileNotFoundError(f"Could not find any language directories with MSGBNDs in: {msg_path}")
+        return cls(msg_directories)
+
+    def invalidate(self):
+        """Discard all index data, which will be rebuilt as needed by the next search."""
+        self._segments.clear()
+
+    def search(
+        self,
+        query: str | re.Pattern,
+        mode: str = "words",
+        case_sensitive=False,
+        category_name_regex: str | re.Pattern = "",
+        languages: tp.Iterable[str] = None,
+        limit: int = None,
+    ) -> list[TextSearchHit]:
+        """Search all strings for `query` and return hits in directory, FMG, and string order.
+
+        Args:
+            query: Text or pattern to find.
+            mode: How to match `query`:
+                'words' (default): strings must contain all words in `query` (in any order). Always case-insensitive.
+                'substring': strings must contain `query` anywhere (like `query in text`).
+                'regex': `query` is a regular expression that is searched for in each string with `re.search`.
+            case_sensitive: Whether 'substring' and 'regex' searches are case-sensitive. (Default: False)
+            category_name_regex: Only search FMGs whose Soulstruct category names (e.g. 'WeaponDescriptions') match
+                this pattern.
+            languages: Only search these keys of `msg_directories`. (Default: all)
+            limit: Maximum number of hits to return. (Default: no limit)
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Invalid text search mode '{mode}'. Must be one of: {SEARCH_MODES}")
+        if mode == "regex":
+            if isinstance(query, str):
+                query = re.compile(query, 0 if case_sensitive else re.IGNORECASE)
+        elif not isinstance(query, str):
+            raise TypeError(f"Text search query must be a string in '{mode}' mode.")
+        if mode == "words":
+            words = _WORD_RE.findall(query.casefold())
+            if not words:
+                return []
+        elif not query:
+            return []
+        if isinstance(category_name_regex, str) and category_name_regex:
+            category_name_regex = re.compile(category_name_regex)
+        if languages is not None:
+            languages = set(languages)
+            if missing := languages - self.msg_directories.keys():
+                raise KeyError(f"Unknown text search languages: {sorted(missing)}")
+
+        hits = []
+        for language, msg_directory in self.msg_directories.items():
+            if languages is not None and language not in languages:
+                continue
+            for segment in self._get_segments(language, msg_directory):
+                if category_name_regex and not category_name_regex.match(segment.category):
+                    continue
+                if mode == "words":
+                    indices = segment.find_words(words)
+                elif mode == "substring":
+                    indices = segment.find_substring(query, case_sensitive)
+                else:
+                    indices = segment.find_pattern(query)
+                string_ids, texts = segment.string_ids, segment.texts
+                hits += [
+                    TextSearchHit(segment.category, segment.fmg_name, string_ids[i], texts[i], language)
+                    for i in indices
+                ]
+                if limit is not None and len(hits) >= limit:
+                    return hits[:limit]
+        return hits
+
+    def _get_segments(self, language: str, msg_directory: MSGDirectory) -> list[_FMGSegment]:
+        """Get up-to-date index segments for all FMGs in `msg_directory`, (re)building any that are new or modified."""
+        segments = self._segments.setdefault(language, {})
+        category_names = None  # type: dict[int, str] | None
+        current_segments = []
+        for fmg_key, fmg in msg_directory.fmgs.items():
+            segment = segments.get(fmg_key)
+            if segment is None or not segment.is_current(fmg):
+                if category_names is None:
+                    category_names = {id(_fmg): name for name, _fmg in msg_directory.get_matching_fmgs().items()}
+                msgbnd_name, entry_id = fmg_key
+                fmg_name = msg_directory.DEFAULT_ENTRY_STEMS.get(fmg_key, f"{msgbnd_name}[{entry_id}]")
+                segment = segments[fmg_key] = _FMGSegment(fmg, category_names.get(id(fmg), fmg_name), fmg_name)
+            current_segments.append(segment)
+        if len(segments) != len(current_segments):
+            # Forget removed FMGs.
+            for fmg_key in segments.keys() - msg_directory.fmgs.keys():
+                segments.pop(fmg_key)
+        return current_segments
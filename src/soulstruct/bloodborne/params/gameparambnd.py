@@ -19,9 +19,9 @@ from soulstruct.base.params.param import Param
 from soulstruct.utilities.misc import BiDict
 
 from . import paramdef
-from .paramdef import *
 
 if tp.TYPE_CHECKING:
+    from .paramdef import *
     from ..text.msg_directory import MSGDirectory
 
 
@@ -69,67 +69,11 @@ __all__ = [
     "WIND_PARAM_ST",
 ]
 
+from soulstruct.utilities.misc import get_lazy_module_getattr
+
 from .core import *
-from .ACTIONBUTTON_PARAM_ST import ACTIONBUTTON_PARAM_ST
-from .AI_SOUND_PARAM_ST import AI_SOUND_PARAM_ST
-from .AI_STANDARD_INFO_BANK import AI_STANDARD_INFO_BANK
-from .ATK_PARAM_ST import ATK_PARAM_ST
-from .BEHAVIOR_PARAM_ST import BEHAVIOR_PARAM_ST
-from .BULLET_PARAM_ST import BULLET_PARAM_ST
-from .CACL_CORRECT_GRAPH_ST import CACL_CORRECT_GRAPH_ST
-from .CHARACTER_INIT_PARAM import CHARACTER_INIT_PARAM
-from .CHARMAKEMENU_LISTITEM_PARAM_ST import CHARMAKEMENU_LISTITEM_PARAM_ST
-from .CHARMAKEMENUTOP_PARAM_ST import CHARMAKEMENUTOP_PARAM_ST
-from .DECAL_PARAM_ST import DECAL_PARAM_ST
-from .DUNGEON_FEATURE_PARAM_ST import DUNGEON_FEATURE_PARAM_ST
-from .DUNGEON_SUB_FEAT_LOT_PARAM import DUNGEON_SUB_FEAT_LOT_PARAM
-from .ENEMY_STANDARD_INFO_BANK import ENEMY_STANDARD_INFO_BANK
-from .EQUIP_MTRL_SET_PARAM_ST import EQUIP_MTRL_SET_PARAM_ST
-from .EQUIP_PARAM_ACCESSORY_ST import EQUIP_PARAM_ACCESSORY_ST
-from .EQUIP_PARAM_GOODS_ST import EQUIP_PARAM_GOODS_ST
-from .EQUIP_PARAM_PROTECTOR_ST import EQUIP_PARAM_PROTECTOR_ST
-from .EQUIP_PARAM_WEAPON_ST import EQUIP_PARAM_WEAPON_ST
-from .FACE_GEN_PARAM_ST import FACE_GEN_PARAM_ST
-from .FACE_PARAM_ST import FACE_PARAM_ST
-from .FACE_RANGE_PARAM_ST import FACE_RANGE_PARAM_ST
-from .GAME_AREA_PARAM_ST import GAME_AREA_PARAM_ST
-from .GAME_MAP_PARAM_ST import GAME_MAP_PARAM_ST
-from .GEM_CATEGORY_PARAM_ST import GEM_CATEGORY_PARAM_ST
-from .GEM_DROP_DOPING_PARAM_ST import GEM_DROP_DOPING_PARAM_ST
-from .GEM_DROP_MODIFY_PARAM_ST import GEM_DROP_MODIFY_PARAM_ST
-from .GEMEFFECT_PARAM_ST import GEMEFFECT_PARAM_ST
-from .GEM_GEN_PARAM_ST import GEM_GEN_PARAM_ST
-from .HIT_MTRL_PARAM_ST import HIT_MTRL_PARAM_ST
-from .HOLYGRAIL_EX_PARAM_ST import HOLYGRAIL_EX_PARAM_ST
-from .ITEMLOT_LVDEP_PARAM_ST import ITEMLOT_LVDEP_PARAM_ST
-from .ITEMLOT_PARAM_ST import ITEMLOT_PARAM_ST
-from .KNOCKBACK_PARAM_ST import KNOCKBACK_PARAM_ST
-from .LOCK_CAM_PARAM_ST import LOCK_CAM_PARAM_ST
-from .LOD_BANK import LOD_BANK
-from .MAGIC_PARAM_ST import MAGIC_PARAM_ST
-from .MENU_PARAM_COLOR_TABLE_ST import MENU_PARAM_COLOR_TABLE_ST
-from .MENUPROPERTY_LAYOUT import MENUPROPERTY_LAYOUT
-from .MENUPROPERTY_SPEC import MENUPROPERTY_SPEC
-from .MENU_VALUE_TABLE_SPEC import MENU_VALUE_TABLE_SPEC
-from .MOVE_PARAM_ST import MOVE_PARAM_ST
-from .NPC_PARAM_ST import NPC_PARAM_ST
-from .NPC_THINK_PARAM_ST import NPC_THINK_PARAM_ST
-from .OBJ_ACT_PARAM_ST import OBJ_ACT_PARAM_ST
-from .OBJECT_PARAM_ST import OBJECT_PARAM_ST
-from .PROTECTOR_GEN_PARAM_ST import PROTECTOR_GEN_PARAM_ST
-from .QWC_CHANGE_PARAM_ST import QWC_CHANGE_PARAM_ST
-from .QWC_JUDGE_PARAM_ST import QWC_JUDGE_PARAM_ST
-from .RAGDOLL_PARAM_ST import RAGDOLL_PARAM_ST
-from .REINFORCE_PARAM_PROTECTOR_ST import REINFORCE_PARAM_PROTECTOR_ST
-from .REINFORCE_PARAM_WEAPON_ST import REINFORCE_PARAM_WEAPON_ST
-from .RESIDENT_FX_PARAM_ST import RESIDENT_FX_PARAM_ST
-from .RETURN_POINT_PARAM_ST import RETURN_POINT_PARAM_ST
-from .RITUAL_REQUIRED_MAT_PARAM import RITUAL_REQUIRED_MAT_PARAM
-from .SHOP_LINEUP_PARAM import SHOP_LINEUP_PARAM
-from .SKELETON_PARAM_ST import SKELETON_PARAM_ST
-from .SP_EFFECT_PARAM_ST import SP_EFFECT_PARAM_ST
-from .SP_EFFECT_VFX_PARAM_ST import SP_EFFECT_VFX_PARAM_ST
-from .TALK_PARAM_ST import TALK_PARAM_ST
-from .THROW_INFO_BANK import THROW_INFO_BANK
-from .WEAPON_GEN_PARAM_ST import WEAPON_GEN_PARAM_ST
-from .WIND_PARAM_ST import WIND_PARAM_ST
+
+# Generated row types are only imported from their submodules when first accessed.
+__getattr__, __dir__ = get_lazy_module_getattr(
+    __name__, attributes={name: f".{name}" for name in __all__ if name not in {"ParamDef", "ParamDefBND"}}
+)
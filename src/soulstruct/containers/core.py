@@ -790,6 +790,7 @@ class Binder(BaseBinaryFile):
         if self.version == BinderVersion.V3:
             writer = self._header_to_writer_v3()
             self._entries_into_writer_v3(writer, writer)
+            writer.fill_with_position("file_size", obj=self)
         elif self.version == BinderVersion.V4:
             writer = self._header_to_writer_v4()
             rebuild_hash_table = self._check_v4_hash_table() if self.v4_info.hash_table_type == 4 else False
@@ -797,8 +798,6 @@ class Binder(BaseBinaryFile):
         else:
             raise ValueError(f"Cannot pack BND version: {self.version}")
 
-        writer.fill_with_position("file_size", obj=self)
-
         return writer
 
     def _to_split_writers(self) -> tuple[BinaryWriter, BinaryWriter]:
@@ -819,8 +818,9 @@ class Binder(BaseBinaryFile):
         else:
             raise ValueError(f"Cannot pack BND version: {self.version}")
 
-        # File size is zero for BXF.
-        header_writer.fill("file_size", 0, obj=self)
+        if self.version == BinderVersion.V3:
+            # File size is zero for BXF.
+            header_writer.fill("file_size", 0, obj=self)
 
         return header_writer, entry_writer
 
@@ -1196,7 +1196,8 @@ class Binder(BaseBinaryFile):
         """
         try:
             # NOTE: Will raise an unhandled `MultipleEntriesFoundError` if multiple entries are found.
-            return self[entry_spec]
+            # Subclasses may override `__getitem__` for their own contents (e.g. `TalkESDBND` talk IDs).
+            return Binder.__getitem__(self, entry_spec)
         except EntryNotFoundError:
             # Create new entry. Value of `entry_spec` is redirected to the appropriate creation argument.
 
@@ -10,7 +10,7 @@ import typing as tp
 import zlib
 from dataclasses import dataclass
 from enum import IntEnum
-from pathlib import Path
+from pathlib import Path, PureWindowsPath
 
 from soulstruct.utilities.binary import *
 
@@ -196,7 +196,7 @@ class BinderEntry:
 
     def set_path_name(self, new_name: str):
         """Update just the basename of `path`."""
-        self.path = str(Path(self.path).parent.joinpath(new_name))
+        self.path = str(PureWindowsPath(self.path).parent.joinpath(new_name))
 
     def to_binary_file(self, binary_file_cls: type[BASE_BINARY_FILE_T]) -> BASE_BINARY_FILE_T:
         binary_file = binary_file_cls.from_bytes(self.get_uncompressed_data())
@@ -217,26 +217,28 @@ class BinderEntry:
     def data_size(self) -> int:
         return len(self.data)
 
+    # NOTE: Entry paths are always Windows paths, and must be split as such on any platform.
+
     @property
     def name(self) -> str:
-        return Path(self.path).name
+        return PureWindowsPath(self.path).name
 
     @property
     def stem(self) -> str:
-        return Path(self.path).stem
+        return PureWindowsPath(self.path).stem
 
     @property
     def minimal_stem(self) -> str:
         """Returns only the part of the path name before ANY dots, rather than only removing the final extension."""
-        return Path(self.path).name.split(".")[0]
+        return PureWindowsPath(self.path).name.split(".")[0]
 
     @property
     def suffix(self) -> str:
-        return Path(self.path).suffix
+        return PureWindowsPath(self.path).suffix
 
     @property
     def suffixes(self) -> list[str]:
-        return Path(self.path).suffixes
+        return PureWindowsPath(self.path).suffixes
 
     @property
     def path_with_forward_slashes(self) -> str:
@@ -244,7 +246,7 @@ class BinderEntry:
 
     @property
     def directory_with_forward_slashes(self) -> str:
-        return str(Path(self.path).parent).replace("\\", "/")
+        return str(PureWindowsPath(self.path).parent).replace("\\", "/")
 
     def copy(self) -> BinderEntry:
         return BinderEntry(data=self.data, entry_id=self.entry_id, path=self.path, flags=self.flags)
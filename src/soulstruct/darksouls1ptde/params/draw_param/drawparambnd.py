@@ -21,7 +21,9 @@ from soulstruct.base.params.param_dict import ParamDict
 
 from .core import DrawParam, TypedDrawParam
 from .. import paramdef
-from ..paramdef import *
+
+if tp.TYPE_CHECKING:
+    from ..paramdef import *
 
 _LOGGER = logging.getLogger(__name__)
 
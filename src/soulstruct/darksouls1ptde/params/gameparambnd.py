@@ -14,9 +14,9 @@ from soulstruct.utilities.misc import BiDict
 from soulstruct.darksouls1ptde.constants import PLAYER_WEAPON_BEHAVIOR_VARIATIONS, BEHAVIOR_SUB_ID
 
 from . import paramdef
-from .paramdef import *
 
 if tp.TYPE_CHECKING:
+    from .paramdef import *
     from ..text.msg_directory import MSGDirectory
 
 
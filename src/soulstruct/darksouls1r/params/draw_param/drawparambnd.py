@@ -15,7 +15,10 @@ from soulstruct.darksouls1ptde.params.paramdef import (
     TONE_CORRECT_BANK as PTDE_TONE_CORRECT_BANK,
 )
 from .. import paramdef
-from ..paramdef import *
+from ..paramdef import TONE_CORRECT_BANK, TONE_MAP_BANK
+
+if tp.TYPE_CHECKING:
+    from ..paramdef import *
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -61,17 +61,28 @@ __all__ = [
 
 ]
 
-from soulstruct.darksouls1ptde.params.paramdef import *
-from .core import *  # override PTDE imports
+from soulstruct.utilities.misc import get_lazy_module_getattr
 
-# NEW
-from .COOL_TIME_PARAM_ST import COOL_TIME_PARAM_ST
-from .LEVELSYNC_PARAM_ST import LEVELSYNC_PARAM_ST
-from .WHITE_COOL_TIME_PARAM_ST import WHITE_COOL_TIME_PARAM_ST
+from .core import *  # override PTDE `ParamDef` classes
 
-# UPDATED
-from .EQUIP_PARAM_GOODS_ST import EQUIP_PARAM_GOODS_ST
-from .EQUIP_PARAM_WEAPON_ST import EQUIP_PARAM_WEAPON_ST
-from .REINFORCE_PARAM_WEAPON_ST import REINFORCE_PARAM_WEAPON_ST
-from .TONE_CORRECT_BANK import TONE_CORRECT_BANK
-from .TONE_MAP_BANK import TONE_MAP_BANK
+# Generated row types are only imported from their submodules when first accessed. Types unchanged from PTDE are
+# imported from (and hence shared with) the PTDE package.
+_DSR_TYPES = {
+    # NEW
+    "COOL_TIME_PARAM_ST",
+    "LEVELSYNC_PARAM_ST",
+    "WHITE_COOL_TIME_PARAM_ST",
+    # UPDATED
+    "EQUIP_PARAM_GOODS_ST",
+    "EQUIP_PARAM_WEAPON_ST",
+    "REINFORCE_PARAM_WEAPON_ST",
+    "TONE_CORRECT_BANK",
+    "TONE_MAP_BANK",
+}
+__getattr__, __dir__ = get_lazy_module_getattr(
+    __name__,
+    attributes={
+        name: f".{name}" if name in _DSR_TYPES else "soulstruct.darksouls1ptde.params.paramdef"
+        for name in __all__ if name not in {"ParamDef", "ParamDefBND"}
+    },
+)
@@ -1,6 +1,13 @@
-from . import events
-from . import ezstate
-from . import game_types
-from . import maps
-from . import models
-from . import params
+__all__ = [
+    "events",
+    "ezstate",
+    "game_types",
+    "maps",
+    "models",
+    "params",
+]
+
+from soulstruct.utilities.misc import get_lazy_module_getattr
+
+# Subpackages are only imported when first accessed, as some of them (e.g. `params`) contain a lot of generated code.
+__getattr__, __dir__ = get_lazy_module_getattr(__name__, submodules=__all__)
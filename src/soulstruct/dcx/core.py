@@ -379,14 +379,13 @@ def _compress_dcx_edge(raw_data: bytes) -> bytes:
 
 
 def _compress_dcx_zstd(raw_data: bytes, compression_level=15) -> bytes:
+    # NOTE: `write_content_size` must be set in the parameters, as `ZstdCompressor` rejects it alongside them.
     cparams = zstd.ZstdCompressionParameters.from_level(
         compression_level,
         window_log=16,
-    )
-    cctx = zstd.ZstdCompressor(
-        compression_params=cparams,
         write_content_size=False,
     )
+    cctx = zstd.ZstdCompressor(compression_params=cparams)
     return cctx.compress(raw_data)
 
 
@@ -399,8 +398,9 @@ def compress(raw_data: bytes, dcx_type: DCXType) -> bytes:
         # This does enough differently that we build the DCX header inside the sub-function.
         return _compress_dcx_edge(raw_data)
 
+    zstd_compression_level = 15
     if dcx_type == DCXType.DCX_ZSTD:
-        compressed = _compress_dcx_zstd(raw_data)
+        compressed = _compress_dcx_zstd(raw_data, zstd_compression_level)
     elif dcx_type == DCXType.DCX_KRAK:
         compressed = oodle.compress(raw_data)  # default compressor and compression level are correct
     else:
@@ -420,7 +420,9 @@ def compress(raw_data: bytes, dcx_type: DCXType) -> bytes:
             compression_type=version_info.compression_type,
             decompressed_size=len(raw_data),
             compressed_size=len(compressed),
-            compression_level=version_info.compression_level,
+            compression_level=(
+                zstd_compression_level if dcx_type == DCXType.DCX_ZSTD else version_info.compression_level
+            ),
             version5=version_info.version5,
             version6=version_info.version6,
             version7=version_info.version7,
@@ -10,8 +10,7 @@ from pathlib import Path
 from soulstruct.containers import BinderVersion, BinderVersion4Info
 from soulstruct.dcx import DCXType
 from soulstruct.base.params.gameparambnd import GameParamBND as _BaseGameParamBND, param_property
-from soulstruct.base.params.ParamCrypt import ParamCrypt
-from soulstruct.utilities.files import SOULSTRUCT_PATH
+from soulstruct.base.params.ParamCrypt import decrypt_regulation, encrypt_regulation
 
 from . import paramdef
 
@@ -233,15 +232,21 @@ class GameParamBND(_BaseGameParamBND):
     def from_encrypted_path(cls, encrypted_path: Path | str) -> tp.Self:
         """Load `GameParamBND` from encrypted DCX-compressed Binder, generally `regulation.bin`."""
         encrypted_path = Path(encrypted_path)
-        temp_decrypted = SOULSTRUCT_PATH("__ParamCrypt__.parambnd.dcx")
         _LOGGER.info(f"Decrypting Elden Ring `GameParamBND` from regulation: {encrypted_path}")
-        ParamCrypt(encrypted_path, "decrypt", "er", temp_decrypted)
-        data = Path(temp_decrypted).read_bytes()  # DCX-compressed `Binder` (BND4)
-        temp_decrypted.unlink()
-        gameparambnd = cls.from_bytes(data)
+        gameparambnd = cls.from_encrypted_bytes(encrypted_path.read_bytes())
         gameparambnd.path = encrypted_path
         return gameparambnd
 
+    @classmethod
+    def from_encrypted_bytes(cls, encrypted_data: bytes) -> tp.Self:
+        """Load `GameParamBND` from encrypted DCX-compressed Binder data."""
+        data = decrypt_regulation(encrypted_data, "er")  # DCX-compressed `Binder` (BND4)
+        return cls.from_bytes(data)
+
+    def to_encrypted_bytes(self, iv: bytes = None) -> bytes:
+        """Pack, DCX-compress, and encrypt as game-ready regulation data. A random IV is used unless `iv` is given."""
+        return encrypt_regulation(bytes(self), "er", iv=iv)
+
     def write_encrypted(self, file_path: None | str | Path = None, make_dirs=True):
         """Write back to encrypted, game-ready encrypted file, generally `regulation.bin`."""
         if file_path is None:
@@ -254,10 +259,7 @@ class GameParamBND(_BaseGameParamBND):
         if make_dirs:
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        temp_decrypted = SOULSTRUCT_PATH("__ParamCrypt__.parambnd.dcx")
-        self.write(temp_decrypted, make_dirs=False, check_hash=False)
-        ParamCrypt(temp_decrypted, "encrypt", "er", file_path)
-        # temp_decrypted.unlink()
+        file_path.write_bytes(self.to_encrypted_bytes())
 
     # TODO: `rename_entries_from_text` and other utilities
 
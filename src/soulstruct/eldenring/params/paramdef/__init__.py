@@ -199,198 +199,11 @@ __all__ = [
     "WWISE_VALUE_TO_STR_CONVERT_PARAM_ST",
 ]
 
-from .ACTIONBUTTON_PARAM_ST import ACTIONBUTTON_PARAM_ST
-from .AI_ANIM_TBL_PARAM import AI_ANIM_TBL_PARAM
-from .AI_ATTACK_PARAM_ST import AI_ATTACK_PARAM_ST
-from .AI_ODDS_PARAM import AI_ODDS_PARAM
-from .AI_SOUND_PARAM_ST import AI_SOUND_PARAM_ST
-from .AI_STANDARD_INFO_BANK import AI_STANDARD_INFO_BANK
-from .ASSET_GEOMETORY_PARAM_ST import ASSET_GEOMETORY_PARAM_ST
-from .ASSET_MATERIAL_SFX_PARAM_ST import ASSET_MATERIAL_SFX_PARAM_ST
-from .ASSET_MODEL_SFX_PARAM_ST import ASSET_MODEL_SFX_PARAM_ST
-from .ATK_PARAM_ST import ATK_PARAM_ST
-from .ATTACK_ELEMENT_CORRECT_PARAM_ST import ATTACK_ELEMENT_CORRECT_PARAM_ST
-from .AUTO_CREATE_ENV_SOUND_PARAM_ST import AUTO_CREATE_ENV_SOUND_PARAM_ST
-from .BASECHR_SELECT_MENU_PARAM_ST import BASECHR_SELECT_MENU_PARAM_ST
-from .BEHAVIOR_PARAM_ST import BEHAVIOR_PARAM_ST
-from .BONFIRE_WARP_PARAM_ST import BONFIRE_WARP_PARAM_ST
-from .BONFIRE_WARP_SUB_CATEGORY_PARAM_ST import BONFIRE_WARP_SUB_CATEGORY_PARAM_ST
-from .BONFIRE_WARP_TAB_PARAM_ST import BONFIRE_WARP_TAB_PARAM_ST
-from .BUDDY_PARAM_ST import BUDDY_PARAM_ST
-from .BUDDY_STONE_PARAM_ST import BUDDY_STONE_PARAM_ST
-from .BUDGET_PARAM_ST import BUDGET_PARAM_ST
-from .BULLET_CREATE_LIMIT_PARAM_ST import BULLET_CREATE_LIMIT_PARAM_ST
-from .BULLET_PARAM_ST import BULLET_PARAM_ST
-from .CACL_CORRECT_GRAPH_ST import CACL_CORRECT_GRAPH_ST
-from .CAMERA_FADE_PARAM_ST import CAMERA_FADE_PARAM_ST
-from .CEREMONY_PARAM_ST import CEREMONY_PARAM_ST
-from .CHARACTER_INIT_PARAM import CHARACTER_INIT_PARAM
-from .CHARMAKEMENUTOP_PARAM_ST import CHARMAKEMENUTOP_PARAM_ST
-from .CHARMAKEMENU_LISTITEM_PARAM_ST import CHARMAKEMENU_LISTITEM_PARAM_ST
-from .CHR_ACTIVATE_CONDITION_PARAM_ST import CHR_ACTIVATE_CONDITION_PARAM_ST
-from .CHR_EQUIP_MODEL_PARAM_ST import CHR_EQUIP_MODEL_PARAM_ST
-from .CHR_MODEL_PARAM_ST import CHR_MODEL_PARAM_ST
-from .CLEAR_COUNT_CORRECT_PARAM_ST import CLEAR_COUNT_CORRECT_PARAM_ST
-from .COMMON_SYSTEM_PARAM_ST import COMMON_SYSTEM_PARAM_ST
-from .COOL_TIME_PARAM_ST import COOL_TIME_PARAM_ST
-from .CS_AA_QUALITY_DETAIL import CS_AA_QUALITY_DETAIL
-from .CS_DECAL_QUALITY_DETAIL import CS_DECAL_QUALITY_DETAIL
-from .CS_DOF_QUALITY_DETAIL import CS_DOF_QUALITY_DETAIL
-from .CS_EFFECT_QUALITY_DETAIL import CS_EFFECT_QUALITY_DETAIL
-from .CS_GRAPHICS_CONFIG_PARAM_ST import CS_GRAPHICS_CONFIG_PARAM_ST
-from .CS_KEY_ASSIGN_MENUITEM_PARAM import CS_KEY_ASSIGN_MENUITEM_PARAM
-from .CS_LIGHTING_QUALITY_DETAIL import CS_LIGHTING_QUALITY_DETAIL
-from .CS_MOTION_BLUR_QUALITY_DETAIL import CS_MOTION_BLUR_QUALITY_DETAIL
-from .CS_RAYTRACING_QUALITY_DETAIL import CS_RAYTRACING_QUALITY_DETAIL
-from .CS_REFLECTION_QUALITY_DETAIL import CS_REFLECTION_QUALITY_DETAIL
-from .CS_SHADER_QUALITY_DETAIL import CS_SHADER_QUALITY_DETAIL
-from .CS_SHADOW_QUALITY_DETAIL import CS_SHADOW_QUALITY_DETAIL
-from .CS_SSAO_QUALITY_DETAIL import CS_SSAO_QUALITY_DETAIL
-from .CS_TEXTURE_FILTER_QUALITY_DETAIL import CS_TEXTURE_FILTER_QUALITY_DETAIL
-from .CS_VOLUMETRIC_EFFECT_QUALITY_DETAIL import CS_VOLUMETRIC_EFFECT_QUALITY_DETAIL
-from .CS_WATER_QUALITY_DETAIL import CS_WATER_QUALITY_DETAIL
-from .CUTSCENE_GPARAM_TIME_PARAM_ST import CUTSCENE_GPARAM_TIME_PARAM_ST
-from .CUTSCENE_GPARAM_WEATHER_PARAM_ST import CUTSCENE_GPARAM_WEATHER_PARAM_ST
-from .CUTSCENE_MAP_ID_PARAM_ST import CUTSCENE_MAP_ID_PARAM_ST
-from .CUTSCENE_TEXTURE_LOAD_PARAM_ST import CUTSCENE_TEXTURE_LOAD_PARAM_ST
-from .CUTSCENE_TIMEZONE_CONVERT_PARAM_ST import CUTSCENE_TIMEZONE_CONVERT_PARAM_ST
-from .CUTSCENE_WEATHER_OVERRIDE_GPARAM_ID_CONVERT_PARAM_ST import CUTSCENE_WEATHER_OVERRIDE_GPARAM_ID_CONVERT_PARAM_ST
-from .DECAL_PARAM_ST import DECAL_PARAM_ST
-from .DEFAULT_KEY_ASSIGN import DEFAULT_KEY_ASSIGN
-from .DIRECTION_CAMERA_PARAM_ST import DIRECTION_CAMERA_PARAM_ST
-from .ENEMY_COMMON_PARAM_ST import ENEMY_COMMON_PARAM_ST
-from .ENEMY_STANDARD_INFO_BANK import ENEMY_STANDARD_INFO_BANK
-from .ENV_OBJ_LOT_PARAM_ST import ENV_OBJ_LOT_PARAM_ST
-from .EQUIP_MTRL_SET_PARAM_ST import EQUIP_MTRL_SET_PARAM_ST
-from .EQUIP_PARAM_ACCESSORY_ST import EQUIP_PARAM_ACCESSORY_ST
-from .EQUIP_PARAM_CUSTOM_WEAPON_ST import EQUIP_PARAM_CUSTOM_WEAPON_ST
-from .EQUIP_PARAM_GEM_ST import EQUIP_PARAM_GEM_ST
-from .EQUIP_PARAM_GOODS_ST import EQUIP_PARAM_GOODS_ST
-from .EQUIP_PARAM_PROTECTOR_ST import EQUIP_PARAM_PROTECTOR_ST
-from .EQUIP_PARAM_WEAPON_ST import EQUIP_PARAM_WEAPON_ST
-from .ESTUS_FLASK_RECOVERY_PARAM_ST import ESTUS_FLASK_RECOVERY_PARAM_ST
-from .EVENT_FLAG_USAGE_PARAM_ST import EVENT_FLAG_USAGE_PARAM_ST
-from .FACE_PARAM_ST import FACE_PARAM_ST
-from .FACE_RANGE_PARAM_ST import FACE_RANGE_PARAM_ST
-from .FE_TEXT_EFFECT_PARAM_ST import FE_TEXT_EFFECT_PARAM_ST
-from .FINAL_DAMAGE_RATE_PARAM_ST import FINAL_DAMAGE_RATE_PARAM_ST
-from .FOOT_SFX_PARAM_ST import FOOT_SFX_PARAM_ST
-from .GAME_AREA_PARAM_ST import GAME_AREA_PARAM_ST
-from .GAME_INFO_PARAM import GAME_INFO_PARAM
-from .GAME_SYSTEM_COMMON_PARAM_ST import GAME_SYSTEM_COMMON_PARAM_ST
-from .GESTURE_PARAM_ST import GESTURE_PARAM_ST
-from .GPARAM_GRID_REGION_INFO_PARAM_ST import GPARAM_GRID_REGION_INFO_PARAM_ST
-from .GPARAM_REF_SETTINGS_PARAM_ST import GPARAM_REF_SETTINGS_PARAM_ST
-from .GRAPHICS_COMMON_PARAM_ST import GRAPHICS_COMMON_PARAM_ST
-from .GRASS_LOD_RANGE_PARAM_ST import GRASS_LOD_RANGE_PARAM_ST
-from .GRASS_MAP_SETTINGS_PARAM_ST import GRASS_MAP_SETTINGS_PARAM_ST
-from .GRASS_TYPE_PARAM_ST import GRASS_TYPE_PARAM_ST
-from .HIT_EFFECT_SE_PARAM_ST import HIT_EFFECT_SE_PARAM_ST
-from .HIT_EFFECT_SFX_CONCEPT_PARAM_ST import HIT_EFFECT_SFX_CONCEPT_PARAM_ST
-from .HIT_EFFECT_SFX_PARAM_ST import HIT_EFFECT_SFX_PARAM_ST
-from .HIT_MTRL_PARAM_ST import HIT_MTRL_PARAM_ST
-from .ITEMLOT_PARAM_ST import ITEMLOT_PARAM_ST
-from .KEY_ASSIGN_PARAM_ST import KEY_ASSIGN_PARAM_ST
-from .KNOCKBACK_PARAM_ST import KNOCKBACK_PARAM_ST
-from .KNOWLEDGE_LOADSCREEN_ITEM_PARAM_ST import KNOWLEDGE_LOADSCREEN_ITEM_PARAM_ST
-from .LEGACY_DISTANT_VIEW_PARTS_REPLACE_PARAM import LEGACY_DISTANT_VIEW_PARTS_REPLACE_PARAM
-from .LOAD_BALANCER_DRAW_DIST_SCALE_PARAM_ST import LOAD_BALANCER_DRAW_DIST_SCALE_PARAM_ST
-from .LOAD_BALANCER_NEW_DRAW_DIST_SCALE_PARAM_ST import LOAD_BALANCER_NEW_DRAW_DIST_SCALE_PARAM_ST
-from .LOAD_BALANCER_PARAM_ST import LOAD_BALANCER_PARAM_ST
-from .LOCK_CAM_PARAM_ST import LOCK_CAM_PARAM_ST
-from .MAGIC_PARAM_ST import MAGIC_PARAM_ST
-from .MAP_DEFAULT_INFO_PARAM_ST import MAP_DEFAULT_INFO_PARAM_ST
-from .MAP_GD_REGION_DRAW_PARAM import MAP_GD_REGION_DRAW_PARAM
-from .MAP_GD_REGION_ID_PARAM_ST import MAP_GD_REGION_ID_PARAM_ST
-from .MAP_GRID_CREATE_HEIGHT_LIMIT_DETAIL_INFO_PARAM_ST import MAP_GRID_CREATE_HEIGHT_LIMIT_DETAIL_INFO_PARAM_ST
-from .MAP_GRID_CREATE_HEIGHT_LIMIT_INFO_PARAM_ST import MAP_GRID_CREATE_HEIGHT_LIMIT_INFO_PARAM_ST
-from .MAP_MIMICRY_ESTABLISHMENT_PARAM_ST import MAP_MIMICRY_ESTABLISHMENT_PARAM_ST
-from .MAP_NAME_TEX_PARAM_ST import MAP_NAME_TEX_PARAM_ST
-from .MAP_NAME_TEX_PARAM_ST_DLC02 import MAP_NAME_TEX_PARAM_ST_DLC02
-from .MAP_PIECE_TEX_PARAM_ST import MAP_PIECE_TEX_PARAM_ST
-from .MAP_PIECE_TEX_PARAM_ST_DLC02 import MAP_PIECE_TEX_PARAM_ST_DLC02
-from .MATERIAL_EX_PARAM_ST import MATERIAL_EX_PARAM_ST
-from .MENUPROPERTY_LAYOUT import MENUPROPERTY_LAYOUT
-from .MENUPROPERTY_SPEC import MENUPROPERTY_SPEC
-from .MENU_COMMON_PARAM_ST import MENU_COMMON_PARAM_ST
-from .MENU_OFFSCR_REND_PARAM_ST import MENU_OFFSCR_REND_PARAM_ST
-from .MENU_PARAM_COLOR_TABLE_ST import MENU_PARAM_COLOR_TABLE_ST
-from .MENU_VALUE_TABLE_SPEC import MENU_VALUE_TABLE_SPEC
-from .MIMICRY_ESTABLISHMENT_TEX_PARAM_ST import MIMICRY_ESTABLISHMENT_TEX_PARAM_ST
-from .MIMICRY_ESTABLISHMENT_TEX_PARAM_ST_DLC02 import MIMICRY_ESTABLISHMENT_TEX_PARAM_ST_DLC02
-from .MISSILE_PARAM_ST import MISSILE_PARAM_ST
-from .MODEL_SFX_PARAM_ST import MODEL_SFX_PARAM_ST
-from .MOVE_PARAM_ST import MOVE_PARAM_ST
-from .MULTI_ESTUS_FLASK_BONUS_PARAM_ST import MULTI_ESTUS_FLASK_BONUS_PARAM_ST
-from .MULTI_PLAY_CORRECTION_PARAM_ST import MULTI_PLAY_CORRECTION_PARAM_ST
-from .MULTI_SOUL_BONUS_RATE_PARAM_ST import MULTI_SOUL_BONUS_RATE_PARAM_ST
-from .NETWORK_AREA_PARAM_ST import NETWORK_AREA_PARAM_ST
-from .NETWORK_MSG_PARAM_ST import NETWORK_MSG_PARAM_ST
-from .NETWORK_PARAM_ST import NETWORK_PARAM_ST
-from .NPC_AI_ACTION_PARAM_ST import NPC_AI_ACTION_PARAM_ST
-from .NPC_AI_BEHAVIOR_PROBABILITY_PARAM_ST import NPC_AI_BEHAVIOR_PROBABILITY_PARAM_ST
-from .NPC_PARAM_ST import NPC_PARAM_ST
-from .NPC_THINK_PARAM_ST import NPC_THINK_PARAM_ST
-from .OBJECT_MATERIAL_SFX_PARAM_ST import OBJECT_MATERIAL_SFX_PARAM_ST
-from .OBJECT_PARAM_ST import OBJECT_PARAM_ST
-from .OBJ_ACT_PARAM_ST import OBJ_ACT_PARAM_ST
-from .PARTS_DRAW_PARAM_ST import PARTS_DRAW_PARAM_ST
-from .PERFORMANCE_CHECK_PARAM import PERFORMANCE_CHECK_PARAM
-from .PHANTOM_PARAM_ST import PHANTOM_PARAM_ST
-from .PLAYER_COMMON_PARAM_ST import PLAYER_COMMON_PARAM_ST
-from .PLAY_REGION_PARAM_ST import PLAY_REGION_PARAM_ST
-from .POSTURE_CONTROL_PARAM_GENDER_ST import POSTURE_CONTROL_PARAM_GENDER_ST
-from .POSTURE_CONTROL_PARAM_PRO_ST import POSTURE_CONTROL_PARAM_PRO_ST
-from .POSTURE_CONTROL_PARAM_WEP_LEFT_ST import POSTURE_CONTROL_PARAM_WEP_LEFT_ST
-from .POSTURE_CONTROL_PARAM_WEP_RIGHT_ST import POSTURE_CONTROL_PARAM_WEP_RIGHT_ST
-from .RANDOM_APPEAR_EDIT_PARAM_ST import RANDOM_APPEAR_EDIT_PARAM_ST
-from .RANDOM_APPEAR_PARAM_ST import RANDOM_APPEAR_PARAM_ST
-from .REINFORCE_PARAM_PROTECTOR_ST import REINFORCE_PARAM_PROTECTOR_ST
-from .REINFORCE_PARAM_WEAPON_ST import REINFORCE_PARAM_WEAPON_ST
-from .RESIST_CORRECT_PARAM_ST import RESIST_CORRECT_PARAM_ST
-from .REVERB_AUX_SEND_BUS_PARAM_ST import REVERB_AUX_SEND_BUS_PARAM_ST
-from .RIDE_PARAM_ST import RIDE_PARAM_ST
-from .ROLE_PARAM_ST import ROLE_PARAM_ST
-from .ROLLING_OBJ_LOT_PARAM_ST import ROLLING_OBJ_LOT_PARAM_ST
-from .RUNTIME_BONE_CONTROL_PARAM_ST import RUNTIME_BONE_CONTROL_PARAM_ST
-from .SE_ACTIVATION_RANGE_PARAM_ST import SE_ACTIVATION_RANGE_PARAM_ST
-from .SE_MATERIAL_CONVERT_PARAM_ST import SE_MATERIAL_CONVERT_PARAM_ST
-from .SFX_BLOCK_RES_SHARE_PARAM import SFX_BLOCK_RES_SHARE_PARAM
-from .SHOP_LINEUP_PARAM import SHOP_LINEUP_PARAM
-from .SIGN_PUDDLE_PARAM_ST import SIGN_PUDDLE_PARAM_ST
-from .SIGN_PUDDLE_SUB_CATEGORY_PARAM_ST import SIGN_PUDDLE_SUB_CATEGORY_PARAM_ST
-from .SIGN_PUDDLE_TAB_PARAM_ST import SIGN_PUDDLE_TAB_PARAM_ST
-from .SOUND_ASSET_SOUND_OBJ_ENABLE_DIST_PARAM_ST import SOUND_ASSET_SOUND_OBJ_ENABLE_DIST_PARAM_ST
-from .SOUND_AUTO_ENV_SOUND_GROUP_PARAM_ST import SOUND_AUTO_ENV_SOUND_GROUP_PARAM_ST
-from .SOUND_AUTO_REVERB_EVALUATION_DIST_PARAM_ST import SOUND_AUTO_REVERB_EVALUATION_DIST_PARAM_ST
-from .SOUND_AUTO_REVERB_SELECT_PARAM_ST import SOUND_AUTO_REVERB_SELECT_PARAM_ST
-from .SOUND_CHR_PHYSICS_SE_PARAM_ST import SOUND_CHR_PHYSICS_SE_PARAM_ST
-from .SOUND_COMMON_INGAME_PARAM_ST import SOUND_COMMON_INGAME_PARAM_ST
-from .SOUND_COMMON_SYSTEM_PARAM_ST import SOUND_COMMON_SYSTEM_PARAM_ST
-from .SOUND_CUTSCENE_PARAM_ST import SOUND_CUTSCENE_PARAM_ST
-from .SPEEDTREE_MODEL_PARAM_ST import SPEEDTREE_MODEL_PARAM_ST
-from .SP_EFFECT_PARAM_ST import SP_EFFECT_PARAM_ST
-from .SP_EFFECT_SET_PARAM_ST import SP_EFFECT_SET_PARAM_ST
-from .SP_EFFECT_VFX_PARAM_ST import SP_EFFECT_VFX_PARAM_ST
-from .SWORD_ARTS_PARAM_ST import SWORD_ARTS_PARAM_ST
-from .TALK_PARAM_ST import TALK_PARAM_ST
-from .THROW_DIRECTION_SFX_PARAM_ST import THROW_DIRECTION_SFX_PARAM_ST
-from .THROW_PARAM_ST import THROW_PARAM_ST
-from .TOUGHNESS_PARAM_ST import TOUGHNESS_PARAM_ST
-from .TUTORIAL_PARAM_ST import TUTORIAL_PARAM_ST
-from .WAYPOINT_PARAM_ST import WAYPOINT_PARAM_ST
-from .WEATHER_ASSET_CREATE_PARAM_ST import WEATHER_ASSET_CREATE_PARAM_ST
-from .WEATHER_ASSET_REPLACE_PARAM_ST import WEATHER_ASSET_REPLACE_PARAM_ST
-from .WEATHER_LOT_PARAM_ST import WEATHER_LOT_PARAM_ST
-from .WEATHER_LOT_TEX_PARAM_ST import WEATHER_LOT_TEX_PARAM_ST
-from .WEATHER_LOT_TEX_PARAM_ST_DLC02 import WEATHER_LOT_TEX_PARAM_ST_DLC02
-from .WEATHER_PARAM_ST import WEATHER_PARAM_ST
-from .WEP_ABSORP_POS_PARAM_ST import WEP_ABSORP_POS_PARAM_ST
-from .WET_ASPECT_PARAM_ST import WET_ASPECT_PARAM_ST
-from .WHITE_SIGN_COOL_TIME_PARAM_ST import WHITE_SIGN_COOL_TIME_PARAM_ST
-from .WORLD_MAP_LEGACY_CONV_PARAM_ST import WORLD_MAP_LEGACY_CONV_PARAM_ST
-from .WORLD_MAP_PIECE_PARAM_ST import WORLD_MAP_PIECE_PARAM_ST
-from .WORLD_MAP_PLACE_NAME_PARAM_ST import WORLD_MAP_PLACE_NAME_PARAM_ST
-from .WORLD_MAP_POINT_PARAM_ST import WORLD_MAP_POINT_PARAM_ST
-from .WWISE_VALUE_TO_STR_CONVERT_PARAM_ST import WWISE_VALUE_TO_STR_CONVERT_PARAM_ST
+from soulstruct.utilities.misc import get_lazy_module_getattr
+
 from .core import ParamDef, ParamDefBND
+
+# Generated row types are only imported from their submodules when first accessed.
+__getattr__, __dir__ = get_lazy_module_getattr(
+    __name__, attributes={name: f".{name}" for name in __all__ if name not in {"ParamDef", "ParamDefBND"}}
+)
@@ -1,6 +1,9 @@
 
 __all__ = [
     "FLVER",
+    "FLVERBinderResult",
+    "FLVERContentHashes",
+    "FLVERDuplicateIndex",
 
     "FLVERBone",
     "FLVERBoneUsageFlags",
@@ -12,6 +15,8 @@ __all__ = [
     "Material",
     "FLVERMesh",
     "MergedMesh",
+    "MergedMeshCache",
+    "SkeletonArrays",
     "SplitMeshDef",
     "Texture",
     "FLVERVersion",
@@ -19,15 +24,18 @@ __all__ = [
     "VertexArrayLayout",
 ]
 
-from .core import FLVER
+from .core import FLVER, FLVERBinderResult
 
 from .bone import FLVERBone, FLVERBoneUsageFlags
+from .dedup import FLVERContentHashes, FLVERDuplicateIndex
 from .dummy import Dummy, ColorRGBA
 from .face_set import FaceSetFlags, FaceSet
 from .gx_item import GXItem
 from .material import Material
 from .mesh import FLVERMesh
+from .mesh_cache import MergedMeshCache
 from .mesh_tools import MergedMesh, SplitMeshDef
+from .skeleton import SkeletonArrays
 from .texture import Texture
 from .version import FLVERVersion
 from .vertex_array import VertexArray
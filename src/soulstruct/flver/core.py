@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-__all__ = ["FLVER"]
+__all__ = [
+    "FLVER",
+    "FLVERBinderResult",
+]
 
+import io
 import logging
+import multiprocessing
 import re
 import typing as tp
 from dataclasses import field
@@ -24,6 +29,7 @@ from .layout_repair import check_ds1_layouts
 from .material import Material
 from .mesh_tools import MergedMesh
 from .mesh import FLVERMesh
+from .skeleton import SkeletonArrays
 from .texture import Texture
 from .version import FLVERVersion
 from .vertex_array import VertexArray, VertexDataSizeError
@@ -32,6 +38,13 @@ from .vertex_array_layout import VertexArrayLayout
 _LOGGER = logging.getLogger(__name__)
 
 
+class FLVERBinderResult(tp.NamedTuple):
+    """Result for one FLVER entry from `FLVER.iter_from_binder_paths()`."""
+    binder_path: Path
+    entry_name: str  # empty if binder itself could not be read
+    result: tp.Any  # `FLVER`, return value of `result_func`, or `None` if loading or processing failed
+
+
 class FLVER(GameFile):
     """FromSoftware 3D model format.
 
@@ -159,7 +172,9 @@ class FLVER(GameFile):
     # region Format Read
 
     @classmethod
-    def from_reader(cls, reader: BinaryReader) -> tp.Self:
+    def from_reader(cls, reader: BinaryReader, lazy_vertex_arrays=False) -> tp.Self:
+        """If `lazy_vertex_arrays=True`, vertex arrays keep their raw packed data and only decompress fields as they are
+        accessed (see `VertexArray`), which is much faster when only some fields (e.g. positions) are needed."""
         byte_order = ByteOrder.from_reader_peek(reader, 2, 6, b"B\0", b"L\0")
         version_int = reader.peek(f"{byte_order}I", bytes_ahead=8)[0]
         try:
@@ -167,13 +182,13 @@ class FLVER(GameFile):
         except ValueError:
             raise ValueError(f"Unrecognized FLVER version: {version_int}. Cannot read it.")
         if version <= 0xFFFF:
-            return cls._from_flver0_reader(reader)
-        return cls._from_flver2_reader(reader)
+            return cls._from_flver0_reader(reader, lazy_vertex_arrays)
+        return cls._from_flver2_reader(reader, lazy_vertex_arrays)
 
     @classmethod
-    def from_path(cls, path: str | Path) -> tp.Self:
+    def from_path(cls, path: str | Path, lazy_vertex_arrays=False) -> tp.Self:
         """Reports invalid array layouts."""
-        flver = super(FLVER, cls).from_path(path)
+        flver = super(FLVER, cls).from_path(path, lazy_vertex_arrays=lazy_vertex_arrays)
         assert isinstance(flver, FLVER)
         if any(mesh.invalid_layout for mesh in flver.meshes):
             _LOGGER.warning(f"FLVER '{Path(path).name}' has one or more meshes with invalid vertex array sizes.")
@@ -203,7 +218,41 @@ class FLVER(GameFile):
         return [cls.from_bytes(binder[entry_id_or_name]) for entry_id_or_name in entry_ids_or_names]
 
     @classmethod
-    def _from_flver0_reader(cls, reader: BinaryReader) -> tp.Self:
+    def iter_from_binder_paths(
+        cls,
+        binder_paths: tp.Iterable[Path | str],
+        result_func: tp.Callable[[FLVER], tp.Any] = None,
+        processes: int | None = None,
+        lazy_vertex_arrays=False,
+        from_bak=False,
+        entry_pattern=r".*\.flver(\.dcx)?$",
+    ) -> tp.Iterator[FLVERBinderResult]:
+        """Use multiprocessing to read every FLVER entry (matching `entry_pattern`) from each binder in `binder_paths`
+        in parallel, yielding a `FLVERBinderResult` for each one as soon as its binder is done (in any binder order).
+
+        Binders are read, decompressed, and parsed in the worker processes. If `result_func` is given, it is also
+        called on each FLVER in the worker, and only its return value is sent back rather than the whole `FLVER`. It
+        must be picklable, e.g. `FLVER.get_vertex_bounds` or `functools.partial(MergedMesh.from_flver,
+        keep_flver=False)`. Combine with `lazy_vertex_arrays=True` if `result_func` only needs some vertex data.
+
+        If `processes` is 1, binders are read one at a time in this process instead. Failures are logged and give a
+        `None` result.
+        """
+        mp_args = [
+            (cls, Path(binder_path), result_func, lazy_vertex_arrays, from_bak, entry_pattern)
+            for binder_path in binder_paths
+        ]
+        if processes == 1:
+            for args in mp_args:
+                yield from _read_binder_flvers(*args)
+            return
+
+        with multiprocessing.Pool(processes=processes) as pool:
+            for binder_results in pool.imap_unordered(_read_binder_flvers_mp, mp_args):
+                yield from binder_results
+
+    @classmethod
+    def _from_flver0_reader(cls, reader: BinaryReader, lazy_vertex_arrays=False) -> tp.Self:
         """Much simpler than `FLVER` with all the missing elements.
 
         However, note that layouts are packed inside materials. Each mesh indexes a materia, each vertex array
@@ -248,6 +297,7 @@ class FLVER(GameFile):
                 vertex_data_offset=header.vertex_data_offset,
                 materials=materials,
                 version=header.version,
+                lazy_vertex_array=lazy_vertex_arrays,
             ) for _ in range(header.mesh_count)
         ]
         for i, mesh in enumerate(meshes):
@@ -272,7 +322,7 @@ class FLVER(GameFile):
         )
 
     @classmethod
-    def _from_flver2_reader(cls, reader: BinaryReader) -> tp.Self:
+    def _from_flver2_reader(cls, reader: BinaryReader, lazy_vertex_arrays=False) -> tp.Self:
         byte_order = ByteOrder.from_reader_peek(reader, 2, 6, b"B\0", b"L\0")
         reader.byte_order = byte_order  # applies to all FLVER structs (manually passed to `VertexArray`)
         header = cls.STRUCT2.from_bytes(reader)
@@ -341,7 +391,7 @@ class FLVER(GameFile):
         for i, array_header in enumerate(array_headers):
             try:
                 vertex_array = VertexArray.from_flver2_reader(
-                    reader, array_header, layouts, header.vertex_data_offset, uv_factor
+                    reader, array_header, layouts, header.vertex_data_offset, uv_factor, lazy=lazy_vertex_arrays
                 )
             except VertexDataSizeError:
                 vertex_array = VertexArray(array=np.empty(0), layout=layouts[array_header.layout_index])
@@ -398,7 +448,7 @@ class FLVER(GameFile):
         for mesh in self.meshes:
             if len(mesh.face_sets) != 1:
                 raise ValueError("Each FLVER0 mesh must have exactly one FaceSet.")
-            if (vertex_count := len(mesh.vertices)) >= 0xFFFF:
+            if (vertex_count := mesh.vertex_count) >= 0xFFFF:
                 raise ValueError(f"`FLVER0` mesh cannot have more than 65534 vertices ({vertex_count}).")
             face_set = mesh.face_sets[0]
             if (max_index := face_set.vertex_indices.max()) > 0xFFFF:
@@ -531,7 +581,7 @@ class FLVER(GameFile):
         true_face_count = 0
         total_face_count = 0
         for mesh in self.meshes:
-            uses_0xffff_separators = len(mesh.vertices) <= 0xFFFF  # max unsigned short value
+            uses_0xffff_separators = mesh.vertex_count <= 0xFFFF  # max unsigned short value
             for face_set in mesh.face_sets:
                 face_set_true_count, face_set_total_count = face_set.get_face_counts(uses_0xffff_separators)
                 true_face_count += face_set_true_count
@@ -831,9 +881,9 @@ class FLVER(GameFile):
                     axes=axes,
                     **kwargs,
                 )
-        for bone in self.bones:
-            bone_position, _, _ = bone.get_armature_space_transform()
-            axes.scatter(*bone_position.to_xzy(), color="blue", s=10)
+        if self.bones:
+            bone_positions, _, _ = self.get_skeleton_arrays().get_armature_space_transforms()
+            axes.scatter(*bone_positions[:, [0, 2, 1]].T, color="blue", s=10)
         if auto_show:
             plt.show()
 
@@ -944,35 +994,23 @@ class FLVER(GameFile):
     def refresh_bone_bounding_boxes(self, in_local_space=True, only_bones: tp.Container[int] = ()):
         """Refresh the bounding box of each bone by finding every vertex in every mesh weighted to it.
 
-        As you'd expect, this is a little expensive, though less so with `NumPy`, thankfully. Optionally allows
-        restriction to only certain bones, in case you KNOW which bones need refreshing and don't want to waste time on
-        the others.
+        Every (vertex, bone) influence with non-zero weight (or the first bone index of each vertex, if there are no
+        bone weights) is gathered from all mesh vertex arrays at once. Their positions are transformed into the local
+        space of their bones in one batch, then sorted by bone so each bone's min/max is a single segment reduction.
+        Optionally allows restriction to only certain bones, in case you KNOW which bones need refreshing.
 
         Note that rigged FLVERs (characters, objects) seem to always use `in_local_space=True`, while map pieces do not.
         """
-
-        if in_local_space:
-            # Get the inverse transforms required to convert each bone's vertex positions to local bone space.
-            bone_arma_translate_inv_rotates = [
-                (translate, rotate.inverse())
-                for translate, rotate, _ in self.get_bone_armature_space_transforms()
-            ]
-        else:
-            # Unused.
-            bone_arma_translate_inv_rotates = []
-
-        refresh_bone_indices = [i for i, bone in enumerate(self.bones) if not only_bones or i in only_bones]
-
-        # 3D arrays that track min/max vertex positions for each bone and axis.
-        bone_mins = SINGLE_MAX * np.ones((len(self.bones), 3))
-        bone_maxs = SINGLE_MIN * np.ones((len(self.bones), 3))
-
-        # We need to check all bone indices in every vertex array in every mesh.
+        bone_count = len(self.bones)
+        refresh_bone_indices = [i for i in range(bone_count) if not only_bones or i in only_bones]
+        is_refreshed = np.zeros(bone_count, dtype=bool)
+        is_refreshed[refresh_bone_indices] = True
+
+        # Gather position and global bone index of every used influence in every vertex array in every mesh.
+        all_positions = []  # type: list[np.ndarray]
+        all_bone_indices = []  # type: list[np.ndarray]
         for mesh in self.meshes:
-
             for vertex_array in mesh.vertex_arrays:
-
-                used_bone_vertex_indices = {}  # tracks vertex indices used by each bone
                 if vertex_array.guess_has_normal_w_bone_indices:
                     # Already global, but confirmed below.
                     bone_indices = vertex_array["normal_w"]
@@ -981,53 +1019,59 @@ class FLVER(GameFile):
                         bone_indices = vertex_array["bone_indices"]
                     except ValueError:
                         continue  # mesh vertex array has no bone indices (weird)
+                bone_indices = bone_indices.reshape((len(bone_indices), -1)).astype(np.int64)
 
                 if mesh.bone_indices is not None:
                     # Remap bone indices to global indices.
-                    bone_indices = mesh.bone_indices[bone_indices]
+                    bone_indices = np.asarray(mesh.bone_indices)[bone_indices]
 
                 try:
                     bone_weights = vertex_array["bone_weights"]
                 except ValueError:
                     # No bone weights (e.g. Map Piece or special material). We only need first bone index (always used).
-                    for bone_index in refresh_bone_indices:
-                        used_bone_vertex_indices[bone_index] = bone_indices[:, 0] == bone_index
+                    vertex_indices = np.arange(len(bone_indices))
+                    influence_bone_indices = bone_indices[:, 0]
                 else:
-                    # Only check bone indices where weight is non-zero.
-                    for bone_index in refresh_bone_indices:
-                        used = ((bone_indices == bone_index) & (bone_weights > 0.0)).any(axis=1)
-                        used_bone_vertex_indices[bone_index] = used
-
-                position = vertex_array["position"]
-
-                for bone_index, vertex_indices in used_bone_vertex_indices.items():
-                    if not np.any(vertex_indices):
-                        continue  # bone unused by this mesh array
-
-                    # Get vertex positions for this bone.
-                    bone_vertex_positions = position[vertex_indices]
-
-                    if in_local_space:
-                        # Transform vertex positions into bone local space (typical for characters).
-                        arma_translate, inv_arma_rotate = bone_arma_translate_inv_rotates[bone_index]
-                        bone_vertex_positions -= arma_translate.data
-                        bone_vertex_positions = bone_vertex_positions @ inv_arma_rotate.data.T
-
-                    # Get bounds for this vertex array.
-                    bone_vertex_mins = np.min(bone_vertex_positions, axis=0)
-                    bone_vertex_maxs = np.max(bone_vertex_positions, axis=0)
-
-                    # Update FLVER-wide bounds across all meshes and vertex arrays.
-                    bone_mins[bone_index] = np.min((bone_mins[bone_index], bone_vertex_mins), axis=0)
-                    bone_maxs[bone_index] = np.max((bone_maxs[bone_index], bone_vertex_maxs), axis=0)
+                    # Only use bone indices where weight is non-zero.
+                    if bone_indices.shape[1] != bone_weights.shape[1]:
+                        bone_indices = np.broadcast_to(bone_indices, bone_weights.shape)  # e.g. one `normal_w` index
+                    vertex_indices, influence_indices = np.nonzero(bone_weights > 0.0)
+                    influence_bone_indices = bone_indices[vertex_indices, influence_indices]
+
+                is_valid = (influence_bone_indices >= 0) & (influence_bone_indices < bone_count)
+                is_valid[is_valid] = is_refreshed[influence_bone_indices[is_valid]]
+                all_positions.append(vertex_array["position"][vertex_indices[is_valid]])
+                all_bone_indices.append(influence_bone_indices[is_valid])
+
+        # 2D arrays that track min/max vertex positions for each bone and axis.
+        bone_mins = SINGLE_MAX * np.ones((bone_count, 3))
+        bone_maxs = SINGLE_MIN * np.ones((bone_count, 3))
+
+        influence_bone_indices = np.concatenate(all_bone_indices) if all_bone_indices else np.empty(0, dtype=np.int64)
+        if influence_bone_indices.size:
+            positions = np.concatenate(all_positions)
+            if in_local_space:
+                # Transform vertex positions into bone local space (typical for characters), using the inverse of each
+                # bone's armature space transform.
+                arma_translates, arma_rotates, _ = self.get_skeleton_arrays().get_armature_space_transforms()
+                inv_arma_rotates = np.linalg.inv(arma_rotates)
+                positions -= arma_translates[influence_bone_indices]  # still single precision, like vertex positions
+                positions = np.einsum("nij,nj->ni", inv_arma_rotates[influence_bone_indices], positions)
+
+            # Sort influences by bone, then reduce each bone's contiguous segment.
+            order = np.argsort(influence_bone_indices, kind="stable")
+            sorted_bone_indices = influence_bone_indices[order]
+            segment_starts = np.flatnonzero(np.diff(sorted_bone_indices, prepend=-1))
+            used_bone_indices = sorted_bone_indices[segment_starts]
+            sorted_positions = positions[order]
+            bone_mins[used_bone_indices] = np.minimum.reduceat(sorted_positions, segment_starts, axis=0)
+            bone_maxs[used_bone_indices] = np.maximum.reduceat(sorted_positions, segment_starts, axis=0)
 
         # Update bone bounding boxes.
         for bone_index in refresh_bone_indices:
-            # print(f"BEFORE: {bone.name}: {bone.bounding_box_min} -> {bone.bounding_box_max}")
             bone = self.bones[bone_index]
             bone.bounding_box_min = Vector3(bone_mins[bone_index])
             bone.bounding_box_max = Vector3(bone_maxs[bone_index])
-            # print(f"    --> {bone.name}: {bone.bounding_box_min} -> {bone.bounding_box_max}")
 
     def refresh_bounding_boxes(self):
         """Refresh global bounding box of FLVER from minimum and maximum positions of all mesh vertices, along with
@@ -1066,6 +1110,22 @@ class FLVER(GameFile):
         self.bounding_box_min = Vector3(mesh_mins.min(axis=0))
         self.bounding_box_max = Vector3(mesh_maxs.max(axis=0))
 
+    def get_vertex_bounds(self) -> tuple[Vector3, Vector3]:
+        """Get minimum and maximum vertex positions across all meshes, without modifying any bounding boxes.
+
+        Only decompresses vertex positions of lazy vertex arrays.
+        """
+        positions = [
+            vertex_array["position"] for mesh in self.meshes for vertex_array in mesh.vertex_arrays
+            if len(vertex_array) > 0
+        ]
+        if not positions:
+            return Vector3((SINGLE_MAX, SINGLE_MAX, SINGLE_MAX)), Vector3((SINGLE_MIN, SINGLE_MIN, SINGLE_MIN))
+        return (
+            Vector3(np.min([position.min(axis=0) for position in positions], axis=0)),
+            Vector3(np.max([position.max(axis=0) for position in positions], axis=0)),
+        )
+
     def get_root_bones(self) -> list[FLVERBone]:
         """Return all bones with no parent."""
         return [bone for bone in self.bones if bone.parent_bone is None]
@@ -1104,38 +1164,26 @@ class FLVER(GameFile):
                         other_bone.previous_sibling_bone = children[-1]
                     children.append(other_bone)
 
+    def get_skeleton_arrays(self) -> SkeletonArrays:
+        """Get parent indices and local transforms of all bones as arrays, for batched transform computations.
+
+        Changes to the arrays do not affect `bones` until `SkeletonArrays.set_bone_transforms(flver.bones)` is called.
+        """
+        return SkeletonArrays.from_bones(self.bones)
+
     def get_bone_armature_space_transforms(self) -> list[tuple[Vector3, Matrix3, Vector3]]:
-        """Compute the FLVER armature space transforms of all bones at once by moving downward through the hierarchy.
+        """Compute the FLVER armature space transforms of all bones at once, one hierarchy level at a time.
 
         Note that bone scale is not inherited. All scale values are local.
 
         Also note that we can't cache this because any/all parent bone transforms could change. It's inexpensive anyway.
+        Use `get_skeleton_arrays().get_armature_space_transforms()` to get all transforms as arrays instead.
         """
-        root_bones = self.get_root_bones()
-        # Start with local transforms. They will be changed to armature space transforms one at a time, recursively.
-        armature_space_transforms = [bone.get_local_transform() for bone in self.bones]
-        done_indices = set()
-
-        def local_to_parent_space(bone: FLVERBone, parent_transform: tuple[Vector3, Matrix3, Vector3]):
-            index = bone.get_bone_index(self.bones)
-            if index in done_indices:
-                raise ValueError(f"Bone '{bone.name}' is a child of multiple bones.")
-            done_indices.add(index)
-            local_translate, local_rotate_matrix, local_scale = armature_space_transforms[index]
-            parent_translate, parent_rotate_matrix, _ = parent_transform
-            bone_armature_transform = (
-                parent_translate + parent_rotate_matrix @ local_translate,
-                parent_rotate_matrix @ local_rotate_matrix,
-                local_scale,  # scale not inherited
-            )
-            armature_space_transforms[index] = bone_armature_transform
-            for child_bone in bone.get_all_immediate_children():
-                local_to_parent_space(child_bone, bone_armature_transform)
-
-        for root_bone in root_bones:
-            local_to_parent_space(root_bone, (Vector3.zero(), Matrix3.identity(), Vector3.one()))
-
-        return armature_space_transforms
+        arma_translates, arma_rotates, arma_scales = self.get_skeleton_arrays().get_armature_space_transforms()
+        return [
+            (Vector3(translate), Matrix3(rotate), Vector3(scale))
+            for translate, rotate, scale in zip(arma_translates, arma_rotates, arma_scales)
+        ]
 
     def set_bone_armature_space_transforms(self, armature_space_transforms: list[tuple[Vector3, Matrix3, Vector3]]):
         """Use given `armature_space_transforms` to set the local transforms of each `FLVERBone`, by applying the
@@ -1148,30 +1196,13 @@ class FLVER(GameFile):
         if (arma_count := len(armature_space_transforms)) != len(self.bones):
             raise ValueError(f"Expected {len(self.bones)} armature space transforms, but got {arma_count}.")
 
-        parent_inv_rots = {}  # type: dict[int, Matrix3]
-
-        for bone_index, bone in enumerate(self.bones):
-            arma_transform = armature_space_transforms[bone_index]
-            parent_bone = bone.parent_bone
-            if parent_bone is None:
-                # Root bone: armature space transform is local transform.
-                bone.set_local_transform(arma_transform)
-                continue
-
-            parent_index = parent_bone.get_bone_index(self.bones)
-
-            # Get parent transform and apply inverse to this bone's armature space transform.
-            arma_translate, arma_rotate_matrix, arma_scale = arma_transform
-            parent_arma_translate, parent_arma_rotate_matrix, _ = armature_space_transforms[parent_index]
-            parent_arma_inv_rotate = parent_inv_rots.setdefault(parent_index, parent_arma_rotate_matrix.inverse())
-
-            bone.set_local_transform(
-                (
-                    parent_arma_inv_rotate @ (arma_translate - parent_arma_translate),
-                    parent_arma_inv_rotate @ arma_rotate_matrix,
-                    arma_scale,  # scale not inherited
-                )
-            )
+        skeleton = self.get_skeleton_arrays()
+        skeleton.set_armature_space_transforms(
+            np.array([transform[0].data for transform in armature_space_transforms], dtype=float).reshape((-1, 3)),
+            np.array([transform[1].data for transform in armature_space_transforms], dtype=float).reshape((-1, 3, 3)),
+            np.array([transform[2].data for transform in armature_space_transforms], dtype=float).reshape((-1, 3)),
+        )
+        skeleton.set_bone_transforms(self.bones)
 
     def check_if_all_zero_bone_weights(self) -> bool:
         """Reliable (so far) indicator of map piece FLVER, as opposed to character/object FLVER.
@@ -1288,37 +1319,60 @@ class FLVER(GameFile):
 
     # region Other Formats
 
-    def to_obj(self, name="FLVER", meshes=()) -> str:
+    def to_obj(self, name="FLVER", meshes=(), float_format="%.6f") -> str:
+        stream = io.StringIO()
+        self.write_obj_stream(stream, name, meshes, float_format)
+        return stream.getvalue().removesuffix("\n")
+
+    def write_obj_stream(self, stream: tp.TextIO, name="FLVER", meshes=(), float_format="%.6f"):
+        """Write all meshes (or only indices in `meshes`) to text `stream` in OBJ format, separated by blank lines."""
         if isinstance(meshes, int):
             meshes = [meshes]
         vertex_offset = 0
-        mesh_objs = []
+        first = True
         for i, mesh in enumerate(self.meshes):
             if meshes and i not in meshes:
                 continue  # skip this mesh
-            mesh_objs.append(mesh.to_obj(name=f"{name} Mesh {i}", vertex_offset=vertex_offset))
-            vertex_offset += len(mesh.vertices)
-        return "\n\n".join(mesh_objs)
-
-    def write_obj(self, obj_path: Path | str = None, obj_name="", make_dirs=True, meshes=()):
-        if obj_path is None:
-            if self.path is None:
-                raise ValueError("You must specify `file_path` because `GameFile` default path has not been set.")
-            obj_path = self.path
-            if obj_path.suffix == ".dcx":
-                obj_path = obj_path.with_name(obj_path.stem)
-            obj_path = obj_path.with_suffix(".obj")
-        else:
-            obj_path = Path(obj_path)
-            if obj_path.suffix != ".obj":
-                obj_path = obj_path.with_suffix(".obj")
+            if not first:
+                stream.write("\n")
+            mesh.write_obj_stream(stream, f"{name} Mesh {i}", vertex_offset, float_format=float_format)
+            vertex_offset += mesh.vertex_count
+            first = False
+
+    def write_obj(self, obj_path: Path | str = None, obj_name="", make_dirs=True, meshes=(), float_format="%.6f"):
+        """Write OBJ file, streamed mesh by mesh. Defaults to FLVER `path` with an '.obj' suffix."""
+        obj_path = self._get_export_path(obj_path, ".obj")
         if make_dirs:
             obj_path.parent.mkdir(parents=True, exist_ok=True)
         if not obj_name:
             obj_name = obj_path.stem
-        obj_str = self.to_obj(name=obj_name, meshes=meshes)
         with obj_path.open("w") as f:
-            f.write(obj_str)
+            self.write_obj_stream(f, name=obj_name, meshes=meshes, float_format=float_format)
+
+    def to_glb(self, meshes=(), include_skin=True) -> bytes:
+        """Convert to a binary glTF 2.0 file. See `flver.gltf.flver_to_glb()`."""
+        from .gltf import flver_to_glb
+        return flver_to_glb(self, meshes, include_skin)
+
+    def write_glb(self, glb_path: Path | str = None, make_dirs=True, meshes=(), include_skin=True):
+        """Write binary glTF 2.0 file. Defaults to FLVER `path` with a '.glb' suffix."""
+        glb_path = self._get_export_path(glb_path, ".glb")
+        if make_dirs:
+            glb_path.parent.mkdir(parents=True, exist_ok=True)
+        glb_path.write_bytes(self.to_glb(meshes, include_skin))
+
+    def _get_export_path(self, file_path: Path | str | None, suffix: str) -> Path:
+        if file_path is None:
+            if self.path is None:
+                raise ValueError("You must specify `file_path` because `GameFile` default path has not been set.")
+            file_path = self.path
+            if file_path.suffix == ".dcx":
+                file_path = file_path.with_name(file_path.stem)
+            return file_path.with_suffix(suffix)
+        file_path = Path(file_path)
+        if file_path.suffix != suffix:
+            file_path = file_path.with_suffix(suffix)
+        return file_path
 
     # endregion
 
@@ -1357,3 +1411,36 @@ class FLVER(GameFile):
             print()
 
     # endregion
+
+
+def _read_binder_flvers(
+    flver_class: type[FLVER],
+    binder_path: Path,
+    result_func: tp.Callable[[FLVER], tp.Any] | None,
+    lazy_vertex_arrays: bool,
+    from_bak: bool,
+    entry_pattern: str,
+) -> list[FLVERBinderResult]:
+    try:
+        binder = Binder.from_bak(binder_path) if from_bak else Binder.from_path(binder_path)
+        entries = binder.find_entries_matching_name(entry_pattern)
+    except Exception as ex:
+        _LOGGER.error(f"Failed to read binder '{binder_path}': {ex}")
+        return [FLVERBinderResult(binder_path, "", None)]
+
+    results = []
+    for entry in entries:
+        try:
+            flver = flver_class.from_bytes(entry.get_uncompressed_data(), lazy_vertex_arrays=lazy_vertex_arrays)
+            flver.path = Path(entry.path)
+            result = flver if result_func is None else result_func(flver)
+        except Exception as ex:
+            _LOGGER.error(f"Failed to process FLVER '{entry.name}' in binder '{binder_path}': {ex}")
+            result = None
+        results.append(FLVERBinderResult(binder_path, entry.name, result))
+    return results
+
+
+def _read_binder_flvers_mp(args: tuple) -> list[FLVERBinderResult]:
+    """Function for `FLVER.iter_from_binder_paths` worker pool."""
+    return _read_binder_flvers(*args)
@@ -0,0 +1,275 @@
+"""Quadric-error mesh decimation over triangle index arrays, used to generate FLVER LOD face sets.
+
+Edges are collapsed onto one of their two existing vertices (half-edge collapse), so decimated triangles always index
+the original vertex array and no new vertices are needed. Each collapse is scored by the quadric error (sum of squared
+distances to the planes of all original faces merged into the kept vertex) of the kept vertex, as in Garland and
+Heckbert's algorithm.
+
+Rather than collapsing one edge at a time from a priority queue, each pass collapses a batch of edges at once. The
+cheapest edges are candidates, and a candidate is collapsed only if it has the highest (random) priority of all
+candidates touching any face around its removed vertex and all candidates at its kept vertex. Then no face moves with
+more than one collapse, and no kept vertex is also removed. Collapses that would fold a face over (or tear the surface,
+by merging two vertices with more common neighbors than shared faces) are rejected.
+"""
+from __future__ import annotations
+
+__all__ = ["decimate_triangles"]
+
+import logging
+
+import numpy as np
+
+from .face_set import FaceSet
+
+_LOGGER = logging.getLogger(__name__)
+
+# Boundary edge quadrics are weighted by this much more than face quadrics, so open edges keep their shape.
+_BOUNDARY_WEIGHT = 100.0
+# Initial fraction of (cheapest) edges that are candidates for collapse in each pass. Doubled (up to all edges) whenever
+# a pass removes fewer than `_MIN_PASS_COLLAPSE_FRACTION` of remaining triangles, which happens when candidates are
+# crowded together or rejected.
+_CANDIDATE_FRACTION = 0.25
+_MIN_PASS_COLLAPSE_FRACTION = 0.005
+# Collapses are rejected if they rotate any face normal by more than this (cosine of angle).
+_MIN_NORMAL_COSINE = 0.2
+
+
+def decimate_triangles(
+    positions: np.ndarray,
+    triangles: np.ndarray,
+    target_triangle_count: int,
+    max_error=np.inf,
+    preserve_boundaries=True,
+    max_passes=200,
+) -> np.ndarray:
+    """Collapse edges of `(n, 3)` `triangles` (indexing `positions`) until no more than `target_triangle_count`
+    triangles remain, and return the remaining triangles (same winding, no degenerate or duplicate triangles).
+
+    Fewer triangles may be removed if every remaining collapse would exceed `max_error` (squared distance), flip a face,
+    or move a boundary vertex (if `preserve_boundaries=True`). Note that FLVER vertices are split along UV and normal
+    seams, which therefore count as boundaries and are kept intact.
+    """
+    positions = np.asarray(positions, dtype=np.float64)[:, :3]
+    triangles = _remove_bad_triangles(np.asarray(triangles, dtype=np.int64).reshape((-1, 3)))
+    if len(triangles) <= target_triangle_count:
+        return triangles
+    vertex_count = len(positions)
+    homogeneous_positions = np.column_stack([positions, np.ones(vertex_count)])
+    rng = np.random.default_rng(0)  # same result every time
+
+    edges, edge_face_counts, edge_first_faces = _get_edges(triangles, vertex_count)
+    quadrics = _get_vertex_quadrics(positions, triangles)
+    is_boundary_edge = edge_face_counts == 1
+    if np.any(is_boundary_edge):
+        _add_boundary_quadrics(
+            quadrics, positions, edges[is_boundary_edge], triangles[edge_first_faces[is_boundary_edge]]
+        )
+
+    candidate_fraction = _CANDIDATE_FRACTION
+    for _pass in range(max_passes):
+        excess_count = len(triangles) - target_triangle_count
+        if excess_count <= 0:
+            break
+        collapse_from, collapse_to = _get_pass_collapses(
+            homogeneous_positions, triangles, quadrics, edges, edge_face_counts, excess_count, max_error,
+            preserve_boundaries, candidate_fraction, rng,
+        )
+        if len(collapse_from) < _MIN_PASS_COLLAPSE_FRACTION * len(triangles):
+            if len(collapse_from) == 0 and candidate_fraction == 1.0:
+                break
+            candidate_fraction = min(2.0 * candidate_fraction, 1.0)
+        if len(collapse_from) == 0:
+            continue
+
+        vertex_map = np.arange(vertex_count)
+        vertex_map[collapse_from] = collapse_to
+        triangles = _remove_bad_triangles(vertex_map[triangles])
+        quadrics[collapse_to] += quadrics[collapse_from]  # targets are unique in a pass
+        edges, edge_face_counts, _ = _get_edges(triangles, vertex_count)
+    else:
+        _LOGGER.debug(f"Mesh decimation stopped after maximum of {max_passes} passes.")
+
+    if len(triangles) > target_triangle_count:
+        _LOGGER.debug(
+            f"Mesh decimation could only reduce triangle count to {len(triangles)} (target {target_triangle_count})."
+        )
+    return triangles
+
+
+def _get_pass_collapses(
+    homogeneous_positions: np.ndarray,
+    triangles: np.ndarray,
+    quadrics: np.ndarray,
+    edges: np.ndarray,
+    edge_face_counts: np.ndarray,
+    excess_count: int,
+    max_error: float,
+    preserve_boundaries: bool,
+    candidate_fraction: float,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Choose a batch of independent edge collapses for one pass. Returns arrays of removed and kept vertices."""
+    vertex_count = len(homogeneous_positions)
+    edge_count = len(edges)
+    v0, v1 = edges[:, 0], edges[:, 1]
+    edge_quadrics = quadrics[v0] + quadrics[v1]
+    # Error of keeping each vertex of the edge (i.e. collapsing the other vertex onto it).
+    keep_v0_costs = np.einsum("ei,eij,ej->e", homogeneous_positions[v0], edge_quadrics, homogeneous_positions[v0])
+    keep_v1_costs = np.einsum("ei,eij,ej->e", homogeneous_positions[v1], edge_quadrics, homogeneous_positions[v1])
+
+    if preserve_boundaries:
+        # Boundary vertices may only move along boundary edges.
+        is_boundary_edge = edge_face_counts != 2  # including non-manifold edges
+        is_boundary_vertex = np.zeros(vertex_count, dtype=bool)
+        is_boundary_vertex[edges[is_boundary_edge].ravel()] = True
+        keep_v0_costs[is_boundary_vertex[v1] & ~is_boundary_edge] = np.inf
+        keep_v1_costs[is_boundary_vertex[v0] & ~is_boundary_edge] = np.inf
+
+    keep_v0 = keep_v0_costs <= keep_v1_costs
+    costs = np.where(keep_v0, keep_v0_costs, keep_v1_costs)
+    costs[costs > max_error] = np.inf
+
+    # Candidates are the cheapest valid edges. They get unique random priorities (lower is higher priority), and other
+    # edges get priority `edge_count`.
+    candidate_count = min(np.count_nonzero(np.isfinite(costs)), max(int(edge_count * candidate_fraction), 1))
+    candidates = np.argsort(costs, kind="stable")[:candidate_count]  # sorted by cost
+    priorities = np.full(edge_count, edge_count, dtype=np.int64)
+    priorities[candidates] = rng.permutation(candidate_count)
+
+    # Find the best priority of every vertex, then the best priority of any edge that touches any face around every
+    # vertex. Candidates with the best priority around their removed vertex and at their kept vertex are independent.
+    vertex_priorities = np.full(vertex_count, edge_count, dtype=np.int64)
+    np.minimum.at(vertex_priorities, v0, priorities)
+    np.minimum.at(vertex_priorities, v1, priorities)
+    face_priorities = vertex_priorities[triangles].min(axis=1)
+    around_priorities = np.full(vertex_count, edge_count, dtype=np.int64)
+    np.minimum.at(around_priorities, triangles.ravel(), np.repeat(face_priorities, 3))
+
+    candidate_from = np.where(keep_v0[candidates], v1[candidates], v0[candidates])
+    candidate_to = np.where(keep_v0[candidates], v0[candidates], v1[candidates])
+    candidate_priorities = priorities[candidates]
+    is_selected = (
+        (around_priorities[candidate_from] == candidate_priorities)
+        & (vertex_priorities[candidate_to] == candidate_priorities)
+    )
+    selected = candidates[is_selected]
+    # Interior collapses remove two triangles and boundary collapses one. Don't overshoot the target by much.
+    selected_count = np.searchsorted(np.cumsum(edge_face_counts[selected]), excess_count) + 1
+    selected = selected[:selected_count]
+    collapse_from = candidate_from[is_selected][:selected_count]
+    collapse_to = candidate_to[is_selected][:selected_count]
+
+    # Reject collapses whose vertices have any common neighbors that do not share a face with the edge (link condition).
+    has_extra_neighbors = _get_common_neighbor_counts(edges, collapse_from, collapse_to) > edge_face_counts[selected]
+    collapse_from = collapse_from[~has_extra_neighbors]
+    collapse_to = collapse_to[~has_extra_neighbors]
+
+    # Reject collapses that would fold over any face that moves with them. Each face moves with at most one collapse.
+    is_from = np.zeros(vertex_count, dtype=bool)
+    is_from[collapse_from] = True
+    vertex_map = np.arange(vertex_count)
+    vertex_map[collapse_from] = collapse_to
+    moved_triangles = triangles[is_from[triangles].any(axis=1)]
+    new_triangles = vertex_map[moved_triangles]
+    positions = homogeneous_positions[:, :3]
+    old_normals = _get_face_normals(positions, moved_triangles)
+    new_normals = _get_face_normals(positions, new_triangles)
+    dots = np.einsum("ij,ij->i", old_normals, new_normals)
+    min_dots = _MIN_NORMAL_COSINE * np.linalg.norm(old_normals, axis=1) * np.linalg.norm(new_normals, axis=1)
+    is_flipped = (dots <= min_dots) & FaceSet.get_non_degenerate_mask(new_triangles)
+    flipped_from = moved_triangles[is_flipped][is_from[moved_triangles[is_flipped]]]
+    is_rejected = np.zeros(vertex_count, dtype=bool)
+    is_rejected[flipped_from] = True
+    is_accepted = ~is_rejected[collapse_from]
+    return collapse_from[is_accepted], collapse_to[is_accepted]
+
+
+def _get_edges(triangles: np.ndarray, vertex_count: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get `(e, 2)` array of unique undirected edges (lower vertex index first), the number of triangles using each
+    edge, and the index of the first triangle using each edge."""
+    face_edges = triangles[:, [0, 1, 1, 2, 2, 0]].reshape((-1, 2))
+    edge_keys = face_edges.min(axis=1) * vertex_count + face_edges.max(axis=1)
+    key_order = np.argsort(edge_keys, kind="stable")
+    sorted_keys = edge_keys[key_order]
+    is_first = np.ones(len(sorted_keys), dtype=bool)
+    is_first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    first_indices = np.flatnonzero(is_first)
+    unique_keys = sorted_keys[first_indices]
+    edge_face_counts = np.diff(np.append(first_indices, len(sorted_keys)))
+    edges = np.column_stack([unique_keys // vertex_count, unique_keys % vertex_count])
+    return edges, edge_face_counts, key_order[first_indices] // 3
+
+
+def _get_common_neighbor_counts(edges: np.ndarray, vertices_a: np.ndarray, vertices_b: np.ndarray) -> np.ndarray:
+    """Count vertices that are connected by `edges` to both `vertices_a[i]` and `vertices_b[i]`, for each `i`."""
+    vertex_count = max(edges.max(initial=-1), vertices_a.max(initial=-1), vertices_b.max(initial=-1)) + 1
+    # Adjacency lists of all vertices, in CSR form.
+    directed_edges = np.concatenate((edges, edges[:, ::-1]))
+    directed_edges = directed_edges[np.argsort(directed_edges[:, 0], kind="stable")]
+    neighbor_starts = np.searchsorted(directed_edges[:, 0], np.arange(vertex_count + 1))
+
+    pair_count = len(vertices_a)
+    pair_keys = []
+    for vertices in (vertices_a, vertices_b):
+        starts = neighbor_starts[vertices]
+        counts = neighbor_starts[vertices + 1] - starts
+        pair_indices = np.repeat(np.arange(pair_count), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        neighbors = directed_edges[np.repeat(starts, counts) + offsets, 1]
+        pair_keys.append(pair_indices * vertex_count + neighbors)
+    # Each neighbor appears at most once per vertex, so any repeated key is a common neighbor.
+    sorted_keys = np.sort(np.concatenate(pair_keys))
+    common_keys = sorted_keys[1:][sorted_keys[1:] == sorted_keys[:-1]]
+    return np.bincount(common_keys // vertex_count, minlength=pair_count)
+
+
+def _get_face_normals(positions: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    """Unnormalized (area-weighted) face normals."""
+    p0, p1, p2 = positions[triangles[:, 0]], positions[triangles[:, 1]], positions[triangles[:, 2]]
+    return np.cross(p1 - p0, p2 - p0)
+
+
+def _get_vertex_quadrics(positions: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    """Sum area-weighted plane quadrics of all faces around each vertex into a `(v, 4, 4)` array."""
+    normals = _get_face_normals(positions, triangles)
+    double_areas = np.linalg.norm(normals, axis=1)
+    valid = double_areas > 0.0
+    planes = np.zeros((len(triangles), 4))
+    planes[valid, :3] = normals[valid] / double_areas[valid, np.newaxis]
+    planes[:, 3] = -np.einsum("ij,ij->i", planes[:, :3], positions[triangles[:, 0]])
+    face_quadrics = planes[:, :, np.newaxis] * planes[:, np.newaxis, :] * (double_areas / 2)[:, np.newaxis, np.newaxis]
+    quadrics = np.zeros((len(positions), 4, 4))
+    for i in range(3):
+        np.add.at(quadrics, triangles[:, i], face_quadrics)
+    return quadrics
+
+
+def _add_boundary_quadrics(
+    quadrics: np.ndarray, positions: np.ndarray, boundary_edges: np.ndarray, boundary_triangles: np.ndarray
+):
+    """Add heavily weighted quadrics of planes through each boundary edge, perpendicular to its face."""
+    face_normals = _get_face_normals(positions, boundary_triangles)
+    edge_vectors = positions[boundary_edges[:, 1]] - positions[boundary_edges[:, 0]]
+    plane_normals = np.cross(edge_vectors, face_normals)
+    lengths = np.linalg.norm(plane_normals, axis=1)
+    valid = lengths > 0.0
+    planes = np.zeros((len(boundary_edges), 4))
+    planes[valid, :3] = plane_normals[valid] / lengths[valid, np.newaxis]
+    planes[:, 3] = -np.einsum("ij,ij->i", planes[:, :3], positions[boundary_edges[:, 0]])
+    weights = _BOUNDARY_WEIGHT * np.einsum("ij,ij->i", edge_vectors, edge_vectors)
+    edge_quadrics = planes[:, :, np.newaxis] * planes[:, np.newaxis, :] * weights[:, np.newaxis, np.newaxis]
+    for i in range(2):
+        np.add.at(quadrics, boundary_edges[:, i], edge_quadrics)
+
+
+def _remove_bad_triangles(triangles: np.ndarray) -> np.ndarray:
+    """Remove degenerate triangles and all but the first of any duplicate triangles (same indices and winding)."""
+    triangles = triangles[FaceSet.get_non_degenerate_mask(triangles)]
+    # Rotate each triangle to start with its lowest index, so duplicates are identical rows.
+    rotations = np.argmin(triangles, axis=1)[:, np.newaxis]
+    rotated = np.take_along_axis(triangles, (rotations + np.arange(3)) % 3, axis=1)
+    row_order = np.lexsort(rotated.T[::-1])
+    sorted_rows = rotated[row_order]
+    is_duplicate = np.zeros(len(triangles), dtype=bool)
+    is_duplicate[row_order[1:]] = (sorted_rows[1:] == sorted_rows[:-1]).all(axis=1)
+    return triangles[~is_duplicate]
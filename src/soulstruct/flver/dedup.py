@@ -0,0 +1,378 @@
+"""Stable content hashes of FLVER meshes, and an index of duplicated FLVER data across a whole game install.
+
+Each mesh is hashed in parts (vertex arrays, face sets, vertex array layouts, material, and texture names), so data
+shared by otherwise different FLVERs can be found, along with an exact hash of the whole mesh and a 'geometry' hash of
+its (quantized) triangle positions only. Meshes with the same geometry hash but different exact hashes are reported as
+near-duplicates: e.g. the same shape with different vertex order, strip encoding, normals, UVs, or float noise.
+
+Hashes use BLAKE2b (not Python's salted `hash()`), so they are identical across processes and runs. Note that lazy
+vertex arrays (used when scanning) are hashed from their raw data, so compare hashes from the same kind of scan only.
+"""
+from __future__ import annotations
+
+__all__ = ["MeshUse", "MeshContentHashes", "FLVERContentHashes", "FLVERDuplicateIndex"]
+
+import functools
+import hashlib
+import logging
+import multiprocessing
+import typing as tp
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from soulstruct.utilities.files import write_json
+from .core import FLVER
+from .face_set import FaceSet
+from .material import Material
+from .mesh import FLVERMesh
+from .vertex_array_layout import VertexArrayLayout
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hash digest size in bytes.
+_DIGEST_SIZE = 16
+
+# Default patterns for `FLVERDuplicateIndex.from_directory()`.
+BINDER_PATTERNS = ("*.chrbnd", "*.chrbnd.dcx", "*.objbnd", "*.objbnd.dcx", "*.partsbnd", "*.partsbnd.dcx")
+FLVER_PATTERNS = ("*.flver", "*.flver.dcx")
+
+
+class MeshUse(tp.NamedTuple):
+    """Location of one mesh (or whole FLVER, if `mesh_index` is -1) in an indexed FLVER."""
+    path: str  # binder or loose FLVER path
+    entry_name: str  # empty for loose FLVER files
+    mesh_index: int
+
+
+@dataclass(slots=True)
+class MeshContentHashes:
+    """Hex hashes of all the parts of one `FLVERMesh`."""
+
+    mesh: str  # all fields below, plus mesh bone indices and bind pose
+    geometry: str  # quantized triangle positions only (for near-duplicates)
+    vertex_arrays: list[str]
+    face_sets: list[str]
+    layouts: list[str]
+    material: str
+    texture_names: list[str]  # lower-case texture file stems, which are compared directly instead of hashed
+    # Packed sizes (in bytes) of vertex arrays and face sets, for estimating duplicated data size.
+    vertex_array_sizes: list[int]
+    face_set_sizes: list[int]
+
+    @classmethod
+    def from_mesh(cls, mesh: FLVERMesh, is_flver0: bool, position_tolerance=1e-3) -> tp.Self:
+        """Hash all parts of `mesh`, without decompressing lazy vertex arrays.
+
+        Lazy vertex arrays are hashed from their raw (compressed) data, so `vertex_arrays` hashes (and hence `mesh`
+        hashes) of a lazy mesh are NOT equal to those of the same mesh read eagerly. `geometry` hashes are comparable.
+        """
+        vertex_arrays = [vertex_array.get_data_hash().hex()[:2 * _DIGEST_SIZE] for vertex_array in mesh.vertex_arrays]
+        face_sets = [get_face_set_hash(face_set) for face_set in mesh.face_sets]
+        layouts = [get_layout_hash(vertex_array.layout) for vertex_array in mesh.vertex_arrays]
+        material = get_material_hash(mesh.material) if mesh.material is not None else ""
+        bone_indices = None if mesh.bone_indices is None else np.asarray(mesh.bone_indices).tolist()
+        mesh_hash = _get_hash(
+            repr((vertex_arrays, face_sets, layouts, material, bone_indices, mesh.is_bind_pose)).encode()
+        )
+
+        if not mesh.vertex_arrays or not mesh.face_sets:
+            geometry = mesh_hash
+        else:
+            triangles = mesh.triangulate_flver0() if is_flver0 else mesh.triangulate_flver2()
+            geometry = get_geometry_hash(mesh.vertex_arrays[0]["position"], triangles, position_tolerance)
+
+        textures = mesh.material.textures if mesh.material is not None else []
+        return cls(
+            mesh=mesh_hash,
+            geometry=geometry,
+            vertex_arrays=vertex_arrays,
+            face_sets=face_sets,
+            layouts=layouts,
+            material=material,
+            texture_names=[texture.stem.lower() for texture in textures if texture.path],
+            vertex_array_sizes=[
+                len(vertex_array) * vertex_array.layout.get_total_data_size(include_ignored=False)
+                for vertex_array in mesh.vertex_arrays
+            ],
+            face_set_sizes=[face_set.vertex_indices.size * (2 if is_flver0 else 4) for face_set in mesh.face_sets],
+        )
+
+
+@dataclass(slots=True)
+class FLVERContentHashes:
+    """Hex hash of a whole `FLVER` (meshes and bones) and `MeshContentHashes` of each of its meshes.
+
+    Small and picklable, so it can be computed by `FLVER.iter_from_binder_paths()` workers instead of returning FLVERs.
+    """
+
+    flver: str
+    meshes: list[MeshContentHashes]
+
+    @classmethod
+    def from_flver(cls, flver: FLVER, position_tolerance=1e-3) -> tp.Self:
+        is_flver0 = flver.version.is_flver0()
+        meshes = [MeshContentHashes.from_mesh(mesh, is_flver0, position_tolerance) for mesh in flver.meshes]
+        bones = [
+            (bone.name, tuple(bone.translate), tuple(bone.rotate), tuple(bone.scale), bone.usage_flags)
+            for bone in flver.bones
+        ]
+        flver_hash = _get_hash(repr(([mesh.mesh for mesh in meshes], bones)).encode())
+        return cls(flver=flver_hash, meshes=meshes)
+
+
+@dataclass(slots=True)
+class FLVERDuplicateIndex:
+    """Index of every FLVER, mesh, and mesh part hash to all of its uses, built from any number of FLVER files.
+
+    Categories (keys of `uses`) are:
+        'flvers': whole FLVERs (with `mesh_index` -1)
+        'meshes': whole meshes
+        'geometry': quantized triangle positions of meshes
+        'vertex_arrays', 'face_sets', 'layouts', 'materials': mesh parts
+        'textures': lower-case texture stems used by mesh materials
+    """
+
+    CATEGORIES: tp.ClassVar[tuple[str, ...]] = (
+        "flvers", "meshes", "geometry", "vertex_arrays", "face_sets", "layouts", "materials", "textures"
+    )
+
+    # Maps category to a dictionary mapping each hash (or texture name) to all of its uses.
+    uses: dict[str, dict[str, list[MeshUse]]] = field(
+        default_factory=lambda: {category: {} for category in FLVERDuplicateIndex.CATEGORIES}
+    )
+    # Packed data sizes of vertex array and face set hashes.
+    sizes: dict[str, int] = field(default_factory=dict)
+    # Exact mesh hash of every mesh use, for telling near-duplicates apart from exact duplicates.
+    mesh_hashes: dict[MeshUse, str] = field(default_factory=dict)
+    # Binders or FLVER files (or binder entries, as 'path/entry_name') that could not be read.
+    failed_paths: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: Path | str,
+        binder_patterns: tp.Sequence[str] = BINDER_PATTERNS,
+        flver_patterns: tp.Sequence[str] = FLVER_PATTERNS,
+        processes: int | None = None,
+        position_tolerance=1e-3,
+    ) -> tp.Self:
+        """Index every FLVER in every binder (matching any of `binder_patterns`) and every loose FLVER file (matching
+        any of `flver_patterns`) anywhere in `directory`, reading and hashing them in `processes` worker processes.
+
+        FLVERs are read with lazy vertex arrays, and only their (small) hashes are sent back from workers.
+        """
+        directory = Path(directory)
+        binder_paths = sorted({path for pattern in binder_patterns for path in directory.rglob(pattern)})
+        flver_paths = sorted({path for pattern in flver_patterns for path in directory.rglob(pattern)})
+        index = cls()
+        hash_func = functools.partial(FLVERContentHashes.from_flver, position_tolerance=position_tolerance)
+
+        # Workers finish in any order, so results are added in path order to keep the index deterministic.
+        results = [
+            (binder_path, entry_name, hashes)
+            for binder_path, entry_name, hashes in FLVER.iter_from_binder_paths(
+                binder_paths, hash_func, processes=processes, lazy_vertex_arrays=True
+            )
+        ]
+        results += [
+            (flver_path, "", hashes)
+            for flver_path, hashes in _iter_flver_file_hashes(flver_paths, position_tolerance, processes)
+        ]
+        for path, entry_name, hashes in sorted(results, key=lambda result: (str(result[0]), result[1])):
+            if hashes is None:
+                index.failed_paths.append(f"{path}/{entry_name}" if entry_name else str(path))
+            else:
+                index.add(path, entry_name, hashes)
+
+        _LOGGER.info(
+            f"Indexed {len(index.get_uses_by_flver())} FLVERs in '{directory}' ({len(index.failed_paths)} failed)."
+        )
+        return index
+
+    def add(self, path: Path | str, entry_name: str, hashes: FLVERContentHashes):
+        """Add all hashes of one FLVER (from `path`, or entry `entry_name` of binder `path`) to the index.
+
+        Vertex array hashes (and the mesh and FLVER hashes that include them) depend on whether the FLVER was read with
+        lazy vertex arrays (see `MeshContentHashes.from_mesh()`). `from_directory()` always reads them lazily, so only
+        add hashes of FLVERs read with `lazy_vertex_arrays=True` to an index built that way, or vice versa.
+        """
+        path = str(path)
+        self.uses["flvers"].setdefault(hashes.flver, []).append(MeshUse(path, entry_name, -1))
+        for mesh_index, mesh in enumerate(hashes.meshes):
+            use = MeshUse(path, entry_name, mesh_index)
+            self.mesh_hashes[use] = mesh.mesh
+            self.uses["meshes"].setdefault(mesh.mesh, []).append(use)
+            self.uses["geometry"].setdefault(mesh.geometry, []).append(use)
+            self.uses["materials"].setdefault(mesh.material, []).append(use)
+            for category, part_hashes in (
+                ("vertex_arrays", mesh.vertex_arrays),
+                ("face_sets", mesh.face_sets),
+                ("layouts", mesh.layouts),
+                ("textures", mesh.texture_names),
+            ):
+                for part_hash in part_hashes:
+                    self.uses[category].setdefault(part_hash, []).append(use)
+            self.sizes.update(zip(mesh.vertex_arrays, mesh.vertex_array_sizes))
+            self.sizes.update(zip(mesh.face_sets, mesh.face_set_sizes))
+
+    def get_uses_by_flver(self) -> dict[tuple[str, str], MeshUse]:
+        """Get the 'flvers' category use of every indexed FLVER, keyed by `(path, entry_name)`."""
+        return {
+            (use.path, use.entry_name): use
+            for flver_uses in self.uses["flvers"].values() for use in flver_uses
+        }
+
+    def get_duplicates(self, category: str, min_flver_count=2) -> dict[str, list[MeshUse]]:
+        """Get all hashes in `category` that are used by at least `min_flver_count` different FLVERs, with all of their
+        uses, from most to least used.
+
+        Use `min_flver_count=1` to also include hashes used more than once in a single FLVER only.
+        """
+        if category not in self.uses:
+            raise KeyError(f"Invalid duplicate category: '{category}'. Must be one of: {self.CATEGORIES}")
+        duplicates = {}
+        for content_hash, uses in self.uses[category].items():
+            if len(uses) < 2:
+                continue
+            if len({(use.path, use.entry_name) for use in uses}) >= min_flver_count:
+                duplicates[content_hash] = uses
+        return dict(sorted(duplicates.items(), key=lambda item: -len(item[1])))
+
+    def get_near_duplicates(self) -> list[list[MeshUse]]:
+        """Get groups of meshes with the same (quantized) geometry, but that are not all exact duplicates of each other.
+
+        Groups are sorted from largest to smallest.
+        """
+        groups = []
+        for uses in self.uses["geometry"].values():
+            if len(uses) >= 2 and len({self.mesh_hashes[use] for use in uses}) >= 2:
+                groups.append(uses)
+        return sorted(groups, key=lambda uses: -len(uses))
+
+    def get_duplicated_size(self, category: str) -> int:
+        """Get total size (in bytes) of all but one copy of every duplicated vertex array or face set."""
+        if category not in {"vertex_arrays", "face_sets"}:
+            raise ValueError(f"Data size is only known for 'vertex_arrays' and 'face_sets', not '{category}'.")
+        return sum(
+            self.sizes[content_hash] * (len(uses) - 1)
+            for content_hash, uses in self.get_duplicates(category, min_flver_count=1).items()
+        )
+
+    def get_report(self, max_examples=3) -> str:
+        """Get human-readable summary of duplicates in each category, with up to `max_examples` uses of the most used
+        hashes in each."""
+
+        def format_use(use: MeshUse) -> str:
+            source = f"{use.path}/{use.entry_name}" if use.entry_name else use.path
+            return source if use.mesh_index < 0 else f"{source} (mesh {use.mesh_index})"
+
+        lines = [f"FLVERs indexed: {len(self.get_uses_by_flver())} ({len(self.failed_paths)} failed)"]
+        for category in self.CATEGORIES:
+            duplicates = self.get_duplicates(category)
+            line = f"{category}: {len(self.uses[category])} unique, {len(duplicates)} shared by multiple FLVERs"
+            if category in {"vertex_arrays", "face_sets"}:
+                line += f" ({self.get_duplicated_size(category)} duplicated bytes)"
+            lines.append(line)
+            for content_hash, uses in list(duplicates.items())[:max_examples]:
+                lines.append(f"    {content_hash}: {len(uses)} uses, e.g. {format_use(uses[0])}")
+        near_duplicates = self.get_near_duplicates()
+        lines.append(f"near-duplicate mesh groups: {len(near_duplicates)}")
+        for uses in near_duplicates[:max_examples]:
+            lines.append(f"    {len(uses)} meshes, e.g. {', '.join(format_use(use) for use in uses[:2])}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, tp.Any]:
+        """Get JSON-compatible dictionary of duplicates (as `[path, entry_name, mesh_index]` lists) in every category,
+        near-duplicate groups, duplicated data sizes, and failed paths."""
+        return {
+            "duplicates": {
+                category: {
+                    content_hash: [list(use) for use in uses]
+                    for content_hash, uses in self.get_duplicates(category).items()
+                }
+                for category in self.CATEGORIES
+            },
+            "near_duplicates": [[list(use) for use in uses] for uses in self.get_near_duplicates()],
+            "duplicated_sizes": {
+                category: self.get_duplicated_size(category) for category in ("vertex_arrays", "face_sets")
+            },
+            "failed_paths": self.failed_paths,
+        }
+
+    def write_json(self, json_path: Path | str, indent=4):
+        write_json(json_path, self.to_dict(), indent=indent)
+
+
+def get_face_set_hash(face_set: FaceSet) -> str:
+    header = repr((face_set.flags, face_set.is_triangle_strip, face_set.use_backface_culling, face_set.unk_x06))
+    vertex_indices = np.ascontiguousarray(face_set.vertex_indices, dtype=np.uint32)
+    return _get_hash(header.encode(), repr(vertex_indices.shape).encode(), vertex_indices.data)
+
+
+def get_layout_hash(layout: VertexArrayLayout) -> str:
+    data_types = [
+        (data_type.__class__.__name__, int(data_type.format_enum), data_type.unk_x00) for data_type in layout.read_types
+    ]
+    return _get_hash(repr(data_types).encode())
+
+
+def get_material_hash(material: Material) -> str:
+    """Unlike `Material.__hash__()`, stable across processes. Includes `name` as well."""
+    textures = [
+        (
+            texture.path, texture.texture_type, tuple(texture.scale), texture.f2_unk_x10, texture.f2_unk_x11,
+            texture.f2_unk_x14, texture.f2_unk_x18, texture.f2_unk_x1c,
+        )
+        for texture in material.textures
+    ]
+    gx_items = [(gx_item.category, gx_item.index, gx_item.data) for gx_item in material.gx_items]
+    return _get_hash(
+        repr((material.name, material.mat_def_path, material.flags, material.f2_unk_x18, textures, gx_items)).encode()
+    )
+
+
+def get_geometry_hash(positions: np.ndarray, triangles: np.ndarray, position_tolerance: float) -> str:
+    """Hash triangle corner positions, quantized to `position_tolerance`, independent of vertex order, triangle order,
+    and triangle winding. Degenerate triangles (after quantizing) are ignored."""
+    quantized = np.round(np.asarray(positions, dtype=np.float64)[:, :3] / position_tolerance).astype(np.int64)
+    corners = quantized[np.asarray(triangles, dtype=np.int64).reshape((-1, 3))]  # (t, 3, 3)
+    # Sort corners within each triangle, then sort triangles.
+    corner_order = np.lexsort(corners.transpose((2, 0, 1))[::-1], axis=-1)
+    corners = np.take_along_axis(corners, corner_order[:, :, np.newaxis], axis=1).reshape((-1, 9))
+    is_degenerate = (corners[:, 0:3] == corners[:, 3:6]).all(axis=1) | (corners[:, 3:6] == corners[:, 6:9]).all(axis=1)
+    corners = corners[~is_degenerate]
+    corners = np.ascontiguousarray(corners[np.lexsort(corners.T[::-1])])
+    return _get_hash(repr(corners.shape).encode(), corners.data)
+
+
+def _get_hash(*parts: bytes | memoryview) -> str:
+    content_hash = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    for part in parts:
+        content_hash.update(part)
+    return content_hash.hexdigest()
+
+
+def _iter_flver_file_hashes(
+    flver_paths: list[Path], position_tolerance: float, processes: int | None
+) -> tp.Iterator[tuple[Path, FLVERContentHashes | None]]:
+    """Read and hash loose FLVER files in a worker pool (unless `processes` is 1), yielding results in any order."""
+    mp_args = [(flver_path, position_tolerance) for flver_path in flver_paths]
+    if processes == 1 or not mp_args:
+        yield from map(_get_flver_file_hashes_mp, mp_args)
+        return
+
+    with multiprocessing.Pool(processes=processes) as pool:
+        yield from pool.imap_unordered(_get_flver_file_hashes_mp, mp_args)
+
+
+def _get_flver_file_hashes_mp(args: tuple[Path, float]) -> tuple[Path, FLVERContentHashes | None]:
+    """Function for `FLVERDuplicateIndex.from_directory()` worker pool."""
+    flver_path, position_tolerance = args
+    try:
+        flver = FLVER.from_path(flver_path, lazy_vertex_arrays=True)
+        return flver_path, FLVERContentHashes.from_flver(flver, position_tolerance)
+    except Exception as ex:
+        _LOGGER.error(f"Failed to hash FLVER file '{flver_path}': {ex}")
+        return flver_path, None
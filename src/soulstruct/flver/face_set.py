@@ -144,17 +144,12 @@ class FaceSet:
             # True and total face counts are the same.
             return len(self.vertex_indices), len(self.vertex_indices)
 
-        true_face_count = 0
-        total_face_count = 0
-        for i in range(len(self.vertex_indices) - 2):
-            triplet = self.vertex_indices[i:i + 3]
-            if uses_0xffff_separators and 0xFFFF in triplet:
-                continue  # ignore triplet
-            total_face_count += 1
-            if not self.has_flag(FaceSetFlags.MotionBlur) and len(set(triplet)) == 3:
-                # Vertices are not MotionBlur and not degenerate.
-                true_face_count += 1
-        return true_face_count, total_face_count
+        triplets, is_restart, _ = _get_strip_triplets(self.vertex_indices, uses_0xffff_separators)
+        total_face_count = len(triplets) - np.count_nonzero(is_restart)
+        if self.has_flag(FaceSetFlags.MotionBlur):
+            return 0, total_face_count
+        true_face_count = np.count_nonzero(~is_restart & self.get_non_degenerate_mask(triplets))
+        return int(true_face_count), int(total_face_count)
 
     def needs_32bit_indices(self) -> bool:
         """Check if vertices can be written as unsigned shorts (16-bit), which is only possible if they are all less
@@ -199,17 +194,14 @@ class FaceSet:
             # Sub-call with modified (slower) method including TK's manual normal inspection.
             return self._triangulate_flver0(flver0_vertices)
 
-        triangle_list = []  # can't predict array length due to primitive restarts
-        flip = False
-        for i in range(len(self.vertex_indices) - 2):
-            triplet = self.vertex_indices[i:i + 3]
-            if uses_0xffff_separators and 0xFFFF in triplet:
-                flip = False  # restart the strip and ignore this triplet
-                continue
-            if include_degenerate_faces or len(set(triplet)) == 3:
-                triangle_list.append([triplet[2], triplet[1], triplet[0]] if flip else triplet)
-            flip = not flip
-        return np.array(triangle_list)
+        triplets, is_restart, is_flipped = _get_strip_triplets(self.vertex_indices, uses_0xffff_separators)
+        keep = ~is_restart
+        if not include_degenerate_faces:
+            keep &= self.get_non_degenerate_mask(triplets)
+        triangles = triplets[keep]  # new array
+        flipped = is_flipped[keep]
+        triangles[flipped] = triangles[flipped, ::-1]
+        return triangles
 
     def _triangulate_flver0(self, vertices: np.ndarray) -> np.ndarray:
         """Triangulate a triangle strip with manual normal inspection for `FLVER0`."""
@@ -259,11 +251,20 @@ class FaceSet:
         return connected_vertices
 
     @classmethod
-    def from_triangles(cls, triangles: np.ndarray | list[tuple[int, int, int], ...], use_backface_culling=True):
-        """Create a `FaceSet` with `triangle_strip=False` from a list of vertex indices triplets.
+    def from_triangles(
+        cls,
+        triangles: np.ndarray | list[tuple[int, int, int], ...],
+        use_backface_culling=True,
+        triangle_strip=False,
+        uses_0xffff_separators=True,
+    ):
+        """Create a `FaceSet` from a list of vertex indices triplets.
 
         Given `triangles` can be a 1D or 2D array or a list of triplets. If 1D, it will be reshaped to 2D.
 
+        If `triangle_strip=True`, the triangles are converted to a triangle strip with `stripify()` (passing on
+        `uses_0xffff_separators`) and the face set will have `is_triangle_strip=True`.
+
         A new array will be created in all cases to ensure it has `uint32` type.
 
         TODO: Currently sets `flags=0` and `unk_x06=0`, which is correct so far in my usage.
@@ -277,16 +278,90 @@ class FaceSet:
                 raise ValueError("Triangle array must be 1D or 2D.")
         else:
             # Flatten and combine into 1D `uint32` array.
-            vertex_indices = np.array([i for tri in triangles for i in tri], dtype=np.uint32)
+            vertex_indices = np.array([i for tri in triangles for i in tri], dtype=np.uint32).reshape((-1, 3))
+
+        if triangle_strip:
+            vertex_indices = cls.stripify(vertex_indices, uses_0xffff_separators)
 
         return cls(
             flags=0,
             unk_x06=0,
-            is_triangle_strip=False,
+            is_triangle_strip=triangle_strip,
             use_backface_culling=use_backface_culling,
             vertex_indices=vertex_indices,
         )
 
+    @staticmethod
+    def stripify(triangles: np.ndarray, uses_0xffff_separators=True) -> np.ndarray:
+        """Convert `(n, 3)` array of `triangles` to a 1D triangle strip that `triangulate()` turns back into the same
+        triangles (in a different order, but with the same winding). Degenerate triangles are dropped.
+
+        Strips are grown greedily from triangles with the fewest neighbors, always continuing across the edge that keeps
+        the strip's alternating winding. Consecutive strips are separated by a 0xFFFF primitive restart index if
+        `uses_0xffff_separators=True` (which requires all vertex indices to be less than 0xFFFF). Otherwise, they are
+        joined by degenerate triangles, which are ignored when counting and triangulating real faces.
+        """
+        triangles = np.asarray(triangles, dtype=np.int64).reshape((-1, 3))
+        triangles = triangles[FaceSet.get_non_degenerate_mask(triangles)]
+        if len(triangles) == 0:
+            return np.empty(0, dtype=np.uint32)
+        if uses_0xffff_separators and triangles.max() >= 0xFFFF:
+            raise ValueError("Cannot use 0xFFFF strip separators with vertex indices of 0xFFFF or greater.")
+
+        # Key every directed edge `(a, b)`, `(b, c)`, `(c, a)` of every triangle. Neighbors with consistent winding
+        # share an edge in the opposite direction.
+        key_factor = int(triangles.max()) + 1
+        edge_keys = (triangles * key_factor + triangles[:, [1, 2, 0]]).ravel()
+        reverse_keys = (triangles[:, [1, 2, 0]] * key_factor + triangles).ravel()
+        neighbor_counts = np.isin(reverse_keys, edge_keys).reshape((-1, 3)).sum(axis=1)
+        start_order = np.argsort(neighbor_counts, kind="stable")
+
+        edge_triangles = dict(zip(edge_keys.tolist(), np.repeat(np.arange(len(triangles)), 3).tolist()))
+        triangle_list = triangles.tolist()
+        triangle_sums = triangles.sum(axis=1).tolist()  # third vertex of a triangle is its sum minus the other two
+        visited = bytearray(len(triangles))
+        strip = []  # type: list[int]
+        for start in start_order.tolist():
+            if visited[start]:
+                continue
+            visited[start] = 1
+            a, b, c = triangle_list[start]
+            # Start with the rotation that can be continued (next triangle contains directed edge `(r, q)`), if any.
+            for p, q, r in ((a, b, c), (b, c, a), (c, a, b)):
+                neighbor = edge_triangles.get(r * key_factor + q)
+                if neighbor is not None and not visited[neighbor]:
+                    break
+            else:
+                p, q, r = a, b, c
+
+            if strip:
+                if uses_0xffff_separators:
+                    strip.append(0xFFFF)  # resets winding
+                else:
+                    # Join with degenerate triangles. New strip's first triangle must be at an even (unflipped) index.
+                    strip += [strip[-1], p] if len(strip) % 2 == 0 else [strip[-1], p, p]
+            strip += [p, q, r]
+            flip = True  # winding of next triangle
+            while True:
+                s, e = strip[-2], strip[-1]
+                neighbor = edge_triangles.get(e * key_factor + s if flip else s * key_factor + e)
+                if neighbor is None or visited[neighbor]:
+                    break
+                visited[neighbor] = 1
+                strip.append(triangle_sums[neighbor] - s - e)
+                flip = not flip
+
+        return np.array(strip, dtype=np.uint32)
+
+    @staticmethod
+    def get_non_degenerate_mask(triangles: np.ndarray) -> np.ndarray:
+        """Get a boolean mask of the triangles (rows of `triangles`) that have three different vertex indices."""
+        return (
+            (triangles[:, 0] != triangles[:, 1])
+            & (triangles[:, 1] != triangles[:, 2])
+            & (triangles[:, 0] != triangles[:, 2])
+        )
+
     def __repr__(self):
         if self.is_triangle_strip:
             vertex_indices_str = f"<{self.vertex_indices.size}-index strip>"
@@ -303,3 +378,25 @@ class FaceSet:
             f"  vertex_indices = {vertex_indices_str}\n"
             f")"
         )
+
+
+def _get_strip_triplets(
+    vertex_indices: np.ndarray, uses_0xffff_separators: bool
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get `(n - 2, 3)` array of all consecutive vertex index triplets in a triangle strip, along with masks of triplets
+    that are primitive restarts (contain 0xFFFF, if used) and triplets whose winding is flipped.
+
+    Winding alternates with each triplet, and is reset to unflipped after each restart.
+    """
+    if len(vertex_indices) < 3:
+        return np.empty((0, 3), dtype=vertex_indices.dtype), np.empty(0, dtype=bool), np.empty(0, dtype=bool)
+    triplets = np.lib.stride_tricks.sliding_window_view(vertex_indices, 3)
+    triplet_indices = np.arange(len(triplets))
+    if uses_0xffff_separators:
+        is_restart = (triplets == 0xFFFF).any(axis=1)
+        last_restart = np.maximum.accumulate(np.where(is_restart, triplet_indices, -1))
+        is_flipped = (triplet_indices - last_restart) % 2 == 0
+    else:
+        is_restart = np.zeros(len(triplets), dtype=bool)
+        is_flipped = triplet_indices % 2 == 1
+    return triplets, is_restart, is_flipped
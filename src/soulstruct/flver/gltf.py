@@ -0,0 +1,251 @@
+"""Export `FLVER` models to binary glTF 2.0 (GLB) files.
+
+Vertex data is written straight from the FLVER vertex arrays into binary buffer views. FromSoftware models use a
+left-handed coordinate system, so the X axis is mirrored (and triangle winding reversed) to get glTF's right-handed
+coordinates.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "flver_to_glb",
+]
+
+import json
+import logging
+import struct
+import typing as tp
+
+import numpy as np
+
+from soulstruct.utilities.maths import Matrix3
+
+if tp.TYPE_CHECKING:
+    from .core import FLVER
+    from .mesh import FLVERMesh
+
+_LOGGER = logging.getLogger(__name__)
+
+_GLB_HEADER = struct.Struct("<4sII")
+_GLB_CHUNK_HEADER = struct.Struct("<II")
+_JSON_CHUNK_TYPE = 0x4E4F534A
+_BIN_CHUNK_TYPE = 0x004E4942
+
+# Accessor component types and buffer view targets.
+_UNSIGNED_SHORT = 5123
+_UNSIGNED_INT = 5125
+_FLOAT = 5126
+_ARRAY_BUFFER = 34962
+_ELEMENT_ARRAY_BUFFER = 34963
+_TRIANGLES = 4
+
+# Mirrors the X axis to convert between left-handed (FromSoftware) and right-handed (glTF) coordinates.
+_MIRROR_X = np.diag([-1.0, 1.0, 1.0, 1.0])
+
+
+class _GLBBuffer:
+    """Accumulates the binary chunk of a GLB file, with its buffer views and accessors."""
+
+    def __init__(self):
+        self.chunks = []  # type: list[bytes]
+        self.byte_length = 0
+        self.buffer_views = []  # type: list[dict[str, tp.Any]]
+        self.accessors = []  # type: list[dict[str, tp.Any]]
+
+    def add_accessor(self, array: np.ndarray, accessor_type: str, target: int = None, min_max=False) -> int:
+        """Add `array` (float32, uint16, or uint32) to the buffer and return the index of its new accessor."""
+        component_type = {np.float32: _FLOAT, np.uint16: _UNSIGNED_SHORT, np.uint32: _UNSIGNED_INT}[array.dtype.type]
+        data = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<")).tobytes()
+        if self.byte_length % 4:
+            padding = 4 - self.byte_length % 4
+            self.chunks.append(b"\0" * padding)
+            self.byte_length += padding
+
+        buffer_view = {"buffer": 0, "byteOffset": self.byte_length, "byteLength": len(data)}
+        if target is not None:
+            buffer_view["target"] = target
+        self.buffer_views.append(buffer_view)
+        self.chunks.append(data)
+        self.byte_length += len(data)
+
+        accessor = {
+            "bufferView": len(self.buffer_views) - 1,
+            "componentType": component_type,
+            "count": len(array),
+            "type": accessor_type,
+        }
+        if min_max:
+            accessor["min"] = array.min(axis=0).tolist()
+            accessor["max"] = array.max(axis=0).tolist()
+        self.accessors.append(accessor)
+        return len(self.accessors) - 1
+
+
+def flver_to_glb(flver: FLVER, meshes: tp.Iterable[int] = (), include_skin=True) -> bytes:
+    """Convert `flver` meshes (all, or only indices in `meshes`) to a binary glTF 2.0 file.
+
+    Each mesh becomes a glTF mesh with one triangle primitive (from its first face set) with positions, normals, and all
+    UV layers. If `include_skin=True`, the FLVER bones become a node hierarchy and meshes with bone weights are skinned
+    to it. Materials are exported by name only.
+
+    Note that glTF nodes inherit their parents' scale, unlike FLVER bones.
+    """
+    if isinstance(meshes, int):
+        meshes = [meshes]
+    meshes = set(meshes)
+    is_flver0 = flver.version.is_flver0()
+    glb_buffer = _GLBBuffer()
+
+    exported_meshes = [
+        (i, mesh) for i, mesh in enumerate(flver.meshes)
+        if (not meshes or i in meshes) and mesh.vertex_arrays and not mesh.invalid_layout
+    ]
+    skinned = include_skin and len(flver.bones) > 0 and any(
+        mesh.vertex_arrays[0].has_field("bone_indices") and mesh.vertex_arrays[0].has_field("bone_weights")
+        for _, mesh in exported_meshes
+    )
+
+    nodes = []  # type: list[dict[str, tp.Any]]
+    scene_nodes = []
+    if skinned:
+        nodes, root_indices, inverse_bind_matrices = _get_bone_nodes(flver)
+        scene_nodes += root_indices
+        # glTF matrices are column-major.
+        ibm_accessor = glb_buffer.add_accessor(
+            inverse_bind_matrices.transpose(0, 2, 1).reshape(-1, 16).astype(np.float32), "MAT4"
+        )
+        skins = [{"joints": list(range(len(flver.bones))), "inverseBindMatrices": ibm_accessor}]
+    else:
+        skins = []
+
+    materials = []  # type: list[dict[str, tp.Any]]
+    material_indices = {}  # type: dict[int, int]
+    gltf_meshes = []  # type: list[dict[str, tp.Any]]
+    for i, mesh in exported_meshes:
+        triangles = mesh.triangulate_flver0() if is_flver0 else mesh.triangulate_flver2()
+        if len(triangles) == 0:
+            _LOGGER.warning(f"Mesh {i} has no faces and will not be exported.")
+            continue
+        primitive = _get_mesh_primitive(glb_buffer, mesh, triangles, len(flver.bones) if skinned else 0)
+        if mesh.material is not None:
+            if id(mesh.material) not in material_indices:
+                material_indices[id(mesh.material)] = len(materials)
+                materials.append({"name": mesh.material.name})
+            primitive["material"] = material_indices[id(mesh.material)]
+        gltf_meshes.append({"name": f"Mesh {i}", "primitives": [primitive]})
+
+        mesh_node = {"name": f"Mesh {i}", "mesh": len(gltf_meshes) - 1}
+        if skinned and "JOINTS_0" in primitive["attributes"]:
+            mesh_node["skin"] = 0
+        scene_nodes.append(len(nodes))
+        nodes.append(mesh_node)
+
+    gltf = {
+        "asset": {"version": "2.0", "generator": "Soulstruct"},
+        "scene": 0,
+        "scenes": [{"name": flver.path_minimal_stem if flver.path else "FLVER", "nodes": scene_nodes}],
+        "nodes": nodes,
+        "meshes": gltf_meshes,
+        "accessors": glb_buffer.accessors,
+        "bufferViews": glb_buffer.buffer_views,
+        "buffers": [{"byteLength": glb_buffer.byte_length}],
+    }
+    if materials:
+        gltf["materials"] = materials
+    if skins:
+        gltf["skins"] = skins
+
+    json_chunk = json.dumps(gltf, separators=(",", ":")).encode("utf-8")
+    json_chunk += b" " * (-len(json_chunk) % 4)
+    bin_chunk = b"".join(glb_buffer.chunks)
+    bin_chunk += b"\0" * (-len(bin_chunk) % 4)
+    total_size = _GLB_HEADER.size + 2 * _GLB_CHUNK_HEADER.size + len(json_chunk) + len(bin_chunk)
+    return b"".join((
+        _GLB_HEADER.pack(b"glTF", 2, total_size),
+        _GLB_CHUNK_HEADER.pack(len(json_chunk), _JSON_CHUNK_TYPE),
+        json_chunk,
+        _GLB_CHUNK_HEADER.pack(len(bin_chunk), _BIN_CHUNK_TYPE),
+        bin_chunk,
+    ))
+
+
+def _get_bone_nodes(flver: FLVER) -> tuple[list[dict[str, tp.Any]], list[int], np.ndarray]:
+    """Get glTF nodes (with local matrices) for all FLVER bones, the indices of root bone nodes, and the inverse bind
+    matrix of each bone (in the mirrored glTF coordinates)."""
+    bone_count = len(flver.bones)
+    local_matrices = np.empty((bone_count, 4, 4))
+    for i, bone in enumerate(flver.bones):
+        matrix = np.eye(4)
+        matrix[:3, :3] = Matrix3.from_euler_angles_rad(bone.rotate).data * bone.scale.data  # scale columns
+        matrix[:3, 3] = bone.translate.data
+        local_matrices[i] = _MIRROR_X @ matrix @ _MIRROR_X
+
+    nodes = []
+    for i, bone in enumerate(flver.bones):
+        node = {"name": bone.name, "matrix": local_matrices[i].T.ravel().tolist()}
+        children = [child.get_bone_index(flver.bones) for child in bone.get_all_immediate_children()]
+        if children:
+            node["children"] = children
+        nodes.append(node)
+
+    world_matrices = np.empty((bone_count, 4, 4))
+    root_indices = [i for i, bone in enumerate(flver.bones) if bone.parent_bone is None]
+    stack = [(i, np.eye(4)) for i in root_indices]
+    while stack:
+        i, parent_matrix = stack.pop()
+        world_matrices[i] = parent_matrix @ local_matrices[i]
+        stack.extend((child_index, world_matrices[i]) for child_index in nodes[i].get("children", ()))
+
+    return nodes, root_indices, np.linalg.inv(world_matrices)
+
+
+def _get_mesh_primitive(
+    glb_buffer: _GLBBuffer, mesh: FLVERMesh, triangles: np.ndarray, skin_bone_count: int
+) -> dict[str, tp.Any]:
+    """Add vertex data and (re-wound) triangle indices of `mesh` to `glb_buffer` and return its glTF primitive.
+
+    Joints and weights are only added if `skin_bone_count > 0`. Invalid bone indices get zero weight.
+    """
+    vertex_array = mesh.vertex_arrays[0]
+    attributes = {}
+
+    positions = vertex_array["position"][:, :3].astype(np.float32)
+    positions[:, 0] *= -1.0
+    attributes["POSITION"] = glb_buffer.add_accessor(positions, "VEC3", _ARRAY_BUFFER, min_max=True)
+
+    if vertex_array.has_field("normal"):
+        normals = vertex_array["normal"][:, :3].astype(np.float32)
+        normals[:, 0] *= -1.0
+        lengths = np.linalg.norm(normals, axis=1)
+        normals[lengths == 0.0] = (0.0, 1.0, 0.0)
+        lengths[lengths == 0.0] = 1.0
+        normals /= lengths[:, np.newaxis]
+        attributes["NORMAL"] = glb_buffer.add_accessor(normals, "VEC3", _ARRAY_BUFFER)
+
+    uv_index = 0
+    while vertex_array.has_field(f"uv_{uv_index}"):
+        uvs = vertex_array[f"uv_{uv_index}"][:, :2].astype(np.float32)
+        attributes[f"TEXCOORD_{uv_index}"] = glb_buffer.add_accessor(uvs, "VEC2", _ARRAY_BUFFER)
+        uv_index += 1
+
+    if skin_bone_count > 0 and vertex_array.has_field("bone_indices") and vertex_array.has_field("bone_weights"):
+        joints = np.asarray(vertex_array["bone_indices"], dtype=np.int64)
+        if mesh.bone_indices is not None:
+            joints = np.asarray(mesh.bone_indices)[joints]
+        weights = vertex_array["bone_weights"].astype(np.float32)
+        weights[(joints < 0) | (joints >= skin_bone_count)] = 0.0
+        joints[weights == 0.0] = 0
+        weight_sums = weights.sum(axis=1)
+        unweighted = weight_sums == 0.0
+        weights[unweighted, 0] = 1.0  # fall back to first (valid or root) joint
+        weight_sums[unweighted] = 1.0
+        weights /= weight_sums[:, np.newaxis]
+        attributes["JOINTS_0"] = glb_buffer.add_accessor(joints.astype(np.uint16), "VEC4", _ARRAY_BUFFER)
+        attributes["WEIGHTS_0"] = glb_buffer.add_accessor(weights, "VEC4", _ARRAY_BUFFER)
+
+    index_dtype = np.uint16 if len(vertex_array) < 0xFFFF else np.uint32
+    indices = np.ascontiguousarray(triangles[:, ::-1]).ravel().astype(index_dtype)
+    return {
+        "attributes": attributes,
+        "indices": glb_buffer.add_accessor(indices, "SCALAR", _ELEMENT_ARRAY_BUFFER),
+        "mode": _TRIANGLES,
+    }
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 __all__ = ["FLVERMesh"]
 
+import io
 import logging
 import random
 import typing as tp
@@ -12,7 +13,8 @@ import numpy as np
 from soulstruct.utilities.binary import *
 from soulstruct.utilities.maths import Vector3
 from soulstruct.utilities.text import indent_lines
-from .face_set import FaceSet
+from .decimation import decimate_triangles
+from .face_set import FaceSet, FaceSetFlags
 from .material import Material
 from .vertex_array import VertexArray
 from .vertex_array_layout import VertexArrayLayout
@@ -20,6 +22,9 @@ from .version import FLVERVersion
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of rows formatted at once when writing OBJ data.
+_OBJ_ROW_CHUNK_SIZE = 0x10000
+
 
 @dataclass(slots=True)
 class FLVERMesh:
@@ -119,6 +124,7 @@ class FLVERMesh:
         vertex_data_offset: int,
         materials: list[Material],
         version: FLVERVersion,
+        lazy_vertex_array=False,
     ) -> tp.Self:
         mesh_struct = cls.STRUCT0.from_bytes(reader)
 
@@ -161,7 +167,7 @@ class FLVERMesh:
         # NOTE: Hacky way to determine UV factor.
         uv_factor = 1024 if reader.byte_order == ByteOrder.BigEndian else 2048
         vertex_array = VertexArray.from_flver0_reader(
-            reader, array_header, material._layouts, vertex_data_offset, uv_factor
+            reader, array_header, material._layouts, vertex_data_offset, uv_factor, lazy=lazy_vertex_array
         )
 
         # Convert vertex indices to numpy array. We use `uint32` regardless of vertex index size.
@@ -270,12 +276,12 @@ class FLVERMesh:
 
         # Check that all vertex arrays for this mesh have the same length.
         if self.vertex_arrays:
-            if len({len(vertex_array.array) for vertex_array in self.vertex_arrays}) != 1:
+            if len({len(vertex_array) for vertex_array in self.vertex_arrays}) != 1:
                 raise ValueError("Vertex arrays for mesh do not all have the same size.")
         else:
             _LOGGER.warning("Mesh has no vertex arrays.")
 
-        if any(vertex_array.array.size == 0 for vertex_array in self.vertex_arrays):
+        if any(len(vertex_array) == 0 for vertex_array in self.vertex_arrays):
             mat_def_name = self.material.mat_def_name if self.material else '<unknown>'
             _LOGGER.warning(
                 f"Mesh in FLVER (mat def '{mat_def_name}') has an incorrect layout that could not be fixed. Mesh "
@@ -302,7 +308,7 @@ class FLVERMesh:
             _LOGGER.warning(f"FaceSet `unk_x06` not used in FLVER0. Non-zero value {face_set.unk_x06} ignored.")
 
         vertex_array = self.vertex_arrays[0]
-        vertex_count = len(vertex_array.array)
+        vertex_count = len(vertex_array)
         vertex_index_count = face_set.vertex_indices.size  # NOT `len()`
         vertex_array_data_size = vertex_array.layout.get_total_data_size(include_ignored=False) * vertex_count
 
@@ -397,9 +403,14 @@ class FLVERMesh:
         """Shortcut for accessing the data of the first vertex array (generally the only array)."""
         return self.vertex_arrays[0].array
 
+    @property
+    def vertex_count(self) -> int:
+        """Number of vertices in the first vertex array (without decompressing lazy arrays)."""
+        return len(self.vertex_arrays[0])
+
     @property
     def vertices_dtype(self) -> np.dtype:
-        return self.vertices.dtype
+        return self.vertex_arrays[0].dtype
 
     @property
     def layout(self) -> VertexArrayLayout:
@@ -442,7 +453,7 @@ class FLVERMesh:
 
     def triangulate_flver0(self, include_degenerate_faces=False) -> np.ndarray:
         """Shortcut for triangulating first face set. Passes in vertices for a manual normal check set up by TK."""
-        uses_0xffff_separators = len(self.vertices) < 0xFFFF  # should always be true for `FLVER0`
+        uses_0xffff_separators = self.vertex_count < 0xFFFF  # should always be true for `FLVER0`
         return self.face_sets[0].triangulate(
             uses_0xffff_separators,
             include_degenerate_faces,
@@ -451,9 +462,64 @@ class FLVERMesh:
 
     def triangulate_flver2(self, include_degenerate_faces=False) -> np.ndarray:
         """Shortcut for triangulating first face set."""
-        uses_0xffff_separators = len(self.vertices) < 0xFFFF
+        uses_0xffff_separators = self.vertex_count < 0xFFFF
         return self.face_sets[0].triangulate(uses_0xffff_separators, include_degenerate_faces)
 
+    def create_lod_face_sets(
+        self,
+        lod_ratios: tp.Sequence[float] = (0.5, 0.25),
+        max_error=np.inf,
+        preserve_boundaries=True,
+    ):
+        """Replace any `LodLevel1`/`LodLevel2` face sets of this mesh with new ones decimated from each base face set.
+
+        For `FLVER2` meshes only (`FLVER0` meshes have a single face set). `lod_ratios` are the target triangle counts
+        of (up to) two LOD levels as fractions of the base face set triangle count. Each level is decimated from the
+        previous one, and all levels use the existing vertex array. New face sets copy the flags (plus LOD level),
+        triangle strip format, and backface culling of their base face set, and follow it in `face_sets`. LOD face sets
+        with no base face set (same flags without LOD level) are kept as they are. See `decimate_triangles()` for
+        `max_error` and `preserve_boundaries`.
+        """
+        if not 1 <= len(lod_ratios) <= 2:
+            raise ValueError(f"Must give one or two LOD ratios, not {len(lod_ratios)}.")
+        if not all(1.0 >= ratio > 0.0 for ratio in lod_ratios) or list(lod_ratios) != sorted(lod_ratios, reverse=True):
+            raise ValueError(f"LOD ratios must be in (0, 1] and in decreasing order: {lod_ratios}")
+
+        lod_flags = (FaceSetFlags.LodLevel1, FaceSetFlags.LodLevel2)
+        all_lod_flags = FaceSetFlags.LodLevel1 | FaceSetFlags.LodLevel2
+        uses_0xffff_separators = self.vertex_count < 0xFFFF
+        positions = self.vertex_arrays[0]["position"]
+        base_flags = {face_set.flags for face_set in self.face_sets if not face_set.flags & all_lod_flags}
+
+        new_face_sets = []
+        for base_face_set in self.face_sets:
+            if base_face_set.flags & all_lod_flags:
+                if base_face_set.flags & ~all_lod_flags not in base_flags:
+                    new_face_sets.append(base_face_set)  # no base face set to replace it from
+                continue
+            new_face_sets.append(base_face_set)
+            triangles = base_face_set.triangulate(uses_0xffff_separators)
+            base_triangle_count = len(triangles)
+            for ratio, lod_flag in zip(lod_ratios, lod_flags):
+                triangles = decimate_triangles(
+                    positions,
+                    triangles,
+                    target_triangle_count=int(base_triangle_count * ratio),
+                    max_error=max_error,
+                    preserve_boundaries=preserve_boundaries,
+                )
+                lod_face_set = FaceSet.from_triangles(
+                    triangles,
+                    use_backface_culling=base_face_set.use_backface_culling,
+                    triangle_strip=base_face_set.is_triangle_strip,
+                    uses_0xffff_separators=uses_0xffff_separators,
+                )
+                lod_face_set.flags = base_face_set.flags | lod_flag
+                lod_face_set.unk_x06 = base_face_set.unk_x06
+                new_face_sets.append(lod_face_set)
+
+        self.face_sets = new_face_sets
+
     def refresh_bounding_boxes(self):
         if not self.uses_bounding_boxes:
             return  # nothing to refresh
@@ -463,50 +529,66 @@ class FLVERMesh:
         self.bounding_box_min = Vector3.single_max()
         self.bounding_box_max = Vector3.single_min()
         for vertex_array in self.vertex_arrays:
-            self.bounding_box_min = np.minimum(self.bounding_box_min, vertex_array.array["position"].min(axis=0))
-            self.bounding_box_max = np.maximum(self.bounding_box_max, vertex_array.array["position"].max(axis=0))
+            self.bounding_box_min = np.minimum(self.bounding_box_min, vertex_array["position"].min(axis=0))
+            self.bounding_box_max = np.maximum(self.bounding_box_max, vertex_array["position"].max(axis=0))
         if self.bounding_box_unknown is not None:
             _LOGGER.warning("Cannot refresh `bounding_box_unknown` for Mesh (unknown values).")
 
-    def to_obj(self, name: str = None, vertex_offset=0, vertex_array=0) -> str:
+    def to_obj(self, name: str = None, vertex_offset=0, vertex_array=0, float_format="%.6f") -> str:
         """Convert mesh vertices, normals, UVs, and faces to an OBJ string.
 
         Use `vertex_offset` to offset all vertex indices in face definitions (e.g. if other meshes' vertices have
         been defined in the same file).
         """
-        if name is None:
-            name = f"{name}{self.index}"
+        stream = io.StringIO()
+        self.write_obj_stream(stream, name, vertex_offset, vertex_array, float_format)
+        return stream.getvalue().removesuffix("\n")
+
+    def write_obj_stream(
+        self, stream: tp.TextIO, name: str = None, vertex_offset=0, vertex_array=0, float_format="%.6f"
+    ):
+        """Write mesh vertices, normals, UVs, and faces to text `stream` in OBJ format (see `to_obj()`).
 
-        lines = [f"o {name}"]
+        Rows are formatted in large batches with `float_format` rather than one value at a time.
+        """
+        if name is None:
+            name = f"Mesh {self.index}"
 
-        # Check if vertex data has multiple UVs (unsupported in OBJ):
-        if "uv_1" in self.vertices.dtype.names:
-            raise NotImplementedError("Cannot convert mesh to OBJ because one or more vertices has multiple UVs.")
-        array = self.vertex_arrays[0]
+        array = self.vertex_arrays[vertex_array]
+        if array.has_field("uv_1"):
+            _LOGGER.warning("Mesh has multiple UV layers (unsupported in OBJ). Only the first will be included.")
 
-        for position in array["position"]:
-            pos_str = " ".join(str(x) for x in position)
-            lines.append(f"v {pos_str}")
-        if "normal" in array.dtype.names:
-            for normal in array["normal"]:
-                normal_str = " ".join(str(x) for x in normal)
-                lines.append(f"vn {normal_str}")
+        stream.write(f"o {name}\n")
+        _write_obj_rows(stream, "v", float_format, array["position"])
+        has_normals = array.has_field("normal")
+        if has_normals:
+            _write_obj_rows(stream, "vn", float_format, array["normal"][:, :3])
         else:
             _LOGGER.warning("Mesh has no normals. Normals will not be included in OBJ export.")
-        if "uv_0" in self.vertices.dtype.names:
-            for uv in array["uv_0"]:
-                uv_str = " ".join(str(x) for x in uv)
-                lines.append(f"vt {uv_str}")
+        has_uvs = array.has_field("uv_0")
+        if has_uvs:
+            _write_obj_rows(stream, "vt", float_format, array["uv_0"])
         else:
             _LOGGER.warning("Mesh has no UVs. UVs will not be included in OBJ export.")
+
+        # Each OBJ vertex uses its own UV and normal, if present.
+        if has_uvs and has_normals:
+            face_vertex_format = "%d/%d/%d"
+        elif has_uvs:
+            face_vertex_format = "%d/%d"
+        elif has_normals:
+            face_vertex_format = "%d//%d"
+        else:
+            face_vertex_format = "%d"
+        face_vertex_repeats = face_vertex_format.count("%d")
+
         for i, face_set in enumerate(self.face_sets):
-            lines.append(f"# Face Set {i}")
-            triangles = face_set.triangulate(uses_0xffff_separators=len(self.vertex_arrays[vertex_array]) <= 0xFFFF)
-            for j in range(0, len(triangles), 3):
-                # TODO: Are these UV/normal assignments correct, given that each vertex has one?
-                face = " ".join("/".join([str(v + vertex_offset + 1)] * 3) for v in triangles[j:j + 3])
-                lines.append(f"f {face}")
-        return "\n".join(lines)
+            stream.write(f"# Face Set {i}\n")
+            triangles = face_set.triangulate(uses_0xffff_separators=len(array) <= 0xFFFF)
+            if len(triangles) == 0:
+                continue
+            face_indices = np.repeat(triangles.astype(np.int64) + (vertex_offset + 1), face_vertex_repeats, axis=1)
+            _write_obj_rows(stream, "f", face_vertex_format, face_indices, face_vertex_repeats)
 
     def sort_bone_indices(self):
         """Sort `bone_indices` in-place, if defined, and re-index all vertex data to match."""
@@ -536,7 +618,7 @@ class FLVERMesh:
 
                 # Get indices of all vertices with non-zero bone weights.
                 used_indices = np.nonzero(bone_weights)[0]  # (n, 4) mask array
-                vertex_array["bone_indices"][used_indices] = sorted_indices[bone_indices[used_indices]]
+                vertex_array.array["bone_indices"][used_indices] = sorted_indices[bone_indices[used_indices]]
 
     def local_to_global_bone_indices(self):
         """Transforms `vertex_array` in-place by replacing all vertex bone indices with the global bone index in
@@ -570,7 +652,7 @@ class FLVERMesh:
     ):
         def triangulate(face_set: FaceSet):
             return face_set.triangulate(
-                uses_0xffff_separators=len(self.vertices) <= 0xFFFF,
+                uses_0xffff_separators=self.vertex_count <= 0xFFFF,
                 include_degenerate_faces=False,
                 flver0_vertices=self.vertices,
             )
@@ -593,7 +675,7 @@ class FLVERMesh:
         **kwargs,
     ):
         def triangulate(face_set: FaceSet):
-            return face_set.triangulate(uses_0xffff_separators=len(self.vertices) <= 0xFFFF)
+            return face_set.triangulate(uses_0xffff_separators=self.vertex_count <= 0xFFFF)
 
         self._draw(
             triangulate,
@@ -666,7 +748,7 @@ class FLVERMesh:
             f"  material = {material}",
             f"  default_bone_index = {self.default_bone_index}",
             f"  bone_indices = {self.bone_indices}",
-            f"  vertices = <{len(self.vertices)} vertices>",
+            f"  vertices = <{self.vertex_count} vertices>",
         ]
         if not self.is_bind_pose:
             lines.append("  is_bind_pose = False")
@@ -681,3 +763,18 @@ class FLVERMesh:
         return "\n".join(lines)
 
     # endregion
+
+
+def _write_obj_rows(stream: tp.TextIO, prefix: str, value_format: str, values: np.ndarray, group_size=1):
+    """Write each row of 2D `values` to `stream` as an OBJ line starting with `prefix`, formatting each group of
+    `group_size` values with `value_format` (space-separated).
+
+    Formats `_OBJ_ROW_CHUNK_SIZE` rows with one `%` operation at a time, which is far faster than per-value `str()`.
+    """
+    if len(values) == 0:
+        return
+    group_count = values.shape[1] // group_size
+    row_format = f"{prefix} {' '.join([value_format] * group_count)}\n"
+    for i in range(0, len(values), _OBJ_ROW_CHUNK_SIZE):
+        chunk = values[i:i + _OBJ_ROW_CHUNK_SIZE]
+        stream.write((row_format * len(chunk)) % tuple(chunk.ravel().tolist()))
@@ -0,0 +1,184 @@
+"""Content-hash cache of `MergedMesh` arrays, used to skip repeated FLVER-to-`MergedMesh` conversions.
+
+Each conversion is keyed by the BLAKE2b hash of everything `MergedMesh.from_flver()` reads from the FLVER (vertex array
+data, first face set of each mesh, mesh bone indices, and material display masks) plus the conversion arguments. The
+resulting arrays are stored as one compressed NPZ file per key. Cache hits refresh the modification time of their file,
+and the least recently used files are deleted whenever the cache directory grows past `max_size` bytes. The cache keeps
+a running total of entry sizes, so the directory is only scanned when that total first exceeds `max_size`.
+"""
+from __future__ import annotations
+
+__all__ = ["MergedMeshCache"]
+
+import hashlib
+import logging
+import os
+import typing as tp
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+if tp.TYPE_CHECKING:
+    from .core import FLVER
+    from .mesh_tools import MergedMesh
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bump this whenever the stored arrays or the meaning of a cache key changes (including `MergedMesh` algorithm changes).
+_CACHE_VERSION = 1
+
+
+class MergedMeshCache:
+    """Manages a directory of compressed NPZ files holding `MergedMesh` arrays, keyed by FLVER content hash."""
+
+    cache_directory: Path
+    # Least recently used entries are deleted when the total size of all entries exceeds this many bytes.
+    max_size: int
+    # Total size of all entries as of the last directory scan, plus the size of entries written since. Entries written
+    # by other processes are only counted by the next scan. `None` until the first scan.
+    total_size: int | None
+
+    def __init__(self, cache_directory: Path | str, max_size: int = 2 ** 30):
+        self.cache_directory = Path(cache_directory)
+        self.max_size = max_size
+        self.total_size = None
+
+    def get_key(
+        self,
+        flver: FLVER,
+        mesh_material_indices: tp.Sequence[int] = None,
+        material_uv_layer_names: tp.Sequence[tp.Sequence[str]] = None,
+        merge_vertices=True,
+    ) -> str:
+        """Get the hex hash that covers all `flver` data used by `MergedMesh.from_flver()` with these arguments.
+
+        Note that lazy vertex arrays are hashed from their raw data, so lazily and fully read copies of the same FLVER
+        will use different cache entries.
+        """
+        key_hash = hashlib.blake2b(f"{_CACHE_VERSION}|{flver.version.is_flver0()}|{merge_vertices}".encode())
+        key_hash.update(f"|{list(mesh_material_indices) if mesh_material_indices else None}".encode())
+        if material_uv_layer_names:
+            key_hash.update(f"|{[list(names) for names in material_uv_layer_names]}".encode())
+        else:
+            key_hash.update(b"|None")
+
+        for mesh in flver.meshes:
+            display_mask = mesh.material.display_mask if mesh.material is not None else None
+            key_hash.update(f"|mesh:{display_mask}:{len(mesh.vertex_arrays)}:{len(mesh.face_sets)}".encode())
+            if mesh.bone_indices is not None:
+                key_hash.update(np.ascontiguousarray(mesh.bone_indices, dtype=np.int64).data)
+            for vertex_array in mesh.vertex_arrays:
+                key_hash.update(vertex_array.get_data_hash())
+            if mesh.face_sets:
+                face_set = mesh.face_sets[0]
+                vertex_indices = np.ascontiguousarray(face_set.vertex_indices, dtype=np.int64)
+                key_hash.update(f"|faces:{face_set.is_triangle_strip}:{vertex_indices.shape}".encode())
+                key_hash.update(vertex_indices.data)
+
+        return key_hash.hexdigest()
+
+    def get(self, key: str) -> dict[str, tp.Any] | None:
+        """Get `MergedMesh` field values stored under `key`, or `None` if there is no (readable) cache entry."""
+        entry_path = self._get_entry_path(key)
+        try:
+            with np.load(entry_path, allow_pickle=False) as npz:
+                arrays = {name: npz[name] for name in npz.files}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zipfile.BadZipFile) as ex:
+            _LOGGER.warning(f"Deleting unreadable MergedMesh cache entry '{entry_path}': {ex}")
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        try:
+            os.utime(entry_path)  # mark as recently used
+        except OSError:
+            pass  # deleted by another process
+
+        tangent_count, color_count = arrays["loop_array_counts"]
+        return dict(
+            vertex_data=arrays["vertex_data"],
+            loop_vertex_indices=arrays["loop_vertex_indices"],
+            vertices_merged=bool(arrays["vertices_merged"]),
+            loop_normals=arrays.get("loop_normals"),
+            loop_normals_w=arrays.get("loop_normals_w"),
+            loop_tangents=[arrays[f"loop_tangents_{i}"] for i in range(tangent_count)],
+            loop_bitangents=arrays.get("loop_bitangents"),
+            loop_vertex_colors=[arrays[f"loop_vertex_colors_{i}"] for i in range(color_count)],
+            loop_uvs={str(name): arrays[f"loop_uvs_{i}"] for i, name in enumerate(arrays["loop_uv_names"])},
+            faces=arrays["faces"],
+        )
+
+    def put(self, key: str, merged_mesh: MergedMesh):
+        """Store arrays of `merged_mesh` under `key`, then evict least recently used entries if `total_size` (or the
+        actual size of the cache directory, on the first call) is now greater than `max_size`."""
+        arrays = {
+            "vertex_data": merged_mesh.vertex_data,
+            "loop_vertex_indices": merged_mesh.loop_vertex_indices,
+            "vertices_merged": np.array(merged_mesh.vertices_merged),
+            "faces": merged_mesh.faces,
+            "loop_array_counts": np.array([len(merged_mesh.loop_tangents), len(merged_mesh.loop_vertex_colors)]),
+            "loop_uv_names": np.array(list(merged_mesh.loop_uvs), dtype=np.str_),
+        }
+        for name in ("loop_normals", "loop_normals_w", "loop_bitangents"):
+            if (array := getattr(merged_mesh, name)) is not None:
+                arrays[name] = array
+        for i, array in enumerate(merged_mesh.loop_tangents):
+            arrays[f"loop_tangents_{i}"] = array
+        for i, array in enumerate(merged_mesh.loop_vertex_colors):
+            arrays[f"loop_vertex_colors_{i}"] = array
+        for i, array in enumerate(merged_mesh.loop_uvs.values()):
+            arrays[f"loop_uvs_{i}"] = array
+
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        entry_path = self._get_entry_path(key)
+        # Written to a temporary file first, so other processes never read a partial entry.
+        temp_path = entry_path.with_name(f"{key}.{os.getpid()}.tmp")
+        with temp_path.open("wb") as f:
+            np.savez_compressed(f, **arrays)
+        entry_size = temp_path.stat().st_size
+        try:
+            replaced_size = entry_path.stat().st_size
+        except FileNotFoundError:
+            replaced_size = 0
+        os.replace(temp_path, entry_path)
+
+        if self.total_size is None:
+            self.evict()  # first scan
+        else:
+            self.total_size += entry_size - replaced_size
+            if self.total_size > self.max_size:
+                self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the total size of the cache is no more than `max_size`.
+
+        Scans the whole cache directory and resets `total_size` to its actual remaining size.
+        """
+        entries = []
+        total_size = 0
+        for entry_path in self.cache_directory.glob("*.npz"):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+            total_size += stat.st_size
+
+        entries.sort()
+        for _, size, entry_path in entries:
+            if total_size <= self.max_size:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+        self.total_size = total_size
+
+    def clear(self):
+        """Delete all cache entries."""
+        for entry_path in self.cache_directory.glob("*.npz"):
+            entry_path.unlink(missing_ok=True)
+        self.total_size = 0
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self.cache_directory / f"{key}.npz"
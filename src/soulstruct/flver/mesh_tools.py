@@ -25,6 +25,7 @@ from .vertex_array_layout import VertexArrayLayout
 
 if tp.TYPE_CHECKING:
     from .core import FLVER
+    from .mesh_cache import MergedMeshCache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -131,6 +132,8 @@ class MergedMesh:
         mesh_material_indices: tp.Sequence[int] = None,
         material_uv_layer_names: tp.Sequence[tp.Sequence[str]] = None,
         merge_vertices=True,
+        keep_flver=True,
+        cache: MergedMeshCache = None,
     ):
         """Construct merged mesh data from all `flver` meshes.
 
@@ -152,10 +155,26 @@ class MergedMesh:
         importing FLVERs more quickly and faithfully, but makes the models a lot more painful to edit, as adjacent faces
         with different materials -- even those that are clearly intended to represent a contiguous surface -- will not
         share their vertices or edges.
+
+        If `keep_flver = False`, the `MergedMesh` will not reference `flver`, which makes it much cheaper to send
+        between processes.
+
+        If `cache` is given, the merged mesh arrays are loaded from it if this exact FLVER data has been converted with
+        the same arguments before, and stored in it otherwise.
         """
         if not flver.meshes:
             raise ValueError("FLVER has no meshes. Cannot create `MergedMesh`.")
 
+        if cache is not None:
+            cache_key = cache.get_key(flver, mesh_material_indices, material_uv_layer_names, merge_vertices)
+            if (cached_fields := cache.get(cache_key)) is not None:
+                return cls(**cached_fields, flver=flver if keep_flver else None)
+            merged_mesh = cls.from_flver(
+                flver, mesh_material_indices, material_uv_layer_names, merge_vertices, keep_flver
+            )
+            cache.put(cache_key, merged_mesh)
+            return merged_mesh
+
         if not mesh_material_indices:
             # By default, every mesh will be considered a separate 'material' in the `MergedMesh`.
             mesh_material_indices = list(range(len(flver.meshes)))
@@ -164,8 +183,8 @@ class MergedMesh:
         valid_mesh_material_indices = []
         for i, mesh in enumerate(flver.meshes):
             if any(
-                "position" in vertex_array.array.dtype.names
-                and np.isnan(vertex_array.array["position"]).any()
+                vertex_array.has_field("position")
+                and np.isnan(vertex_array["position"]).any()
                 for vertex_array in mesh.vertex_arrays
             ):
                 _LOGGER.warning(
@@ -206,7 +225,7 @@ class MergedMesh:
             vertices_merged=merge_vertices,
             **loop_data_dict,
             faces=faces,
-            flver=flver,
+            flver=flver if keep_flver else None,
         )
 
     @classmethod
@@ -215,18 +234,41 @@ class MergedMesh:
         flvers: list[FLVER],
         merged_mesh_args: list[tuple[tuple[int, ...], tuple[tuple[str, ...], ...], bool]],
         processes: int = None,
+        cache: MergedMeshCache = None,
     ) -> list[tp.Self | None]:
         """Use multiprocessing to create `MergedMesh` instances from given `FLVER` instances and args in parallel.
 
-        Failed conversions will put `None` into list rather than `MergedMesh`.
-        """
-        mp_args = [
-            (flver, *args) for flver, args in zip(flvers, merged_mesh_args, strict=True)
-        ]
-
-        with multiprocessing.Pool(processes=processes) as pool:
-            merged_meshes = pool.starmap(_from_flver_mp, mp_args)  # blocks here until all done
+        Failed conversions will put `None` into list rather than `MergedMesh`. Workers do not send their copies of the
+        FLVERs back; each `MergedMesh` references the given `FLVER` instead.
 
+        If `cache` is given, cache hits are loaded directly and only the remaining FLVERs are sent to workers. Their
+        results are then added to the cache.
+        """
+        if len(flvers) != len(merged_mesh_args):
+            raise ValueError("Number of FLVERs and `MergedMesh` args must be equal.")
+
+        merged_meshes = [None] * len(flvers)  # type: list[tp.Self | None]
+        cache_keys = {}  # type: dict[int, str]
+        mp_indices = []
+        for i, (flver, args) in enumerate(zip(flvers, merged_mesh_args)):
+            if cache is not None and flver.meshes:
+                cache_keys[i] = cache_key = cache.get_key(flver, *args)
+                if (cached_fields := cache.get(cache_key)) is not None:
+                    merged_meshes[i] = cls(**cached_fields, flver=flver)
+                    continue
+            mp_indices.append(i)
+
+        if mp_indices:
+            mp_args = [(flvers[i], *merged_mesh_args[i]) for i in mp_indices]
+            with multiprocessing.Pool(processes=processes) as pool:
+                mp_merged_meshes = pool.starmap(_from_flver_mp, mp_args)  # blocks here until all done
+
+            for i, merged_mesh in zip(mp_indices, mp_merged_meshes):
+                if merged_mesh is not None:
+                    merged_mesh.flver = flvers[i]
+                    if i in cache_keys:
+                        cache.put(cache_keys[i], merged_mesh)
+                merged_meshes[i] = merged_mesh
         return merged_meshes
 
     @classmethod
@@ -423,7 +465,7 @@ class MergedMesh:
             all_mesh_faces.append(mesh_faces)
             loop_offset += mesh.vertices.shape[0]
 
-        faces = np.row_stack(all_mesh_faces)
+        faces = np.vstack(all_mesh_faces)
         return faces
 
     @classmethod
@@ -468,109 +510,84 @@ class MergedMesh:
         In practice, we can simplify these by simply ensuring that faces with different material display masks are NEVER
         merged, which is probably desirable anyway.
 
-        To classify these different cases, we unfortunately need to iterate over faces, rather than just vertices, and
-        manually compare vertex normals (averaged over their loop normals) with `np.dot`. We also check the display mask
-        mask of each material.
+        FLVER vertices (loops) are considered in the order they are first used by a face. Loops with identical raw
+        vertex data (position and bone weights/indices) and material display mask are grouped with `np.unique`, and the
+        first loop in each group defines its vertex and reference normal. Any later loop in the group whose normal is
+        nearly inverted from that reference normal (dot product below -0.9) uses a second variant vertex of the group
+        instead. (No more than two vertex variants can exist, as no other normal could be different enough from BOTH.)
+        New vertices are numbered in the order their first loop is used, and loops never used by a face are marked as
+        unused (`2 ** 32 - 1`).
         """
+        # Map material display masks (which may be `None`) to consecutive integers.
+        display_mask_ids = {}  # type: dict[int | None, int]
 
-        # Maps raw vertex bytes (as a hash) and material display mask (could be `None`) to vertex index and the
-        # normal of the first face with that display mask found that uses it. Two variant dicts; the second
-        # is only used if a face has a near-inverted normal from the vertices retrieved from the first variant. (No more
-        # than two vertex variants can exist, as no other face normal could possibly be different enough from BOTH of
-        # the previous faces.)
-        vertex_indices_normals = {}  # type: dict[tuple[int | None, bytes], tuple[int, np.ndarray]]
-        inv_vertex_indices = {}  # type: dict[tuple[int | None, bytes], int]  # normal not needed here
-
-        # Actual vertex indices (subset of row indices) to extract from `all_vertices`.
-        reduced_vertex_indices = []  # type: list[int]
-
-        vertex_count = 0  # rather than continually calling `len(reduced_vertex_indices)`
-
-        # List of final faces: `(loop0, loop1, loop2)`, which naturally excludes duplicates. Material index added later.
         all_mesh_faces = []  # type: list[np.ndarray]
-
-        # Array of loop vertex indices. Same length as other loop data, as face loop indices are not modified (beyond
-        # offsetting them for each merged mesh).
-        loop_vertex_indices = np.empty(all_vertices.shape[0], dtype=np.uint32)
-
+        mesh_loop_display_mask_ids = []  # type: list[int]
         loop_offset = 0
-        for i, (mesh, material_index) in enumerate(zip(meshes, mesh_material_indices)):
-
-            display_mask = mesh.material.display_mask  # type: int | None
-
+        for mesh, material_index in zip(meshes, mesh_material_indices):
             triangles = mesh.triangulate_flver0() if is_flver0 else mesh.triangulate_flver2()  # `(n, 3)` array
             triangles += loop_offset
-            resolved_loop_indices = set()
-
-            for triangle in triangles:
-                for loop_index in triangle:
-                    # We inspect each FLVER loop index as it appears, and figure out if we can redirect it to an
-                    # existing 'true vertex'. Otherwise, we create a new 'true vertex' for it.
-
-                    if loop_index in resolved_loop_indices:
-                        # This loop has already been handled by a previous FLVER face that uses it.
-                        continue
-                    resolved_loop_indices.add(loop_index)
-
-                    triangle_vert = all_vertices[loop_index]
-                    vertex_hash = triangle_vert.tobytes()  # "hash" of position, bone indices, and bone weights
-                    vert_normal = loop_normals[loop_index] if loop_normals is not None else None
-
-                    # Check for an existing vertex with the same display mask and same hashed (position, bone_weights,
-                    # bone_indices) data.
-                    try:
-                        existing_vertex_index, existing_normal = vertex_indices_normals[display_mask, vertex_hash]
-                    except KeyError:
-                        # First time this vertex has been encountered in this display mask.
-                        vertex_index = vertex_count
-                        vertex_indices_normals[display_mask, vertex_hash] = (vertex_index, vert_normal)
-                        loop_vertex_indices[loop_index] = vertex_index
-                        reduced_vertex_indices.append(loop_index)
-                        vertex_count += 1
-                        continue
-
-                    # Compare normals to see if this vertex is suitable.
-                    if vert_normal is not None and np.dot(vert_normal, existing_normal) < -0.9:
-                        # This face is inverted from the existing vertex. Use the inv dict (whether existing or new).
-                        try:
-                            existing_inv_vertex_index = inv_vertex_indices[display_mask, vertex_hash]
-                        except KeyError:
-                            # First time this inverted vertex has been encountered.
-                            vertex_index = vertex_count
-                            inv_vertex_indices[display_mask, vertex_hash] = vertex_index
-                            reduced_vertex_indices.append(loop_index)
-                            loop_vertex_indices[loop_index] = vertex_index
-                            vertex_count += 1
-                            continue
-
-                        # Use existing inverted vertex. We do NOT check for normals here; if it turns out that another
-                        # face has already used the exact same three inverted vertices, it will be treated as a true
-                        # 'duplicate face' and handled accordingly (e.g. simply discarded in Blender).
-                        loop_vertex_indices[loop_index] = existing_inv_vertex_index
-                        continue
-
-                    # Existing vertex is suitable (normal is sufficiently close). Again, if it turns out that multiple
-                    # faces use the exact same three vertices, they will be treated as a true 'duplicate face'.
-                    loop_vertex_indices[loop_index] = existing_vertex_index
-
-            # Check for any unused FLVER vertices (now loops).
-            all_loop_indices = set(range(loop_offset, loop_offset + len(mesh.vertices)))
-            unresolved_loop_indices = all_loop_indices - resolved_loop_indices
-            if unresolved_loop_indices:
-                # This happens way too much in vanilla FLVER models to elevate above DEBUG log level.
-                _LOGGER.debug(f"FLVER mesh {i} has {len(unresolved_loop_indices)} vertices never used by a face.")
-                for loop_index in unresolved_loop_indices:
-                    loop_vertex_indices[loop_index] = 2 ** 32 - 1  # mark as unused (-1)
-
-            mesh_faces = np.column_stack(
-                [triangles, np.full(triangles.shape[0], material_index, dtype=np.uint32)]
+            all_mesh_faces.append(
+                np.column_stack([triangles, np.full(triangles.shape[0], material_index, dtype=np.uint32)])
             )
-            all_mesh_faces.append(mesh_faces)
-
+            display_mask_id = display_mask_ids.setdefault(mesh.material.display_mask, len(display_mask_ids))
+            mesh_loop_display_mask_ids.append(display_mask_id)
             loop_offset += len(mesh.vertex_arrays[0])
 
-        vertex_data = all_vertices[reduced_vertex_indices]
-        faces = np.row_stack(all_mesh_faces)
+        faces = np.vstack(all_mesh_faces)
+        loop_display_mask_ids = np.repeat(
+            np.array(mesh_loop_display_mask_ids, dtype=np.int64),
+            [len(mesh.vertex_arrays[0]) for mesh in meshes],
+        )
+
+        # Loops used by faces, in order of first use.
+        face_loops = faces[:, :3].ravel().astype(np.int64)
+        used_loops, first_uses = np.unique(face_loops, return_index=True)
+        loops = used_loops[np.argsort(first_uses, kind="stable")]
+
+        # Group loops by raw vertex bytes and display mask. Rows of `all_vertices` are viewed as single `np.void` items
+        # so they are compared exactly like `tobytes()` (e.g. -0.0 and 0.0 differ).
+        loop_vertices = np.ascontiguousarray(all_vertices[loops])
+        vertex_bytes = loop_vertices.view(np.dtype((np.void, loop_vertices.dtype.itemsize)))
+        _, vertex_groups = np.unique(vertex_bytes, return_inverse=True)
+        group_keys = vertex_groups.ravel().astype(np.int64) * len(display_mask_ids) + loop_display_mask_ids[loops]
+        _, first_in_group, loop_groups = np.unique(group_keys, return_index=True, return_inverse=True)
+        loop_groups = loop_groups.ravel()
+
+        # Compare each loop's normal with the normal of the first loop in its group.
+        if loop_normals is not None:
+            normals = loop_normals[loops]
+            group_normals = normals[first_in_group][loop_groups]
+            dots = normals[:, 0] * group_normals[:, 0]
+            dots += normals[:, 1] * group_normals[:, 1]
+            dots += normals[:, 2] * group_normals[:, 2]
+            is_inverted = dots < -0.9
+        else:
+            is_inverted = np.zeros(len(loops), dtype=bool)
+
+        # Each group has up to two vertex variants. Number them in order of first use.
+        variant_keys = loop_groups.astype(np.int64) * 2 + is_inverted
+        _, first_in_variant, loop_variants = np.unique(variant_keys, return_index=True, return_inverse=True)
+        variant_order = np.argsort(first_in_variant, kind="stable")
+        variant_vertex_indices = np.empty(len(variant_order), dtype=np.uint32)
+        variant_vertex_indices[variant_order] = np.arange(len(variant_order), dtype=np.uint32)
+
+        loop_vertex_indices = np.full(all_vertices.shape[0], 2 ** 32 - 1, dtype=np.uint32)  # unused loops stay -1
+        loop_vertex_indices[loops] = variant_vertex_indices[loop_variants.ravel()]
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            is_used = np.zeros(all_vertices.shape[0], dtype=bool)
+            is_used[loops] = True
+            loop_offset = 0
+            for i, mesh in enumerate(meshes):
+                mesh_loop_count = len(mesh.vertex_arrays[0])
+                unused_count = mesh_loop_count - np.count_nonzero(is_used[loop_offset:loop_offset + mesh_loop_count])
+                if unused_count:
+                    # This happens way too much in vanilla FLVER models to elevate above DEBUG log level.
+                    _LOGGER.debug(f"FLVER mesh {i} has {unused_count} vertices never used by a face.")
+                loop_offset += mesh_loop_count
+
+        vertex_data = all_vertices[loops[np.sort(first_in_variant)]]
         return vertex_data, loop_vertex_indices, faces
 
     @staticmethod
@@ -675,6 +692,7 @@ class MergedMesh:
         normal_tangent_dot_threshold=1.0,
         max_mesh_vertex_count=0,
         is_flver0=False,
+        use_triangle_strips=False,
     ) -> list[FLVERMesh]:
         """Splits merged mesh into FLVER meshes.
 
@@ -719,6 +737,10 @@ class MergedMesh:
         If `max_mesh_vertex_count` is >0, an error will be raised if any mesh has more than this number of
         vertices. This is useful for ensuring that meshes are not too large for the game to handle, as earlier games
         restrict face vertex indices to being 16-bit.
+
+        If `use_triangle_strips` is True, face sets are written as triangle strips (see `FaceSet.stripify()`), which
+        are usually considerably smaller than triangle lists. Strips are separated by 0xFFFF restart indices where
+        possible, and joined by degenerate triangles in `FLVER0` or meshes with 0xFFFF or more vertices.
         """
         if use_mesh_bone_indices and max_bones_per_mesh < 3:
             raise ValueError("`max_bones_per_mesh` must be >= 3 (and realistically should be much higher).")
@@ -780,11 +802,18 @@ class MergedMesh:
         # data).
         split_mesh_info = []  # type: list[tuple[int, np.ndarray, tp.Optional[np.ndarray]]]
 
+        # Partition `faces` by material index (column 3) with one stable sort (keeping face order within materials).
+        material_sorted_faces = self.faces[np.argsort(self.faces[:, 3], kind="stable")]
+        material_face_offsets = np.searchsorted(
+            material_sorted_faces[:, 3], np.arange(len(global_uv_material_dtypes) + 1)
+        )
+
         merged_loop_views = {}  # minor optimization (construct each dtype-dependent view only once)
         for material_index, global_uv_material_dtype in enumerate(global_uv_material_dtypes):
 
-            # Split `faces` and indexed `merged_loops` by material index (column 3).
-            mesh_faces = self.faces[self.faces[:, 3] == material_index][:, :3]  # `(n, 3)` array
+            # Split `faces` and indexed `merged_loops` by material index.
+            faces_start, faces_end = material_face_offsets[material_index:material_index + 2]
+            mesh_faces = material_sorted_faces[faces_start:faces_end, :3]  # `(n, 3)` array
             if len(mesh_faces) == 0:
                 # This is an unused material index. Do not create any meshes.
                 continue
@@ -824,6 +853,7 @@ class MergedMesh:
 
         for material_index, mesh_loops, mesh_bone_indices in split_mesh_info:
             kwargs = mesh_kwargs[material_index].copy()  # may be used by multiple subsplit meshes
+            kwargs.setdefault("is_bind_pose", mesh_is_bind_pose[material_index])
 
             # Duplicate loop data is finally removed here, giving the true vertex data stored in the FLVER mesh.
 
@@ -858,7 +888,10 @@ class MergedMesh:
 
             face_set_count = kwargs.pop("face_set_count", 1)
             face_set = FaceSet.from_triangles(
-                face_vertex_indices, use_backface_culling=kwargs.pop("use_backface_culling")
+                face_vertex_indices,
+                use_backface_culling=kwargs.pop("use_backface_culling"),
+                triangle_strip=use_triangle_strips,
+                uses_0xffff_separators=not is_flver0 and len(mesh_vertices) < 0xFFFF,
             )
             material = mesh_materials[material_index]
             mesh = FLVERMesh(
@@ -878,7 +911,7 @@ class MergedMesh:
                 for i in range(1, face_set_count):
                     face_set = FaceSet(
                         flags=i,  # 1 or 2
-                        is_triangle_strip=base_face_set.is_triangle_strip,  # False
+                        is_triangle_strip=base_face_set.is_triangle_strip,
                         use_backface_culling=base_face_set.use_backface_culling,
                         unk_x06=base_face_set.unk_x06,
                         vertex_indices=base_face_set.vertex_indices,  # don't bother copying array
@@ -986,10 +1019,11 @@ class MergedMesh:
     ) -> list[tuple[int, np.ndarray, np.ndarray]]:
         """Takes arrays of split faces, loops, and bone indices and returns a tuple of arrays of subsplit faces, loops,
         and bone indices, which can be appended to the appropriate lists for each material rather than a single
-        mesh."""
-        subsplit_face_indices = [0]
-        subsplit_bone_indices = []
+        mesh.
 
+        Faces are added to the current subsplit in order until the next face would take it over `max_bones_per_mesh`
+        unique bones. See `get_subsplit_face_indices()`.
+        """
         bone_indices = mesh_loops["bone_indices"]  # copied below if modified
 
         if is_rigged:
@@ -1005,25 +1039,12 @@ class MergedMesh:
         # Loops are still genuine loops, i.e. every three represent one triangle with 12 total bone indices.
         all_face_bone_indices = bone_indices.reshape((-1, 12))
 
-        # Rather than filtering out values of -1, we make sure it's always in the set, and offset the check.
-        # Slightly suboptimal for `is_rigged = False`, as every face should only have up to 3 bones, but
-        # worth the complexity trade-off.
-        max_bones = max_bones_per_mesh + 1
-        unique_indices = {-1}
-        for face_index, face_bone_indices in enumerate(all_face_bone_indices):
-            new_indices = unique_indices | set(face_bone_indices)
-            if len(new_indices) > max_bones:
-                # This row would exceed the limit. Start a new mesh.
-                subsplit_face_indices.append(face_index)
-                subsplit_bone_indices.append(np.array(sorted(unique_indices - {-1})))
-                unique_indices = {-1} | set(face_bone_indices)
-            else:
-                # Can continue.
-                unique_indices = new_indices
-
-        # Finish final subsplit. Face indices for meshes that don't need sub-splitting will just be `[0, n]`.
-        subsplit_face_indices += [len(mesh_loops) // 3]
-        subsplit_bone_indices.append(np.array(sorted(unique_indices - {-1})))
+        # Face indices for meshes that don't need sub-splitting will just be `[0, n]`.
+        subsplit_face_indices = cls.get_subsplit_face_indices(all_face_bone_indices, max_bones_per_mesh)
+        subsplit_bone_indices = []
+        for face_start, face_end in zip(subsplit_face_indices[:-1], subsplit_face_indices[1:]):
+            face_bone_indices = all_face_bone_indices[face_start:face_end]
+            subsplit_bone_indices.append(np.flatnonzero(np.bincount(face_bone_indices[face_bone_indices != -1])))
 
         all_subsplits = []
         for i, face_start in enumerate(subsplit_face_indices[:-1]):
@@ -1040,6 +1061,38 @@ class MergedMesh:
 
         return all_subsplits
 
+    @staticmethod
+    def get_subsplit_face_indices(face_bone_indices: np.ndarray, max_bones_per_mesh: int) -> list[int]:
+        """Get the start index of each run of faces (rows of `face_bone_indices`) that uses no more than
+        `max_bones_per_mesh` unique bones (ignoring -1), followed by the total face count. Runs are as long as possible
+        in order, and a single face is always used even if it exceeds the maximum.
+
+        Every use of every bone is sorted by bone and face, so the first face to use each bone from any start face can
+        be found with one binary search per bone. The next run then starts at the first use of the bone that exceeds
+        the maximum.
+        """
+        face_count, indices_per_face = face_bone_indices.shape
+        bone_indices = face_bone_indices.ravel().astype(np.int64)
+        is_used = bone_indices != -1
+        use_faces = np.flatnonzero(is_used) // indices_per_face
+        use_keys = np.sort(bone_indices[is_used] * face_count + use_faces)  # sorted by bone, then face
+        use_bones = use_keys // face_count
+        bones = use_bones[np.concatenate(([True], use_bones[1:] != use_bones[:-1]))]
+        bone_key_ends = np.searchsorted(use_keys, (bones + 1) * face_count)
+
+        subsplit_face_indices = [0]
+        while subsplit_face_indices[-1] < face_count:
+            face_start = subsplit_face_indices[-1]
+            next_uses = np.searchsorted(use_keys, bones * face_count + face_start)
+            next_uses = next_uses[next_uses < bone_key_ends]  # bones used at or after `face_start`
+            if len(next_uses) <= max_bones_per_mesh:
+                subsplit_face_indices.append(face_count)
+                break
+            first_use_faces = use_keys[next_uses] % face_count
+            face_end = np.partition(first_use_faces, max_bones_per_mesh)[max_bones_per_mesh]
+            subsplit_face_indices.append(max(int(face_end), face_start + 1))
+        return subsplit_face_indices
+
     def get_combined_loop_data(self, combined_dtype: np.dtype):
         """Combine the appropriate loop data, in the given order, into a single structured array for indexing by loop
         row ('FLVER vertex row') or field name (so mesh materials can retrieve only the fields they need).
@@ -1123,7 +1176,9 @@ def _from_flver_mp(
         _LOGGER.info(f"FLVER '{flver.path_name}' has no meshes. No MergedMesh created.")
         return None
     try:
-        return MergedMesh.from_flver(flver, mesh_material_indices, material_uv_layer_names, merge_vertices)
+        return MergedMesh.from_flver(
+            flver, mesh_material_indices, material_uv_layer_names, merge_vertices, keep_flver=False
+        )
     except Exception as ex:
         _LOGGER.error(f"Failed to load FLVER '{flver.path_name}' as MergedMesh: {ex}")
         return None
@@ -0,0 +1,176 @@
+"""Array-based FLVER skeleton, for computing transforms of all bones at once.
+
+Bone hierarchy is stored as an array of parent indices, and local bone transforms as arrays of translations, rotation
+matrices, and scales. Armature space transforms are computed one hierarchy depth level at a time (forward kinematics),
+so the number of Python iterations is the depth of the skeleton rather than its size, and local transforms are recovered
+from armature space transforms in a single batch (inverse kinematics).
+
+As with `FLVERBone`, rotations use FromSoft's XZY Euler order, and bone scale is NOT inherited.
+"""
+from __future__ import annotations
+
+__all__ = ["SkeletonArrays"]
+
+import typing as tp
+from dataclasses import dataclass
+
+import numpy as np
+
+from soulstruct.utilities.maths import EulerRad, Vector3
+from soulstruct.utilities.misc import IDList
+from .bone import FLVERBone
+
+
+@dataclass(slots=True)
+class SkeletonArrays:
+    """Parent indices and local transforms of `n` bones, as contiguous arrays."""
+
+    names: list[str]
+    parent_indices: np.ndarray  # (n,) int array, with -1 for root bones
+    translates: np.ndarray  # (n, 3) local translations
+    rotates: np.ndarray  # (n, 3, 3) local rotation matrices
+    scales: np.ndarray  # (n, 3) local scales
+
+    @classmethod
+    def from_bones(cls, bones: tp.Sequence[FLVERBone]) -> tp.Self:
+        """Get arrays from `FLVERBone` list (using `parent_bone` references only)."""
+        bone_indices = {id(bone): i for i, bone in enumerate(bones)}
+        parent_indices = np.empty(len(bones), dtype=np.int64)
+        for i, bone in enumerate(bones):
+            if bone.parent_bone is None:
+                parent_indices[i] = -1
+                continue
+            try:
+                parent_indices[i] = bone_indices[id(bone.parent_bone)]
+            except KeyError:
+                raise ValueError(f"Parent of bone '{bone.name}' is not in given `bones` list.")
+        return cls(
+            names=[bone.name for bone in bones],
+            parent_indices=parent_indices,
+            translates=np.array([bone.translate.data for bone in bones], dtype=float).reshape((-1, 3)),
+            rotates=euler_xzy_to_matrices(np.array([bone.rotate for bone in bones], dtype=float).reshape((-1, 3))),
+            scales=np.array([bone.scale.data for bone in bones], dtype=float).reshape((-1, 3)),
+        )
+
+    def to_bones(self) -> IDList[FLVERBone]:
+        """Create new `FLVERBone` list with these names, local transforms, and hierarchy (including child and sibling
+        references, with siblings in index order). Bounding boxes and usage flags are left at their defaults."""
+        bones = IDList(FLVERBone(name=name) for name in self.names)
+        self.set_bone_transforms(bones)
+        previous_children = {}  # type: dict[int, FLVERBone]  # latest child of each parent (-1 for root bones)
+        for bone, parent_index in zip(bones, self.parent_indices.tolist()):
+            if parent_index >= 0:
+                bone.parent_bone = bones[parent_index]
+                if bones[parent_index].child_bone is None:
+                    bones[parent_index].child_bone = bone
+            if (previous_sibling := previous_children.get(parent_index)) is not None:
+                previous_sibling.next_sibling_bone = bone
+                bone.previous_sibling_bone = previous_sibling
+            previous_children[parent_index] = bone
+        return bones
+
+    def set_bone_transforms(self, bones: tp.Sequence[FLVERBone]):
+        """Set local transforms of existing `bones` (same length and order as these arrays)."""
+        if len(bones) != len(self):
+            raise ValueError(f"Expected {len(self)} bones, but got {len(bones)}.")
+        eulers = matrices_to_euler_xzy(self.rotates).tolist()
+        for bone, translate, euler, scale in zip(bones, self.translates.tolist(), eulers, self.scales.tolist()):
+            bone.translate = Vector3(translate)
+            bone.rotate = EulerRad(euler)
+            bone.scale = Vector3(scale)
+
+    def get_depth_levels(self) -> list[np.ndarray]:
+        """Get indices of bones at each hierarchy depth, starting with root bones. Every bone appears after its parent
+        (i.e. in topological order) when levels are concatenated."""
+        bone_count = len(self)
+        depths = np.zeros(bone_count, dtype=np.int64)
+        ancestors = self.parent_indices.copy()
+        for _ in range(bone_count + 1):
+            has_ancestor = ancestors >= 0
+            if not has_ancestor.any():
+                break
+            depths[has_ancestor] += 1
+            ancestors[has_ancestor] = self.parent_indices[ancestors[has_ancestor]]
+        else:
+            cycle_names = [self.names[i] for i in np.flatnonzero(ancestors >= 0)]
+            raise ValueError(f"Bone hierarchy has a cycle (bones: {cycle_names}).")
+        order = np.argsort(depths, kind="stable")
+        level_starts = np.searchsorted(depths[order], np.arange(depths.max(initial=0) + 2))
+        return [order[start:stop] for start, stop in zip(level_starts[:-1], level_starts[1:])]
+
+    def get_armature_space_transforms(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get `(n, 3)` translations, `(n, 3, 3)` rotation matrices, and `(n, 3)` scales of all bones in armature space.
+
+        Scales are just copies of local scales, as they are not inherited.
+        """
+        arma_translates = self.translates.copy()
+        arma_rotates = self.rotates.copy()
+        for level in self.get_depth_levels()[1:]:  # root bones are already in armature space
+            parent_indices = self.parent_indices[level]
+            parent_rotates = arma_rotates[parent_indices]
+            arma_translates[level] = arma_translates[parent_indices] + np.einsum(
+                "nij,nj->ni", parent_rotates, self.translates[level]
+            )
+            arma_rotates[level] = parent_rotates @ self.rotates[level]
+        return arma_translates, arma_rotates, self.scales.copy()
+
+    def set_armature_space_transforms(
+        self, arma_translates: np.ndarray, arma_rotates: np.ndarray, arma_scales: np.ndarray = None
+    ):
+        """Set local transforms from `(n, 3)` armature space translations, `(n, 3, 3)` armature space rotation matrices,
+        and optional `(n, 3)` scales (which are local anyway, as they are not inherited) by applying the inverse of each
+        bone's parent armature space transform."""
+        arma_translates = np.asarray(arma_translates, dtype=float)
+        arma_rotates = np.asarray(arma_rotates, dtype=float)
+        if arma_translates.shape != (len(self), 3) or arma_rotates.shape != (len(self), 3, 3):
+            raise ValueError(
+                f"Expected armature space transforms for {len(self)} bones, but got translate array of shape "
+                f"{arma_translates.shape} and rotate array of shape {arma_rotates.shape}."
+            )
+
+        translates = arma_translates.copy()
+        rotates = arma_rotates.copy()
+        is_child = self.parent_indices >= 0
+        parent_indices = self.parent_indices[is_child]
+        parent_inv_rotates = np.linalg.inv(arma_rotates[parent_indices])
+        translates[is_child] = np.einsum(
+            "nij,nj->ni", parent_inv_rotates, arma_translates[is_child] - arma_translates[parent_indices]
+        )
+        rotates[is_child] = parent_inv_rotates @ arma_rotates[is_child]
+
+        self.translates = translates
+        self.rotates = rotates
+        if arma_scales is not None:
+            self.scales = np.array(arma_scales, dtype=float).reshape((-1, 3))
+
+    def __len__(self) -> int:
+        return len(self.parent_indices)
+
+
+def euler_xzy_to_matrices(eulers: np.ndarray) -> np.ndarray:
+    """Convert `(n, 3)` XZY Euler angles (radians) to `(n, 3, 3)` rotation matrices `Ry @ Rz @ Rx`.
+
+    Batched equivalent of `Matrix3.from_euler_angles_rad()`.
+    """
+    sx, sy, sz = np.sin(eulers).T
+    cx, cy, cz = np.cos(eulers).T
+    return np.stack([
+        np.stack([cy * cz, -cx * cy * sz + sx * sy, sx * cy * sz + cx * sy], axis=-1),
+        np.stack([sz, cx * cz, -sx * cz], axis=-1),
+        np.stack([-sy * cz, cx * sy * sz + sx * cy, -sx * sy * sz + cx * cy], axis=-1),
+    ], axis=-2)
+
+
+def matrices_to_euler_xzy(matrices: np.ndarray) -> np.ndarray:
+    """Convert `(n, 3, 3)` rotation matrices to `(n, 3)` XZY Euler angles (radians).
+
+    Batched equivalent of `Matrix3.to_euler_angles_rad()`, including its handling of gimbal lock.
+    """
+    m = matrices
+    eulers = np.empty((len(m), 3))
+    is_unique = (m[:, 1, 0] < 1) & (m[:, 1, 0] > -1)
+    eulers[:, 0] = np.where(is_unique, np.arctan2(-m[:, 1, 2], m[:, 1, 1]), 0.0)
+    eulers[:, 2] = np.where(is_unique, np.arcsin(np.clip(m[:, 1, 0], -1.0, 1.0)), np.copysign(np.pi / 2, m[:, 1, 0]))
+    locked_y = np.copysign(1.0, m[:, 1, 0]) * np.arctan2(m[:, 2, 1], m[:, 2, 2])
+    eulers[:, 1] = np.where(is_unique, np.arctan2(-m[:, 2, 0], m[:, 0, 0]), locked_y)
+    return eulers
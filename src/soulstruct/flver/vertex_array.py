@@ -5,10 +5,13 @@ __all__ = [
     "VertexDataSizeError",
 ]
 
+import hashlib
 import logging
+import typing as tp
 from dataclasses import dataclass
 
 import numpy as np
+from numpy.lib.recfunctions import repack_fields
 
 from soulstruct.exceptions import SoulstructError
 from soulstruct.utilities.binary import *
@@ -35,9 +38,16 @@ class VertexDataSizeError(SoulstructError):
         )
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, init=False)
 class VertexArray:
-    """Wraps a structured NumPy array containing vertex data for a particular FLVER mesh."""
+    """Wraps a structured NumPy array containing vertex data for a particular FLVER mesh.
+
+    If read with `lazy=True`, the vertex array instead keeps a read-only view of the raw (compressed) FLVER array data
+    and only decompresses it when needed. Fields accessed with `vertex_array[name]` are decompressed and cached one at a
+    time (and are read-only), so e.g. just vertex positions can be used cheaply. Accessing `array` or setting any data
+    decompresses the whole array and ends lazy mode. A lazy array that is never decompressed as a whole is packed back
+    to its original bytes.
+    """
 
     class HEADER0(BinaryStruct):
         """Header information about a packed FLVER0 vertex data array, which we read into a NumPy structured array."""
@@ -56,8 +66,28 @@ class VertexArray:
         array_length: int
         array_offset: int
 
-    array: np.ndarray
+    _array: np.ndarray | None
     layout: VertexArrayLayout
+    # Lazy mode only.
+    _raw_array: np.ndarray | None
+    _uv_factor: int | None
+    _fields: dict[str, np.ndarray]
+
+    def __init__(self, array: np.ndarray, layout: VertexArrayLayout):
+        self._array = array
+        self.layout = layout
+        self._raw_array = None
+        self._uv_factor = None
+        self._fields = {}
+
+    @classmethod
+    def from_raw_array(cls, raw_array: np.ndarray, layout: VertexArrayLayout, uv_factor: int) -> tp.Self:
+        """Create a lazy vertex array from a structured array of compressed vertex data (see
+        `VertexArrayLayout.view_vertex_array()`), which will only be decompressed with `uv_factor` when accessed."""
+        vertex_array = cls(None, layout)
+        vertex_array._raw_array = raw_array
+        vertex_array._uv_factor = uv_factor
+        return vertex_array
 
     @classmethod
     def from_flver0_reader(
@@ -67,13 +97,15 @@ class VertexArray:
         layouts: list[VertexArrayLayout],
         vertex_data_offset: int,  # from `FLVER0` header
         uv_factor: int,
+        lazy=False,
     ):
         layout = layouts[array_header.layout_index]
         with flver_reader.temp_offset(vertex_data_offset + array_header.array_offset):
             array_data = flver_reader.read(array_header.array_length)
-            array = layout.unpack_vertex_array(array_data, uv_factor)
 
-        return cls(array, layout)
+        if lazy:
+            return cls.from_raw_array(layout.view_vertex_array(array_data), layout, uv_factor)
+        return cls(layout.unpack_vertex_array(array_data, uv_factor), layout)
 
     @classmethod
     def from_flver2_reader(
@@ -83,6 +115,7 @@ class VertexArray:
         layouts: list[VertexArrayLayout],
         vertex_data_offset: int,
         uv_factor: int,
+        lazy=False,
     ):
         if array_header.vertex_size != array_header.array_length / array_header.vertex_count:
             _LOGGER.warning(
@@ -107,9 +140,10 @@ class VertexArray:
                         f"FLVER vertex array data appears to be a known corrupted case from DS1R (Map Piece "
                         f"{corrupted_key}). You may want to replace its vertex data from the same model in PTDE!"
                     )
-            array = layout.unpack_vertex_array(array_data, uv_factor)
 
-        return cls(array, layout)
+        if lazy:
+            return cls.from_raw_array(layout.view_vertex_array(array_data), layout, uv_factor)
+        return cls(layout.unpack_vertex_array(array_data, uv_factor), layout)
 
     @classmethod
     def read_flver0_header_list(cls, reader: BinaryReader) -> list[HEADER0]:
@@ -130,7 +164,7 @@ class VertexArray:
     ):
         """Note that `layout_index` will be into a merged FLVER-wide list."""
         layout_size = self.layout.get_total_data_size(include_ignored=False)
-        vertex_count = len(self.array)
+        vertex_count = len(self)
         self.HEADER0.object_to_writer(
             self,
             writer,
@@ -148,7 +182,7 @@ class VertexArray:
     ):
         """Note that `layout_index` will be into a merged FLVER-wide list."""
         layout_size = self.layout.get_total_data_size(include_ignored=False)
-        vertex_count = len(self.array)
+        vertex_count = len(self)
         self.HEADER2.object_to_writer(
             self,
             writer,
@@ -166,32 +200,90 @@ class VertexArray:
         array_offset: int,
         uv_factor: int,
     ):
-        """Identical for FLVER0 and FLVER2 versions."""
+        """Identical for FLVER0 and FLVER2 versions.
+
+        Lazy arrays that were never decompressed as a whole are written back unchanged (minus any `VertexIgnore` data),
+        unless `uv_factor` has changed.
+        """
         writer.fill("array_offset", array_offset, obj=self)
-        writer.append(self.layout.pack_vertex_array(self.array, uv_factor))
+        if self._array is None and uv_factor == self._uv_factor:
+            writer.append(repack_fields(self._raw_array).tobytes())
+        else:
+            writer.append(self.layout.pack_vertex_array(self.array, uv_factor))
 
     # region Vertex Array Methods
 
+    @property
+    def array(self) -> np.ndarray:
+        """Structured array of decompressed vertex data. Decompressed on first access if lazy."""
+        if self._array is None:
+            self._array = self.layout.decompress_vertex_array(self._raw_array, self._uv_factor, self._fields)
+            self._raw_array = None
+            self._uv_factor = None
+            self._fields = {}
+        return self._array
+
+    @array.setter
+    def array(self, value: np.ndarray):
+        self._array = value
+        self._raw_array = None
+        self._uv_factor = None
+        self._fields = {}
+
+    @property
+    def is_lazy(self) -> bool:
+        """Vertex data has not been decompressed as a whole yet."""
+        return self._array is None
+
+    def get_data_hash(self) -> bytes:
+        """Get BLAKE2b hash of vertex data and its dtype, without decompressing lazy arrays.
+
+        Lazy arrays hash their raw (compressed) data and UV factor instead, so they do NOT have the same hash as a fully
+        decompressed copy of the same data.
+        """
+        if self._array is None:
+            data_hash = hashlib.blake2b(f"raw|{self._uv_factor}|{self._raw_array.dtype.descr}".encode())
+            data_hash.update(np.ascontiguousarray(self._raw_array).data)
+        else:
+            data_hash = hashlib.blake2b(f"array|{self._array.dtype.descr}".encode())
+            data_hash.update(np.ascontiguousarray(self._array).data)
+        return data_hash.digest()
+
     def has_field(self, name: str) -> bool:
-        return name in self.array.dtype.names
+        return name in self.dtype.names
 
     @property
     def dtype(self) -> np.dtype:
-        """Wraps NumPy array dtype."""
-        return self.array.dtype
+        """Wraps NumPy array dtype (without decompressing lazy arrays)."""
+        if self._array is None:
+            return self.layout.get_dtypes()[1]
+        return self._array.dtype
 
     @property
     def guess_has_normal_w_bone_indices(self):
         """Just checks if ANY `normal_w` values are not 127 and not 0."""
-        if "bone_indices" in self.array.dtype.names:
+        if "bone_indices" in self.dtype.names:
             return False  # has REAL bone indices
-        if "normal_w" not in self.array.dtype.names:
+        if "normal_w" not in self.dtype.names:
             return False
         # Check if any normal_w values are not 127 and not 0.
-        return np.any((self.array["normal_w"] != 127) & (self.array["normal_w"] != 0))
+        normal_w = self["normal_w"]
+        return np.any((normal_w != 127) & (normal_w != 0))
 
     def __getitem__(self, key):
-        """Wraps NumPy array indexing."""
+        """Wraps NumPy array indexing.
+
+        Fields of lazy arrays are decompressed and cached individually, and are read-only. Use `array` (or item
+        assignment on this vertex array) to modify them.
+        """
+        if self._array is None and isinstance(key, str):
+            try:
+                return self._fields[key]
+            except KeyError:
+                field_array = self.layout.decompress_field(self._raw_array, key, self._uv_factor)
+                field_array.flags.writeable = False
+                self._fields[key] = field_array
+                return field_array
         return self.array[key]
 
     def __setitem__(self, key, value):
@@ -200,6 +292,8 @@ class VertexArray:
 
     def __len__(self):
         """Wraps NumPy array length."""
-        return len(self.array)
+        if self._array is None:
+            return len(self._raw_array)
+        return len(self._array)
 
     # endregion
@@ -612,44 +612,83 @@ class VertexArrayLayout:
 
     # region Array Methods
 
-    def _ignore_data(self, data: bytes) -> bytes:
-        """Remove any bytes in each vertex that correspond to `VertexIgnore` data types.
-
-        TODO: Probably would be better to have a `compressed_dtype` that supported the `asserted` data type, so
-         we can slice out the data more efficiently.
+    def get_raw_dtype(self) -> np.dtype:
+        """Get compressed NumPy dtype that spans the full vertex size of raw FLVER array data, including any
+        `VertexIgnore` data types, which are skipped with field offsets. Used to view raw array data without copying.
+        """
+        compressed_dtype, _ = self.get_dtypes()
+        if not any(isinstance(data_type, VertexIgnore) for data_type in self.read_types):
+            return compressed_dtype
+
+        field_names = iter(compressed_dtype.names)
+        offsets = []
+        ignored_size = 0
+        for data_type in self.read_types:
+            if isinstance(data_type, VertexIgnore):
+                ignored_size += data_type.size
+                continue
+            for _ in data_type.get_format().compressed_dtype:
+                offsets.append(compressed_dtype.fields[next(field_names)][1] + ignored_size)
+        return np.dtype({
+            "names": compressed_dtype.names,
+            "formats": [compressed_dtype.fields[name][0] for name in compressed_dtype.names],
+            "offsets": offsets,
+            "itemsize": self.get_total_data_size(include_ignored=True),
+        })
+
+    def view_vertex_array(self, data: bytes) -> np.ndarray:
+        """View raw FLVER array data as a (read-only) structured array of compressed vertex data, without copying it.
+
+        Any trailing bytes that do not make up a full vertex are ignored.
         """
-        vertex_count = len(data) // self.get_total_data_size(include_ignored=True)
-        kept_data = bytearray()
-        data_offset = 0
-        for _ in range(vertex_count):
-            for data_type in self.read_types:
-                data_type_bytes = data[data_offset:data_offset + data_type.size]
-                if not isinstance(data_type, VertexIgnore):
-                    kept_data.extend(data_type_bytes)
-                    data_offset += data_type.size
-                    continue
-                # Otherwise, ignore data.
-                data_offset += data_type.size
-
-        return bytes(kept_data)
+        raw_dtype = self.get_raw_dtype()
+        return np.frombuffer(data, dtype=raw_dtype, count=len(data) // raw_dtype.itemsize)
 
     def unpack_vertex_array(self, data: bytes, uv_factor: int) -> np.ndarray:
         """Use this layout to read a structured array of vertex data from the given raw FLVER array data."""
-        compressed_dtype, decompressed_dtype = self.get_dtypes()
-        codecs = self.get_codecs(uv_factor=uv_factor)
+        return self.decompress_vertex_array(self.view_vertex_array(data), uv_factor)
 
-        # First, we check for any `assert_and_discard` data types, validate their data, and remove it.
-        if any(isinstance(data_type, VertexIgnore) for data_type in self.read_types):
-            data = self._ignore_data(data)
+    def decompress_vertex_array(
+        self,
+        raw_array: np.ndarray,
+        uv_factor: int,
+        decompressed_fields: dict[str, np.ndarray] = None,
+    ) -> np.ndarray:
+        """Decompress every field of `raw_array` (from `view_vertex_array()`) into a new structured array.
 
-        compressed_array = np.frombuffer(data, dtype=compressed_dtype)
-        decompressed_array = np.empty(len(compressed_array), dtype=decompressed_dtype)
+        Fields already in `decompressed_fields` (from `decompress_field()`) are copied rather than decompressed again.
+        """
+        _, decompressed_dtype = self.get_dtypes()
+        codecs = self.get_codecs(uv_factor=uv_factor)
+        if decompressed_fields is None:
+            decompressed_fields = {}
+
+        decompressed_array = np.empty(len(raw_array), dtype=decompressed_dtype)
         for codec, (name, dtype) in zip(codecs, decompressed_dtype.fields.items()):
+            if name in decompressed_fields:
+                decompressed_array[name] = decompressed_fields[name]
+                continue
             # NOTE: Very important to cast array to decompressed dtype FIRST, before decompressing.
-            compressed_subarray = compressed_array[name].astype(dtype[0].base)
+            compressed_subarray = raw_array[name].astype(dtype[0].base)
             decompressed_array[name] = codec.decompress(compressed_subarray)
         return decompressed_array
 
+    def decompress_field(self, raw_array: np.ndarray, name: str, uv_factor: int) -> np.ndarray:
+        """Decompress a single field of `raw_array` (from `view_vertex_array()`) into a new array.
+
+        Raises a `ValueError` if the layout has no field `name`, like indexing a structured array.
+        """
+        _, decompressed_dtype = self.get_dtypes()
+        if name not in decompressed_dtype.names:
+            raise ValueError(f"no field of name {name}")
+        codec = self.get_codecs(uv_factor=uv_factor)[decompressed_dtype.names.index(name)]
+        field_dtype = decompressed_dtype.fields[name][0]
+
+        field_array = np.empty(len(raw_array), dtype=field_dtype)
+        # NOTE: Very important to cast array to decompressed dtype FIRST, before decompressing.
+        field_array[...] = codec.decompress(raw_array[name].astype(field_dtype.base))
+        return field_array
+
     def pack_vertex_array(self, array: np.ndarray, uv_factor: int) -> bytes:
         """Use this layout to pack a structured array of vertex data into raw FLVER array data."""
         compressed_dtype, decompressed_dtype = self.get_dtypes()
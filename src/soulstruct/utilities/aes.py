@@ -0,0 +1,233 @@
+"""AES-256 in CBC mode (without padding), for encrypting and decrypting game files such as `regulation.bin`.
+
+Uses the `cryptography` package if it is installed. Otherwise, falls back to the table-based implementation in this
+module: decryption handles all blocks at once with NumPy (CBC decryption is not chained), while encryption must process
+one block at a time in pure Python, and is therefore much slower (a few seconds for a typical regulation file).
+"""
+from __future__ import annotations
+
+__all__ = [
+    "aes_cbc_decrypt",
+    "aes_cbc_encrypt",
+    "AES_BLOCK_SIZE",
+]
+
+import functools
+import logging
+import typing as tp
+
+import numpy as np
+
+try:
+    # noinspection PyPackageRequirements
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+except ImportError:
+    Cipher = algorithms = modes = None
+
+_LOGGER = logging.getLogger(__name__)
+
+AES_BLOCK_SIZE = 16
+
+
+def aes_cbc_decrypt(key: bytes, iv: bytes, data: bytes, use_cryptography=True) -> bytes:
+    """Decrypt `data` (a whole number of blocks) with AES-256-CBC.
+
+    `use_cryptography=False` forces the fallback implementation in this module.
+    """
+    _check_args(key, iv, data)
+    if use_cryptography and Cipher is not None:
+        decryptor = Cipher(algorithms.AES(key), modes.CBC(iv)).decryptor()
+        return decryptor.update(data) + decryptor.finalize()
+
+    if not data:
+        return b""
+    tables = _get_tables()
+    td0, td1, td2, td3 = tables.td_arrays
+    round_keys = _get_decryption_round_keys(key)
+    cipher_words = np.frombuffer(data, dtype=">u4").reshape(-1, 4).astype(np.uint32)
+    s0, s1, s2, s3 = (cipher_words[:, i] ^ round_keys[0][i] for i in range(4))
+    for rk in round_keys[1:-1]:
+        s0, s1, s2, s3 = (
+            td0[s0 >> 24] ^ td1[(s3 >> 16) & 0xFF] ^ td2[(s2 >> 8) & 0xFF] ^ td3[s1 & 0xFF] ^ rk[0],
+            td0[s1 >> 24] ^ td1[(s0 >> 16) & 0xFF] ^ td2[(s3 >> 8) & 0xFF] ^ td3[s2 & 0xFF] ^ rk[1],
+            td0[s2 >> 24] ^ td1[(s1 >> 16) & 0xFF] ^ td2[(s0 >> 8) & 0xFF] ^ td3[s3 & 0xFF] ^ rk[2],
+            td0[s3 >> 24] ^ td1[(s2 >> 16) & 0xFF] ^ td2[(s1 >> 8) & 0xFF] ^ td3[s0 & 0xFF] ^ rk[3],
+        )
+    rk = round_keys[-1]
+    inv_sbox = tables.inv_sbox_array
+    plain_words = np.empty_like(cipher_words)
+    for i, (a, b, c, d) in enumerate(((s0, s3, s2, s1), (s1, s0, s3, s2), (s2, s1, s0, s3), (s3, s2, s1, s0))):
+        plain_words[:, i] = (
+            (inv_sbox[a >> 24] << 24)
+            ^ (inv_sbox[(b >> 16) & 0xFF] << 16)
+            ^ (inv_sbox[(c >> 8) & 0xFF] << 8)
+            ^ inv_sbox[d & 0xFF]
+            ^ rk[i]
+        )
+
+    # CBC: XOR each decrypted block with the previous cipher block (or IV).
+    previous_words = np.empty_like(cipher_words)
+    previous_words[0] = np.frombuffer(iv, dtype=">u4")
+    previous_words[1:] = cipher_words[:-1]
+    plain_words ^= previous_words
+    return plain_words.astype(">u4").tobytes()
+
+
+def aes_cbc_encrypt(key: bytes, iv: bytes, data: bytes, use_cryptography=True) -> bytes:
+    """Encrypt `data` (a whole number of blocks) with AES-256-CBC.
+
+    `use_cryptography=False` forces the (slow, sequential) fallback implementation in this module.
+    """
+    _check_args(key, iv, data)
+    if use_cryptography and Cipher is not None:
+        encryptor = Cipher(algorithms.AES(key), modes.CBC(iv)).encryptor()
+        return encryptor.update(data) + encryptor.finalize()
+
+    round_keys = _get_encryption_round_keys(key)
+    first_rk, last_rk = round_keys[0], round_keys[-1]
+    middle_rks = round_keys[1:-1]
+    tables = _get_tables()
+    (te0, te1, te2, te3), sbox = tables.te, tables.sbox
+    block_words = memoryview(data).cast("B").tolist()  # faster to slice than `bytes`
+    out = bytearray(len(data))
+    c0, c1, c2, c3 = (int.from_bytes(iv[i:i + 4], "big") for i in range(0, 16, 4))
+    for offset in range(0, len(data), 16):
+        b = block_words[offset:offset + 16]
+        s0 = ((b[0] << 24) | (b[1] << 16) | (b[2] << 8) | b[3]) ^ c0 ^ first_rk[0]
+        s1 = ((b[4] << 24) | (b[5] << 16) | (b[6] << 8) | b[7]) ^ c1 ^ first_rk[1]
+        s2 = ((b[8] << 24) | (b[9] << 16) | (b[10] << 8) | b[11]) ^ c2 ^ first_rk[2]
+        s3 = ((b[12] << 24) | (b[13] << 16) | (b[14] << 8) | b[15]) ^ c3 ^ first_rk[3]
+        for rk in middle_rks:
+            s0, s1, s2, s3 = (
+                te0[s0 >> 24] ^ te1[(s1 >> 16) & 0xFF] ^ te2[(s2 >> 8) & 0xFF] ^ te3[s3 & 0xFF] ^ rk[0],
+                te0[s1 >> 24] ^ te1[(s2 >> 16) & 0xFF] ^ te2[(s3 >> 8) & 0xFF] ^ te3[s0 & 0xFF] ^ rk[1],
+                te0[s2 >> 24] ^ te1[(s3 >> 16) & 0xFF] ^ te2[(s0 >> 8) & 0xFF] ^ te3[s1 & 0xFF] ^ rk[2],
+                te0[s3 >> 24] ^ te1[(s0 >> 16) & 0xFF] ^ te2[(s1 >> 8) & 0xFF] ^ te3[s2 & 0xFF] ^ rk[3],
+            )
+        c0 = ((sbox[s0 >> 24] << 24) | (sbox[(s1 >> 16) & 0xFF] << 16)
+              | (sbox[(s2 >> 8) & 0xFF] << 8) | sbox[s3 & 0xFF]) ^ last_rk[0]
+        c1 = ((sbox[s1 >> 24] << 24) | (sbox[(s2 >> 16) & 0xFF] << 16)
+              | (sbox[(s3 >> 8) & 0xFF] << 8) | sbox[s0 & 0xFF]) ^ last_rk[1]
+        c2 = ((sbox[s2 >> 24] << 24) | (sbox[(s3 >> 16) & 0xFF] << 16)
+              | (sbox[(s0 >> 8) & 0xFF] << 8) | sbox[s1 & 0xFF]) ^ last_rk[2]
+        c3 = ((sbox[s3 >> 24] << 24) | (sbox[(s0 >> 16) & 0xFF] << 16)
+              | (sbox[(s1 >> 8) & 0xFF] << 8) | sbox[s2 & 0xFF]) ^ last_rk[3]
+        out[offset:offset + 16] = (
+            c0.to_bytes(4, "big") + c1.to_bytes(4, "big") + c2.to_bytes(4, "big") + c3.to_bytes(4, "big")
+        )
+    return bytes(out)
+
+
+def _check_args(key: bytes, iv: bytes, data: bytes):
+    if len(key) != 32:
+        raise ValueError(f"AES-256 key must be 32 bytes, not {len(key)}.")
+    if len(iv) != AES_BLOCK_SIZE:
+        raise ValueError(f"AES IV must be {AES_BLOCK_SIZE} bytes, not {len(iv)}.")
+    if len(data) % AES_BLOCK_SIZE != 0:
+        raise ValueError(f"AES-CBC data size must be a multiple of {AES_BLOCK_SIZE} bytes (no padding): {len(data)}")
+
+
+class _Tables(tp.NamedTuple):
+    sbox: list[int]
+    te: tuple[list[int], ...]  # encryption round tables
+    td: tuple[list[int], ...]  # decryption round tables
+    td_arrays: tuple[np.ndarray, ...]  # decryption round tables as `uint32` arrays, for NumPy block decryption
+    inv_sbox_array: np.ndarray
+
+
+@functools.cache
+def _get_tables() -> _Tables:
+    """Build S-boxes and combined round tables (as in the reference 'T-table' implementation) on first use, from
+    logarithm and antilogarithm tables of GF(2^8) with generator 3."""
+    exp = [0] * 255
+    log = [0] * 256
+    value = 1
+    for i in range(255):
+        exp[i] = value
+        log[value] = i
+        value ^= (value << 1) ^ (0x11B if value & 0x80 else 0)  # multiply by 3
+
+    def gf_mul(a: int, b: int) -> int:
+        return exp[(log[a] + log[b]) % 255] if a and b else 0
+
+    sbox = [0] * 256
+    inv_sbox = [0] * 256
+    for x in range(256):
+        # Multiplicative inverse in GF(2^8), followed by the affine transform.
+        inverse = exp[-log[x]] if x else 0
+        s = inverse
+        for shift in range(1, 5):
+            s ^= ((inverse << shift) | (inverse >> (8 - shift))) & 0xFF
+        s ^= 0x63
+        sbox[x] = s
+        inv_sbox[s] = x
+
+    def ror(word: int, bits: int) -> int:
+        return ((word >> bits) | (word << (32 - bits))) & 0xFFFFFFFF
+
+    te0 = [(gf_mul(s, 2) << 24) | (s << 16) | (s << 8) | gf_mul(s, 3) for s in sbox]
+    td0 = [
+        (gf_mul(s, 0x0E) << 24) | (gf_mul(s, 0x09) << 16) | (gf_mul(s, 0x0D) << 8) | gf_mul(s, 0x0B)
+        for s in inv_sbox
+    ]
+    te = (te0, *([ror(w, bits) for w in te0] for bits in (8, 16, 24)))
+    td = (td0, *([ror(w, bits) for w in td0] for bits in (8, 16, 24)))
+    return _Tables(
+        sbox=sbox,
+        te=te,
+        td=td,
+        td_arrays=tuple(np.array(table, dtype=np.uint32) for table in td),
+        inv_sbox_array=np.array(inv_sbox, dtype=np.uint32),
+    )
+
+
+_ROUND_KEY_CACHE = {}  # type: dict[tuple[bytes, bool], list[tuple[int, int, int, int]]]
+
+
+def _get_encryption_round_keys(key: bytes) -> list[tuple[int, int, int, int]]:
+    """Expand 256-bit `key` into 15 round keys of four big-endian words each."""
+    if (key, False) in _ROUND_KEY_CACHE:
+        return _ROUND_KEY_CACHE[key, False]
+    words = [int.from_bytes(key[i:i + 4], "big") for i in range(0, 32, 4)]
+    rcon = 1
+    for i in range(8, 60):
+        temp = words[i - 1]
+        if i % 8 == 0:
+            temp = ((temp << 8) | (temp >> 24)) & 0xFFFFFFFF  # RotWord
+            temp = _sub_word(temp) ^ (rcon << 24)
+            rcon = ((rcon << 1) ^ 0x11B) if rcon & 0x80 else rcon << 1
+        elif i % 8 == 4:
+            temp = _sub_word(temp)
+        words.append(words[i - 8] ^ temp)
+    round_keys = [tuple(words[i:i + 4]) for i in range(0, 60, 4)]
+    _ROUND_KEY_CACHE[key, False] = round_keys
+    return round_keys
+
+
+def _get_decryption_round_keys(key: bytes) -> list[tuple[int, int, int, int]]:
+    """Encryption round keys in reverse order, with InvMixColumns applied to all but the first and last."""
+    if (key, True) in _ROUND_KEY_CACHE:
+        return _ROUND_KEY_CACHE[key, True]
+    encryption_keys = _get_encryption_round_keys(key)[::-1]
+    tables = _get_tables()
+    td0, td1, td2, td3 = tables.td
+    sbox = tables.sbox
+    round_keys = [encryption_keys[0]]
+    for rk in encryption_keys[1:-1]:
+        round_keys.append(tuple(
+            td0[sbox[w >> 24]] ^ td1[sbox[(w >> 16) & 0xFF]] ^ td2[sbox[(w >> 8) & 0xFF]] ^ td3[sbox[w & 0xFF]]
+            for w in rk
+        ))
+    round_keys.append(encryption_keys[-1])
+    _ROUND_KEY_CACHE[key, True] = round_keys
+    return round_keys
+
+
+def _sub_word(word: int) -> int:
+    sbox = _get_tables().sbox
+    return (
+        (sbox[word >> 24] << 24)
+        | (sbox[(word >> 16) & 0xFF] << 16)
+        | (sbox[(word >> 8) & 0xFF] << 8)
+        | sbox[word & 0xFF]
+    )
@@ -8,6 +8,9 @@ __all__ = [
     "import_arbitrary_module",
     "read_json",
     "write_json",
+    "write_json_stream",
+    "write_json_lines",
+    "iter_json_lines",
     "get_blake2b_hash",
     "get_blake2b_hash_hex",
 ]
@@ -21,6 +24,7 @@ import re
 import shutil
 import sys
 import types
+import typing as tp
 from pathlib import Path
 
 from soulstruct.exceptions import RestoreBackupError
@@ -165,6 +169,90 @@ def write_json(
         f.write(json_str)
 
 
+def write_json_stream(
+    json_path: str | Path,
+    data: dict,
+    stream_key: str,
+    items: tp.Iterable[tuple[tp.Any, tp.Any]],
+    indent=4,
+    encoding="utf-8",
+    ensure_ascii=True,
+    encoder=None,
+):
+    """Write given `data` dictionary to JSON file exactly like `write_json()`, except that the value of `stream_key`
+    (which must be a key in `data`, with any placeholder value) is a JSON object built from `items`, an iterable of
+    `(key, value)` pairs that are encoded and written one at a time.
+
+    The full dictionary for `stream_key` (e.g. all the rows of a `Param`) is never created, and `items` can be a
+    generator that creates each value just before it is written.
+    """
+    if stream_key not in data:
+        raise KeyError(f"Stream key '{stream_key}' must be present in JSON `data`.")
+
+    dumps = (encoder or json.JSONEncoder)(indent=indent, ensure_ascii=ensure_ascii).encode
+
+    if indent is None:
+        item_sep, line, inner_line = ", ", "", ""
+    else:
+        item_sep, line, inner_line = ",", "\n" + " " * indent, "\n" + " " * (2 * indent)
+
+    with Path(json_path).open("w", encoding=encoding) as f:
+        f.write("{")
+        for i, (key, value) in enumerate(data.items()):
+            if i > 0:
+                f.write(item_sep)
+            f.write(f"{line}{dumps(str(key))}: ")
+            if key != stream_key:
+                f.write(dumps(value).replace("\n", line))
+                continue
+            f.write("{")
+            item_count = 0
+            for item_key, item_value in items:
+                if item_count > 0:
+                    f.write(item_sep)
+                f.write(f"{inner_line}{dumps(str(item_key))}: {dumps(item_value).replace(chr(10), inner_line)}")
+                item_count += 1
+            f.write(f"{line}}}" if item_count else "}")
+        f.write("\n}" if data and indent is not None else "}")
+
+
+def write_json_lines(
+    json_path: str | Path,
+    header: dict,
+    items: tp.Iterable,
+    encoding="utf-8",
+    ensure_ascii=True,
+    encoder=None,
+):
+    """Write newline-delimited JSON file: the `header` dictionary on the first line, then each of `items` (e.g. `[key,
+    value]` lists, which may be generated one at a time) on its own line.
+
+    Read the file back with `iter_json_lines()`.
+    """
+    with Path(json_path).open("w", encoding=encoding) as f:
+        f.write(json.dumps(header, ensure_ascii=ensure_ascii, cls=encoder))
+        for item in items:
+            f.write("\n")
+            f.write(json.dumps(item, ensure_ascii=ensure_ascii, cls=encoder))
+        f.write("\n")
+
+
+def iter_json_lines(json_path: str | Path, encoding="utf-8") -> tp.Iterator[tp.Any]:
+    """Decode each non-empty line of newline-delimited JSON file (e.g. from `write_json_lines()`) in order.
+
+    The first value yielded is the header dictionary, if the file was written by `write_json_lines()`.
+    """
+    json_path = Path(json_path)
+    with json_path.open("r", encoding=encoding) as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as ex:
+                raise ValueError(f"Encountered JSON decode error in file {json_path} (line {line_number}): {ex}")
+
+
 def get_blake2b_hash(data: bytes | str | Path) -> bytes:
     """Get BLAKE2b hash of given `bytes` or `str`/`Path` of file."""
     if isinstance(data, (str, Path)):
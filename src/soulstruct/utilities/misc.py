@@ -6,13 +6,16 @@ __all__ = [
     "setdefault_lambda",
     "BiDict",
     "get_startupinfo",
+    "get_lazy_module_getattr",
     "Flags8",
     "IDList",
 ]
 
 import abc
+import importlib
 import logging
 import subprocess
+import sys
 import typing as tp
 
 _LOGGER = logging.getLogger(__name__)
@@ -140,6 +143,45 @@ def get_startupinfo():
     return si
 
 
+def get_lazy_module_getattr(
+    module_name: str,
+    submodules: tp.Iterable[str] = (),
+    attributes: dict[str, str] = None,
+) -> tuple[tp.Callable[[str], tp.Any], tp.Callable[[], list[str]]]:
+    """Get module-level `__getattr__` and `__dir__` functions (PEP 562) that defer expensive imports until first use.
+
+    Names in `submodules` resolve to that submodule of `module_name`. Names in `attributes` are imported from the mapped
+    module (absolute, or relative to `module_name`), e.g. `{"ATK_PARAM_ST": ".ATK_PARAM_ST"}`. Each resolved value is
+    stored in the module's globals, so later access (and `from module import *`) does not come through here again.
+
+    Usage, at the end of a package `__init__.py`:
+        `__getattr__, __dir__ = get_lazy_module_getattr(__name__, attributes={...})`
+
+    NOTE: Importing an attribute's submodule directly (e.g. `import package.ATK_PARAM_ST`) before accessing the
+    attribute will make the package attribute refer to that submodule, as with any package.
+    """
+    module_globals = sys.modules[module_name].__dict__
+    lazy_names = {name: f".{name}" for name in submodules}  # type: dict[str, str]
+    lazy_submodules = set(lazy_names)
+    if attributes:
+        lazy_names |= attributes
+
+    def __getattr__(name: str):
+        try:
+            source_module_name = lazy_names[name]
+        except KeyError:
+            raise AttributeError(f"module '{module_name}' has no attribute '{name}'") from None
+        source_module = importlib.import_module(source_module_name, module_name)
+        value = source_module if name in lazy_submodules else getattr(source_module, name)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(module_globals) | set(lazy_names))
+
+    return __getattr__, __dir__
+
+
 class Flags8(abc.ABC):
     def __init__(self, byte: int):
         if isinstance(byte, Flags8):
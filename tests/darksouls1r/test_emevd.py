@@ -1,7 +1,13 @@
+import shutil
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from soulstruct.base.events import build_cache
+from soulstruct.darksouls1r import events as events_package
 from soulstruct.darksouls1r.events import EMEVD, EventDirectory
+from soulstruct.darksouls1r.game_types import Character
 from soulstruct.utilities.inspection import Timer
 
 
@@ -30,6 +36,97 @@ class EMEVDTest(unittest.TestCase):
         with Timer("Event Directory Write from EVS"):
             evs_ed.write("_test_event_from_evs_directory")
 
+    def test_incremental_build(self):
+        vanilla_dir = Path(events_package.__file__).parent / "vanilla"
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            evs_dir = Path(temp_dir)
+            for stem in ("m10_00_00_00", "m10_01_00_00"):
+                shutil.copy2(vanilla_dir / f"{stem}.evs.py", evs_dir)
+
+            with Timer("Incremental Build (cold)"):
+                rebuilt = EventDirectory.build_incremental(evs_dir)
+            self.assertEqual(rebuilt, ["m10_00_00_00", "m10_01_00_00"])
+            built_bytes = (evs_dir / "m10_00_00_00.emevd.dcx").read_bytes()
+
+            with Timer("Incremental Build (no-op)"):
+                rebuilt = EventDirectory.build_incremental(evs_dir)
+            self.assertEqual(rebuilt, [])
+
+            # Adding an enums module imported by one script only rebuilds that script.
+            (evs_dir / "m10_01_00_00_enums.py").write_text("from soulstruct.darksouls1r.game_types import *\n")
+            evs_path = evs_dir / "m10_01_00_00.evs.py"
+            evs_source = evs_path.read_text()
+            evs_path.write_text(evs_source.replace(
+                "from soulstruct.darksouls1r.events.instructions import *\n",
+                "from soulstruct.darksouls1r.events.instructions import *\nfrom .m10_01_00_00_enums import *\n",
+                1,
+            ))
+            self.assertEqual(EventDirectory.build_incremental(evs_dir), ["m10_01_00_00"])
+            (evs_dir / "m10_01_00_00_enums.py").write_text(
+                "from soulstruct.darksouls1r.game_types import *\n\n\nclass Flags(Flag):\n    Unused = 11010999\n"
+            )
+            self.assertEqual(EventDirectory.build_incremental(evs_dir), ["m10_01_00_00"])
+            self.assertEqual((evs_dir / "m10_00_00_00.emevd.dcx").read_bytes(), built_bytes)
+
+            # A different Soulstruct version rebuilds everything.
+            with mock.patch.object(build_cache, "_SOULSTRUCT_VERSION", "0.0.0"):
+                self.assertEqual(EventDirectory.build_incremental(evs_dir), ["m10_00_00_00", "m10_01_00_00"])
+
+    def test_enums_index_cache(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            enums_path = Path(temp_dir, "m10_00_00_00_enums.py")
+            enums_path.write_text(
+                "from soulstruct.darksouls1r.game_types import *\n\n\n"
+                "class Characters(Character):\n    Knight = 1000100\n\n\n"
+                "class Flags(Flag):\n    Door = 11000100\n"
+            )
+            cache_path = Path(temp_dir, "enums_index.json")
+
+            imported = EMEVD.ENTITY_ENUMS_MANAGER([enums_path], index_cache_path=cache_path)
+            self.assertTrue(cache_path.is_file())
+            cached = EMEVD.ENTITY_ENUMS_MANAGER([enums_path], index_cache_path=cache_path)
+            self.assertIsNone(cached.modules["m10_00_00_00_enums"])  # not imported
+
+            for manager in (imported, cached):
+                manager.star_import_module_names = ["m10_00_00_00_enums"]
+                self.assertEqual(manager.check_out_enum_variable(1000100, Character), "Characters.Knight")
+                self.assertEqual(manager.check_out_enum_variable(11000100), "Flags.Door")
+                self.assertEqual([info.enum.name for info in manager.used_enums], ["Knight", "Door"])
+                with self.assertRaises(manager.MissingEnumValueError):
+                    manager.check_out_enum_variable(1000101, Character)
+
+            # Changed module invalidates cache.
+            enums_path.write_text(enums_path.read_text().replace("1000100", "1000101"))
+            changed = EMEVD.ENTITY_ENUMS_MANAGER([enums_path], index_cache_path=cache_path)
+            self.assertIsNotNone(changed.modules["m10_00_00_00_enums"])
+            self.assertIn(1000101, changed.enums["m10_00_00_00_enums"][Character])
+
+    def test_event_directory_pool(self):
+        vanilla_dir = Path(events_package.__file__).parent / "vanilla"
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+            evs_dir = temp_dir / "evs"
+            evs_dir.mkdir()
+            for stem in ("m10_00_00_00", "m10_01_00_00", "m10_02_00_00"):
+                shutil.copy2(vanilla_dir / f"{stem}.evs.py", evs_dir)
+
+            with Timer("Event Directory EVS Read (serial)"):
+                serial_ed = EventDirectory.from_path(evs_dir)
+            with Timer("Event Directory EVS Read (pool)"):
+                pool_ed = EventDirectory.from_path(evs_dir, processes=2)
+            self.assertEqual(list(serial_ed.files), list(pool_ed.files))
+            for map_stem, emevd in serial_ed.files.items():
+                self.assertEqual(bytes(emevd), bytes(pool_ed.files[map_stem]))
+
+            with Timer("Event Directory EVS Write (serial)"):
+                serial_ed.write_evs(temp_dir / "serial")
+            with Timer("Event Directory EVS Write (pool)"):
+                pool_ed.write_evs(temp_dir / "pool", processes=2)
+            for evs_path in (temp_dir / "serial").glob("*.evs.py"):
+                self.assertEqual(evs_path.read_text(), (temp_dir / "pool" / evs_path.name).read_text())
+
     def test_emevd(self):
 
         with Timer("EMEVD Binary Reader"):
@@ -1,9 +1,25 @@
+import copy
+import functools
+import json
 import os
+import shutil
+import struct
 import unittest
 from pathlib import Path
 
-from soulstruct.flver import FLVER
+import numpy as np
+
+from soulstruct.containers import Binder, BinderEntry
+from soulstruct.flver import (
+    FLVER, FLVERBone, FLVERDuplicateIndex, FLVERMesh, FaceSet, FaceSetFlags, MergedMeshCache, SkeletonArrays
+)
+from soulstruct.flver.decimation import decimate_triangles
+from soulstruct.flver.vertex_array import VertexArray
+from soulstruct.flver.vertex_array_layout import *
+from soulstruct.flver.mesh_tools import MergedMesh, SplitMeshDef
 from soulstruct.utilities.inspection import profile_function, Timer
+from soulstruct.utilities.maths import EulerRad, Vector3, SINGLE_MAX, SINGLE_MIN
+from soulstruct.utilities.misc import IDList
 
 
 class FLVERTest(unittest.TestCase):
@@ -24,11 +40,663 @@ class FLVERTest(unittest.TestCase):
         with Timer("Re-reading chr FLVER"):
             FLVER.from_path("_test_c5370.flver")
 
+    def test_merged_vertices(self):
+        """Vectorized vertex merging gives the same result as the original loop-by-loop merging."""
+        for flver_path in ("resources/c5370.flver", "resources/m2200B0A10.flver.dcx"):
+            flver = FLVER.from_path(flver_path)
+            for mesh_index, mesh in enumerate(flver.meshes):
+                if mesh_index % 3 == 1:
+                    mesh.material.display_mask = mesh_index % 2  # mask partitioning
+            mesh_material_indices = list(range(len(flver.meshes)))
+            all_vertices, loop_data = MergedMesh.build_stacked_loops(
+                flver.meshes, mesh_material_indices, None, flver_name=flver.path_name
+            )
+            inverted_normals = loop_data["loop_normals"].copy()
+            inverted_normals[::2] *= -1.0  # many inverted variants
+            for loop_normals in (loop_data["loop_normals"], inverted_normals, None):
+                kwargs = dict(
+                    meshes=flver.meshes,
+                    all_vertices=all_vertices,
+                    mesh_material_indices=mesh_material_indices,
+                    loop_normals=loop_normals,
+                    is_flver0=flver.version.is_flver0(),
+                )
+                with Timer(f"Merge vertices ({flver_path})"):
+                    vertex_data, loop_vertex_indices, faces = MergedMesh.get_merged_vertices(**kwargs)
+                expected_vertex_data, expected_loop_vertex_indices, expected_faces = get_merged_vertices_by_loop(
+                    **kwargs
+                )
+                self.assertEqual(vertex_data.tobytes(), expected_vertex_data.tobytes())
+                np.testing.assert_array_equal(loop_vertex_indices, expected_loop_vertex_indices)
+                np.testing.assert_array_equal(faces, expected_faces)
+
+    def test_lazy_vertex_arrays(self):
+        """Lazy vertex arrays decompress the same data as eager ones and write untouched data back unchanged."""
+        for flver_path in ("resources/c5370.flver", "resources/m2200B0A10.flver.dcx"):
+            with Timer(f"Reading FLVER ({flver_path})"):
+                flver = FLVER.from_path(flver_path)
+            with Timer(f"Reading FLVER lazily ({flver_path})"):
+                lazy_flver = FLVER.from_path(flver_path, lazy_vertex_arrays=True)
+            with Timer(f"Getting lazy FLVER positions ({flver_path})"):
+                for mesh in lazy_flver.meshes:
+                    _ = mesh.vertex_arrays[0]["position"]
+            self.assertEqual(bytes(lazy_flver.to_writer()), bytes(flver.to_writer()))
+            lazy_flver.refresh_bounding_boxes()
+            for mesh, lazy_mesh in zip(flver.meshes, lazy_flver.meshes):
+                lazy_array = lazy_mesh.vertex_arrays[0]
+                self.assertTrue(lazy_array.is_lazy)
+                self.assertEqual(lazy_array.dtype, mesh.vertices.dtype)
+                self.assertEqual(len(lazy_array), len(mesh.vertices))
+                for name in mesh.vertices.dtype.names:
+                    self.assertEqual(lazy_array[name].tobytes(), mesh.vertices[name].tobytes())
+                with self.assertRaises(ValueError):
+                    lazy_array["position"][0] = 0.0  # cached fields are read-only
+                with self.assertRaises(ValueError):
+                    _ = lazy_array["missing"]
+                self.assertEqual(lazy_mesh.vertices.tobytes(), mesh.vertices.tobytes())
+                self.assertFalse(lazy_array.is_lazy)
+
+        # Large array: eager unpacking vs. decompressing only positions.
+        vertex_array = flver.meshes[0].vertex_arrays[0]
+        layout = vertex_array.layout
+        data = layout.pack_vertex_array(np.resize(vertex_array.array, 500_000), uv_factor=1024)
+        with Timer("Unpacking 500k vertices"):
+            array = layout.unpack_vertex_array(data, uv_factor=1024)
+        with Timer("Unpacking 500k vertex positions lazily"):
+            lazy_array = VertexArray.from_raw_array(layout.view_vertex_array(data), layout, uv_factor=1024)
+            positions = lazy_array["position"]
+        np.testing.assert_array_equal(positions, array["position"])
+
+        # Ignored data is skipped by the raw dtype and dropped when writing.
+        ignore_layout = VertexArrayLayout(
+            VertexPosition(VertexDataFormatEnum.Float3),
+            VertexIgnore(4),
+            VertexNormal(VertexDataFormatEnum.FourBytesC),
+            VertexIgnore(8),
+            VertexUV(VertexDataFormatEnum.UV),
+        )
+        ignore_data = np.random.default_rng(0).integers(0, 256, 100 * 32, dtype=np.uint8).tobytes()
+        kept_data = b"".join(
+            ignore_data[i:i + 12] + ignore_data[i + 16:i + 20] + ignore_data[i + 28:i + 32]
+            for i in range(0, len(ignore_data), 32)
+        )
+        raw_array = ignore_layout.view_vertex_array(ignore_data)
+        self.assertEqual(len(raw_array), 100)
+        self.assertEqual(raw_array.astype(ignore_layout.get_dtypes()[0]).tobytes(), kept_data)
+
+    def test_export(self):
+        """GLB export contains the (mirrored) vertex data and a skin matching the bind pose, and OBJ export writes one
+        line per vertex and face."""
+        gwyn = FLVER.from_path("resources/c5370.flver", lazy_vertex_arrays=True)
+        with Timer("Writing chr GLB"):
+            gwyn.write_glb("_test_c5370.glb")
+        glb = Path("_test_c5370.glb").read_bytes()
+        magic, version, size = struct.unpack_from("<4sII", glb)
+        self.assertEqual((magic, version, size), (b"glTF", 2, len(glb)))
+        json_size, _ = struct.unpack_from("<II", glb, 12)
+        gltf = json.loads(glb[20:20 + json_size])
+        bin_offset = 20 + json_size + 8
+
+        def get_accessor_array(accessor_index: int) -> np.ndarray:
+            accessor = gltf["accessors"][accessor_index]
+            buffer_view = gltf["bufferViews"][accessor["bufferView"]]
+            dtype = {5123: np.uint16, 5125: np.uint32, 5126: np.float32}[accessor["componentType"]]
+            width = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4, "MAT4": 16}[accessor["type"]]
+            offset = bin_offset + buffer_view["byteOffset"]
+            return np.frombuffer(glb, dtype, accessor["count"] * width, offset).reshape(accessor["count"], width)
+
+        self.assertEqual(len(gltf["meshes"]), len(gwyn.meshes))
+        for mesh, gltf_mesh in zip(gwyn.meshes, gltf["meshes"]):
+            primitive = gltf_mesh["primitives"][0]
+            positions = get_accessor_array(primitive["attributes"]["POSITION"])
+            np.testing.assert_array_equal(positions, mesh.vertex_arrays[0]["position"] * (-1.0, 1.0, 1.0))
+            indices = get_accessor_array(primitive["indices"]).reshape(-1, 3)
+            np.testing.assert_array_equal(indices, mesh.triangulate_flver2()[:, ::-1])
+            weights = get_accessor_array(primitive["attributes"]["WEIGHTS_0"])
+            np.testing.assert_allclose(weights.sum(axis=1), 1.0, rtol=1e-6)
+            joints = get_accessor_array(primitive["attributes"]["JOINTS_0"])
+            self.assertLess(joints.max(), len(gwyn.bones))
+        self.assertTrue(all(mesh.vertex_arrays[0].is_lazy for mesh in gwyn.meshes))
+
+        # Inverse bind matrices invert each bone's (mirrored) armature space transform.
+        inverse_bind_matrices = get_accessor_array(gltf["skins"][0]["inverseBindMatrices"]).reshape(-1, 4, 4)
+        for bone, inverse_bind_matrix in zip(gwyn.bones, inverse_bind_matrices.transpose(0, 2, 1)):
+            translate, rotate, _ = bone.get_armature_space_transform()
+            bind_matrix = np.linalg.inv(inverse_bind_matrix)
+            np.testing.assert_allclose(bind_matrix[:3, 3], translate.data * (-1.0, 1.0, 1.0), atol=1e-4)
+
+        map_piece = FLVER.from_path("resources/m2200B0A10.flver.dcx")
+        with Timer("Writing map piece OBJ"):
+            map_piece.write_obj("_test_m2200B0A10.obj")
+        obj_lines = Path("_test_m2200B0A10.obj").read_text().splitlines()
+        vertex_count = sum(mesh.vertex_count for mesh in map_piece.meshes)
+        face_count = sum(
+            len(face_set.triangulate(uses_0xffff_separators=mesh.vertex_count <= 0xFFFF))
+            for mesh in map_piece.meshes for face_set in mesh.face_sets
+        )
+        self.assertEqual(sum(line.startswith("v ") for line in obj_lines), vertex_count)
+        self.assertEqual(sum(line.startswith("vn ") for line in obj_lines), vertex_count)
+        self.assertEqual(sum(line.startswith("f ") for line in obj_lines), face_count)
+        self.assertEqual(obj_lines[2], "v %.6f %.6f %.6f" % tuple(map_piece.meshes[0].vertices["position"][1]))
+        last_face = [face_vertex.split("/") for face_vertex in obj_lines[-1].split()[1:]]
+        self.assertTrue(all(len(face_vertex) == 3 and len(set(face_vertex)) == 1 for face_vertex in last_face))
+        self.assertLessEqual(max(int(face_vertex[0]) for face_vertex in last_face), vertex_count)
+
+    def test_binder_batch(self):
+        """FLVERs in binders are parsed and processed in workers, with failures giving `None` results."""
+        binder = Binder()
+        binder.add_entry(BinderEntry(Path("resources/c5370.flver").read_bytes(), 200, "c5370.flver"))
+        binder.add_entry(BinderEntry(b"not a FLVER", 201, "c5371.flver"))
+        binder.write("_test_c5370.chrbnd")
+        binder_paths = ["_test_c5370.chrbnd", "_test_missing.chrbnd"]
+        gwyn = FLVER.from_path("resources/c5370.flver")
+
+        for processes in (1, 2):
+            results = sorted(
+                FLVER.iter_from_binder_paths(
+                    binder_paths, FLVER.get_vertex_bounds, processes=processes, lazy_vertex_arrays=True
+                )
+            )
+            self.assertEqual([(str(r.binder_path), r.entry_name) for r in results], [
+                ("_test_c5370.chrbnd", "c5370.flver"),
+                ("_test_c5370.chrbnd", "c5371.flver"),
+                ("_test_missing.chrbnd", ""),
+            ])
+            self.assertEqual(results[0].result, gwyn.get_vertex_bounds())
+            self.assertIsNone(results[1].result)
+            self.assertIsNone(results[2].result)
+
+        merged_mesh_func = functools.partial(MergedMesh.from_flver, keep_flver=False)
+        (result, _) = FLVER.iter_from_binder_paths(["_test_c5370.chrbnd"], merged_mesh_func, processes=2)
+        self.assertIsNone(result.result.flver)
+        np.testing.assert_array_equal(result.result.vertex_data, MergedMesh.from_flver(gwyn).vertex_data)
+
+    def test_merged_mesh_cache(self):
+        """Cached `MergedMesh` arrays are identical to fresh conversions, and least recently used entries are evicted
+        first."""
+        cache = MergedMeshCache("_test_merged_mesh_cache")
+        cache.clear()
+        map_piece = FLVER.from_path("resources/m2200B0A10.flver.dcx")
+        uv_layer_names = [["UVTexture0", "UVLightmap"]] * len(map_piece.meshes)
+
+        with Timer("MergedMesh from map piece (cold cache)"):
+            expected = MergedMesh.from_flver(map_piece, material_uv_layer_names=uv_layer_names, cache=cache)
+        with Timer("MergedMesh from map piece (warm cache)"):
+            cached = MergedMesh.from_flver(map_piece, material_uv_layer_names=uv_layer_names, cache=cache)
+        self.assertIs(cached.flver, map_piece)
+        for name in (
+            "vertex_data", "loop_vertex_indices", "faces", "loop_normals", "loop_normals_w", "loop_bitangents"
+        ):
+            if getattr(expected, name) is None:
+                self.assertIsNone(getattr(cached, name))
+            else:
+                self.assertEqual(getattr(cached, name).tobytes(), getattr(expected, name).tobytes())
+        for name in ("loop_tangents", "loop_vertex_colors"):
+            self.assertEqual(len(getattr(cached, name)), len(getattr(expected, name)))
+            for cached_array, expected_array in zip(getattr(cached, name), getattr(expected, name)):
+                np.testing.assert_array_equal(cached_array, expected_array)
+        self.assertEqual(list(cached.loop_uvs), list(expected.loop_uvs))
+        for uv_layer_name, uv_array in expected.loop_uvs.items():
+            np.testing.assert_array_equal(cached.loop_uvs[uv_layer_name], uv_array)
+
+        # Different conversion arguments or FLVER data use new entries.
+        key = cache.get_key(map_piece, None, uv_layer_names, True)
+        self.assertNotEqual(cache.get_key(map_piece, None, uv_layer_names, False), key)
+        material_name = map_piece.meshes[0].material.name
+        map_piece.meshes[0].material.display_mask = 1
+        self.assertNotEqual(cache.get_key(map_piece, None, uv_layer_names, True), key)
+        map_piece.meshes[0].material.name = material_name
+        self.assertEqual(cache.get_key(map_piece, None, uv_layer_names, True), key)
+        map_piece.meshes[0].vertex_arrays[0]["position"][0, 0] += 1.0
+        self.assertNotEqual(cache.get_key(map_piece, None, uv_layer_names, True), key)
+
+        gwyn = FLVER.from_path("resources/c5370.flver")
+        gwyn_key = cache.get_key(gwyn)
+        merged_meshes = MergedMesh.from_flver_batch([gwyn, map_piece], [((), (), True), ((), (), True)], cache=cache)
+        self.assertIs(merged_meshes[0].flver, gwyn)
+        self.assertIsNotNone(cache.get(gwyn_key))
+        entry_sizes = [path.stat().st_size for path in cache.cache_directory.glob("*.npz")]
+        self.assertEqual(len(entry_sizes), 3)
+        self.assertEqual(cache.total_size, sum(entry_sizes))  # running total, without rescanning
+        gwyn_size = (cache.cache_directory / f"{gwyn_key}.npz").stat().st_size
+
+        # Touching the first entry (with a hit) means the map piece batch entry is evicted first.
+        os.utime(cache.cache_directory / f"{key}.npz", ns=(0, 0))
+        cache.get(key)
+        cache.max_size = (cache.cache_directory / f"{key}.npz").stat().st_size
+        cache.evict()
+        self.assertEqual([path.stem for path in cache.cache_directory.glob("*.npz")], [key])
+        self.assertEqual(cache.total_size, cache.max_size)
+        # Putting a new entry pushes the running total past `max_size`, which evicts the older entry.
+        cache.max_size = max(cache.max_size, gwyn_size)
+        cache.put(gwyn_key, merged_meshes[0])
+        self.assertEqual([path.stem for path in cache.cache_directory.glob("*.npz")], [gwyn_key])
+        cache.clear()
+
+    def test_triangle_strips(self):
+        """Stripified triangles triangulate back to the same triangles (with the same winding), including after writing
+        split meshes with strips to a FLVER, and benchmark a 500k-triangle grid."""
+        for vertex_count, uses_0xffff_separators in ((101 * 101, True), (501 * 501, False)):
+            triangles = self.make_grid_triangles(round(vertex_count ** 0.5))
+            with Timer(f"Stripify {len(triangles)} triangles"):
+                strip = FaceSet.stripify(triangles, uses_0xffff_separators)
+            face_set = FaceSet(0, True, True, 0, strip)
+            with Timer(f"Triangulate {len(strip)}-index strip"):
+                strip_triangles = face_set.triangulate(uses_0xffff_separators)
+            # Grid rows strip to about one index per triangle, plus row restarts (a third of the triangle list size).
+            self.assertLess(len(strip), triangles.size * 0.35)
+            self.assertEqual(face_set.get_face_counts(uses_0xffff_separators)[0], len(triangles))
+            np.testing.assert_array_equal(self.get_canonical_triangles(strip_triangles), triangles)
+
+        gwyn = FLVER.from_path("resources/c5370.flver")
+        merged = MergedMesh.from_flver(gwyn, merge_vertices=False)
+        split_mesh_defs = SplitMeshDef.get_defs_from_flver(gwyn)
+        list_meshes = merged.split_mesh(split_mesh_defs)
+        gwyn.meshes = merged.split_mesh(split_mesh_defs, use_triangle_strips=True)
+        gwyn.write("_test_c5370_strips.flver")
+        strip_meshes = FLVER.from_path("_test_c5370_strips.flver").meshes
+        self.assertEqual(len(strip_meshes), len(list_meshes))
+        for strip_mesh, list_mesh in zip(strip_meshes, list_meshes):
+            self.assertTrue(strip_mesh.face_sets[0].is_triangle_strip)
+            np.testing.assert_array_equal(
+                self.get_canonical_triangles(strip_mesh.triangulate_flver2()),
+                self.get_canonical_triangles(list_mesh.face_sets[0].vertex_indices),
+            )
+
+    def test_subsplit_faces(self):
+        """Array-based bone subsplits match greedy set-based subsplits."""
+        rng = np.random.default_rng(3)
+        # Neighboring faces use nearby bones (as in real meshes), with some unused (-1) indices.
+        face_bone_indices = np.arange(500_000)[:, np.newaxis] // 2000 + rng.integers(0, 16, (500_000, 12))
+        face_bone_indices[rng.random(face_bone_indices.shape) < 0.3] = -1
+        for max_bones in (38, 20):
+            expected_ends = []
+            bones = set()
+            with Timer(f"Subsplit {len(face_bone_indices)} faces with sets (max {max_bones} bones)"):
+                for face_index, face_bones in enumerate(face_bone_indices.tolist()):
+                    new_bones = bones | set(face_bones)
+                    if len(new_bones - {-1}) > max_bones:
+                        expected_ends.append(face_index)
+                        new_bones = set(face_bones)
+                    bones = new_bones
+                expected_ends.append(len(face_bone_indices))
+
+            with Timer(f"Subsplit {len(face_bone_indices)} faces (max {max_bones} bones)"):
+                face_indices = MergedMesh.get_subsplit_face_indices(face_bone_indices, max_bones)
+            self.assertEqual(face_indices, [0] + expected_ends)
+
+    def test_lod_face_sets(self):
+        """Decimate a 100k-triangle sphere, and generate LOD face sets for Gwyn that survive writing."""
+        positions, triangles = self.make_sphere_triangles(160, 316)
+        for ratio in (0.5, 0.1, 0.01):
+            target_triangle_count = int(len(triangles) * ratio)
+            with Timer(f"Decimate {len(triangles)} triangles to {target_triangle_count}"):
+                lod_triangles = decimate_triangles(positions, triangles, target_triangle_count)
+            self.assertAlmostEqual(len(lod_triangles), target_triangle_count, delta=target_triangle_count * 0.1)
+            # Still closed and manifold (every edge used by exactly two triangles, in opposite directions).
+            edges = lod_triangles[:, [0, 1, 1, 2, 2, 0]].reshape((-1, 2))
+            self.assertEqual(len(np.unique(edges, axis=0)), len(edges))
+            self.assertEqual(len(np.unique(np.sort(edges, axis=1), axis=0)) * 2, len(edges))
+
+        gwyn = FLVER.from_path("resources/c5370.flver")
+        old_face_set_flags = [[face_set.flags for face_set in mesh.face_sets] for mesh in gwyn.meshes]
+        with Timer(f"Create LOD face sets for {len(gwyn.meshes)} meshes"):
+            for mesh in gwyn.meshes:
+                mesh.create_lod_face_sets((0.5, 0.2))
+        gwyn.write("_test_c5370_lods.flver")
+        for mesh, old_flags in zip(FLVER.from_path("_test_c5370_lods.flver").meshes, old_face_set_flags):
+            # Vanilla meshes already have LOD face sets for each base face set (except one mesh with only LOD2).
+            self.assertEqual([face_set.flags for face_set in mesh.face_sets], old_flags)
+            uses_0xffff_separators = mesh.vertex_count < 0xFFFF
+            face_counts = [face_set.get_face_counts(uses_0xffff_separators)[0] for face_set in mesh.face_sets]
+            lod_flags = FaceSetFlags.LodLevel1 | FaceSetFlags.LodLevel2
+            for i, face_set in enumerate(mesh.face_sets[1:], start=1):
+                previous_flags = mesh.face_sets[i - 1].flags
+                if face_set.flags & lod_flags and face_set.flags & ~lod_flags == previous_flags & ~lod_flags:
+                    self.assertLessEqual(face_counts[i], face_counts[i - 1])  # LOD level of previous face set
+
+        with self.assertRaises(ValueError):
+            gwyn.meshes[0].create_lod_face_sets((0.2, 0.5))
+
+    def test_skeleton_arrays(self):
+        """Compare batched bone transforms with per-bone parent chains, and benchmark a large synthetic skeleton."""
+        gwyn = FLVER.from_path("resources/c5370.flver")
+        synthetic = self.make_synthetic_flver(gwyn, bone_count=5000, vertex_count=1000)
+        for flver in (gwyn, synthetic):
+            with Timer(f"Get armature space transforms of {len(flver.bones)} bones"):
+                arma_translates, arma_rotates, _ = flver.get_skeleton_arrays().get_armature_space_transforms()
+            with Timer(f"Get armature space transforms of {len(flver.bones)} bones with parent chains"):
+                expected_transforms = [bone.get_armature_space_transform() for bone in flver.bones]
+            np.testing.assert_allclose(arma_translates, [t.data for t, _, _ in expected_transforms], atol=1e-9)
+            np.testing.assert_allclose(arma_rotates, [r.data for _, r, _ in expected_transforms], atol=1e-9)
+
+            # Setting armature space transforms recovers local transforms.
+            old_skeleton = flver.get_skeleton_arrays()
+            with Timer(f"Set armature space transforms of {len(flver.bones)} bones"):
+                flver.set_bone_armature_space_transforms(flver.get_bone_armature_space_transforms())
+            skeleton = flver.get_skeleton_arrays()
+            # Bones near gimbal lock lose some precision in Euler angles (as with `Matrix3.to_euler_angles_rad()`).
+            np.testing.assert_allclose(skeleton.translates, old_skeleton.translates, atol=1e-6)
+            np.testing.assert_allclose(skeleton.rotates, old_skeleton.rotates, atol=1e-6)
+
+            # New bone list has the same hierarchy as `FLVER.set_bone_children_siblings()`.
+            new_bones = skeleton.to_bones()
+            np.testing.assert_array_equal(SkeletonArrays.from_bones(new_bones).parent_indices, skeleton.parent_indices)
+            flver.set_bone_children_siblings()
+            for bone, new_bone in zip(flver.bones, new_bones):
+                for connection_name in ("parent", "child", "next_sibling", "previous_sibling"):
+                    connected_bone = getattr(bone, f"{connection_name}_bone")
+                    new_connected_bone = getattr(new_bone, f"{connection_name}_bone")
+                    if connected_bone is None:
+                        self.assertIsNone(new_connected_bone)
+                    else:
+                        self.assertEqual(
+                            flver.bones.index(connected_bone), new_bones.index(new_connected_bone), connection_name
+                        )
+
+        gwyn.bones[1].parent_bone = gwyn.bones[2]
+        gwyn.bones[2].parent_bone = gwyn.bones[1]
+        with self.assertRaises(ValueError):
+            gwyn.get_bone_armature_space_transforms()
+
+    def test_duplicate_index(self):
+        """Exact and near-duplicate FLVERs, meshes, and mesh parts are found across binders and loose FLVER files, with
+        the same hashes in worker processes."""
+        shutil.rmtree("_test_dedup", ignore_errors=True)
+        self.addCleanup(shutil.rmtree, "_test_dedup", ignore_errors=True)
+        self.addCleanup(Path("_test_dedup.json").unlink, missing_ok=True)
+        gwyn_data = Path("resources/c5370.flver").read_bytes()
+        # Same shape as Gwyn's first mesh, but with different normals.
+        gwyn_variant = FLVER.from_bytes(gwyn_data)
+        gwyn_variant.meshes[0].vertices["normal"] *= -1.0
+        binder = Binder()
+        binder.add_entry(BinderEntry(gwyn_data, 200, "c5370.flver"))
+        binder.add_entry(BinderEntry(gwyn_variant.to_bytes(), 201, "c5371.flver"))
+        binder.add_entry(BinderEntry(b"not a FLVER", 202, "c5372.flver"))
+        binder.write("_test_dedup/chr/c5370.chrbnd")
+        for name in ("m2200B0A10", "m2200B1A10"):
+            Path(f"_test_dedup/map/{name}.flver.dcx").parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy("resources/m2200B0A10.flver.dcx", f"_test_dedup/map/{name}.flver.dcx")
+
+        with Timer("Index duplicates (one process)"):
+            index = FLVERDuplicateIndex.from_directory("_test_dedup", processes=1)
+        with Timer("Index duplicates (two processes)"):
+            mp_index = FLVERDuplicateIndex.from_directory("_test_dedup", processes=2)
+        self.assertEqual(mp_index.to_dict(), index.to_dict())
+        self.assertEqual(index.failed_paths, [str(Path("_test_dedup/chr/c5370.chrbnd")) + "/c5372.flver"])
+        self.assertIn("FLVERs indexed: 4 (1 failed)", index.get_report())
+
+        chrbnd_path = str(Path("_test_dedup/chr/c5370.chrbnd"))
+        map_paths = {str(Path(f"_test_dedup/map/{name}.flver.dcx")) for name in ("m2200B0A10", "m2200B1A10")}
+        flver_duplicates = list(index.get_duplicates("flvers").values())
+        self.assertEqual(len(flver_duplicates), 1)
+        self.assertEqual({use.path for use in flver_duplicates[0]}, map_paths)
+
+        # All Gwyn meshes but the first are shared by both Gwyn entries, and the first are near-duplicates.
+        gwyn_mesh_count = len(gwyn_variant.meshes)
+        shared_mesh_uses = [
+            use for uses in index.get_duplicates("meshes").values() for use in uses if use.path == chrbnd_path
+        ]
+        self.assertEqual(len(shared_mesh_uses), 2 * (gwyn_mesh_count - 1))
+        self.assertNotIn(0, {use.mesh_index for use in shared_mesh_uses})
+        near_duplicates = index.get_near_duplicates()
+        self.assertIn(
+            sorted((use.entry_name, use.mesh_index) for use in near_duplicates[0]),
+            [[("c5370.flver", 0), ("c5371.flver", 0)]],
+        )
+        self.assertGreater(index.get_duplicated_size("vertex_arrays"), 0)
+        self.assertTrue(any(len(uses) == 2 * gwyn_mesh_count for uses in index.get_duplicates("layouts").values()))
+
+        index.write_json("_test_dedup.json")
+        self.assertEqual(json.loads(Path("_test_dedup.json").read_text())["failed_paths"], index.failed_paths)
+
+    def test_split_mesh_bind_pose(self):
+        """Split meshes take `is_bind_pose` from their `SplitMeshDef` unless its mesh kwargs set it."""
+        gwyn = FLVER.from_path("resources/c5370.flver")
+        merged = MergedMesh.from_flver(gwyn, merge_vertices=False)
+        split_mesh_defs = SplitMeshDef.get_defs_from_flver(gwyn)
+        for is_bind_pose in (True, False):
+            meshes = merged.split_mesh([mesh_def._replace(is_bind_pose=is_bind_pose) for mesh_def in split_mesh_defs])
+            self.assertEqual(len(meshes), len(gwyn.meshes))
+            self.assertTrue(all(mesh.is_bind_pose is is_bind_pose for mesh in meshes))
+        meshes = merged.split_mesh(
+            [mesh_def._replace(kwargs=mesh_def.kwargs | {"is_bind_pose": False}) for mesh_def in split_mesh_defs]
+        )
+        self.assertTrue(all(not mesh.is_bind_pose for mesh in meshes))
+
+    def test_bone_bounding_boxes(self):
+        """Compare single-pass bone bounding boxes with a per-bone reference, and benchmark a large synthetic FLVER."""
+        gwyn = FLVER.from_path("resources/c5370.flver")
+        synthetic = self.make_synthetic_flver(gwyn, bone_count=200, vertex_count=200_000)
+        for flver in (gwyn, FLVER.from_path("resources/m2200B0A10.flver.dcx"), synthetic):
+            for in_local_space in (True, False):
+                size = f"{len(flver.bones)} bones, {sum(len(mesh.vertices) for mesh in flver.meshes)} vertices"
+                with Timer(f"Refresh bone bounding boxes ({size}, in_local_space={in_local_space})"):
+                    flver.refresh_bone_bounding_boxes(in_local_space=in_local_space)
+                with Timer(f"Per-bone reference bounding boxes ({size}, in_local_space={in_local_space})"):
+                    expected_mins, expected_maxs = self.get_bone_bounds_by_bone(flver, in_local_space)
+                # Batched transforms may differ from per-bone matrix products in the last bits.
+                bone_mins = [bone.bounding_box_min.data for bone in flver.bones]
+                bone_maxs = [bone.bounding_box_max.data for bone in flver.bones]
+                np.testing.assert_allclose(bone_mins, expected_mins, rtol=1e-12, atol=1e-12)
+                np.testing.assert_allclose(bone_maxs, expected_maxs, rtol=1e-12, atol=1e-12)
+
+        # Restricted refresh only changes given bones.
+        old_bounds = [(bone.bounding_box_min, bone.bounding_box_max) for bone in synthetic.bones]
+        for bone in synthetic.bones:
+            bone.bounding_box_min = Vector3.zero()
+        synthetic.refresh_bone_bounding_boxes(in_local_space=False, only_bones={3, 150})
+        self.assertEqual(synthetic.bones[3].bounding_box_min, old_bounds[3][0])
+        self.assertEqual(synthetic.bones[150].bounding_box_max, old_bounds[150][1])
+        self.assertEqual(synthetic.bones[4].bounding_box_min, Vector3.zero())
+
+    @staticmethod
+    def make_synthetic_flver(flver: FLVER, bone_count: int, vertex_count: int) -> FLVER:
+        """Chain of `bone_count` random bones, with random weights and indices for `vertex_count` vertices."""
+        flver = copy.deepcopy(flver)
+        rng = np.random.default_rng(42)
+        flver.bones = IDList()
+        for i in range(bone_count):
+            flver.bones.append(FLVERBone(
+                name=f"Bone{i}",
+                translate=Vector3(rng.uniform(-0.5, 0.5, 3)),
+                rotate=EulerRad(rng.uniform(-np.pi, np.pi, 3)),
+                parent_bone=flver.bones[i // 2] if i > 0 else None,
+            ))
+        flver.set_bone_children_siblings()
+        mesh_vertex_count = vertex_count // len(flver.meshes)
+        for mesh in flver.meshes:
+            vertex_array = mesh.vertex_arrays[0]
+            vertex_array.array = array = np.resize(vertex_array.array, mesh_vertex_count)
+            array["position"] = rng.uniform(-2.0, 2.0, (mesh_vertex_count, 3))
+            array["bone_indices"] = rng.integers(0, bone_count, (mesh_vertex_count, 4))
+            array["bone_weights"] = rng.random((mesh_vertex_count, 4)) * (rng.random((mesh_vertex_count, 4)) < 0.5)
+            mesh.bone_indices = None  # global indices
+        return flver
+
+    @staticmethod
+    def make_grid_triangles(size: int) -> np.ndarray:
+        """Two triangles for every quad in a `size` by `size` grid of vertices, in canonical order."""
+        corners = (np.arange(size - 1)[:, np.newaxis] * size + np.arange(size - 1)).ravel()
+        triangles = np.concatenate([
+            np.column_stack([corners, corners + size, corners + 1]),
+            np.column_stack([corners + 1, corners + size, corners + size + 1]),
+        ])
+        return FLVERTest.get_canonical_triangles(triangles)
+
+    @staticmethod
+    def get_canonical_triangles(triangles: np.ndarray) -> np.ndarray:
+        """Rotate each triangle (keeping its winding) to start with its lowest index, then sort triangles."""
+        triangles = np.asarray(triangles, dtype=np.int64).reshape((-1, 3))
+        rotations = np.argmin(triangles, axis=1)[:, np.newaxis]
+        triangles = np.take_along_axis(triangles, (rotations + np.arange(3)) % 3, axis=1)
+        return triangles[np.lexsort(triangles.T[::-1])]
+
+    @staticmethod
+    def make_sphere_triangles(ring_count: int, ring_size: int) -> tuple[np.ndarray, np.ndarray]:
+        """Unit UV sphere with `ring_count - 1` rings of `ring_size` vertices between two poles, wound outward."""
+        latitudes = np.linspace(0.0, np.pi, ring_count + 1)[1:-1, np.newaxis]
+        longitudes = np.linspace(0.0, 2 * np.pi, ring_size, endpoint=False)
+        rings = np.stack([
+            np.sin(latitudes) * np.cos(longitudes),
+            np.cos(latitudes) * np.ones(ring_size),
+            np.sin(latitudes) * np.sin(longitudes),
+        ], axis=-1).reshape((-1, 3))
+        positions = np.vstack([[0.0, 1.0, 0.0], rings, [0.0, -1.0, 0.0]])
+
+        column = np.arange(ring_size)
+        next_column = (column + 1) % ring_size
+        bottom_pole = len(positions) - 1
+        last_ring_start = 1 + (ring_count - 2) * ring_size
+        triangles = [np.column_stack([np.zeros(ring_size, int), 1 + next_column, 1 + column])]
+        for ring_start in range(1, last_ring_start, ring_size):
+            a, b = ring_start + column, ring_start + next_column
+            triangles += [np.column_stack([a, b, a + ring_size]), np.column_stack([b, b + ring_size, a + ring_size])]
+        bottom_poles = np.full(ring_size, bottom_pole)
+        triangles.append(np.column_stack([last_ring_start + column, last_ring_start + next_column, bottom_poles]))
+        return positions, np.vstack(triangles)
+
+    @staticmethod
+    def get_bone_bounds_by_bone(flver: FLVER, in_local_space: bool) -> tuple[np.ndarray, np.ndarray]:
+        """Reference bone bounds from a vertex mask and transform for every bone."""
+        transforms = flver.get_bone_armature_space_transforms()
+        bone_mins = np.full((len(flver.bones), 3), SINGLE_MAX)
+        bone_maxs = np.full((len(flver.bones), 3), SINGLE_MIN)
+        for mesh in flver.meshes:
+            for vertex_array in mesh.vertex_arrays:
+                bone_indices = vertex_array["bone_indices"]
+                if mesh.bone_indices is not None:
+                    bone_indices = mesh.bone_indices[bone_indices]
+                has_weights = "bone_weights" in vertex_array.dtype.names
+                for bone_index in range(len(flver.bones)):
+                    if has_weights:
+                        used = ((bone_indices == bone_index) & (vertex_array["bone_weights"] > 0.0)).any(axis=1)
+                    else:
+                        used = bone_indices[:, 0] == bone_index  # first bone index only
+                    if not used.any():
+                        continue
+                    positions = vertex_array["position"][used]
+                    if in_local_space:
+                        translate, rotate, _ = transforms[bone_index]
+                        positions -= translate.data
+                        positions = positions @ rotate.inverse().data.T
+                    bone_mins[bone_index] = np.minimum(bone_mins[bone_index], positions.min(axis=0))
+                    bone_maxs[bone_index] = np.maximum(bone_maxs[bone_index], positions.max(axis=0))
+        return bone_mins, bone_maxs
+
     def tearDown(self):
         for test_file in Path(".").glob("_test*"):
             if test_file.is_file():
                 os.remove(str(test_file))
 
 
+def get_merged_vertices_by_loop(
+    meshes: list[FLVERMesh],
+    all_vertices: np.ndarray,
+    mesh_material_indices: list[int],
+    loop_normals: np.ndarray | None,
+    is_flver0: bool,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Original implementation of `MergedMesh.get_merged_vertices()` that processes one loop at a time with vertex
+    byte dictionaries and compares normals with `np.dot`. Much slower, but used as a reference for its output."""
+
+    # Maps raw vertex bytes (as a hash) and material display mask (could be `None`) to vertex index and the
+    # normal of the first face with that display mask found that uses it. Two variant dicts; the second
+    # is only used if a face has a near-inverted normal from the vertices retrieved from the first variant. (No more
+    # than two vertex variants can exist, as no other face normal could possibly be different enough from BOTH of
+    # the previous faces.)
+    vertex_indices_normals = {}  # type: dict[tuple[int | None, bytes], tuple[int, np.ndarray]]
+    inv_vertex_indices = {}  # type: dict[tuple[int | None, bytes], int]  # normal not needed here
+
+    # Actual vertex indices (subset of row indices) to extract from `all_vertices`.
+    reduced_vertex_indices = []  # type: list[int]
+
+    vertex_count = 0  # rather than continually calling `len(reduced_vertex_indices)`
+
+    # List of final faces: `(loop0, loop1, loop2)`, which naturally excludes duplicates. Material index added later.
+    all_mesh_faces = []  # type: list[np.ndarray]
+
+    # Array of loop vertex indices. Same length as other loop data, as face loop indices are not modified (beyond
+    # offsetting them for each merged mesh).
+    loop_vertex_indices = np.empty(all_vertices.shape[0], dtype=np.uint32)
+
+    loop_offset = 0
+    for mesh, material_index in zip(meshes, mesh_material_indices):
+
+        display_mask = mesh.material.display_mask  # type: int | None
+
+        triangles = mesh.triangulate_flver0() if is_flver0 else mesh.triangulate_flver2()  # `(n, 3)` array
+        triangles += loop_offset
+        resolved_loop_indices = set()
+
+        for triangle in triangles:
+            for loop_index in triangle:
+                # We inspect each FLVER loop index as it appears, and figure out if we can redirect it to an
+                # existing 'true vertex'. Otherwise, we create a new 'true vertex' for it.
+
+                if loop_index in resolved_loop_indices:
+                    # This loop has already been handled by a previous FLVER face that uses it.
+                    continue
+                resolved_loop_indices.add(loop_index)
+
+                triangle_vert = all_vertices[loop_index]
+                vertex_hash = triangle_vert.tobytes()  # "hash" of position, bone indices, and bone weights
+                vert_normal = loop_normals[loop_index] if loop_normals is not None else None
+
+                # Check for an existing vertex with the same display mask and same hashed (position, bone_weights,
+                # bone_indices) data.
+                try:
+                    existing_vertex_index, existing_normal = vertex_indices_normals[display_mask, vertex_hash]
+                except KeyError:
+                    # First time this vertex has been encountered in this display mask.
+                    vertex_index = vertex_count
+                    vertex_indices_normals[display_mask, vertex_hash] = (vertex_index, vert_normal)
+                    loop_vertex_indices[loop_index] = vertex_index
+                    reduced_vertex_indices.append(loop_index)
+                    vertex_count += 1
+                    continue
+
+                # Compare normals to see if this vertex is suitable.
+                if vert_normal is not None and np.dot(vert_normal, existing_normal) < -0.9:
+                    # This face is inverted from the existing vertex. Use the inv dict (whether existing or new).
+                    try:
+                        existing_inv_vertex_index = inv_vertex_indices[display_mask, vertex_hash]
+                    except KeyError:
+                        # First time this inverted vertex has been encountered.
+                        vertex_index = vertex_count
+                        inv_vertex_indices[display_mask, vertex_hash] = vertex_index
+                        reduced_vertex_indices.append(loop_index)
+                        loop_vertex_indices[loop_index] = vertex_index
+                        vertex_count += 1
+                        continue
+
+                    # Use existing inverted vertex. We do NOT check for normals here; if it turns out that another
+                    # face has already used the exact same three inverted vertices, it will be treated as a true
+                    # 'duplicate face' and handled accordingly (e.g. simply discarded in Blender).
+                    loop_vertex_indices[loop_index] = existing_inv_vertex_index
+                    continue
+
+                # Existing vertex is suitable (normal is sufficiently close). Again, if it turns out that multiple
+                # faces use the exact same three vertices, they will be treated as a true 'duplicate face'.
+                loop_vertex_indices[loop_index] = existing_vertex_index
+
+        # Check for any unused FLVER vertices (now loops).
+        all_loop_indices = set(range(loop_offset, loop_offset + len(mesh.vertices)))
+        unresolved_loop_indices = all_loop_indices - resolved_loop_indices
+        for loop_index in unresolved_loop_indices:
+            loop_vertex_indices[loop_index] = 2 ** 32 - 1  # mark as unused (-1)
+
+        mesh_faces = np.column_stack(
+            [triangles, np.full(triangles.shape[0], material_index, dtype=np.uint32)]
+        )
+        all_mesh_faces.append(mesh_faces)
+
+        loop_offset += len(mesh.vertex_arrays[0])
+
+    vertex_data = all_vertices[reduced_vertex_indices]
+    faces = np.vstack(all_mesh_faces)
+    return vertex_data, loop_vertex_indices, faces
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,16 @@
+import json
 import os
+import shutil
 import unittest
 from pathlib import Path
 
+from soulstruct.utilities.binary import BinaryReader, float32, int32
+
+from soulstruct.base.params import GameParamDiff, ParamColumn, ParamMergeConflict, ParamView
+from soulstruct.base.params.exceptions import ParamError
+from soulstruct.base.params.param_dict import ParamDict, ParamDictRow
+from soulstruct.base.params.param_row import ParamField, ParamRow
+from soulstruct.containers import Binder, BinderEntry
 from soulstruct.darksouls1r.params import GameParamBND, ParamDefBND
 from soulstruct.utilities.inspection import Timer
 
@@ -48,6 +57,284 @@ class ParamsTest(unittest.TestCase):
         for i, (line_initial, line_json_read) in enumerate(zip(json_initial, json_from_binary_read)):
             self.assertEqual(line_initial, line_json_read, msg=f"Line {i + 1}")
 
+    def test_row_lookup(self):
+        game_param = GameParamBND.from_path("resources/GameParam.parambnd.dcx")
+        dagger = game_param.params["EquipParamWeapon"][100000]
+        field_name = dagger.get_binary_field_names()[0]
+        internal_name = dagger.get_field_metadata(field_name).internal_name
+
+        self.assertEqual(dagger[field_name], getattr(dagger, field_name))
+        self.assertEqual(dagger[internal_name], getattr(dagger, field_name))
+        self.assertEqual(dagger["NAME"], dagger.Name)
+        self.assertEqual(dagger["rawname"], dagger.RawName)
+        self.assertEqual(dagger.get_many([field_name, "Name"]), [getattr(dagger, field_name), dagger.Name])
+        with self.assertRaises(KeyError):
+            _ = dagger["not_a_field"]
+
+        old_value = dagger[field_name]
+        with self.assertRaises(KeyError):
+            dagger.set_many({internal_name: old_value + 1, "not_a_field": 0})
+        self.assertEqual(dagger[field_name], old_value)  # unchanged
+        dagger.set_many({internal_name: old_value + 1, "Name": "Big Dagger"})
+        self.assertEqual(dagger.get_many([field_name, "name"]), [old_value + 1, "Big Dagger"])
+
+        # Lookup tables are built per class, so a subclass with extra fields does not reuse its parent's tables.
+        class BaseRow(ParamRow):
+            base_field: int = ParamField(int32, "baseField", default=0)
+
+        class SubRow(BaseRow):
+            sub_field: float = ParamField(float32, "subField", default=1.0)
+
+        SubRow.get_binary_fields()  # `BinaryStruct` caches these through inheritance, so get them first
+        self.assertEqual(BaseRow.get_field_lookup()[1], ("base_field",))
+        self.assertEqual(SubRow.get_field_lookup()[1], ("base_field", "sub_field"))
+        self.assertEqual(SubRow.get_field_lookup()[0]["subField"], "sub_field")
+        self.assertNotIn("subField", BaseRow.get_field_lookup()[0])
+
+    def test_binder_entry_names(self):
+        """Binder entry paths are Windows paths, and their names must be split as such on any platform."""
+        entry = BinderEntry(b"", 0, "N:\\FRPG\\data\\INTERROOT_x64\\param\\GameParam\\EquipParamWeapon.param.dcx")
+        self.assertEqual(entry.name, "EquipParamWeapon.param.dcx")
+        self.assertEqual(entry.stem, "EquipParamWeapon.param")
+        self.assertEqual(entry.minimal_stem, "EquipParamWeapon")
+        self.assertEqual(entry.suffixes, [".param", ".dcx"])
+        self.assertEqual(entry.directory_with_forward_slashes, "N:/FRPG/data/INTERROOT_x64/param/GameParam")
+        entry.set_path_name("EquipParamArmor.param")
+        self.assertEqual(entry.path, "N:\\FRPG\\data\\INTERROOT_x64\\param\\GameParam\\EquipParamArmor.param")
+
+        game_param = GameParamBND.from_path("resources/GameParam.parambnd.dcx")
+        self.assertIn("EquipParamWeapon", game_param.params)
+        repacked = Binder.from_bytes(bytes(game_param))
+        self.assertEqual(len(repacked.entries), len(game_param.params))  # each param written once
+
+    def test_binder_set_default_entry(self):
+        """`set_default_entry()` finds existing entries by name even if a subclass overrides `__getitem__`."""
+
+        class TalkBinder(Binder):
+            """Looks up entry data by entry ID, like `TalkESDBND` talk IDs."""
+
+            def __getitem__(self, talk_id: int) -> bytes:
+                return self.get_entries_by_id()[talk_id].data
+
+        binder = TalkBinder()
+        entry = BinderEntry(b"talk", 100000, "N:\\FRPG\\data\\INTERROOT_x64\\script\\talk\\t100000.esd")
+        binder.add_entry(entry)
+        self.assertIs(binder.set_default_entry("t100000.esd"), entry)
+        self.assertEqual(len(binder.entries), 1)
+        new_entry = binder.set_default_entry(100001, new_path="N:\\FRPG\\data\\t100001.esd")
+        self.assertEqual(new_entry.name, "t100001.esd")
+        self.assertEqual(len(binder.entries), 2)
+
+    def test_row_block_unpack(self):
+        game_param = GameParamBND.from_path("resources/GameParam.parambnd.dcx")
+        for param in game_param.params.values():
+            row_type = param.ROW_TYPE
+            rows = list(param.rows.values())[:20]
+            data = b"".join(row.to_bytes() for row in rows)
+            unpacked = row_type.unpack_rows(data, row_type.DEFAULT_BYTE_ORDER)
+            self.assertIsNotNone(unpacked, row_type.__name__)
+            for row, unpacked_row in zip(rows, unpacked):
+                self.assertEqual(list(unpacked_row), list(row_type.from_bytes(row.to_bytes())))
+        self.assertIsNone(row_type.unpack_rows(data[:-1], row_type.DEFAULT_BYTE_ORDER))  # not a whole number of rows
+
+    def test_param_diff(self):
+        weapons_name = "EquipParamWeapon"
+        vanilla = GameParamBND.from_path("resources/GameParam.parambnd.dcx")
+
+        def modded(changes: dict, add_row_id=None, remove_row_id=None) -> GameParamBND:
+            game_param = GameParamBND.from_path("resources/GameParam.parambnd.dcx")
+            weapons = game_param.params[weapons_name]
+            weapons[100000].set_many(changes)
+            if add_row_id is not None:
+                weapons[add_row_id] = weapons[100000].copy()
+            if remove_row_id is not None:
+                weapons.pop(remove_row_id)
+            return game_param
+
+        ours = modded({"Name": "Big Dagger", "Weight": 3.0}, add_row_id=100001)
+        with Timer("GameParamBND diff"):
+            diff = GameParamDiff.from_gameparambnds(vanilla, ours)
+        self.assertEqual(list(diff.params), [weapons_name])
+        weapon_diff = diff.params[weapons_name]
+        self.assertEqual(weapon_diff.changed[100000]["Name"][1], "Big Dagger")
+        self.assertEqual(weapon_diff.changed[100000]["Weight"], (vanilla.params[weapons_name][100000].Weight, 3.0))
+        self.assertEqual(list(weapon_diff.added), [100001])
+        self.assertFalse(weapon_diff.removed)
+
+        # Patch JSON round trip and application.
+        diff.write_json("_test_patch.json")
+        diff = GameParamDiff.from_json("_test_patch.json")
+        target = GameParamBND.from_path("resources/GameParam.parambnd.dcx")
+        diff.apply(target)
+        self.assertFalse(GameParamDiff.from_gameparambnds(target, ours))
+        with self.assertRaises(ParamError):
+            diff.apply(target)  # already applied
+
+        # Three-way merge.
+        theirs = modded({"Weight": 4.0, "MaxDurability": 1}, remove_row_id=100100)
+        merged, conflicts = GameParamDiff.three_way_merge(vanilla, ours, theirs)
+        self.assertEqual(conflicts, [ParamMergeConflict(weapons_name, 100000, "Weight", 3.0, 4.0)])
+        merged_weapons = merged.params[weapons_name]
+        self.assertEqual(merged_weapons.changed[100000]["Weight"][1], 3.0)  # ours
+        self.assertEqual(merged_weapons.changed[100000]["MaxDurability"][1], 1)
+        self.assertEqual(merged_weapons.removed, [100100])
+        self.assertEqual(list(merged_weapons.added), [100001])
+
+        # Fields set directly as attributes are found.
+        direct = GameParamBND.from_path("resources/GameParam.parambnd.dcx")
+        direct.params[weapons_name][100000].Weight = 99.0
+        direct_diff = GameParamDiff.from_gameparambnds(vanilla, direct)
+        old_weight = vanilla.params[weapons_name][100000].Weight
+        self.assertEqual(direct_diff.params[weapons_name].changed, {100000: {"Weight": (old_weight, 99.0)}})
+
+        # Rows with identical entry data are skipped in binders that have not changed since they were written.
+        ours.write("_test_ours.parambnd.dcx")
+        ours = GameParamBND.from_path("_test_ours.parambnd.dcx")
+        with Timer("GameParamBND diff with entry data"):
+            entry_diff = GameParamDiff.from_gameparambnds(vanilla, ours, use_entry_data=True)
+        self.assertEqual(entry_diff.params[weapons_name].changed[100000]["Weight"][1], 3.0)
+        self.assertEqual(entry_diff.to_dict(), GameParamDiff.from_gameparambnds(vanilla, ours).to_dict())
+
+    def test_param_view(self):
+        weapons_name = "EquipParamWeapon"
+        game_param = GameParamBND.from_path("resources/GameParam.parambnd.dcx")
+        weapons = game_param.params[weapons_name]
+        binder = Binder.from_path("resources/GameParam.parambnd.dcx")
+
+        views = ParamView.from_binder(binder, GameParamBND.PARAMDEF_MODULE)
+        self.assertEqual(set(views), set(game_param.params))
+        view = views[weapons_name]
+        self.assertEqual(list(view), sorted(weapons.rows))
+        self.assertIn(100000, view)
+        self.assertNotIn(-1, view)
+        for field_name in ("Weight", "MaxDurability", "DisableRepairs"):  # float, int, bit field
+            self.assertEqual(view.get_column(field_name).tolist(), [getattr(weapons[i], field_name) for i in view])
+        self.assertEqual(
+            view.get_column("Weight", [100100, 100000]).tolist(), [weapons[100100].Weight, weapons[100000].Weight]
+        )
+        with self.assertRaises(KeyError):
+            view.get_column("Weight", [-1])
+        dagger = view[100000]
+        self.assertEqual(list(dagger), list(weapons[100000]))
+        self.assertEqual(dagger.Name, weapons[100000].Name)
+        self.assertEqual(view.get_row_name(100000), weapons[100000].Name)
+
+        # Memory-mapped unpacked file.
+        Path("_test_weapons.param").write_bytes(binder.find_entry_name(weapons_name + ".param").data)
+        with ParamView.from_path("_test_weapons.param", view.row_type) as mapped_view:
+            self.assertEqual(mapped_view.get_column("Weight").tolist(), view.get_column("Weight").tolist())
+            self.assertEqual(list(mapped_view[100000]), list(dagger))
+
+    def test_param_query(self):
+        game_param = GameParamBND.from_path("resources/GameParam.parambnd.dcx")
+        weapons = game_param.params["EquipParamWeapon"]
+
+        condition = (
+            (ParamColumn("Weight") > 2.0) & (ParamColumn("MaxDurability") < 200)
+            | ~ParamColumn("DisableRepairs").isin([False])
+        )
+        expected_ids = [
+            row_id for row_id, row in weapons.items()
+            if (row.Weight > 2.0 and row.MaxDurability < 200) or row.DisableRepairs
+        ]
+        self.assertTrue(expected_ids)
+        self.assertEqual(weapons.find_row_ids(condition), expected_ids)
+        self.assertEqual(list(weapons.find_rows(condition)), expected_ids)
+        self.assertEqual(
+            weapons.get_column("Weight", expected_ids[:2]).tolist(), [weapons[i].Weight for i in expected_ids[:2]]
+        )
+
+        old_rows = {row_id: weapons[row_id].copy() for row_id in expected_ids}
+        with Timer("Param bulk update"):
+            updated_ids = weapons.update_rows(
+                condition, {"Weight": lambda weight: weight * 1.1, "MaxDurability": lambda durability: durability / 2}
+            )
+        self.assertEqual(updated_ids, expected_ids)
+        for row_id, old_row in old_rows.items():
+            self.assertAlmostEqual(weapons[row_id].Weight, old_row.Weight * 1.1, places=5)
+            self.assertEqual(weapons[row_id].MaxDurability, round(old_row.MaxDurability / 2))
+            self.assertIsInstance(weapons[row_id].MaxDurability, int)
+
+        # Bulk update values are packed like any other row change.
+        weapons.update_rows(ParamColumn("Weight") > 0.0, {"RepairCost": 7})
+        repacked = GameParamBND.from_bytes(bytes(game_param))
+        repacked_weapons = repacked.params["EquipParamWeapon"]
+        self.assertEqual(repacked_weapons[expected_ids[0]].Weight, weapons[expected_ids[0]].Weight)
+        heavy_ids = weapons.find_row_ids(ParamColumn("Weight") > 0.0)
+        self.assertEqual(set(repacked_weapons.get_column("RepairCost", heavy_ids).tolist()), {7})
+
+    def test_param_dict(self):
+        paramdef_bnd = ParamDefBND.from_bundled("DARK_SOULS_DSR")
+        game_param = GameParamBND.from_path("resources/GameParam.parambnd.dcx")
+        binder = Binder.from_path("resources/GameParam.parambnd.dcx")
+        param_stems = ("EquipParamWeapon", "NpcParam", "TalkParam")  # bit fields, pads, no names
+        game_param.params = {
+            stem: binder.find_entry_name(stem + ".param").to_binary_file(ParamDict) for stem in param_stems
+        }
+        row_bytes = {stem: dict(game_param.params[stem].row_bytes) for stem in param_stems}
+
+        with Timer("ParamDict unpack"):
+            game_param.unpack_all_param_rows(paramdef_bnd, processes=2)
+        for stem in param_stems:
+            param = game_param.params[stem]
+            self.assertEqual(list(param.row_dicts), list(row_bytes[stem]))
+            for row_id, row in list(param.row_dicts.items())[:50]:
+                raw_name, name, data = row_bytes[stem][row_id]
+                by_field = ParamDictRow.from_reader_by_field(BinaryReader(data), param.paramdef, raw_name, name)
+                self.assertEqual(list(row.fields.items()), list(by_field.fields.items()))
+
+            # Packed rows are identical to original row data.
+            repacked = ParamDict.from_bytes(bytes(param))
+            self.assertEqual(repacked.row_bytes, row_bytes[stem])
+
+        weapons = game_param.params["EquipParamWeapon"]
+        weapon_row = weapons.row_dicts[100000]
+        bool_field = next(name for name, value in weapon_row.fields.items() if isinstance(value, bool))
+        weapon_row[bool_field] = not weapon_row[bool_field]
+        repacked = ParamDict.from_bytes(bytes(weapons))
+        repacked.unpack_rows(paramdef_bnd)
+        self.assertEqual(repacked.row_dicts[100000][bool_field], weapon_row[bool_field])
+        weapon_row[bool_field] = 2
+        with self.assertRaises(ParamError):
+            bytes(weapons)
+        weapon_row[bool_field] = False
+
+        # Non-bit numeric fields are still checked against the range of their type.
+        int_field = next(
+            paramdef_field for paramdef_field in weapons.paramdef.fields.values()
+            if paramdef_field.bit_count == -1 and type(weapon_row[paramdef_field.name]) is int
+        )
+        weapon_row[int_field.name] = int_field.py_type_max + 1
+        with self.assertRaisesRegex(ParamError, "outside range"):
+            bytes(weapons)
+
+    def test_param_json(self):
+        game_param = GameParamBND.from_path("resources/GameParam.parambnd.dcx")
+        weapons = game_param.params["EquipParamWeapon"]
+
+        # Streamed JSON file is identical to `to_dict()` JSON.
+        weapons.write_json("_test_weapons.json")
+        self.assertEqual(Path("_test_weapons.json").read_text(), json.dumps(weapons.to_dict(), indent=4))
+        self.assertEqual(
+            weapons.to_dict(ignore_pads=False, ignore_defaults=False, use_internal_names=True)["rows"][100000],
+            weapons[100000].to_dict(ignore_pads=False, ignore_defaults=False, use_internal_names=True),
+        )
+
+        weapons.write_ndjson("_test_weapons")
+        ndjson_weapons = type(weapons).from_ndjson("_test_weapons.ndjson")
+        self.assertEqual(ndjson_weapons.rows, weapons.rows)
+        self.assertEqual(ndjson_weapons.flags2.pack(), weapons.flags2.pack())
+
+        for ndjson, processes in ((False, 1), (True, 2)):
+            json_directory = f"_test_gameparam_{'ndjson' if ndjson else 'json'}"
+            self.addCleanup(shutil.rmtree, json_directory, ignore_errors=True)
+            with Timer(f"GameParamBND JSON directory (ndjson={ndjson}, processes={processes})"):
+                game_param.write_json_directory(json_directory, ndjson=ndjson, processes=processes)
+                from_json = GameParamBND.from_json_directory(json_directory, processes=processes)
+            self.assertEqual(list(from_json.params), list(game_param.params))
+            for param_stem, param in game_param.params.items():
+                self.assertEqual(from_json.params[param_stem].rows, param.rows)
+
     def tearDown(self):
         for test_file in Path(".").glob("_test*"):
             if test_file.is_file():
@@ -1,6 +1,10 @@
+import contextlib
+import io
 import shutil
 import unittest
+from pathlib import Path
 
+from soulstruct.base.text import FMG, TextSearchHit, TextSearchIndex
 from soulstruct.config import DSR_PATH
 from soulstruct.darksouls1r.text import MSGDirectory
 from soulstruct.utilities.inspection import Timer
@@ -33,3 +37,100 @@ class TextTest(unittest.TestCase):
 
         with Timer("Read MSG Directory JSON"):
             json_text = MSGDirectory.from_json_directory("_test_msg_json")
+
+    def test_fmg_pack(self):
+        shared = "Shared description.\n\nSecond paragraph." * 20
+        entries = {i: shared if i % 3 else f"Unique {i}" for i in range(2000)}
+        entries.update({5000: "", 5001: shared, 5003: "Unique 5003"})  # empty string and gap in IDs
+        for version in (0, 1, 2):
+            fmg = FMG(entries=entries.copy(), version=version)
+            with Timer(f"FMG V{version} pack"):
+                packed = bytes(fmg.to_writer())
+            with Timer(f"FMG V{version} pack (pooled)"):
+                pooled = bytes(fmg.to_writer(pool_strings=True))
+            self.assertLess(len(pooled), len(packed) // 10)
+            for data in (packed, pooled):
+                unpacked = FMG.from_bytes(data)
+                self.assertEqual(unpacked.version, version)
+                self.assertEqual(unpacked.entries, entries)
+
+    def test_text_json(self):
+        fmgs = {key: FMG(entries={20: "Second\nline", 10: key[0]}) for key in MSGDirectory.DEFAULT_ENTRY_STEMS}
+        files = {"item": MSGDirectory.FILE_CLASS(), "menu": MSGDirectory.FILE_CLASS()}
+        text = MSGDirectory(fmgs=fmgs, files=files)
+
+        self.addCleanup(Path("_test_fmg.ndjson").unlink, missing_ok=True)
+        text.fmgs["item", 10].write_ndjson("_test_fmg")
+        fmg = FMG.from_ndjson("_test_fmg.ndjson")
+        self.assertEqual(list(fmg.entries.items()), [(10, "item"), (20, "Second\nline")])
+        self.assertEqual(fmg.version, 2)
+
+        for ndjson, processes in ((False, 1), (True, 2)):
+            json_directory = f"_test_msg_{'ndjson' if ndjson else 'json'}"
+            self.addCleanup(shutil.rmtree, json_directory, ignore_errors=True)
+            text.write_json_directory(json_directory, ndjson=ndjson, processes=processes)
+            json_text = MSGDirectory.from_json_directory(json_directory, processes=processes)
+            self.assertEqual(json_text.fmgs.keys(), fmgs.keys())
+            for key, fmg in fmgs.items():
+                self.assertEqual(json_text.fmgs[key].entries, fmg.entries)
+
+    def test_text_search(self):
+        def make_directory(good_names: dict[int, str]) -> MSGDirectory:
+            fmgs = {key: FMG() for key in MSGDirectory.DEFAULT_ENTRY_STEMS}
+            fmgs["item", 10].entries = good_names
+            fmgs["item", 11].entries = {100000: "Dagger", 200000: "Shortsword"}
+            return MSGDirectory(fmgs=fmgs)
+
+        english = make_directory({100: "Estus Flask", 101: "Flask of Estus (Empty)", 102: "", 200: "Humanity"})
+        self.assertEqual(english.search("estus flask"), [
+            TextSearchHit("GoodNames", "Item_name_", 100, "Estus Flask"),
+            TextSearchHit("GoodNames", "Item_name_", 101, "Flask of Estus (Empty)"),
+        ])
+        self.assertEqual([hit.string_id for hit in english.search("es", "words")], [])  # whole words only
+        self.assertEqual([hit.string_id for hit in english.search("es", "substring")], [100, 101])
+        self.assertEqual([hit.string_id for hit in english.search("Es", "substring", case_sensitive=True)], [100, 101])
+        self.assertEqual([hit.string_id for hit in english.search("ES", "substring", case_sensitive=True)], [])
+        self.assertEqual([hit.string_id for hit in english.search(r"^\w+$", "regex")], [200, 100000, 200000])
+        self.assertEqual([hit.string_id for hit in english.search("a", "substring", category_name_regex="Weapon")], [
+            100000
+        ])
+        self.assertEqual(len(english.search("a", "substring", limit=2)), 2)
+
+        # Index updates when FMGs change.
+        english.fmgs["item", 10][300] = "Estus Shard"
+        self.assertEqual([hit.string_id for hit in english.search("estus")], [100, 101, 300])
+        english.fmgs["item", 10].entries = {100: "Ashen Estus Flask"}
+        self.assertEqual([hit.text for hit in english.search("estus")], ["Ashen Estus Flask"])
+        english.fmgs["item", 10].entries[101] = "Estus Flask"  # not detected automatically
+        english.invalidate_search_index()
+        self.assertEqual([hit.string_id for hit in english.search("estus")], [100, 101])
+
+        # Multiple languages.
+        german = make_directory({100: "Estus-Flakon", 200: "Menschlichkeit"})
+        index = TextSearchIndex({"engus": english, "deude": german})
+        self.assertEqual([(hit.language, hit.string_id) for hit in index.search("estus")], [
+            ("engus", 100), ("engus", 101), ("deude", 100)
+        ])
+        self.assertEqual([hit.text for hit in index.search("mensch", "substring", languages=["deude"])], [
+            "Menschlichkeit"
+        ])
+
+        # `find_and_print()` of an empty string prints every string, as before it used the index.
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            german.find_and_print("")
+        self.assertEqual(output.getvalue().count("~~~ "), 4)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            german.find_and_print("Flakon")
+        self.assertEqual(output.getvalue(), "\n~~~ GoodNames[100]:\nEstus-Flakon\n")
+
+    def test_fmg_revision(self):
+        """FMG revision counter is private state, and is not part of FMG equality, `repr`, or dictionary output."""
+        fmg = FMG(entries={1: "a"})
+        fmg[2] = "b"
+        fmg.pop(2)
+        self.assertEqual(fmg.revision, 2)
+        self.assertEqual(fmg, FMG(entries={1: "a"}))
+        self.assertEqual(repr(fmg), repr(FMG(entries={1: "a"})))
+        self.assertNotIn("_revision", fmg.to_dict())
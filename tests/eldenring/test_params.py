@@ -1,8 +1,15 @@
 """Test reading of encrypted `regulation.bin` (GameParamBND) in Elden Ring."""
+import os
+import tempfile
+import time
 import unittest
+from pathlib import Path
 
 from soulstruct.logging_utils import setup
-from soulstruct.eldenring.params import GameParamBND
+from soulstruct.base.params.param import TypedParam
+from soulstruct.base.params.ParamCrypt import ParamCrypt, decrypt_regulation, encrypt_regulation
+from soulstruct.eldenring.params import GameParamBND, paramdef
+from soulstruct.utilities.aes import aes_cbc_decrypt, aes_cbc_encrypt
 from soulstruct.utilities.inspection import Timer
 
 
@@ -16,6 +23,71 @@ class ParamTest(unittest.TestCase):
             regulation = GameParamBND.from_encrypted_path("resources/regulation.bin")
             print(regulation.NpcParam[47300000])  # Starscourge Radahn
 
+    def test_regulation_round_trip(self):
+        """Encrypt and decrypt a small synthetic regulation in memory."""
+        row_type = paramdef.SP_EFFECT_PARAM_ST
+        sp_effect_param = TypedParam(row_type)(
+            param_type="SP_EFFECT_PARAM_ST",
+            rows={10: row_type(Name="Test", EffectDuration=5.0), 20: row_type()},
+        )
+        regulation = GameParamBND(params={"SpEffectParam": sp_effect_param})
+        encrypted = regulation.to_encrypted_bytes()
+        self.assertEqual(len(encrypted) % 16, 0)
+        self.assertNotEqual(encrypted[:16], regulation.to_encrypted_bytes()[:16])  # random IV
+
+        decrypted = decrypt_regulation(encrypted, "er")
+        self.assertEqual(decrypted[:4], b"DCX\0")
+        self.assertEqual(encrypt_regulation(decrypted, "er", iv=encrypted[:16]), encrypted)
+
+        reloaded = GameParamBND.from_encrypted_bytes(encrypted)
+        reloaded_param = reloaded.params["SpEffectParam"]
+        self.assertEqual(list(reloaded_param.rows), [10, 20])
+        self.assertEqual(reloaded_param[10].Name, "Test")
+        self.assertEqual(reloaded_param[10].EffectDuration, 5.0)
+
+        with self.assertRaises(ValueError):
+            decrypt_regulation(encrypted, "bb")
+
+    def test_aes_fallback(self):
+        """Check the built-in AES-256-CBC implementation (used when `cryptography` is not installed) against the
+        NIST SP 800-38A CBC-AES256 test vectors."""
+        key = bytes.fromhex("603deb1015ca71be2b73aef0857d77811f352c073b6108d72d9810a30914dff4")
+        iv = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+        plaintext = bytes.fromhex(
+            "6bc1bee22e409f96e93d7e117393172a" "ae2d8a571e03ac9c9eb76fac45af8e51"
+            "30c81c46a35ce411e5fbc1191a0a52ef" "f69f2445df4f9b17ad2b417be66c3710"
+        )
+        ciphertext = bytes.fromhex(
+            "f58c4c04d6e5f1ba779eabfb5f7bfbd6" "9cfc4e967edb808d679f777bc6702c7d"
+            "39f23369a9d9bacfa530e26304231461" "b2eb05e2c39be9fcda6c19078c6a9d1b"
+        )
+        self.assertEqual(aes_cbc_encrypt(key, iv, plaintext, use_cryptography=False), ciphertext)
+        self.assertEqual(aes_cbc_decrypt(key, iv, ciphertext, use_cryptography=False), plaintext)
+        self.assertEqual(aes_cbc_decrypt(key, iv, b"", use_cryptography=False), b"")
+
+    def test_regulation_crypt_benchmark(self):
+        """Compare in-memory decryption/encryption with `ParamCrypt.exe` (only runnable on Windows)."""
+        encrypted = Path("resources/regulation.bin").read_bytes()
+
+        start = time.perf_counter()
+        decrypted = decrypt_regulation(encrypted, "er")
+        decrypt_time = time.perf_counter() - start
+        start = time.perf_counter()
+        reencrypted = encrypt_regulation(decrypted, "er", iv=encrypted[:16])
+        encrypt_time = time.perf_counter() - start
+        print(f"In-memory regulation decrypt: {decrypt_time:.3f} s | encrypt: {encrypt_time:.3f} s")
+        self.assertEqual(decrypted[:4], b"DCX\0")
+        self.assertEqual(reencrypted, encrypted)
+
+        if os.name != "nt":
+            return
+        with tempfile.TemporaryDirectory() as temp_dir:
+            decrypted_path = Path(temp_dir, "regulation.parambnd.dcx")
+            start = time.perf_counter()
+            ParamCrypt("resources/regulation.bin", "decrypt", "er", decrypted_path)
+            print(f"`ParamCrypt.exe` regulation decrypt: {time.perf_counter() - start:.3f} s")
+            self.assertEqual(decrypted_path.read_bytes()[:len(decrypted)], decrypted)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,55 @@
+"""Cold-import benchmark for game packages, which should not pull in large generated modules until they are used."""
+import subprocess
+import sys
+import unittest
+
+# Seconds allowed for a cold `import soulstruct.{game}` in a fresh interpreter. Generous, to allow for slow machines;
+# importing every subpackage eagerly took several seconds.
+IMPORT_TIME_BUDGET = 1.5
+
+GAME_PACKAGES = (
+    "darksouls1ptde",
+    "darksouls1r",
+    "bloodborne",
+    "darksouls3",
+    "demonssouls",
+    "eldenring",
+)
+
+
+def _run_fresh(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip().splitlines()[-1]
+
+
+class ImportTimeTest(unittest.TestCase):
+
+    def test_game_package_import_time(self):
+        for game in GAME_PACKAGES:
+            with self.subTest(game=game):
+                elapsed = float(_run_fresh(
+                    f"import time\n"
+                    f"t = time.perf_counter()\n"
+                    f"import soulstruct.{game}\n"
+                    f"print(time.perf_counter() - t)\n"
+                ))
+                print(f"Cold import of `soulstruct.{game}`: {elapsed:.3f} s")
+                self.assertLess(elapsed, IMPORT_TIME_BUDGET)
+
+    def test_lazy_paramdef_rows(self):
+        count_code = "sum(name.startswith('soulstruct.eldenring.params.paramdef.') for name in sys.modules)"
+        loaded = _run_fresh(
+            f"import sys\n"
+            f"import soulstruct.eldenring.params\n"
+            f"before = {count_code}\n"
+            f"soulstruct.eldenring.params.paramdef.ATK_PARAM_ST\n"
+            f"print(before, {count_code}, 'events' in sys.modules.get('soulstruct.eldenring').__dict__)\n"
+        ).split()
+        self.assertLessEqual(int(loaded[0]), 2)  # `core` (and no generated row modules)
+        self.assertEqual(int(loaded[1]), int(loaded[0]) + 1)
+        self.assertEqual(loaded[2], "False")  # sibling subpackages not imported
+
+
+if __name__ == '__main__':
+    unittest.main()